@@ -0,0 +1,297 @@
+"""
+Benchmark de controladores síncronos frente a asíncronos
+Lanza 1.000 inscripciones concurrentes (repartidas entre varios eventos) con
+RegistrationController en un pool de threads y con AsyncRegistrationController en un
+único thread con asyncio, y compara throughput, latencia por petición y threads usados.
+
+Uso: python benchmarks/bench_async_controllers.py [--registrations 1000] [--events 10]
+     python benchmarks/bench_async_controllers.py --mysql [--threads 50] [--connections 20]
+Sin --mysql se simula la base de datos (cada sentencia tarda --rtt-ms y la reserva de
+plaza bloquea la fila del evento hasta el commit); con --mysql se usa la base de datos de
+config/config.py (requiere aiomysql), creando eventos y participantes temporales que se
+eliminan al terminar.
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.controllers.registration_controller import RegistrationController, RESERVE_SEAT_SQL, INSERT_REGISTRATION_SQL
+from src.controllers.async_controllers import AsyncRegistrationController
+
+
+class SimServer:
+    """Estado del servidor simulado: aforo por evento e inscripciones"""
+
+    def __init__(self, rtt_ms: float, events: int, capacity: int):
+        self.rtt = rtt_ms / 1000
+        self.events = {event_id: [capacity, 0] for event_id in range(1, events + 1)}
+        self._ids = itertools.count(1)
+        self.registrations = {}
+
+    def apply(self, query: str, params: tuple):
+        """Aplica una sentencia; devuelve (rowcount, lastrowid)"""
+        if query is RESERVE_SEAT_SQL:
+            event = self.events.get(params[0])
+            if event is None or event[1] >= event[0]:
+                return 0, None
+            event[1] += 1
+            return 1, None
+        if query is not INSERT_REGISTRATION_SQL:
+            return 1, None  # Registro de cambios (change_log)
+        registration_id = next(self._ids)
+        self.registrations[(params[0], params[1])] = registration_id
+        return 1, registration_id
+
+
+class SimCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, query, params=()):
+        time.sleep(self.conn.server.rtt)
+        if query is RESERVE_SEAT_SQL:
+            self.conn.hold(params[0])
+        self.rowcount, self.lastrowid = self.conn.server.apply(query, params)
+
+    def close(self):
+        pass
+
+
+class SimConnection:
+    """Conexión síncrona simulada; la fila del evento reservada queda bloqueada hasta el commit"""
+
+    def __init__(self, db):
+        self.db = db
+        self.server = db.server
+        self.held = []
+
+    def hold(self, event_id):
+        lock = self.db.row_locks[event_id]
+        lock.acquire()
+        self.held.append(lock)
+
+    def cursor(self, dictionary=False):
+        return SimCursor(self)
+
+    def start_transaction(self):
+        time.sleep(self.server.rtt)
+
+    def commit(self):
+        time.sleep(self.server.rtt)
+        self._release()
+
+    def rollback(self):
+        time.sleep(self.server.rtt)
+        self._release()
+
+    def close(self):
+        self._release()
+
+    def _release(self):
+        while self.held:
+            self.held.pop().release()
+
+
+class SimDB:
+    """Sustituto de DatabaseConnection: una conexión por thread, sin límite de pool"""
+
+    def __init__(self, server: SimServer):
+        self.server = server
+        self.row_locks = {event_id: threading.Lock() for event_id in server.events}
+
+    def get_connection(self):
+        return SimConnection(self)
+
+
+class SimAsyncCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+        self.lastrowid = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def execute(self, query, params=()):
+        await asyncio.sleep(self.conn.server.rtt)
+        if query is RESERVE_SEAT_SQL:
+            await self.conn.hold(params[0])
+        self.rowcount, self.lastrowid = self.conn.server.apply(query, params)
+
+
+class SimAsyncConnection:
+    def __init__(self, db):
+        self.db = db
+        self.server = db.server
+        self.held = []
+
+    async def hold(self, event_id):
+        lock = self.db.row_locks[event_id]
+        await lock.acquire()
+        self.held.append(lock)
+
+    def cursor(self, *cursor_classes):
+        return SimAsyncCursor(self)
+
+    async def begin(self):
+        await asyncio.sleep(self.server.rtt)
+
+    async def commit(self):
+        await asyncio.sleep(self.server.rtt)
+        self._release()
+
+    async def rollback(self):
+        await asyncio.sleep(self.server.rtt)
+        self._release()
+
+    def _release(self):
+        while self.held:
+            self.held.pop().release()
+
+
+class SimAsyncDB:
+    """Sustituto de AsyncDatabaseConnection: pool de maxsize conexiones con espera"""
+
+    def __init__(self, server: SimServer, maxsize: int):
+        self.server = server
+        self.row_locks = {event_id: asyncio.Lock() for event_id in server.events}
+        self._slots = asyncio.Semaphore(maxsize)
+
+    @asynccontextmanager
+    async def connection(self):
+        async with self._slots:
+            conn = SimAsyncConnection(self)
+            try:
+                yield conn
+            finally:
+                conn._release()
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+def report(label: str, results, latencies, elapsed: float, threads: int):
+    ok = sum(1 for r in results if r)
+    print(f"{label:<24}{ok:>8}{elapsed:>10.2f}{ok / elapsed:>12.0f}"
+          f"{percentile(latencies, 0.5) * 1000:>12.1f}{percentile(latencies, 0.95) * 1000:>12.1f}{threads:>10}")
+
+
+def run_sync(label: str, controller: RegistrationController, tasks, threads: int):
+    """Todas las peticiones llegan a la vez y las atiende un pool de threads"""
+    latencies = []
+    peak_threads = [threading.active_count()]
+
+    def register(task):
+        event_id, participant_id = task
+        result = controller.register_participant(event_id, participant_id)
+        latencies.append(time.perf_counter() - start)
+        peak_threads[0] = max(peak_threads[0], threading.active_count())
+        return result
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(register, tasks))
+    report(label, results, latencies, time.perf_counter() - start, peak_threads[0])
+
+
+async def run_async(label: str, controller: AsyncRegistrationController, tasks):
+    """Todas las peticiones llegan a la vez y las atiende una corrutina cada una"""
+    latencies = []
+    start = time.perf_counter()
+
+    async def register(event_id, participant_id):
+        result = await controller.register_participant(event_id, participant_id)
+        latencies.append(time.perf_counter() - start)
+        return result
+
+    results = await asyncio.gather(*(register(event_id, pid) for event_id, pid in tasks))
+    report(label, results, latencies, time.perf_counter() - start, threading.active_count())
+
+
+def print_header():
+    print(f"{'controlador':<24}{'insc.':>8}{'tiempo':>10}{'insc./s':>12}{'p50 (ms)':>12}{'p95 (ms)':>12}{'threads':>10}")
+
+
+def simulated(args):
+    tasks = [(i % args.events + 1, i + 1) for i in range(args.registrations)]
+    capacity = args.registrations
+    print(f"Base de datos simulada: {args.rtt_ms} ms por sentencia, {args.events} eventos\n")
+    print_header()
+    for threads in sorted({args.connections, args.threads}):
+        server = SimServer(args.rtt_ms, args.events, capacity)
+        run_sync(f"síncrono ({threads} thr.)", RegistrationController(SimDB(server)), tasks, threads)
+
+    async def main():
+        server = SimServer(args.rtt_ms, args.events, capacity)
+        db = SimAsyncDB(server, args.connections)
+        await run_async(f"asyncio ({args.connections} con.)", AsyncRegistrationController(db), tasks)
+
+    asyncio.run(main())
+
+
+def mysql(args):
+    from bench_registration_contention import ThreadConnectionDB, setup, reset, teardown
+    from src.database.async_db_connection import AsyncDatabaseConnection
+
+    per_event = (args.registrations + args.events - 1) // args.events
+    created = [setup(per_event) for _ in range(args.events)]
+    tasks = [(event_id, pid) for event_id, _, participant_ids in created for pid in participant_ids]
+    tasks = tasks[:args.registrations]
+    try:
+        print(f"MySQL: {len(tasks)} inscripciones en {args.events} eventos\n")
+        print_header()
+        db = ThreadConnectionDB()
+        try:
+            run_sync(f"síncrono ({args.threads} thr.)", RegistrationController(db), tasks, args.threads)
+        finally:
+            db.close()
+        for event_id, _, _ in created:
+            reset(event_id)
+
+        async def main():
+            db = AsyncDatabaseConnection(maxsize=args.connections)
+            await db.connect()
+            try:
+                await run_async(f"asyncio ({args.connections} con.)", AsyncRegistrationController(db), tasks)
+            finally:
+                await db.close()
+
+        asyncio.run(main())
+    finally:
+        for event_id, tag, _ in created:
+            teardown(event_id, tag)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registrations', type=int, default=1000)
+    parser.add_argument('--events', type=int, default=10, help="Eventos entre los que se reparten")
+    parser.add_argument('--threads', type=int, default=50, help="Threads del modo síncrono")
+    parser.add_argument('--connections', type=int, default=20, help="Conexiones del pool asíncrono")
+    parser.add_argument('--rtt-ms', type=float, default=1.0, help="Duración simulada de cada sentencia")
+    parser.add_argument('--mysql', action='store_true', help="Usar la base de datos real")
+    args = parser.parse_args()
+
+    if args.mysql:
+        mysql(args)
+    else:
+        simulated(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark de inscripción masiva
+Compara inscribir N participantes en un evento con una transacción por participante
+(register_participant desde varios threads, como hacía register_multiple_participants_parallel)
+frente a register_participants_bulk (un bloqueo del evento e INSERT multi-fila).
+
+Uso: python benchmarks/bench_bulk_enrollment.py [--registrations 10000] [--threads 8]
+Requiere una base de datos MySQL configurada como en config/config.py.
+Crea un evento y participantes temporales y los elimina al terminar.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from bench_registration_contention import ThreadConnectionDB, setup, reset, teardown
+from src.controllers.registration_controller import RegistrationController
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--registrations", type=int, default=10000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    event_id, tag, participant_ids = setup(args.registrations)
+    db = ThreadConnectionDB()
+    controller = RegistrationController(db)
+    try:
+        print(f"Evento {event_id}, {len(participant_ids)} participantes\n")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            results = list(executor.map(lambda pid: controller.register_participant(event_id, pid), participant_ids))
+        elapsed = time.perf_counter() - start
+        ok = sum(1 for r in results if r)
+        print(f"{'individual':<12} {ok:>6} inscripciones en {elapsed:7.3f}s ({args.threads} threads)")
+
+        reset(event_id)
+        start = time.perf_counter()
+        outcomes = controller.register_participants_bulk(event_id, participant_ids)
+        elapsed = time.perf_counter() - start
+        counts = Counter(outcome for _, outcome, _ in outcomes)
+        print(f"{'masiva':<12} {counts['registered']:>6} inscripciones en {elapsed:7.3f}s {dict(counts)}")
+
+        # Segunda pasada: todos duplicados, no debe insertar nada
+        start = time.perf_counter()
+        outcomes = controller.register_participants_bulk(event_id, participant_ids)
+        elapsed = time.perf_counter() - start
+        counts = Counter(outcome for _, outcome, _ in outcomes)
+        print(f"{'repetida':<12} {counts['registered']:>6} inscripciones en {elapsed:7.3f}s {dict(counts)}")
+    finally:
+        db.close()
+        teardown(event_id, tag)
+
+
+if __name__ == "__main__":
+    main()
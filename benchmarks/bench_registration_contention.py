@@ -0,0 +1,182 @@
+"""
+Benchmark de contención en inscripciones sobre un evento "caliente"
+Compara la estrategia anterior (RLock de aplicación + SELECT ... FOR UPDATE + COUNT(*))
+con la reserva atómica actual (UPDATE condicional de confirmed_count + clave única).
+
+Uso: python benchmarks/bench_registration_contention.py [--threads 50] [--registrations 2000]
+Requiere una base de datos MySQL configurada como en config/config.py.
+Crea un evento y participantes temporales y los elimina al terminar.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import mysql.connector
+from config.config import DB_CONFIG
+from src.controllers.registration_controller import RegistrationController
+
+
+class _KeepOpenConnection:
+    """Proxy de conexión cuyo close() no cierra la conexión real (la reutiliza el mismo thread)"""
+    
+    def __init__(self, conn):
+        self._conn = conn
+    
+    def close(self):
+        if self._conn.in_transaction:
+            self._conn.rollback()
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class ThreadConnectionDB:
+    """
+    Sustituto de DatabaseConnection con una conexión por thread.
+    El pool de mysql-connector admite como máximo 32 conexiones, y el benchmark usa más threads.
+    """
+    
+    def __init__(self):
+        self._local = threading.local()
+        self._all = []
+        self._lock = threading.Lock()
+    
+    def get_connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = mysql.connector.connect(**DB_CONFIG)
+            self._local.conn = conn
+            with self._lock:
+                self._all.append(conn)
+        return _KeepOpenConnection(conn)
+    
+    def close(self):
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+
+
+_legacy_lock = threading.RLock()
+
+
+def legacy_register(db, event_id: int, participant_id: int):
+    """Inscripción tal y como se hacía antes: lock de aplicación + FOR UPDATE + COUNT(*)"""
+    with _legacy_lock:
+        conn = db.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            conn.start_transaction()
+            cursor.execute("""
+                SELECT capacity,
+                       (SELECT COUNT(*) FROM event_registrations
+                        WHERE event_id = %s AND status = 'confirmado') as current
+                FROM events WHERE event_id = %s
+                FOR UPDATE
+            """, (event_id, event_id))
+            capacity, current = cursor.fetchone()
+            if current >= capacity:
+                conn.rollback()
+                return None
+            cursor.execute("""
+                SELECT registration_id FROM event_registrations
+                WHERE event_id = %s AND participant_id = %s
+            """, (event_id, participant_id))
+            if cursor.fetchone():
+                conn.rollback()
+                return None
+            cursor.execute("""
+                INSERT INTO event_registrations (event_id, participant_id, status)
+                VALUES (%s, %s, 'confirmado')
+            """, (event_id, participant_id))
+            registration_id = cursor.lastrowid
+            conn.commit()
+            cursor.close()
+            return registration_id
+        finally:
+            conn.close()
+
+
+def setup(num_participants: int):
+    """Crea un evento temporal y los participantes del benchmark"""
+    conn = mysql.connector.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    tag = uuid.uuid4().hex[:8]
+    cursor.execute("""
+        INSERT INTO events (title, description, location, start_datetime, end_datetime, capacity, status)
+        VALUES (%s, 'benchmark', 'benchmark', '2030-01-01 10:00:00', '2030-01-01 12:00:00', %s, 'activo')
+    """, (f"bench_{tag}", num_participants))
+    event_id = cursor.lastrowid
+    rows = [(f"Bench{i}", tag, f"bench_{tag}_{i}@example.com", f"B{tag}{i}") for i in range(num_participants)]
+    cursor.executemany("""
+        INSERT INTO participants (first_name, last_name, email, identifier)
+        VALUES (%s, %s, %s, %s)
+    """, rows)
+    conn.commit()
+    cursor.execute("SELECT participant_id FROM participants WHERE last_name = %s", (tag,))
+    participant_ids = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    conn.close()
+    return event_id, tag, participant_ids
+
+
+def reset(event_id: int):
+    """Elimina las inscripciones del evento del benchmark entre ejecuciones"""
+    conn = mysql.connector.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM event_registrations WHERE event_id = %s", (event_id,))
+    cursor.execute("UPDATE events SET confirmed_count = 0 WHERE event_id = %s", (event_id,))
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def teardown(event_id: int, tag: str):
+    """Elimina el evento y los participantes temporales"""
+    conn = mysql.connector.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM events WHERE event_id = %s", (event_id,))
+    cursor.execute("DELETE FROM participants WHERE last_name = %s", (tag,))
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def run(label: str, register, participant_ids, threads: int):
+    """Ejecuta todas las inscripciones con N threads y muestra inscripciones/segundo"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(register, participant_ids))
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for r in results if r)
+    print(f"{label:<10} {ok:>6} inscripciones en {elapsed:6.2f}s -> {ok / elapsed:8.1f} inscripciones/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--registrations", type=int, default=2000)
+    args = parser.parse_args()
+    
+    event_id, tag, participant_ids = setup(args.registrations)
+    db = ThreadConnectionDB()
+    controller = RegistrationController(db)
+    try:
+        print(f"Evento {event_id}, {len(participant_ids)} participantes, {args.threads} threads")
+        run("antes", lambda pid: legacy_register(db, event_id, pid), participant_ids, args.threads)
+        reset(event_id)
+        run("después", lambda pid: controller.register_participant(event_id, pid), participant_ids, args.threads)
+    finally:
+        db.close()
+        teardown(event_id, tag)
+
+
+if __name__ == "__main__":
+    main()
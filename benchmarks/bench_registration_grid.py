@@ -0,0 +1,194 @@
+"""
+Benchmark de renderizado de la tabla de inscripciones
+Compara la tabla anterior (un Frame + Labels + Combobox + Button por inscripción)
+con la rejilla virtualizada (VirtualGrid), midiendo tiempo de render y memoria (RSS).
+
+Uso: python benchmarks/bench_registration_grid.py [--sizes 10000 100000] [--legacy-max 10000]
+Necesita un display (en servidores: xvfb-run python benchmarks/bench_registration_grid.py).
+No necesita base de datos: genera inscripciones sintéticas.
+Cada caso se ejecuta en un proceso aparte para que el RSS de uno no afecte al siguiente.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def current_rss_mb() -> float:
+    """RSS actual del proceso en MB"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Fallback (pico de RSS; en macOS viene en bytes)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def make_registrations(n: int):
+    """Genera n inscripciones con el formato de RegistrationView.row_to_registration"""
+    rnd = random.Random(42)
+    statuses = ['confirmado', 'pendiente', 'cancelado']
+    base = datetime(2025, 1, 1)
+    return [
+        {
+            'event_id': i % 500 + 1,
+            'event_title': f"Evento {i % 500}",
+            'participant_id': i + 1,
+            'participant_name': f"Nombre{i} Apellido{i % 977}",
+            'email': f"user{i}@example.com",
+            'phone': f"6{rnd.randint(10000000, 99999999)}",
+            'registered_at': base + timedelta(minutes=i),
+            'status': statuses[rnd.randrange(3)]
+        }
+        for i in range(n)
+    ]
+
+
+def legacy_render(parent, registrations):
+    """Tabla anterior: widgets reales por cada inscripción dentro de un Canvas con scroll"""
+    import tkinter as tk
+    from tkinter import ttk
+    from src.views.styles import COLORS
+
+    canvas = tk.Canvas(parent, bg=COLORS['white'], highlightthickness=0)
+    scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
+    table_frame = tk.Frame(canvas, bg=COLORS['white'])
+    table_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+    canvas.create_window((0, 0), window=table_frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+
+    for index, registration in enumerate(registrations):
+        row_frame = tk.Frame(table_frame, bg=COLORS['white'] if index % 2 == 0 else COLORS['table_row_even'])
+        row_frame.pack(fill=tk.X)
+        date_str = registration['registered_at'].strftime("%d/%m/%Y %H:%M")
+        data = [
+            registration['event_title'][:30],
+            registration['participant_name'][:25],
+            registration['email'][:30],
+            registration['phone'],
+            date_str
+        ]
+        for data_item, width in zip(data, [200, 150, 180, 100, 140]):
+            tk.Label(
+                row_frame, text=data_item, font=("Arial", 9), bg=row_frame.cget('bg'),
+                padx=8, pady=8, anchor=tk.W, width=width // 8
+            ).pack(side=tk.LEFT, padx=2)
+        status_frame = tk.Frame(row_frame, bg=COLORS['success'], relief=tk.SOLID, borderwidth=1)
+        status_frame.pack(side=tk.LEFT, padx=2, fill=tk.Y)
+        status_var = tk.StringVar(value=registration['status'].capitalize())
+        ttk.Combobox(
+            status_frame, textvariable=status_var, values=['Confirmado', 'Cancelado', 'Pendiente'],
+            state='readonly', font=("Arial", 8, "bold"), width=12
+        ).pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        tk.Button(row_frame, text="🗑️", relief=tk.FLAT).pack(side=tk.LEFT, padx=4)
+
+
+def virtual_render(parent, registrations):
+    """Rejilla virtualizada con las mismas columnas que la vista de administrador"""
+    from src.views.virtual_grid import VirtualGrid
+    from src.views.registration_view import RegistrationView, STATUS_COLORS
+
+    columns = [
+        {'title': "Evento", 'width': 200, 'format': lambda r: r['event_title'][:30]},
+        {'title': "Participante", 'width': 150, 'format': lambda r: r['participant_name'][:25]},
+        {'title': "Email", 'width': 180, 'format': lambda r: r['email'][:30]},
+        {'title': "Teléfono", 'width': 100, 'key': 'phone'},
+        {'title': "Fecha Inscripción", 'width': 140, 'format': RegistrationView.format_registered_at},
+        {'title': "Estado", 'width': 120, 'kind': 'status', 'key': 'status',
+         'values': ['confirmado', 'cancelado', 'pendiente'], 'colors': STATUS_COLORS,
+         'command': lambda r, s: True},
+        {'title': "Acciones", 'width': 120, 'kind': 'button', 'text': "🗑️", 'command': lambda r: None}
+    ]
+    grid = VirtualGrid(parent, columns)
+    grid.set_rows(registrations)
+    return grid
+
+
+def count_widgets(widget) -> int:
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def run_case(mode: str, size: int) -> dict:
+    """Ejecuta un caso en el proceso actual y devuelve las métricas"""
+    import tkinter as tk
+
+    registrations = make_registrations(size)
+    root = tk.Tk()
+    root.geometry("1100x700")
+    root.update()
+    rss_before = current_rss_mb()
+
+    start = time.perf_counter()
+    grid = legacy_render(root, registrations) if mode == 'legacy' else virtual_render(root, registrations)
+    root.update_idletasks()
+    root.update()
+    render_ms = (time.perf_counter() - start) * 1000
+
+    result = {
+        'mode': mode,
+        'size': size,
+        'render_ms': round(render_ms, 1),
+        'rss_mb': round(current_rss_mb() - rss_before, 1),
+        'widgets': count_widgets(root)
+    }
+
+    if grid is not None:
+        # Tiempo medio de repintado al saltar a posiciones aleatorias del scroll
+        rnd = random.Random(1)
+        jumps = 200
+        start = time.perf_counter()
+        for _ in range(jumps):
+            grid.yview('moveto', rnd.random())
+            root.update_idletasks()
+        result['scroll_ms'] = round((time.perf_counter() - start) * 1000 / jumps, 2)
+
+    root.destroy()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--legacy-max', type=int, default=10000,
+                        help="Tamaño máximo para la tabla anterior (a partir de ahí tarda minutos)")
+    parser.add_argument('--case', nargs=2, metavar=('MODE', 'SIZE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case[0], int(args.case[1]))))
+        return
+
+    print(f"{'modo':<10}{'inscripciones':>14}{'render (ms)':>14}{'RSS (MB)':>11}{'widgets':>10}{'scroll (ms)':>13}")
+    for size in args.sizes:
+        for mode in ('legacy', 'virtual'):
+            if mode == 'legacy' and size > args.legacy_max:
+                print(f"{mode:<10}{size:>14}{'(omitido, --legacy-max)':>48}")
+                continue
+            proc = subprocess.run(
+                [sys.executable, __file__, '--case', mode, str(size)],
+                capture_output=True, text=True
+            )
+            if proc.returncode != 0:
+                print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"Error en {mode} {size}")
+                continue
+            r = json.loads(proc.stdout.strip().splitlines()[-1])
+            print(f"{r['mode']:<10}{r['size']:>14}{r['render_ms']:>14}{r['rss_mb']:>11}"
+                  f"{r['widgets']:>10}{r.get('scroll_ms', '-'):>13}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark del índice de búsqueda en memoria (n-gramas)
+Compara, sobre participantes sintéticos, la búsqueda completa que hacían antes las
+vistas (todas las coincidencias ordenadas) con la consulta por páginas que hacen ahora
+(primera página y página siguiente por clave, con el tamaño de página de la tabla).
+
+Uso: python benchmarks/bench_search_index.py [--rows 100000] [--page-size 100] [--repeat 25]
+No necesita base de datos.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.utils.search_index import NGramIndex
+
+FIRST_NAMES = ["ana", "maría", "josé", "juan", "carmen", "antonio", "laura", "david", "lucía",
+               "javier", "elena", "pablo", "sara", "daniel", "marta", "alejandro", "paula",
+               "sergio", "andrea", "carlos", "garbiñe", "adriana", "óscar", "diana"]
+LAST_NAMES = ["garcía", "martínez", "lópez", "sánchez", "pérez", "gómez", "martín", "jiménez",
+              "ruiz", "hernández", "díaz", "moreno", "álvarez", "romero", "alonso", "gutiérrez",
+              "navarro", "torres", "domínguez", "vázquez", "ramos", "gil", "ramírez", "serrano",
+              "blanco", "molina", "garrido", "santana", "gallego", "etxeberria"]
+
+# Consultas de una palabra poco y muy selectivas, con palabras cortas y largas, y de varias palabras
+QUERIES = ["a", "gar", "ana", "ana5", "ana gar", "maria lopez", "garcia martinez", "santana 12", "xyz"]
+
+
+def build_index(rows: int, seed: int) -> NGramIndex:
+    """Índice con el mismo texto y clave de orden que create_participant_index"""
+    rng = random.Random(seed)
+    index = NGramIndex()
+    for participant_id in range(1, rows + 1):
+        first = rng.choice(FIRST_NAMES)
+        last = f"{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+        email = f"{first}.{last.split()[0]}{rng.randint(1, 9999)}@example.com"
+        identifier = f"{rng.randint(10000000, 99999999)}{rng.choice('TRWAGMYFPDXBNJZSQVHLCKE')}"
+        index.add(participant_id, f"{first} {last} {email} {identifier}",
+                  sort_key=(last, first, participant_id))
+    return index
+
+
+def measure(fn, repeat: int):
+    """Mediana y p95 en milisegundos"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return statistics.median(times), times[min(len(times) - 1, int(len(times) * 0.95))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=25)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = build_index(args.rows, args.seed)
+    index.search('', 1)  # ordena la lista de claves una vez
+    print(f"Índice de {args.rows:,} participantes construido en {time.perf_counter() - start:.1f} s\n")
+
+    limit = args.page_size
+    print(f"{'consulta':<18}{'coinciden':>10}{'completa p50/p95 (ms)':>24}"
+          f"{'página 1 p50/p95 (ms)':>24}{'página 2 p50/p95 (ms)':>24}")
+    for query in QUERIES:
+        matches = index.search(query)
+        first_page = index.search(query, limit)
+        after = index._order[first_page[-1]] if len(first_page) == limit else None
+        full = measure(lambda: index.search(query), args.repeat)
+        page1 = measure(lambda: index.search(query, limit), args.repeat)
+        if after is not None:
+            page2 = measure(lambda: index.search(query, limit, after=after), args.repeat)
+            page2_text = f"{page2[0]:.3f} / {page2[1]:.3f}"
+        else:
+            page2_text = "-"
+        print(f"{query!r:<18}{len(matches):>10,}{f'{full[0]:.3f} / {full[1]:.3f}':>24}"
+              f"{f'{page1[0]:.3f} / {page1[1]:.3f}':>24}{page2_text:>24}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark del tamaño del pool de workers de inscripciones
+Compara ParallelSubscriptionProcessor con tamaño fijo (5 workers, el valor anterior, y
+tantos workers como conexiones) frente al tamaño adaptativo (5..16 según cola, latencia
+y conexiones libres), inscribiendo 1.000 y 10.000 participantes.
+
+Mientras tanto, un thread simula la interfaz pidiendo una conexión cada 20 ms: como el
+pool de mysql-connector no espera (falla si está agotado), se cuentan los fallos.
+
+Uso: python benchmarks/bench_subscription_workers.py [--sizes 1000 10000]
+     python benchmarks/bench_subscription_workers.py --mysql [--sizes 1000]
+Sin --mysql se simula la base de datos (pool de 20 conexiones, 8 núcleos, fila del
+evento con lock); con --mysql se usa la base de datos de config/config.py, creando un
+evento y participantes temporales que se eliminan al terminar.
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.utils.concurrency_manager import ParallelSubscriptionProcessor, gather
+
+
+class PoolExhausted(Exception):
+    pass
+
+
+class SimulatedDB:
+    """
+    Base de datos simulada: pool sin espera, tiempo de red por consulta, CPU limitada
+    y una sección serializada (la actualización de confirmed_count del evento)
+    """
+
+    def __init__(self, pool_size: int = 20, cores: int = 8, rtt_ms: float = 3.0,
+                 cpu_ms: float = 1.0, hot_row_ms: float = 0.1):
+        self.pool_size = pool_size
+        self._available = pool_size
+        self._lock = threading.Lock()
+        self._cpu = threading.Semaphore(cores)
+        self._hot_row = threading.Lock()
+        self.rtt = rtt_ms / 1000
+        self.cpu = cpu_ms / 1000
+        self.hot_row = hot_row_ms / 1000
+
+    def available(self) -> int:
+        return self._available
+
+    def acquire(self):
+        with self._lock:
+            if self._available == 0:
+                raise PoolExhausted("pool exhausted")
+            self._available -= 1
+
+    def release(self):
+        with self._lock:
+            self._available += 1
+
+    def register(self, participant_id: int):
+        self.acquire()
+        try:
+            time.sleep(self.rtt * random.uniform(0.8, 1.2))
+            with self._cpu:
+                time.sleep(self.cpu)
+            with self._hot_row:
+                time.sleep(self.hot_row)
+            return participant_id
+        finally:
+            self.release()
+
+
+class UIProbe:
+    """Simula la interfaz: pide y devuelve una conexión cada interval segundos"""
+
+    def __init__(self, acquire, release, interval: float = 0.02):
+        self.acquire = acquire
+        self.release = release
+        self.interval = interval
+        self.requests = 0
+        self.failures = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.requests += 1
+            try:
+                conn = self.acquire()
+            except Exception:
+                self.failures += 1
+                continue
+            self.release(conn)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_case(label: str, processor: ParallelSubscriptionProcessor, register, participant_ids, probe: UIProbe):
+    processor.start()
+    with probe:
+        start = time.perf_counter()
+        handles = processor.submit_batch([(register, (pid,), {}, None, pid) for pid in participant_ids])
+        outcomes = gather(handles, return_exceptions=True)
+        elapsed = time.perf_counter() - start
+    stats = processor.stats()
+    processor.stop()
+
+    ok = sum(1 for o in outcomes if o and not isinstance(o, BaseException))
+    print(f"{label:<18}{len(participant_ids):>8}{elapsed:>10.2f}{ok / elapsed:>12.0f}{len(participant_ids) - ok:>8}"
+          f"{stats['peak_workers']:>8}{stats['avg_latency_ms']:>12.1f}{probe.failures:>6}/{probe.requests:<6}")
+
+
+def configurations(pool_size: int, probe_capacity):
+    return [
+        ("fijo 5", dict(num_workers=5)),
+        (f"fijo {pool_size}", dict(num_workers=pool_size)),
+        ("adaptativo 5-16", dict(num_workers=5, max_workers=16, capacity_probe=probe_capacity,
+                                 reserve_capacity=4, idle_timeout=1.0))
+    ]
+
+
+def print_header():
+    print(f"{'workers':<18}{'tareas':>8}{'tiempo':>10}{'insc./s':>12}{'fallos':>8}{'pico':>8}"
+          f"{'lat. (ms)':>12}{'UI fallos':>13}")
+
+
+def simulated(sizes):
+    db = SimulatedDB()
+    print("Base de datos simulada: pool de 20 conexiones, 8 núcleos\n")
+    print_header()
+    for size in sizes:
+        participant_ids = list(range(1, size + 1))
+        for label, options in configurations(db.pool_size, db.available):
+            processor = ParallelSubscriptionProcessor(max_queue_size=100, name="Bench", **options)
+            probe = UIProbe(db.acquire, lambda conn: db.release())
+            run_case(label, processor, db.register, participant_ids, probe)
+        print()
+
+
+def mysql(sizes):
+    from bench_registration_contention import setup, reset, teardown
+    from src.database.db_connection import DatabaseConnection
+    from src.controllers.registration_controller import RegistrationController
+
+    db = DatabaseConnection()
+    controller = RegistrationController(db)
+    pool_size = db.pool_stats()['size']
+    print(f"MySQL: pool de {pool_size} conexiones\n")
+    print_header()
+    event_id, tag, participant_ids = setup(max(sizes))
+    try:
+        for size in sizes:
+            for label, options in configurations(pool_size, lambda: db.pool_stats()['available']):
+                reset(event_id)
+                processor = ParallelSubscriptionProcessor(max_queue_size=100, name="Bench", **options)
+                probe = UIProbe(db.get_connection, lambda conn: conn.close())
+                run_case(label, processor, lambda pid: controller.register_participant(event_id, pid),
+                         participant_ids[:size], probe)
+            print()
+    finally:
+        teardown(event_id, tag)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--mysql', action='store_true', help="Usar la base de datos real")
+    args = parser.parse_args()
+
+    if args.mysql:
+        mysql(args.sizes)
+    else:
+        simulated(args.sizes)
+
+
+if __name__ == '__main__':
+    main()
@@ -26,7 +26,9 @@ APP_CONFIG = {
     'window_width': 1200,
     'window_height': 700,
     'min_window_width': 800,
-    'min_window_height': 600
+    'min_window_height': 600,
+    'table_page_size': 100,  # Filas que se piden por página en las tablas paginadas
+    'table_max_rows': 500  # Máximo de filas mantenidas en cada tabla (el resto se pide al hacer scroll)
 }
 
 # Configuración de exportación
@@ -40,11 +42,74 @@ EXPORT_CONFIG = {
 # Configuración de concurrencia
 CONCURRENCY_CONFIG = {
     'lock_timeout': 30,  # segundos - tiempo máximo para adquirir un lock
+    'lock_stripes': 256,  # Número de locks de la tabla por franjas (memoria fija sea cual sea el número de recursos)
+    # Backend de locks por recurso: 'process' (solo threads de esta instancia), 'mysql' (GET_LOCK,
+    # compartido por todas las instancias; cada lock retiene una conexión del pool) o 'none'
+    'lock_backend': os.getenv('LOCK_BACKEND', 'process'),
+    # Las inscripciones ya reservan plaza de forma atómica en MySQL; un lock solo añade latencia
+    'registration_lock_backend': os.getenv('REGISTRATION_LOCK_BACKEND', 'none'),
+    'lock_metrics': True,  # Registrar tiempos de espera de los locks de MySQL
+    # Locks de MySQL adquiridos a la vez como máximo; cada uno ocupa dos conexiones del pool
+    # (la del lock y la de la operación). None = (pool_size - 1) // 2
+    'mysql_lock_max_holders': None,
     'max_retries': 3,  # número máximo de reintentos en operaciones fallidas
     'pool_size': 20,  # Tamaño del pool de conexiones para soportar múltiples usuarios simultáneos
-    'subscription_workers': 5,  # Número de worker threads para procesar suscripciones en paralelo
+    'pool_min_idle': 4,  # Conexiones que se abren al arrancar (warm-up) y se mantienen aunque no se usen
+    'pool_checkout_timeout': 2.0,  # Segundos que se espera una conexión con el pool agotado (0 = fallar al instante)
+    'pool_validation_interval': 30.0,  # Inactividad (segundos) tras la que se comprueba una conexión con un ping antes de prestarla
+    'pool_max_lifetime': 1800.0,  # Vida máxima de una conexión en segundos (0 = sin límite); debe ser menor que wait_timeout de MySQL
+    'pool_idle_timeout': 300.0,  # Segundos sin uso tras los que se cierran las conexiones por encima de pool_min_idle
+    'pool_maintenance_interval': 30.0,  # Cada cuánto se cierran las conexiones caducadas o inactivas (segundos)
+    # Reiniciar la sesión al devolver cada conexión (un viaje al servidor más) para que nadie herede
+    # variables, tablas temporales ni locks; con False solo se deshace la transacción que haya quedado abierta
+    'pool_reset_session': True,
+    'pool_metrics_window': 60.0,  # Ventana (segundos) de la métrica de préstamos por segundo
+    'async_pool_size': 20,  # Conexiones máximas del pool asíncrono (aiomysql) de los controladores asíncronos
+    'subscription_workers': 5,  # Mínimo de worker threads para procesar suscripciones en paralelo
+    'subscription_max_workers': 16,  # Máximo de workers al crecer con la cola (igual al mínimo = tamaño fijo)
+    'subscription_reserved_connections': 4,  # Conexiones del pool que los workers dejan libres para la interfaz
+    'subscription_idle_timeout': 5.0,  # Segundos sin tareas tras los que se retira un worker sobrante
+    'subscription_latency_factor': 2.0,  # No crecer si la latencia media supera este múltiplo de la mejor
     'max_queue_size': 100,  # Tamaño máximo de la cola de tareas para procesamiento paralelo
+    'bulk_insert_chunk': 1000,  # Filas por sentencia INSERT en las inscripciones masivas
     'retry_base_delay': 0.1,  # Retraso base para reintentos (segundos)
-    'retry_max_delay': 2.0  # Retraso máximo para reintentos (segundos)
+    'retry_max_delay': 2.0,  # Retraso máximo para reintentos (segundos)
+    'retry_deadline': 10.0,  # Tiempo total máximo de una operación con sus reintentos (segundos)
+    # Errores de MySQL que se reintentan: deadlock, lock wait timeout y conexión perdida (el resto falla a la primera)
+    'retry_errnos': [1205, 1213, 2006, 2013, 2055],
+    'circuit_failure_threshold': 3,  # Fallos de conexión seguidos que abren el circuito de la base de datos
+    'circuit_cooldown': 10.0,  # Segundos que se rechazan las conexiones antes de probar de nuevo
+    'circuit_success_threshold': 1,  # Pruebas correctas (SELECT 1) necesarias para cerrar el circuito
+    'ui_circuit_poll_ms': 1000,  # Cada cuánto comprueba la ventana principal el estado del circuito (milisegundos)
+    'occupancy_cache_ttl': 5.0,  # Segundos que se reutiliza el conteo de inscritos confirmados por evento
+    'entity_cache_enabled': True,  # Caché de lectura de eventos, participantes y usuarios (get_by_id/get_all)
+    'entity_cache_size': 1000,  # Filas máximas por entidad en la caché (se expulsan las menos usadas)
+    'entity_cache_ttl': 15.0,  # Segundos que se reutiliza una fila sin releerla (cambios de otros equipos)
+    'changes_overlap_seconds': 2.0,  # Margen que get_changed_since vuelve a pedir antes de la marca (segundos)
+    'tombstone_retention_days': 7,  # Días que se conservan las lápidas de bajas (marcas más antiguas = listado completo)
+    'change_feed_enabled': True,  # Registrar los cambios en change_log y seguir los de otras instancias
+    'change_feed_poll_interval': 1.0,  # Segundos entre consultas al registro de cambios
+    'change_feed_batch_size': 500,  # Cambios leídos como máximo por consulta
+    'change_feed_gap_timeout': 10.0,  # Segundos que se espera a un cambio de una transacción aún sin confirmar
+    'change_feed_max_gaps': 1000,  # Huecos vigilados como máximo (los que no caben se cuentan en gaps_dropped)
+    'change_feed_start_window': 200,  # IDs anteriores al punto de partida en los que se buscan huecos al arrancar
+    'change_log_retention_hours': 24,  # Horas que se conservan los cambios en change_log
+    'ui_loader_workers': 4,  # Threads que ejecutan las consultas de las vistas fuera del hilo de Tk
+    'ui_loader_poll_ms': 30,  # Cada cuánto recoge el hilo de Tk los resultados pendientes (milisegundos)
+    'ui_change_window_ms': 100,  # Ventana en la que se agrupan los cambios notificados antes de refrescar una vista
+    'notification_workers': 4,  # Threads que ejecutan los callbacks de las notificaciones
+    'notification_queue_size': 1000,  # Notificaciones pendientes máximas por suscriptor
+    # Política con la cola de un suscriptor llena: 'drop_oldest', 'drop_newest' o 'block'
+    # (notify espera; puede congelar la interfaz si se notifica desde el hilo de Tk)
+    'notification_overflow': 'drop_oldest',
+    'notification_block_timeout': 1.0  # Espera máxima de notify con la política 'block' (segundos)
 }
 
+
+# Configuración de búsqueda
+SEARCH_CONFIG = {
+    # Índice de búsqueda en memoria para filtrar sin consultar MySQL (puestos kiosko/sin conexión)
+    'local_index': os.getenv('LOCAL_SEARCH_INDEX', 'false').lower() in ('1', 'true', 'yes'),
+    'ngram_size': 3,  # Tamaño de los n-gramas del índice en memoria
+    'debounce_ms': 250  # Espera tras la última tecla antes de filtrar (milisegundos)
+}
@@ -0,0 +1,15 @@
+-- Migración: contador de inscripciones confirmadas por evento
+-- Para bases de datos creadas con una versión anterior de schema.sql
+USE eventos_locales;
+
+ALTER TABLE events
+    ADD COLUMN confirmed_count INT NOT NULL DEFAULT 0
+    COMMENT 'Inscripciones confirmadas (mantenido por la aplicación)'
+    AFTER version;
+
+-- updated_at = updated_at: el recálculo no es una edición del evento (ON UPDATE no debe cambiarlo)
+UPDATE events e
+SET e.confirmed_count = (
+    SELECT COUNT(*) FROM event_registrations er
+    WHERE er.event_id = e.event_id AND er.status = 'confirmado'
+), e.updated_at = e.updated_at;
@@ -0,0 +1,9 @@
+-- Migración: índices FULLTEXT para las búsquedas de eventos y participantes
+-- Para bases de datos creadas con una versión anterior de schema.sql
+USE eventos_locales;
+
+ALTER TABLE events
+    ADD FULLTEXT INDEX ft_events_search (title, description, location);
+
+ALTER TABLE participants
+    ADD FULLTEXT INDEX ft_participants_search (first_name, last_name, email, identifier);
@@ -0,0 +1,18 @@
+-- Migración: consultas de cambios incrementales (get_changed_since)
+-- Para bases de datos creadas con una versión anterior de schema.sql
+USE eventos_locales;
+
+ALTER TABLE events
+    ADD INDEX idx_updated_at (updated_at);
+
+ALTER TABLE participants
+    ADD INDEX idx_updated_at (updated_at);
+
+CREATE TABLE IF NOT EXISTS deleted_entities (
+    tombstone_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    entity VARCHAR(50) NOT NULL COMMENT 'Tabla de la entidad eliminada',
+    entity_id INT NOT NULL,
+    deleted_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_entity_deleted_at (entity, deleted_at),
+    INDEX idx_deleted_at (deleted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,14 @@
+-- Migración: registro de cambios entre instancias (src/utils/change_feed.py)
+-- Para bases de datos creadas con una versión anterior de schema.sql
+USE eventos_locales;
+
+CREATE TABLE IF NOT EXISTS change_log (
+    change_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    change_type VARCHAR(50) NOT NULL COMMENT 'Tipo de notificación (event_updated, registration_created, ...)',
+    event_id INT NULL,
+    participant_id INT NULL,
+    user_id INT NULL,
+    origin CHAR(32) NOT NULL COMMENT 'Instancia de la aplicación que hizo el cambio',
+    changed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_changed_at (changed_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -31,10 +31,13 @@ CREATE TABLE IF NOT EXISTS events (
     capacity INT NOT NULL,
     status VARCHAR(50) NOT NULL DEFAULT 'activo',
     version INT NOT NULL DEFAULT 0,
+    confirmed_count INT NOT NULL DEFAULT 0 COMMENT 'Inscripciones confirmadas (mantenido por la aplicación)',
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_status (status),
     INDEX idx_start_datetime (start_datetime),
+    INDEX idx_updated_at (updated_at),
+    FULLTEXT INDEX ft_events_search (title, description, location),
     CHECK (end_datetime > start_datetime),
     CHECK (capacity > 0)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -51,7 +54,9 @@ CREATE TABLE IF NOT EXISTS participants (
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_email (email),
     INDEX idx_identifier (identifier),
-    INDEX idx_full_name (last_name, first_name)
+    INDEX idx_full_name (last_name, first_name),
+    INDEX idx_updated_at (updated_at),
+    FULLTEXT INDEX ft_participants_search (first_name, last_name, email, identifier)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Tabla de inscripciones (relación N:M entre eventos y participantes)
@@ -73,6 +78,28 @@ CREATE TABLE IF NOT EXISTS event_registrations (
     INDEX idx_status (status)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Lápidas de las bajas de eventos y participantes (consultas de cambios incrementales)
+CREATE TABLE IF NOT EXISTS deleted_entities (
+    tombstone_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    entity VARCHAR(50) NOT NULL COMMENT 'Tabla de la entidad eliminada',
+    entity_id INT NOT NULL,
+    deleted_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_entity_deleted_at (entity, deleted_at),
+    INDEX idx_deleted_at (deleted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Registro de cambios que siguen las demás instancias de la aplicación (ChangeFeedPoller)
+CREATE TABLE IF NOT EXISTS change_log (
+    change_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    change_type VARCHAR(50) NOT NULL COMMENT 'Tipo de notificación (event_updated, registration_created, ...)',
+    event_id INT NULL,
+    participant_id INT NULL,
+    user_id INT NULL,
+    origin CHAR(32) NOT NULL COMMENT 'Instancia de la aplicación que hizo el cambio',
+    changed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_changed_at (changed_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- Tabla de logs de auditoría
 CREATE TABLE IF NOT EXISTS audit_logs (
     log_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -129,3 +156,10 @@ WHERE (e.title = 'Concierto de Verano' AND p.identifier = '12345678A')
    OR (e.title = 'Charla sobre Medio Ambiente' AND p.identifier = '12345678A')
    OR (e.title = 'Charla sobre Medio Ambiente' AND p.identifier = '87654321B')
    OR (e.title = 'Charla sobre Medio Ambiente' AND p.identifier = '55667788E');
+
+-- Inicializar el contador de inscripciones confirmadas de los datos de ejemplo
+UPDATE events e
+SET e.confirmed_count = (
+    SELECT COUNT(*) FROM event_registrations er
+    WHERE er.event_id = e.event_id AND er.status = 'confirmado'
+);
@@ -0,0 +1,658 @@
+"""
+Controladores asíncronos (asyncio) para eventos, participantes e inscripciones
+Variante de EventController, ParticipantController y RegistrationController para un
+front-end HTTP o herramientas masivas: miles de operaciones concurrentes en un solo
+thread, compartiendo un pool de aiomysql (AsyncDatabaseConnection).
+
+Las sentencias SQL, la construcción de consultas y las validaciones son las de los
+controladores síncronos; aquí solo cambia la forma de ejecutarlas. Los backends de
+locks de aplicación (bloqueantes) no se usan: las inscripciones ya son atómicas en
+MySQL y las actualizaciones de eventos usan control de versiones optimista.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+
+from src.database.async_db_connection import AsyncDatabaseConnection, DictCursor, Error, IntegrityError
+from src.controllers.event_controller import (
+    EventController, INSERT_EVENT_SQL, SELECT_ALL_EVENTS_SQL, SELECT_EVENT_SQL,
+    UPDATE_EVENT_SQL, DELETE_EVENT_SQL
+)
+from src.controllers.participant_controller import (
+    ParticipantController, INSERT_PARTICIPANT_SQL, SELECT_ALL_PARTICIPANTS_SQL,
+    SELECT_PARTICIPANT_SQL, SELECT_PARTICIPANT_BY_EMAIL_SQL, UPDATE_PARTICIPANT_SQL,
+    SELECT_PARTICIPANT_EVENTS_SQL, RELEASE_PARTICIPANT_SEATS_SQL, DELETE_PARTICIPANT_SQL
+)
+from src.controllers.registration_controller import (
+    RegistrationController, _occupancy_cache, invalidate_occupancy_cache,
+    RESERVE_SEAT_SQL, INSERT_REGISTRATION_SQL, INSERT_REGISTRATION_IF_FREE_SQL,
+    LOCK_REGISTRATION_SQL, DELETE_REGISTRATION_SQL, UPDATE_REGISTRATION_STATUS_SQL,
+    ADJUST_CONFIRMED_COUNT_SQL, LOCK_EVENT_CAPACITY_SQL,
+    BULK_REGISTERED, BULK_NOT_FOUND, BULK_ERROR, BULK_INTEGRITY_OUTCOMES
+)
+from src.models.event import Event
+from src.models.participant import Participant
+from src.utils.concurrency_manager import get_notification_system, get_retry_policy, retry_with_backoff
+from src.utils.change_feed import changes_insert_queries
+from src.utils.change_tracking import INSERT_TOMBSTONE_SQL
+from src.utils.entity_cache import get_entity_cache
+from config.config import CONCURRENCY_CONFIG
+
+# Código de MySQL de clave duplicada (ER_DUP_ENTRY)
+ER_DUP_ENTRY = 1062
+
+
+class AsyncEventController:
+    """Controlador asíncrono de eventos (mismas reglas que EventController)"""
+
+    _check_admin_permission = EventController._check_admin_permission
+
+    def __init__(self, db: AsyncDatabaseConnection, user_role: str = 'user'):
+        """
+        Args:
+            db: Pool de conexiones asíncrono (ya conectado)
+            user_role: Rol del usuario ('admin' o 'user'). Solo admin puede modificar eventos.
+        """
+        self.db = db
+        self.user_role = user_role
+        self.is_admin = (user_role == 'admin')
+        # Misma caché de lectura que EventController
+        self.cache = get_entity_cache('events')
+
+    async def create(self, event: Event) -> Optional[int]:
+        """
+        Crea un nuevo evento
+
+        Raises:
+            PermissionError: Si el usuario no es administrador
+        """
+        self._check_admin_permission()
+        try:
+            async with _transaction(self.db) as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(INSERT_EVENT_SQL, EventController.insert_values(event))
+                    event_id = cursor.lastrowid
+                    await _record_changes(cursor, [('event_created', event_id, None, None)])
+        except Error as e:
+            print(f"Error al crear evento: {e}")
+            return None
+
+        self.cache.invalidate()
+        event.event_id = event_id
+        get_notification_system().notify('event_created', event_id=event_id, event=event)
+        return event_id
+
+    async def get_all(self) -> List[Event]:
+        """Obtiene todos los eventos (de la caché si el listado está vigente)"""
+        rows = self.cache.get_all()
+        if rows is None:
+            generation = self.cache.generation
+            try:
+                rows = await _fetchall(self.db, SELECT_ALL_EVENTS_SQL)
+            except Error as e:
+                print(f"Error al obtener eventos: {e}")
+                return []
+            self.cache.put_all(rows, generation)
+        return [Event.from_dict(row) for row in rows]
+
+    async def get_page(self, after: Optional[Tuple[Any, int]] = None,
+                       before: Optional[Tuple[Any, int]] = None,
+                       limit: int = 100, search_term: Optional[str] = None,
+                       status: Optional[str] = None, order_by: str = 'start_datetime') -> List[Event]:
+        """Obtiene una página de eventos por clave (ver EventController.get_page)"""
+        try:
+            rows = await _fetchall(self.db, *EventController.page_query(after, before, limit, search_term,
+                                                                         status, order_by))
+        except Error as e:
+            print(f"Error al obtener página de eventos: {e}")
+            return []
+        if before is not None:
+            rows.reverse()
+        return [Event.from_dict(row) for row in rows]
+
+    page_key = staticmethod(EventController.page_key)
+
+    async def get_by_id(self, event_id: int) -> Optional[Event]:
+        """Obtiene un evento por su ID (de la caché si está vigente)"""
+        cached = self.cache.get(event_id)
+        if cached is not None:
+            return Event.from_dict(cached)
+        generation = self.cache.generation
+        try:
+            rows = await _fetchall(self.db, SELECT_EVENT_SQL, (event_id,))
+        except Error as e:
+            print(f"Error al obtener evento: {e}")
+            return None
+        if not rows:
+            return None
+        self.cache.put(event_id, rows[0], generation)
+        return Event.from_dict(rows[0])
+
+    @retry_with_backoff(policy=get_retry_policy('async_events', exceptions=(Error,)))
+    async def _update_internal(self, event: Event) -> bool:
+        """Actualiza el evento si su versión no ha cambiado; relanza Error para reintentar"""
+        async with _transaction(self.db) as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(UPDATE_EVENT_SQL, EventController.update_values(event))
+                if cursor.rowcount == 0:
+                    return False
+                await _record_changes(cursor, [('event_updated', event.event_id, None, None)])
+                return True
+
+    async def update(self, event: Event) -> bool:
+        """
+        Actualiza un evento con control de concurrencia optimista: devuelve False si
+        otro usuario lo modificó después de leerlo (versión distinta)
+
+        Raises:
+            PermissionError: Si el usuario no es administrador
+        """
+        self._check_admin_permission()
+        try:
+            updated = await self._update_internal(event)
+        except Exception as e:
+            print(f"Error al actualizar evento después de reintentos: {e}")
+            return False
+        self.cache.invalidate(event.event_id)
+        if updated:
+            get_notification_system().notify('event_updated', event_id=event.event_id, event=event)
+        return updated
+
+    async def delete(self, event_id: int) -> bool:
+        """
+        Elimina un evento
+
+        Raises:
+            PermissionError: Si el usuario no es administrador
+        """
+        self._check_admin_permission()
+        try:
+            async with _transaction(self.db) as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(DELETE_EVENT_SQL, (event_id,))
+                    affected_rows = cursor.rowcount
+                    if affected_rows > 0:
+                        await cursor.execute(INSERT_TOMBSTONE_SQL, ('events', event_id))
+                        await _record_changes(cursor, [('event_deleted', event_id, None, None)])
+        except Error as e:
+            print(f"Error al eliminar evento: {e}")
+            return False
+        self.cache.invalidate(event_id)
+        if affected_rows > 0:
+            get_notification_system().notify('event_deleted', event_id=event_id)
+        return affected_rows > 0
+
+    async def search(self, search_term: str, mode: str = 'like', status: Optional[str] = None,
+                     order_by: Optional[str] = None, limit: Optional[int] = None,
+                     offset: int = 0) -> List[Event]:
+        """Busca eventos (mismos parámetros que EventController.search)"""
+        query, params = EventController.search_query(search_term, mode, status, order_by, limit, offset)
+        try:
+            rows = await _fetchall(self.db, query, params)
+        except Error as e:
+            print(f"Error al buscar eventos: {e}")
+            return []
+        return [Event.from_dict(row) for row in rows]
+
+
+class AsyncParticipantController:
+    """Controlador asíncrono de participantes (mismas reglas que ParticipantController)"""
+
+    _check_admin_permission = ParticipantController._check_admin_permission
+
+    def __init__(self, db: AsyncDatabaseConnection, user_role: str = 'user'):
+        """
+        Args:
+            db: Pool de conexiones asíncrono (ya conectado)
+            user_role: Rol del usuario ('admin' o 'user'). Solo admin puede modificar participantes.
+        """
+        self.db = db
+        self.user_role = user_role
+        self.is_admin = (user_role == 'admin')
+        # Misma caché de lectura que ParticipantController
+        self.cache = get_entity_cache('participants')
+
+    async def create(self, participant: Participant) -> Optional[int]:
+        """
+        Crea un nuevo participante
+
+        Raises:
+            PermissionError: Si el usuario no es administrador
+        """
+        self._check_admin_permission()
+        try:
+            async with _transaction(self.db) as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(INSERT_PARTICIPANT_SQL, ParticipantController.insert_values(participant))
+                    participant_id = cursor.lastrowid
+                    await _record_changes(cursor, [('participant_created', None, participant_id, None)])
+        except Error as e:
+            print(f"Error al crear participante: {e}")
+            return None
+
+        self.cache.invalidate()
+        participant.participant_id = participant_id
+        get_notification_system().notify(
+            'participant_created',
+            participant_id=participant_id,
+            participant=participant
+        )
+        return participant_id
+
+    async def get_all(self) -> List[Participant]:
+        """Obtiene todos los participantes (de la caché si el listado está vigente)"""
+        rows = self.cache.get_all()
+        if rows is None:
+            generation = self.cache.generation
+            try:
+                rows = await _fetchall(self.db, SELECT_ALL_PARTICIPANTS_SQL)
+            except Error as e:
+                print(f"Error al obtener participantes: {e}")
+                return []
+            self.cache.put_all(rows, generation)
+        return [Participant.from_dict(row) for row in rows]
+
+    async def get_page(self, after: Optional[Tuple[str, str, int]] = None,
+                       before: Optional[Tuple[str, str, int]] = None,
+                       limit: int = 100, search_term: Optional[str] = None) -> List[Participant]:
+        """Obtiene una página de participantes por clave (ver ParticipantController.get_page)"""
+        try:
+            rows = await _fetchall(self.db, *ParticipantController.page_query(after, before, limit, search_term))
+        except Error as e:
+            print(f"Error al obtener página de participantes: {e}")
+            return []
+        if before is not None:
+            rows.reverse()
+        return [Participant.from_dict(row) for row in rows]
+
+    page_key = staticmethod(ParticipantController.page_key)
+
+    async def get_by_id(self, participant_id: int) -> Optional[Participant]:
+        """Obtiene un participante por su ID (de la caché si está vigente)"""
+        cached = self.cache.get(participant_id)
+        if cached is not None:
+            return Participant.from_dict(cached)
+        generation = self.cache.generation
+        try:
+            rows = await _fetchall(self.db, SELECT_PARTICIPANT_SQL, (participant_id,))
+        except Error as e:
+            print(f"Error al obtener participante: {e}")
+            return None
+        if not rows:
+            return None
+        self.cache.put(participant_id, rows[0], generation)
+        return Participant.from_dict(rows[0])
+
+    async def get_by_email(self, email: str) -> Optional[Participant]:
+        """Obtiene un participante por su email"""
+        try:
+            rows = await _fetchall(self.db, SELECT_PARTICIPANT_BY_EMAIL_SQL, (email,))
+        except Error as e:
+            print(f"Error al obtener participante por email: {e}")
+            return None
+        return Participant.from_dict(rows[0]) if rows else None
+
+    async def update(self, participant: Participant) -> bool:
+        """
+        Actualiza un participante
+
+        Raises:
+            PermissionError: Si el usuario no es administrador
+        """
+        self._check_admin_permission()
+        try:
+            async with _transaction(self.db) as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(UPDATE_PARTICIPANT_SQL, ParticipantController.update_values(participant))
+                    affected_rows = cursor.rowcount
+                    if affected_rows > 0:
+                        await _record_changes(cursor, [('participant_updated', None, participant.participant_id, None)])
+        except Error as e:
+            print(f"Error al actualizar participante: {e}")
+            return False
+        self.cache.invalidate(participant.participant_id)
+        if affected_rows > 0:
+            get_notification_system().notify(
+                'participant_updated',
+                participant_id=participant.participant_id,
+                participant=participant
+            )
+        return affected_rows > 0
+
+    async def delete(self, participant_id: int) -> bool:
+        """
+        Elimina un participante liberando antes sus plazas confirmadas
+
+        Raises:
+            PermissionError: Si el usuario no es administrador
+        """
+        self._check_admin_permission()
+        try:
+            async with _transaction(self.db) as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(SELECT_PARTICIPANT_EVENTS_SQL, (participant_id,))
+                    event_ids = [row[0] for row in await cursor.fetchall()]
+                    await cursor.execute(RELEASE_PARTICIPANT_SEATS_SQL, (participant_id,))
+                    await cursor.execute(DELETE_PARTICIPANT_SQL, (participant_id,))
+                    affected_rows = cursor.rowcount
+                    if affected_rows > 0:
+                        await cursor.execute(INSERT_TOMBSTONE_SQL, ('participants', participant_id))
+                        await _record_changes(cursor, ParticipantController.deleted_changes(participant_id, event_ids))
+        except Error as e:
+            print(f"Error al eliminar participante: {e}")
+            return False
+
+        invalidate_occupancy_cache()
+        self.cache.invalidate(participant_id)
+        if affected_rows > 0:
+            ParticipantController.notify_deleted(participant_id, event_ids)
+        return affected_rows > 0
+
+    async def search(self, search_term: str, mode: str = 'like', limit: Optional[int] = None,
+                     offset: int = 0) -> List[Participant]:
+        """Busca participantes (mismos parámetros que ParticipantController.search)"""
+        query, params = ParticipantController.search_query(search_term, mode, limit, offset)
+        try:
+            rows = await _fetchall(self.db, query, params)
+        except Error as e:
+            print(f"Error al buscar participantes: {e}")
+            return []
+        return [Participant.from_dict(row) for row in rows]
+
+
+class AsyncRegistrationController:
+    """Controlador asíncrono de inscripciones (mismas reglas que RegistrationController)"""
+
+    validate_status = staticmethod(RegistrationController.validate_status)
+    next_cursor = staticmethod(RegistrationController.next_cursor)
+
+    def __init__(self, db: AsyncDatabaseConnection):
+        """
+        Args:
+            db: Pool de conexiones asíncrono (ya conectado)
+        """
+        self.db = db
+
+    @retry_with_backoff(policy=get_retry_policy('async_registrations', exceptions=(Error,)))
+    async def _register_participant_internal(self, event_id: int, participant_id: int,
+                                             status: str) -> Optional[int]:
+        """Reserva la plaza e inserta la inscripción en una transacción; relanza Error para reintentar"""
+        async with self.db.connection() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    if status == 'confirmado':
+                        await cursor.execute(RESERVE_SEAT_SQL, (event_id,))
+                        if cursor.rowcount == 0:
+                            await conn.rollback()
+                            return None  # Evento inexistente o lleno
+                        await cursor.execute(INSERT_REGISTRATION_SQL, (event_id, participant_id, status))
+                    else:
+                        await cursor.execute(INSERT_REGISTRATION_IF_FREE_SQL, (participant_id, status, event_id))
+                        if cursor.rowcount == 0:
+                            await conn.rollback()
+                            return None
+                    registration_id = cursor.lastrowid
+                    await _record_changes(cursor, [('registration_created', event_id, participant_id, None)])
+                await conn.commit()
+                return registration_id
+            except IntegrityError as e:
+                # Ya inscrito (clave única) o evento/participante inexistente: no se reintenta
+                await conn.rollback()
+                if e.args and e.args[0] != ER_DUP_ENTRY:
+                    print(f"Error al registrar participante: {e}")
+                return None
+            except Error:
+                await conn.rollback()
+                raise
+
+    async def register_participant(self, event_id: int, participant_id: int,
+                                   status: str = "confirmado") -> Optional[int]:
+        """
+        Registra un participante en un evento (reserva atómica de plaza en MySQL,
+        con reintentos ante errores transitorios)
+
+        Raises:
+            ValueError: Si el estado no es válido
+        """
+        status = self.validate_status(status)
+        try:
+            registration_id = await self._register_participant_internal(event_id, participant_id, status)
+        except Exception as e:
+            print(f"Error al registrar participante después de reintentos: {e}")
+            return None
+        if registration_id is not None:
+            _occupancy_cache.invalidate(event_id)
+            get_notification_system().notify(
+                'registration_created',
+                event_id=event_id,
+                participant_id=participant_id,
+                registration_id=registration_id
+            )
+        return registration_id
+
+    async def unregister_participant(self, event_id: int, participant_id: int) -> bool:
+        """Elimina la inscripción de un participante y libera su plaza si estaba confirmada"""
+        try:
+            async with self.db.connection() as conn:
+                await conn.begin()
+                try:
+                    async with conn.cursor() as cursor:
+                        await cursor.execute(LOCK_REGISTRATION_SQL, (event_id, participant_id))
+                        result = await cursor.fetchone()
+                        if not result:
+                            await conn.rollback()
+                            return False
+                        await cursor.execute(DELETE_REGISTRATION_SQL, (event_id, participant_id))
+                        affected_rows = cursor.rowcount
+                        if affected_rows > 0 and result[0] == 'confirmado':
+                            await cursor.execute(ADJUST_CONFIRMED_COUNT_SQL, (-1, event_id))
+                        if affected_rows > 0:
+                            await _record_changes(cursor, [('registration_deleted', event_id, participant_id, None)])
+                    await conn.commit()
+                except Error:
+                    await conn.rollback()
+                    raise
+        except Error as e:
+            print(f"Error al desregistrar participante: {e}")
+            return False
+
+        _occupancy_cache.invalidate(event_id)
+        if affected_rows > 0:
+            get_notification_system().notify(
+                'registration_deleted',
+                event_id=event_id,
+                participant_id=participant_id
+            )
+        return affected_rows > 0
+
+    async def update_status(self, event_id: int, participant_id: int, new_status: str) -> bool:
+        """
+        Actualiza el estado de una inscripción manteniendo confirmed_count
+
+        Raises:
+            ValueError: Si el estado no es válido
+        """
+        new_status = self.validate_status(new_status)
+        try:
+            async with self.db.connection() as conn:
+                await conn.begin()
+                try:
+                    async with conn.cursor() as cursor:
+                        await cursor.execute(LOCK_REGISTRATION_SQL, (event_id, participant_id))
+                        result = await cursor.fetchone()
+                        if not result:
+                            await conn.rollback()
+                            return False
+                        await cursor.execute(UPDATE_REGISTRATION_STATUS_SQL, (new_status, event_id, participant_id))
+                        affected_rows = cursor.rowcount
+                        delta = RegistrationController.confirmed_delta(result[0], new_status)
+                        if delta:
+                            await cursor.execute(ADJUST_CONFIRMED_COUNT_SQL, (delta, event_id))
+                        if affected_rows > 0:
+                            await _record_changes(
+                                cursor, [('registration_status_changed', event_id, participant_id, None)]
+                            )
+                    await conn.commit()
+                except Error:
+                    await conn.rollback()
+                    raise
+        except Error as e:
+            print(f"Error al actualizar estado de inscripción: {e}")
+            return False
+
+        _occupancy_cache.invalidate(event_id)
+        if affected_rows > 0:
+            get_notification_system().notify(
+                'registration_status_changed',
+                event_id=event_id,
+                participant_id=participant_id,
+                new_status=new_status
+            )
+        return affected_rows > 0
+
+    async def get_registrations(self, event_id: Optional[int] = None,
+                                participant_id: Optional[int] = None,
+                                status: Optional[str] = None,
+                                limit: Optional[int] = None,
+                                after: Optional[Tuple[datetime, int]] = None) -> List[Dict]:
+        """Obtiene las inscripciones (mismos parámetros que RegistrationController.get_registrations)"""
+        query, params = RegistrationController.registrations_query(event_id, participant_id, status, limit, after)
+        try:
+            return await _fetchall(self.db, query, params)
+        except Error as e:
+            print(f"Error al obtener inscripciones: {e}")
+            return []
+
+    async def count_confirmed_bulk(self, event_ids: List[int]) -> Dict[int, int]:
+        """Inscripciones confirmadas de varios eventos (comparte la caché de ocupación)"""
+        event_ids = list(dict.fromkeys(event_ids))
+        counts = _occupancy_cache.get_many(event_ids)
+        missing = [event_id for event_id in event_ids if event_id not in counts]
+        if not missing:
+            return counts
+        try:
+            rows = await _fetchall(self.db, *RegistrationController.confirmed_counts_query(missing), dictionary=False)
+        except Error as e:
+            print(f"Error al contar inscripciones confirmadas: {e}")
+            counts.update({event_id: 0 for event_id in missing})
+            return counts
+        fetched = {event_id: 0 for event_id in missing}
+        fetched.update({event_id: count for event_id, count in rows})
+        _occupancy_cache.set_many(fetched)
+        counts.update(fetched)
+        return counts
+
+    @retry_with_backoff(policy=get_retry_policy('async_registrations', exceptions=(Error,)))
+    async def _register_bulk_internal(self, event_id: int, participant_ids: List[int],
+                                      status: str) -> Dict[int, Tuple[str, Optional[int]]]:
+        """Inscripción masiva en una transacción (ver RegistrationController.register_participants_bulk)"""
+        chunk_size = CONCURRENCY_CONFIG.get('bulk_insert_chunk', 1000)
+        outcomes: Dict[int, Tuple[str, Optional[int]]] = {}
+        async with self.db.connection() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(LOCK_EVENT_CAPACITY_SQL, (event_id,))
+                    row = await cursor.fetchone()
+                    if not row:
+                        await conn.rollback()
+                        return {pid: (BULK_NOT_FOUND, None) for pid in participant_ids}
+                    capacity, confirmed = row
+
+                    candidates = []
+                    for chunk in RegistrationController.chunks(participant_ids, chunk_size):
+                        await cursor.execute(*RegistrationController.bulk_lookup_query(event_id, chunk))
+                        found = dict(await cursor.fetchall())
+                        candidates.extend(RegistrationController.classify_bulk_chunk(chunk, found, outcomes))
+
+                    accepted = RegistrationController.accept_bulk(candidates, capacity, confirmed, status, outcomes)
+
+                    # Sin IGNORE: si un bloque falla por otra transacción, se repite fila a fila
+                    inserted: List[int] = []
+                    for chunk in RegistrationController.chunks(accepted, chunk_size):
+                        try:
+                            await cursor.execute(*RegistrationController.bulk_insert_query(event_id, chunk, status))
+                            inserted.extend(chunk)
+                        except IntegrityError as e:
+                            if not e.args or e.args[0] not in BULK_INTEGRITY_OUTCOMES:
+                                raise
+                            for pid in chunk:
+                                try:
+                                    await cursor.execute(INSERT_REGISTRATION_SQL, (event_id, pid, status))
+                                    inserted.append(pid)
+                                except IntegrityError as row_error:
+                                    if not row_error.args or row_error.args[0] not in BULK_INTEGRITY_OUTCOMES:
+                                        raise
+                                    outcomes[pid] = (BULK_INTEGRITY_OUTCOMES[row_error.args[0]], None)
+                    if status == 'confirmado' and inserted:
+                        await cursor.execute(ADJUST_CONFIRMED_COUNT_SQL, (len(inserted), event_id))
+
+                    inserted_set = set(inserted)
+                    targets = RegistrationController.readback_targets(inserted, outcomes)
+                    for chunk in RegistrationController.chunks(targets, chunk_size):
+                        await cursor.execute(*RegistrationController.bulk_readback_query(event_id, chunk))
+                        RegistrationController.classify_readback(await cursor.fetchall(), inserted_set, outcomes)
+
+                    await _record_changes(cursor, [('registration_created', event_id, pid, None) for pid in inserted])
+                await conn.commit()
+                return outcomes
+            except Error:
+                await conn.rollback()
+                raise
+
+    async def register_participants_bulk(self, event_id: int, participant_ids: List[int],
+                                         status: str = "confirmado") -> List[Tuple[int, str, Optional[int]]]:
+        """
+        Inscribe muchos participantes en una transacción
+        (resultados como RegistrationController.register_participants_bulk)
+        """
+        unique_ids = list(dict.fromkeys(participant_ids))
+        status = self.validate_status(status)
+        try:
+            outcomes = await self._register_bulk_internal(event_id, unique_ids, status) if unique_ids else {}
+        except Exception as e:
+            print(f"Error en la inscripción masiva después de reintentos: {e}")
+            return [(pid, BULK_ERROR, None) for pid in unique_ids]
+
+        registered = [pid for pid in unique_ids if outcomes.get(pid, (None,))[0] == BULK_REGISTERED]
+        if registered:
+            _occupancy_cache.invalidate(event_id)
+            notifications = get_notification_system()
+            for pid in registered:
+                notifications.notify(
+                    'registration_created',
+                    event_id=event_id,
+                    participant_id=pid,
+                    registration_id=outcomes[pid][1]
+                )
+        return [(pid, *outcomes.get(pid, (BULK_ERROR, None))) for pid in unique_ids]
+
+
+async def _fetchall(db: AsyncDatabaseConnection, query: str, params: tuple = (),
+                    dictionary: bool = True) -> list:
+    """Ejecuta una consulta de lectura y devuelve sus filas (diccionarios por defecto)"""
+    async with db.connection() as conn:
+        async with (conn.cursor(DictCursor) if dictionary else conn.cursor()) as cursor:
+            await cursor.execute(query, params)
+            return list(await cursor.fetchall())
+
+
+@asynccontextmanager
+async def _transaction(db: AsyncDatabaseConnection):
+    """Conexión con una transacción abierta: commit al salir del bloque y rollback si falla"""
+    async with db.connection() as conn:
+        await conn.begin()
+        try:
+            yield conn
+        except BaseException:
+            await conn.rollback()
+            raise
+        await conn.commit()
+
+
+async def _record_changes(cursor, changes: list):
+    """Añade cambios a change_log dentro de la transacción (ver src/utils/change_feed.py)"""
+    for query, params in changes_insert_queries(changes):
+        await cursor.execute(query, params)
@@ -7,6 +7,8 @@ import bcrypt
 from mysql.connector import Error
 from typing import Optional, Tuple
 from src.database.db_connection import DatabaseConnection
+from src.utils.concurrency_manager import get_notification_system
+from src.utils.change_feed import record_change
 
 
 class AuthController:
@@ -151,6 +153,7 @@ class AuthController:
             user_id = cursor.lastrowid
             
             # Si se proporcionaron datos de participante, crear el participante
+            participant_id = None
             if create_participant:
                 insert_participant_query = """
                     INSERT INTO participants (first_name, last_name, email, phone, identifier)
@@ -159,11 +162,21 @@ class AuthController:
                 cursor.execute(insert_participant_query, (
                     first_name, last_name, email, phone, identifier
                 ))
+                participant_id = cursor.lastrowid
             
+            record_change(cursor, 'user_created', user_id=user_id)
+            if participant_id is not None:
+                record_change(cursor, 'participant_created', participant_id=participant_id)
             conn.commit()
             cursor.close()
             conn.close()
             
+            # Notificar las altas (invalidan las cachés de usuarios y participantes)
+            notifications = get_notification_system()
+            notifications.notify('user_created', user_id=user_id)
+            if participant_id is not None:
+                notifications.notify('participant_created', participant_id=participant_id)
+            
             return True, None
             
         except Error as e:
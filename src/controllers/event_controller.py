@@ -5,19 +5,64 @@ Incluye gestión avanzada de concurrencia para usuarios simultáneos
 """
 
 from src.database.db_connection import DatabaseConnection
-from src.models.event import Event
+from src.models.event import Event, EVENT_STATUSES
 from mysql.connector import Error
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 from datetime import datetime
 from src.utils.concurrency_manager import (
     retry_with_backoff,
-    get_notification_system,
-    ResourceLockManager
+    get_retry_policy,
+    get_notification_system
 )
+from src.utils.change_feed import record_change
+from src.utils.change_tracking import ChangeSet, fetch_changes, record_tombstone
+from src.utils.entity_cache import get_entity_cache
+from src.utils.lock_backends import get_lock_backend
+from src.utils.search import FullTextSearch
 from config.config import CONCURRENCY_CONFIG
 
-# Instancia global del gestor de locks
-_lock_manager = ResourceLockManager()
+# Estado que se muestra en la interfaz: se respeta el estado explícito y, si no es
+# uno de los conocidos, se calcula a partir de las fechas del evento (Event.display_status)
+DERIVED_STATUS_SQL = """
+    CASE
+        WHEN LOWER(status) IN (%s) THEN LOWER(status)
+        WHEN end_datetime < NOW() THEN 'finalizado'
+        WHEN start_datetime <= NOW() AND NOW() <= end_datetime THEN 'activo'
+        WHEN start_datetime > NOW() THEN 'planificado'
+        ELSE LOWER(status)
+    END
+""" % ", ".join(f"'{status}'" for status in EVENT_STATUSES)
+
+# Órdenes admitidos en las búsquedas
+_SEARCH_ORDER = {
+    'relevance': 'relevance DESC',
+    'start_datetime': 'start_datetime DESC',
+    'title': 'title ASC'
+}
+
+# Órdenes de la paginación por clave: columna -> sentido (el desempate por event_id va en el mismo sentido)
+_PAGE_ORDER = {
+    'start_datetime': 'DESC',
+    'title': 'ASC'
+}
+
+# Sentencias compartidas con AsyncEventController (src/controllers/async_controllers.py)
+INSERT_EVENT_SQL = """
+    INSERT INTO events (title, description, location, start_datetime, 
+                      end_datetime, capacity, status, version)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, 0)
+"""
+SELECT_ALL_EVENTS_SQL = "SELECT * FROM events ORDER BY start_datetime DESC"
+SELECT_EVENT_SQL = "SELECT * FROM events WHERE event_id = %s"
+# Control de concurrencia optimista: solo actualiza si la versión no ha cambiado
+UPDATE_EVENT_SQL = """
+    UPDATE events 
+    SET title = %s, description = %s, location = %s,
+        start_datetime = %s, end_datetime = %s,
+        capacity = %s, status = %s, version = version + 1
+    WHERE event_id = %s AND version = %s
+"""
+DELETE_EVENT_SQL = "DELETE FROM events WHERE event_id = %s"
 
 
 class EventController:
@@ -34,6 +79,10 @@ class EventController:
         self.db = db
         self.user_role = user_role
         self.is_admin = (user_role == 'admin')
+        # Backend de locks por recurso ('process', 'mysql' o 'none', ver CONCURRENCY_CONFIG)
+        self.lock_backend = get_lock_backend(CONCURRENCY_CONFIG.get('lock_backend'), db)
+        # Caché de lectura compartida por todos los controladores de eventos
+        self.cache = get_entity_cache('events')
     
     def _check_admin_permission(self) -> bool:
         """
@@ -63,21 +112,21 @@ class EventController:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
-            query = """
-                INSERT INTO events (title, description, location, start_datetime, 
-                                  end_datetime, capacity, status, version)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, 0)
-            """
-            values = (
-                event.title, event.description, event.location,
-                event.start_datetime, event.end_datetime,
-                event.capacity, event.status
-            )
-            
-            cursor.execute(query, values)
-            conn.commit()
+            cursor.execute(INSERT_EVENT_SQL, self.insert_values(event))
             event_id = cursor.lastrowid
+            record_change(cursor, 'event_created', event_id=event_id)
+            conn.commit()
             cursor.close()
+            self.cache.invalidate()
+            
+            # Notificar evento de creación
+            event.event_id = event_id
+            get_notification_system().notify(
+                'event_created',
+                event_id=event_id,
+                event=event
+            )
+            
             return event_id
             
         except Error as e:
@@ -90,16 +139,21 @@ class EventController:
                 conn.close()
     
     def get_all(self) -> List[Event]:
-        """Obtiene todos los eventos"""
+        """Obtiene todos los eventos (de la caché si el listado está vigente)"""
+        cached = self.cache.get_all()
+        if cached is not None:
+            return [Event.from_dict(row) for row in cached]
+        generation = self.cache.generation
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor(dictionary=True)
             
-            query = "SELECT * FROM events ORDER BY start_datetime DESC"
-            cursor.execute(query)
+            cursor.execute(SELECT_ALL_EVENTS_SQL)
             results = cursor.fetchall()
             cursor.close()
+            self.cache.put_all(results, generation)
             
             return [Event.from_dict(row) for row in results]
             
@@ -110,19 +164,130 @@ class EventController:
             if conn:
                 conn.close()
     
+    def get_page(self, after: Optional[Tuple[Any, int]] = None,
+                 before: Optional[Tuple[Any, int]] = None,
+                 limit: int = 100, search_term: Optional[str] = None,
+                 status: Optional[str] = None, order_by: str = 'start_datetime') -> List[Event]:
+        """
+        Obtiene una página de eventos usando paginación por clave (keyset), sin OFFSET
+        
+        Args:
+            after: Clave (page_key) del último evento visto; devuelve los siguientes
+            before: Clave del primer evento visto; devuelve los anteriores (en el mismo orden)
+            limit: Tamaño de la página
+            search_term: Texto a buscar (subcadena del título o la ubicación)
+            status: Filtra por estado mostrado ('activo', 'finalizado', 'cancelado', 'planificado')
+            order_by: 'start_datetime' (más recientes primero) o 'title' (alfabético)
+        """
+        query, params = self.page_query(after, before, limit, search_term, status, order_by)
+        
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(query, params)
+            results = cursor.fetchall()
+            cursor.close()
+            
+            if before is not None:
+                results.reverse()
+            return [Event.from_dict(row) for row in results]
+            
+        except Error as e:
+            print(f"Error al obtener página de eventos: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+    
+    @staticmethod
+    def page_query(after: Optional[Tuple[Any, int]] = None,
+                   before: Optional[Tuple[Any, int]] = None,
+                   limit: int = 100, search_term: Optional[str] = None,
+                   status: Optional[str] = None, order_by: str = 'start_datetime') -> Tuple[str, tuple]:
+        """
+        Consulta y parámetros de get_page (con before, las filas salen en orden inverso)
+        
+        La búsqueda es por subcadena: las vistas la usan sin texto o cuando alguna palabra es
+        demasiado corta para FULLTEXT (en otro caso usan search en modo 'boolean'). Con LIMIT
+        y el orden de un índice, MySQL deja de leer en cuanto completa la página.
+        
+        Raises:
+            ValueError: Si el orden no es válido
+        """
+        if order_by not in _PAGE_ORDER:
+            raise ValueError(f"Orden inválido. Órdenes válidos: {', '.join(_PAGE_ORDER)}")
+        direction = _PAGE_ORDER[order_by]
+        conditions = []
+        params = []
+        
+        term = (search_term or "").strip()
+        if term:
+            conditions.append("(title LIKE %s OR location LIKE %s)")
+            search_pattern = f"%{term}%"
+            params.extend([search_pattern, search_pattern])
+        if status:
+            conditions.append(f"({DERIVED_STATUS_SQL}) = %s")
+            params.append(status.lower())
+        
+        key = before if before is not None else after
+        if key is not None:
+            # after avanza en el sentido del orden; before retrocede
+            forward = before is None
+            op = '<' if (direction == 'DESC') == forward else '>'
+            conditions.append(f"({order_by} {op} %s OR ({order_by} = %s AND event_id {op} %s))")
+            params.extend([key[0], key[0], key[1]])
+        if before is not None:
+            direction = 'ASC' if direction == 'DESC' else 'DESC'
+        
+        query = "SELECT * FROM events"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_by} {direction}, event_id {direction} LIMIT %s"
+        params.append(int(limit))
+        return query, tuple(params)
+    
+    @staticmethod
+    def page_key(event: Event, order_by: str = 'start_datetime') -> Tuple[Any, int]:
+        """Clave de paginación de un evento (valor de la columna de orden y event_id)"""
+        return getattr(event, order_by), event.event_id
+    
+    @staticmethod
+    def insert_values(event: Event) -> tuple:
+        """Parámetros de INSERT_EVENT_SQL"""
+        return (
+            event.title, event.description, event.location,
+            event.start_datetime, event.end_datetime,
+            event.capacity, event.status
+        )
+    
+    @staticmethod
+    def update_values(event: Event) -> tuple:
+        """Parámetros de UPDATE_EVENT_SQL (la versión leída va al final)"""
+        return (
+            event.title, event.description, event.location,
+            event.start_datetime, event.end_datetime,
+            event.capacity, event.status, event.event_id, event.version
+        )
+    
     def get_by_id(self, event_id: int) -> Optional[Event]:
-        """Obtiene un evento por su ID"""
+        """Obtiene un evento por su ID (de la caché si está vigente)"""
+        cached = self.cache.get(event_id)
+        if cached is not None:
+            return Event.from_dict(cached)
+        generation = self.cache.generation
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor(dictionary=True)
             
-            query = "SELECT * FROM events WHERE event_id = %s"
-            cursor.execute(query, (event_id,))
+            cursor.execute(SELECT_EVENT_SQL, (event_id,))
             result = cursor.fetchone()
             cursor.close()
             
             if result:
+                self.cache.put(event_id, result, generation)
                 return Event.from_dict(result)
             return None
             
@@ -133,12 +298,35 @@ class EventController:
             if conn:
                 conn.close()
     
-    @retry_with_backoff(
-        max_retries=CONCURRENCY_CONFIG.get('max_retries', 3),
-        base_delay=CONCURRENCY_CONFIG.get('retry_base_delay', 0.1),
-        max_delay=CONCURRENCY_CONFIG.get('retry_max_delay', 2.0),
-        exceptions=(Error,)
-    )
+    def get_changed_since(self, since: Optional[datetime] = None) -> Optional[ChangeSet]:
+        """
+        Obtiene los eventos creados, modificados o eliminados desde una marca
+        
+        Args:
+            since: watermark del ChangeSet anterior (None = listado completo)
+        
+        Returns:
+            ChangeSet con los cambios y la marca para la siguiente llamada, o None si falla
+            la consulta (se conserva la marca anterior)
+        """
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            rows, deleted, watermark, full = fetch_changes(cursor, 'events', since, SELECT_ALL_EVENTS_SQL)
+            cursor.close()
+            
+            return ChangeSet([Event.from_dict(row) for row in rows], deleted, watermark, full)
+            
+        except Error as e:
+            print(f"Error al obtener cambios de eventos: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+    
+    @retry_with_backoff(policy=get_retry_policy('events'))
     def _update_internal(self, event: Event) -> bool:
         """
         Método interno para actualizar un evento con locks y control de versiones optimista.
@@ -147,8 +335,7 @@ class EventController:
         self._check_admin_permission()
         # Usar lock de recurso para el evento específico
         resource_id = f"event_{event.event_id}"
-        lock = _lock_manager.get_lock(resource_id)
-        acquired = lock.acquire(timeout=CONCURRENCY_CONFIG.get('lock_timeout', 30))
+        acquired = self.lock_backend.acquire(resource_id, timeout=CONCURRENCY_CONFIG.get('lock_timeout', 30))
         if not acquired:
             raise TimeoutError(f"No se pudo adquirir el lock para el evento {event.event_id} en {CONCURRENCY_CONFIG.get('lock_timeout', 30)}s")
         
@@ -158,27 +345,18 @@ class EventController:
             cursor = conn.cursor()
             
             # Verificar versión antes de actualizar (control de concurrencia optimista)
-            query = """
-                UPDATE events 
-                SET title = %s, description = %s, location = %s,
-                    start_datetime = %s, end_datetime = %s,
-                    capacity = %s, status = %s, version = version + 1
-                WHERE event_id = %s AND version = %s
-            """
-            values = (
-                event.title, event.description, event.location,
-                event.start_datetime, event.end_datetime,
-                event.capacity, event.status, event.event_id, event.version
-            )
-            
-            cursor.execute(query, values)
+            cursor.execute(UPDATE_EVENT_SQL, self.update_values(event))
             affected_rows = cursor.rowcount
+            if affected_rows > 0:
+                record_change(cursor, 'event_updated', event_id=event.event_id)
             conn.commit()
             cursor.close()
             
             if affected_rows == 0:
-                # La versión cambió, conflicto de concurrencia
+                # La versión cambió, conflicto de concurrencia: la fila en caché está desfasada
+                self.cache.invalidate(event.event_id)
                 return False
+            self.cache.invalidate(event.event_id)
             
             # Notificar evento de actualización
             get_notification_system().notify(
@@ -197,7 +375,7 @@ class EventController:
         finally:
             if conn:
                 conn.close()
-            lock.release()
+            self.lock_backend.release(resource_id)
     
     def update(self, event: Event) -> bool:
         """
@@ -224,11 +402,19 @@ class EventController:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
-            query = "DELETE FROM events WHERE event_id = %s"
-            cursor.execute(query, (event_id,))
-            conn.commit()
+            cursor.execute(DELETE_EVENT_SQL, (event_id,))
             affected_rows = cursor.rowcount
+            # Lápida para los clientes que refrescan con get_changed_since
+            if affected_rows > 0:
+                record_tombstone(cursor, 'events', event_id)
+                record_change(cursor, 'event_deleted', event_id=event_id)
+            conn.commit()
             cursor.close()
+            self.cache.invalidate(event_id)
+            
+            # Notificar evento de eliminación
+            if affected_rows > 0:
+                get_notification_system().notify('event_deleted', event_id=event_id)
             
             return affected_rows > 0
             
@@ -241,20 +427,29 @@ class EventController:
             if conn:
                 conn.close()
     
-    def search(self, search_term: str) -> List[Event]:
-        """Busca eventos por título, descripción o ubicación"""
+    def search(self, search_term: str, mode: str = 'like', status: Optional[str] = None,
+               order_by: Optional[str] = None, limit: Optional[int] = None,
+               offset: int = 0) -> List[Event]:
+        """
+        Busca eventos por título, descripción o ubicación
+        
+        Args:
+            search_term: Texto a buscar (vacío = todos los eventos)
+            mode: 'like' (subcadena), 'natural' (FULLTEXT en lenguaje natural) o
+                  'boolean' (FULLTEXT con todas las palabras por prefijo)
+            status: Filtra por estado mostrado ('activo', 'finalizado', 'cancelado', 'planificado')
+            order_by: 'relevance', 'start_datetime' o 'title'. Por defecto relevancia
+                      en las búsquedas FULLTEXT y fecha de inicio en el resto
+            limit: Número máximo de resultados (None = todos)
+            offset: Número de resultados a saltar (paginación)
+        """
+        query, params = self.search_query(search_term, mode, status, order_by, limit, offset)
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor(dictionary=True)
-            
-            query = """
-                SELECT * FROM events 
-                WHERE title LIKE %s OR description LIKE %s OR location LIKE %s
-                ORDER BY start_datetime DESC
-            """
-            search_pattern = f"%{search_term}%"
-            cursor.execute(query, (search_pattern, search_pattern, search_pattern))
+            cursor.execute(query, params)
             results = cursor.fetchall()
             cursor.close()
             
@@ -266,4 +461,61 @@ class EventController:
         finally:
             if conn:
                 conn.close()
-
+    
+    @staticmethod
+    def search_query(search_term: str, mode: str = 'like', status: Optional[str] = None,
+                     order_by: Optional[str] = None, limit: Optional[int] = None,
+                     offset: int = 0) -> Tuple[str, tuple]:
+        """
+        Consulta y parámetros de search (valida el modo y el orden)
+        
+        Raises:
+            ValueError: Si el modo o el orden no son válidos
+        """
+        FullTextSearch.validate_mode(mode)
+        select_params = []
+        where_params = []
+        conditions = []
+        relevance = ""
+        term = (search_term or "").strip()
+        
+        if term and mode == 'boolean':
+            against = FullTextSearch.boolean_query(term)
+            if against is None:
+                # Palabras demasiado cortas para el índice FULLTEXT
+                mode = 'like'
+        elif term and mode == 'natural':
+            against = term
+        
+        if term and mode == 'like':
+            conditions.append("(title LIKE %s OR description LIKE %s OR location LIKE %s)")
+            search_pattern = f"%{term}%"
+            where_params.extend([search_pattern, search_pattern, search_pattern])
+        elif term:
+            modifier = "IN BOOLEAN MODE" if mode == 'boolean' else "IN NATURAL LANGUAGE MODE"
+            match = f"MATCH(title, description, location) AGAINST (%s {modifier})"
+            relevance = f", {match} AS relevance"
+            select_params.append(against)
+            conditions.append(match)
+            where_params.append(against)
+        
+        if status:
+            conditions.append(f"({DERIVED_STATUS_SQL}) = %s")
+            where_params.append(status.lower())
+        
+        if order_by is None:
+            order_by = 'relevance' if relevance else 'start_datetime'
+        if order_by == 'relevance' and not relevance:
+            order_by = 'start_datetime'
+        if order_by not in _SEARCH_ORDER:
+            raise ValueError(f"Orden inválido. Órdenes válidos: {', '.join(_SEARCH_ORDER)}")
+        
+        query = f"SELECT *{relevance} FROM events"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {_SEARCH_ORDER[order_by]}, event_id DESC"
+        params = select_params + where_params
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params.extend([int(limit), int(offset)])
+        return query, tuple(params)
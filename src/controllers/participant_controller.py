@@ -5,8 +5,42 @@ Maneja la lógica de negocio relacionada con participantes
 
 from src.database.db_connection import DatabaseConnection
 from src.models.participant import Participant
+from src.controllers.registration_controller import invalidate_occupancy_cache
+from src.utils.search import FullTextSearch
+from src.utils.concurrency_manager import get_notification_system
+from src.utils.change_feed import record_change, record_changes
+from src.utils.change_tracking import ChangeSet, fetch_changes, record_tombstone
+from src.utils.entity_cache import get_entity_cache
 from mysql.connector import Error
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+
+# Sentencias compartidas con AsyncParticipantController (src/controllers/async_controllers.py)
+INSERT_PARTICIPANT_SQL = """
+    INSERT INTO participants (first_name, last_name, email, phone, identifier)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+SELECT_ALL_PARTICIPANTS_SQL = "SELECT * FROM participants ORDER BY last_name, first_name"
+SELECT_PARTICIPANT_SQL = "SELECT * FROM participants WHERE participant_id = %s"
+SELECT_PARTICIPANT_BY_EMAIL_SQL = "SELECT * FROM participants WHERE email = %s"
+UPDATE_PARTICIPANT_SQL = """
+    UPDATE participants 
+    SET first_name = %s, last_name = %s, email = %s, 
+        phone = %s, identifier = %s
+    WHERE participant_id = %s
+"""
+# Eventos de las inscripciones que eliminará el borrado en cascada (se notifican como bajas)
+SELECT_PARTICIPANT_EVENTS_SQL = "SELECT event_id FROM event_registrations WHERE participant_id = %s FOR UPDATE"
+# Liberar las plazas confirmadas antes de que el borrado en cascada elimine sus inscripciones
+# (el contador no es una modificación del evento: updated_at se conserva)
+RELEASE_PARTICIPANT_SEATS_SQL = """
+    UPDATE events e
+    INNER JOIN event_registrations er ON er.event_id = e.event_id
+    SET e.confirmed_count = GREATEST(e.confirmed_count - 1, 0), e.updated_at = e.updated_at
+    WHERE er.participant_id = %s AND er.status = 'confirmado'
+"""
+DELETE_PARTICIPANT_SQL = "DELETE FROM participants WHERE participant_id = %s"
 
 
 class ParticipantController:
@@ -23,6 +57,8 @@ class ParticipantController:
         self.db = db
         self.user_role = user_role
         self.is_admin = (user_role == 'admin')
+        # Caché de lectura compartida por todos los controladores de participantes
+        self.cache = get_entity_cache('participants')
     
     def _check_admin_permission(self) -> bool:
         """
@@ -52,19 +88,21 @@ class ParticipantController:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
-            query = """
-                INSERT INTO participants (first_name, last_name, email, phone, identifier)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            values = (
-                participant.first_name, participant.last_name,
-                participant.email, participant.phone, participant.identifier
-            )
-            
-            cursor.execute(query, values)
-            conn.commit()
+            cursor.execute(INSERT_PARTICIPANT_SQL, self.insert_values(participant))
             participant_id = cursor.lastrowid
+            record_change(cursor, 'participant_created', participant_id=participant_id)
+            conn.commit()
             cursor.close()
+            self.cache.invalidate()
+            
+            # Notificar creación del participante
+            participant.participant_id = participant_id
+            get_notification_system().notify(
+                'participant_created',
+                participant_id=participant_id,
+                participant=participant
+            )
+            
             return participant_id
             
         except Error as e:
@@ -77,16 +115,21 @@ class ParticipantController:
                 conn.close()
     
     def get_all(self) -> List[Participant]:
-        """Obtiene todos los participantes"""
+        """Obtiene todos los participantes (de la caché si el listado está vigente)"""
+        cached = self.cache.get_all()
+        if cached is not None:
+            return [Participant.from_dict(row) for row in cached]
+        generation = self.cache.generation
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor(dictionary=True)
             
-            query = "SELECT * FROM participants ORDER BY last_name, first_name"
-            cursor.execute(query)
+            cursor.execute(SELECT_ALL_PARTICIPANTS_SQL)
             results = cursor.fetchall()
             cursor.close()
+            self.cache.put_all(results, generation)
             
             return [Participant.from_dict(row) for row in results]
             
@@ -97,19 +140,123 @@ class ParticipantController:
             if conn:
                 conn.close()
     
+    def get_page(self, after: Optional[Tuple[str, str, int]] = None,
+                 before: Optional[Tuple[str, str, int]] = None,
+                 limit: int = 100, search_term: Optional[str] = None) -> List[Participant]:
+        """
+        Obtiene una página de participantes ordenados por (last_name, first_name, participant_id)
+        usando paginación por clave (keyset), sin OFFSET
+        
+        Args:
+            after: Clave del último participante visto; devuelve los siguientes
+            before: Clave del primer participante visto; devuelve los anteriores (en el mismo orden)
+            limit: Tamaño de la página
+            search_term: Texto a buscar (subcadena del nombre, apellidos, email o DNI)
+        """
+        query, params = self.page_query(after, before, limit, search_term)
+        
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(query, params)
+            results = cursor.fetchall()
+            cursor.close()
+            
+            if before is not None:
+                results.reverse()
+            return [Participant.from_dict(row) for row in results]
+            
+        except Error as e:
+            print(f"Error al obtener página de participantes: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+    
+    @staticmethod
+    def page_query(after: Optional[Tuple[str, str, int]] = None,
+                   before: Optional[Tuple[str, str, int]] = None,
+                   limit: int = 100, search_term: Optional[str] = None) -> Tuple[str, tuple]:
+        """
+        Consulta y parámetros de get_page (con before, las filas salen en orden inverso)
+        
+        La búsqueda es por subcadena, como search en modo 'like': las vistas la usan cuando
+        alguna palabra es demasiado corta para FULLTEXT (en otro caso usan search en modo
+        'boolean'). El orden de idx_full_name permite a MySQL dejar de leer en cuanto
+        completa la página.
+        """
+        conditions = []
+        params = []
+        term = (search_term or "").strip()
+        if term:
+            conditions.append("(first_name LIKE %s OR last_name LIKE %s OR email LIKE %s OR identifier LIKE %s)")
+            search_pattern = f"%{term}%"
+            params.extend([search_pattern] * 4)
+        
+        if before is not None:
+            last_name, first_name, participant_id = before
+            conditions.append("""(last_name < %s
+                   OR (last_name = %s AND (first_name < %s
+                       OR (first_name = %s AND participant_id < %s))))""")
+            params.extend([last_name, last_name, first_name, first_name, participant_id])
+            order = "last_name DESC, first_name DESC, participant_id DESC"
+        else:
+            if after is not None:
+                last_name, first_name, participant_id = after
+                conditions.append("""(last_name > %s
+                   OR (last_name = %s AND (first_name > %s
+                       OR (first_name = %s AND participant_id > %s))))""")
+                params.extend([last_name, last_name, first_name, first_name, participant_id])
+            order = "last_name, first_name, participant_id"
+        
+        query = "SELECT * FROM participants"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order} LIMIT %s"
+        params.append(int(limit))
+        return query, tuple(params)
+    
+    @staticmethod
+    def insert_values(participant: Participant) -> tuple:
+        """Parámetros de INSERT_PARTICIPANT_SQL"""
+        return (
+            participant.first_name, participant.last_name,
+            participant.email, participant.phone, participant.identifier
+        )
+    
+    @staticmethod
+    def update_values(participant: Participant) -> tuple:
+        """Parámetros de UPDATE_PARTICIPANT_SQL"""
+        return (
+            participant.first_name, participant.last_name,
+            participant.email, participant.phone, participant.identifier,
+            participant.participant_id
+        )
+    
+    @staticmethod
+    def page_key(participant: Participant) -> Tuple[str, str, int]:
+        """Clave de paginación de un participante"""
+        return participant.last_name, participant.first_name, participant.participant_id
+    
     def get_by_id(self, participant_id: int) -> Optional[Participant]:
-        """Obtiene un participante por su ID"""
+        """Obtiene un participante por su ID (de la caché si está vigente)"""
+        cached = self.cache.get(participant_id)
+        if cached is not None:
+            return Participant.from_dict(cached)
+        generation = self.cache.generation
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor(dictionary=True)
             
-            query = "SELECT * FROM participants WHERE participant_id = %s"
-            cursor.execute(query, (participant_id,))
+            cursor.execute(SELECT_PARTICIPANT_SQL, (participant_id,))
             result = cursor.fetchone()
             cursor.close()
             
             if result:
+                self.cache.put(participant_id, result, generation)
                 return Participant.from_dict(result)
             return None
             
@@ -120,6 +267,36 @@ class ParticipantController:
             if conn:
                 conn.close()
     
+    def get_changed_since(self, since: Optional[datetime] = None) -> Optional[ChangeSet]:
+        """
+        Obtiene los participantes creados, modificados o eliminados desde una marca
+        
+        Args:
+            since: watermark del ChangeSet anterior (None = listado completo)
+        
+        Returns:
+            ChangeSet con los cambios y la marca para la siguiente llamada, o None si falla
+            la consulta (se conserva la marca anterior)
+        """
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            rows, deleted, watermark, full = fetch_changes(
+                cursor, 'participants', since, SELECT_ALL_PARTICIPANTS_SQL
+            )
+            cursor.close()
+            
+            return ChangeSet([Participant.from_dict(row) for row in rows], deleted, watermark, full)
+            
+        except Error as e:
+            print(f"Error al obtener cambios de participantes: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+    
     def update(self, participant: Participant) -> bool:
         """
         Actualiza un participante
@@ -134,22 +311,21 @@ class ParticipantController:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
-            query = """
-                UPDATE participants 
-                SET first_name = %s, last_name = %s, email = %s, 
-                    phone = %s, identifier = %s
-                WHERE participant_id = %s
-            """
-            values = (
-                participant.first_name, participant.last_name,
-                participant.email, participant.phone, participant.identifier,
-                participant.participant_id
-            )
-            
-            cursor.execute(query, values)
-            conn.commit()
+            cursor.execute(UPDATE_PARTICIPANT_SQL, self.update_values(participant))
             affected_rows = cursor.rowcount
+            if affected_rows > 0:
+                record_change(cursor, 'participant_updated', participant_id=participant.participant_id)
+            conn.commit()
             cursor.close()
+            self.cache.invalidate(participant.participant_id)
+            
+            # Notificar actualización del participante
+            if affected_rows > 0:
+                get_notification_system().notify(
+                    'participant_updated',
+                    participant_id=participant.participant_id,
+                    participant=participant
+                )
             
             return affected_rows > 0
             
@@ -164,7 +340,7 @@ class ParticipantController:
     
     def delete(self, participant_id: int) -> bool:
         """
-        Elimina un participante
+        Elimina un participante y, en cascada, sus inscripciones
         Solo los administradores pueden eliminar participantes
         
         Raises:
@@ -176,11 +352,27 @@ class ParticipantController:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
-            query = "DELETE FROM participants WHERE participant_id = %s"
-            cursor.execute(query, (participant_id,))
-            conn.commit()
+            conn.start_transaction()
+            
+            cursor.execute(SELECT_PARTICIPANT_EVENTS_SQL, (participant_id,))
+            event_ids = [row[0] for row in cursor.fetchall()]
+            # Liberar las plazas confirmadas antes de que el borrado en cascada
+            # elimine sus inscripciones
+            cursor.execute(RELEASE_PARTICIPANT_SEATS_SQL, (participant_id,))
+            cursor.execute(DELETE_PARTICIPANT_SQL, (participant_id,))
             affected_rows = cursor.rowcount
+            # Lápida para los clientes que refrescan con get_changed_since
+            if affected_rows > 0:
+                record_tombstone(cursor, 'participants', participant_id)
+                record_changes(cursor, self.deleted_changes(participant_id, event_ids))
+            conn.commit()
             cursor.close()
+            invalidate_occupancy_cache()
+            self.cache.invalidate(participant_id)
+            
+            # Notificar las bajas de sus inscripciones y la eliminación del participante
+            if affected_rows > 0:
+                self.notify_deleted(participant_id, event_ids)
             
             return affected_rows > 0
             
@@ -193,22 +385,41 @@ class ParticipantController:
             if conn:
                 conn.close()
     
-    def search(self, search_term: str) -> List[Participant]:
-        """Busca participantes por nombre, apellido, email o DNI"""
+    @staticmethod
+    def deleted_changes(participant_id: int, event_ids: List[int]) -> List[tuple]:
+        """Cambios de change_log de un borrado: una baja por inscripción y el participante"""
+        changes = [('registration_deleted', event_id, participant_id, None) for event_id in event_ids]
+        changes.append(('participant_deleted', None, participant_id, None))
+        return changes
+    
+    @staticmethod
+    def notify_deleted(participant_id: int, event_ids: List[int]):
+        """Notifica las bajas de las inscripciones eliminadas en cascada y el borrado del participante"""
+        notifications = get_notification_system()
+        for event_id in event_ids:
+            notifications.notify('registration_deleted', event_id=event_id, participant_id=participant_id)
+        notifications.notify('participant_deleted', participant_id=participant_id)
+    
+    def search(self, search_term: str, mode: str = 'like', limit: Optional[int] = None,
+               offset: int = 0) -> List[Participant]:
+        """
+        Busca participantes por nombre, apellido, email o DNI
+        
+        Args:
+            search_term: Texto a buscar
+            mode: 'like' (subcadena), 'natural' (FULLTEXT en lenguaje natural) o
+                  'boolean' (FULLTEXT con todas las palabras por prefijo).
+                  Las búsquedas FULLTEXT se ordenan por relevancia.
+            limit: Número máximo de resultados (None = todos)
+            offset: Número de resultados a saltar (paginación)
+        """
+        query, params = self.search_query(search_term, mode, limit, offset)
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor(dictionary=True)
-            
-            query = """
-                SELECT * FROM participants 
-                WHERE first_name LIKE %s OR last_name LIKE %s 
-                   OR email LIKE %s OR identifier LIKE %s
-                ORDER BY last_name, first_name
-            """
-            search_pattern = f"%{search_term}%"
-            cursor.execute(query, (search_pattern, search_pattern, 
-                                  search_pattern, search_pattern))
+            cursor.execute(query, params)
             results = cursor.fetchall()
             cursor.close()
             
@@ -221,6 +432,48 @@ class ParticipantController:
             if conn:
                 conn.close()
     
+    @staticmethod
+    def search_query(search_term: str, mode: str = 'like', limit: Optional[int] = None,
+                     offset: int = 0) -> Tuple[str, tuple]:
+        """
+        Consulta y parámetros de search (valida el modo)
+        
+        Raises:
+            ValueError: Si el modo no es válido
+        """
+        FullTextSearch.validate_mode(mode)
+        term = (search_term or "").strip()
+        against = None
+        if mode == 'boolean':
+            against = FullTextSearch.boolean_query(term)
+        elif mode == 'natural':
+            against = term or None
+        
+        if against is None:
+            # Búsqueda por subcadena (también si las palabras son demasiado cortas para FULLTEXT)
+            query = """
+                SELECT * FROM participants 
+                WHERE first_name LIKE %s OR last_name LIKE %s 
+                   OR email LIKE %s OR identifier LIKE %s
+                ORDER BY last_name, first_name
+            """
+            search_pattern = f"%{term}%"
+            params = [search_pattern, search_pattern, search_pattern, search_pattern]
+        else:
+            modifier = "IN BOOLEAN MODE" if mode == 'boolean' else "IN NATURAL LANGUAGE MODE"
+            match = f"MATCH(first_name, last_name, email, identifier) AGAINST (%s {modifier})"
+            query = f"""
+                SELECT *, {match} AS relevance FROM participants 
+                WHERE {match}
+                ORDER BY relevance DESC, last_name, first_name
+            """
+            params = [against, against]
+        
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params.extend([int(limit), int(offset)])
+        return query, tuple(params)
+    
     def get_by_email(self, email: str) -> Optional[Participant]:
         """Obtiene un participante por su email"""
         conn = None
@@ -228,8 +481,7 @@ class ParticipantController:
             conn = self.db.get_connection()
             cursor = conn.cursor(dictionary=True)
             
-            query = "SELECT * FROM participants WHERE email = %s"
-            cursor.execute(query, (email,))
+            cursor.execute(SELECT_PARTICIPANT_BY_EMAIL_SQL, (email,))
             result = cursor.fetchone()
             cursor.close()
             
@@ -5,19 +5,132 @@ Incluye gestión avanzada de concurrencia para usuarios simultáneos
 """
 
 from src.database.db_connection import DatabaseConnection
-from mysql.connector import Error
+from mysql.connector import Error, IntegrityError, errorcode
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
+import threading
+import time
 from src.utils.concurrency_manager import (
     retry_with_backoff, 
-    get_subscription_processor,
-    get_notification_system,
-    ResourceLockManager
+    get_retry_policy,
+    get_notification_system
 )
+from src.utils.change_feed import record_change, record_changes
+from src.utils.lock_backends import get_lock_backend
 from config.config import CONCURRENCY_CONFIG
 
-# Instancia global del gestor de locks
-_lock_manager = ResourceLockManager()
+
+# Resultados por participante de register_participants_bulk
+BULK_REGISTERED = 'registered'
+BULK_DUPLICATE = 'duplicate'
+BULK_FULL = 'full'
+BULK_NOT_FOUND = 'not_found'
+BULK_ERROR = 'error'
+
+# Estados admitidos de una inscripción
+VALID_REGISTRATION_STATUSES = ('confirmado', 'cancelado', 'pendiente')
+
+# Resultado de una fila de la inscripción masiva según el error de integridad de su INSERT
+BULK_INTEGRITY_OUTCOMES = {
+    errorcode.ER_DUP_ENTRY: BULK_DUPLICATE,
+    errorcode.ER_NO_REFERENCED_ROW: BULK_NOT_FOUND,
+    errorcode.ER_NO_REFERENCED_ROW_2: BULK_NOT_FOUND,
+}
+
+# Sentencias compartidas con AsyncRegistrationController (src/controllers/async_controllers.py)
+# Reservar plaza: el UPDATE solo afecta a la fila si queda aforo
+# Los cambios del contador no son modificaciones del evento: updated_at se conserva para
+# que get_changed_since no devuelva el evento con cada inscripción
+RESERVE_SEAT_SQL = """
+    UPDATE events SET confirmed_count = confirmed_count + 1, updated_at = updated_at
+    WHERE event_id = %s AND confirmed_count < capacity
+"""
+INSERT_REGISTRATION_SQL = """
+    INSERT INTO event_registrations (event_id, participant_id, status)
+    VALUES (%s, %s, %s)
+"""
+# Las inscripciones no confirmadas no ocupan plaza, pero no se admiten en eventos llenos
+INSERT_REGISTRATION_IF_FREE_SQL = """
+    INSERT INTO event_registrations (event_id, participant_id, status)
+    SELECT event_id, %s, %s FROM events
+    WHERE event_id = %s AND confirmed_count < capacity
+"""
+LOCK_REGISTRATION_SQL = """
+    SELECT status FROM event_registrations 
+    WHERE event_id = %s AND participant_id = %s
+    FOR UPDATE
+"""
+DELETE_REGISTRATION_SQL = """
+    DELETE FROM event_registrations 
+    WHERE event_id = %s AND participant_id = %s
+"""
+UPDATE_REGISTRATION_STATUS_SQL = """
+    UPDATE event_registrations 
+    SET status = %s
+    WHERE event_id = %s AND participant_id = %s
+"""
+ADJUST_CONFIRMED_COUNT_SQL = """
+    UPDATE events SET confirmed_count = GREATEST(confirmed_count + %s, 0), updated_at = updated_at
+    WHERE event_id = %s
+"""
+LOCK_EVENT_CAPACITY_SQL = "SELECT capacity, confirmed_count FROM events WHERE event_id = %s FOR UPDATE"
+
+
+class OccupancyCache:
+    """
+    Caché de corta duración (TTL) con el número de inscripciones confirmadas por evento.
+    Se invalida cuando cambia alguna inscripción del evento.
+    """
+    
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._entries: Dict[int, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+    
+    def get_many(self, event_ids: List[int]) -> Dict[int, int]:
+        """Devuelve los conteos vigentes de los eventos pedidos que están en caché"""
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for event_id in event_ids:
+                entry = self._entries.get(event_id)
+                if entry is None:
+                    continue
+                count, expires_at = entry
+                if expires_at > now:
+                    found[event_id] = count
+                else:
+                    del self._entries[event_id]
+        return found
+    
+    def set_many(self, counts: Dict[int, int]):
+        """Guarda los conteos de varios eventos"""
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for event_id, count in counts.items():
+                self._entries[event_id] = (count, expires_at)
+    
+    def invalidate(self, event_id: int):
+        """Elimina de la caché el conteo de un evento"""
+        with self._lock:
+            self._entries.pop(event_id, None)
+    
+    def clear(self):
+        """Vacía la caché"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Instancia global de la caché de ocupación
+_occupancy_cache = OccupancyCache(ttl=CONCURRENCY_CONFIG.get('occupancy_cache_ttl', 5.0))
+
+
+def invalidate_occupancy_cache(event_id: Optional[int] = None):
+    """Invalida la caché de ocupación de un evento (o de todos si event_id es None)"""
+    if event_id is None:
+        _occupancy_cache.clear()
+    else:
+        _occupancy_cache.invalidate(event_id)
 
 
 class RegistrationController:
@@ -25,77 +138,54 @@ class RegistrationController:
     
     def __init__(self, db: DatabaseConnection):
         self.db = db
+        # Lock de aplicación opcional por evento (por defecto 'none': la reserva ya es atómica en MySQL)
+        self.lock_backend = get_lock_backend(CONCURRENCY_CONFIG.get('registration_lock_backend', 'none'), db)
     
-    @retry_with_backoff(
-        max_retries=CONCURRENCY_CONFIG.get('max_retries', 3),
-        base_delay=CONCURRENCY_CONFIG.get('retry_base_delay', 0.1),
-        max_delay=CONCURRENCY_CONFIG.get('retry_max_delay', 2.0),
-        exceptions=(Error,)
-    )
+    @retry_with_backoff(policy=get_retry_policy('registrations'))
     def _register_participant_internal(self, event_id: int, participant_id: int, 
                                       status: str = "confirmado") -> Optional[int]:
         """
-        Método interno para registrar un participante con locks y transacciones.
-        Usa bloqueo SELECT FOR UPDATE para evitar condiciones de carrera.
+        Método interno para registrar un participante.
+        La plaza se reserva con un incremento condicional de confirmed_count y los
+        duplicados los detecta la clave única unique_registration, de modo que la
+        exclusión mutua la garantiza MySQL también entre instancias distintas.
+        Si se configura registration_lock_backend, además se toma el lock del evento.
         """
-        # Usar lock de recurso para el evento específico
         resource_id = f"event_{event_id}"
-        lock = _lock_manager.get_lock(resource_id)
-        acquired = lock.acquire(timeout=CONCURRENCY_CONFIG.get('lock_timeout', 30))
-        if not acquired:
-            raise TimeoutError(f"No se pudo adquirir el lock para el evento {event_id} en {CONCURRENCY_CONFIG.get('lock_timeout', 30)}s")
+        lock_timeout = CONCURRENCY_CONFIG.get('lock_timeout', 30)
+        if not self.lock_backend.acquire(resource_id, timeout=lock_timeout):
+            raise TimeoutError(f"No se pudo adquirir el lock para el evento {event_id} en {lock_timeout}s")
         
         conn = None
         try:
             conn = self.db.get_connection()
-            # Configurar nivel de aislamiento REPEATABLE READ para evitar lecturas sucias y condiciones de carrera
             cursor = conn.cursor()
-            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
             conn.start_transaction()
             
-            # Verificar capacidad del evento con bloqueo FOR UPDATE
-            # Esto previene que otro usuario modifique el evento mientras verificamos
-            capacity_query = """
-                SELECT capacity, 
-                       (SELECT COUNT(*) FROM event_registrations 
-                        WHERE event_id = %s AND status = 'confirmado') as current
-                FROM events WHERE event_id = %s
-                FOR UPDATE
-            """
-            cursor.execute(capacity_query, (event_id, event_id))
-            result = cursor.fetchone()
-            
-            if not result:
-                conn.rollback()
-                cursor.close()
-                return None
-            
-            capacity, current = result
-            if current >= capacity:
-                conn.rollback()
-                cursor.close()
-                return None  # Evento lleno
-            
-            # Verificar si ya está registrado
-            check_query = """
-                SELECT registration_id FROM event_registrations 
-                WHERE event_id = %s AND participant_id = %s
-            """
-            cursor.execute(check_query, (event_id, participant_id))
-            if cursor.fetchone():
-                conn.rollback()
-                cursor.close()
-                return None  # Ya está registrado
+            if status == 'confirmado':
+                # Reservar plaza: el UPDATE solo afecta a la fila si queda aforo.
+                # El bloqueo de la fila del evento dura únicamente hasta el commit.
+                cursor.execute(RESERVE_SEAT_SQL, (event_id,))
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    cursor.close()
+                    return None  # Evento inexistente o lleno
+                
+                cursor.execute(INSERT_REGISTRATION_SQL, (event_id, participant_id, status))
+            else:
+                # Las inscripciones no confirmadas no ocupan plaza, pero no se admiten
+                # en eventos llenos: la comprobación va en la propia sentencia INSERT
+                cursor.execute(INSERT_REGISTRATION_IF_FREE_SQL, (participant_id, status, event_id))
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    cursor.close()
+                    return None
             
-            # Insertar registro
-            query = """
-                INSERT INTO event_registrations (event_id, participant_id, status)
-                VALUES (%s, %s, %s)
-            """
-            cursor.execute(query, (event_id, participant_id, status))
-            conn.commit()
             registration_id = cursor.lastrowid
+            record_change(cursor, 'registration_created', event_id=event_id, participant_id=participant_id)
+            conn.commit()
             cursor.close()
+            _occupancy_cache.invalidate(event_id)
             
             # Notificar evento de inscripción
             get_notification_system().notify(
@@ -107,6 +197,13 @@ class RegistrationController:
             
             return registration_id
             
+        except IntegrityError as e:
+            # Ya inscrito (clave única) o evento/participante inexistente: no se reintenta
+            if conn:
+                conn.rollback()
+            if e.errno != errorcode.ER_DUP_ENTRY:
+                print(f"Error al registrar participante: {e}")
+            return None
         except Error as e:
             if conn:
                 conn.rollback()
@@ -115,16 +212,21 @@ class RegistrationController:
         finally:
             if conn:
                 conn.close()
-            lock.release()
+            self.lock_backend.release(resource_id)
     
     def register_participant(self, event_id: int, participant_id: int, 
                            status: str = "confirmado") -> Optional[int]:
         """
         Registra un participante en un evento.
-        Usa bloqueo SELECT FOR UPDATE y locks de recursos para evitar condiciones de carrera
-        cuando múltiples usuarios intentan inscribirse simultáneamente.
-        Incluye reintentos automáticos y gestión de concurrencia.
+        La reserva de plaza es una actualización condicional atómica en MySQL,
+        sin locks de aplicación ni SELECT FOR UPDATE, por lo que es segura cuando
+        varios usuarios (o varias instancias) se inscriben simultáneamente.
+        Incluye reintentos automáticos ante errores transitorios.
+        
+        Raises:
+            ValueError: Si el estado no es válido
         """
+        status = self.validate_status(status)
         try:
             return self._register_participant_internal(event_id, participant_id, status)
         except Exception as e:
@@ -132,20 +234,41 @@ class RegistrationController:
             return None
     
     def unregister_participant(self, event_id: int, participant_id: int) -> bool:
-        """Elimina el registro de un participante en un evento"""
+        """
+        Elimina el registro de un participante en un evento.
+        Si la inscripción estaba confirmada, libera su plaza en confirmed_count.
+        """
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor()
+            conn.start_transaction()
             
-            query = """
-                DELETE FROM event_registrations 
-                WHERE event_id = %s AND participant_id = %s
-            """
-            cursor.execute(query, (event_id, participant_id))
-            conn.commit()
+            cursor.execute(LOCK_REGISTRATION_SQL, (event_id, participant_id))
+            result = cursor.fetchone()
+            if not result:
+                conn.rollback()
+                cursor.close()
+                return False
+            
+            cursor.execute(DELETE_REGISTRATION_SQL, (event_id, participant_id))
             affected_rows = cursor.rowcount
+            
+            if affected_rows > 0 and result[0] == 'confirmado':
+                self._adjust_confirmed_count(cursor, event_id, -1)
+            if affected_rows > 0:
+                record_change(cursor, 'registration_deleted', event_id=event_id, participant_id=participant_id)
+            
+            conn.commit()
             cursor.close()
+            _occupancy_cache.invalidate(event_id)
+            
+            if affected_rows > 0:
+                get_notification_system().notify(
+                    'registration_deleted',
+                    event_id=event_id,
+                    participant_id=participant_id
+                )
             
             return affected_rows > 0
             
@@ -158,6 +281,35 @@ class RegistrationController:
             if conn:
                 conn.close()
     
+    @staticmethod
+    def _adjust_confirmed_count(cursor, event_id: int, delta: int):
+        """
+        Ajusta el contador de inscripciones confirmadas de un evento.
+        Debe llamarse dentro de la transacción que modifica la inscripción.
+        """
+        cursor.execute(ADJUST_CONFIRMED_COUNT_SQL, (delta, event_id))
+    
+    @staticmethod
+    def validate_status(status: str) -> str:
+        """
+        Normaliza un estado de inscripción
+        
+        Raises:
+            ValueError: Si no es uno de VALID_REGISTRATION_STATUSES
+        """
+        if status.lower() not in VALID_REGISTRATION_STATUSES:
+            raise ValueError(f"Estado inválido. Estados válidos: {', '.join(VALID_REGISTRATION_STATUSES)}")
+        return status.lower()
+    
+    @staticmethod
+    def confirmed_delta(old_status: str, new_status: str) -> int:
+        """Variación de confirmed_count al pasar una inscripción de old_status a new_status"""
+        if old_status == new_status:
+            return 0
+        if new_status == 'confirmado':
+            return 1
+        return -1 if old_status == 'confirmado' else 0
+    
     def update_status(self, event_id: int, participant_id: int, new_status: str) -> bool:
         """
         Actualiza el estado de una inscripción
@@ -171,35 +323,38 @@ class RegistrationController:
             True si se actualizó correctamente, False en caso contrario
         """
         # Validar estado
-        valid_statuses = ['confirmado', 'cancelado', 'pendiente']
-        if new_status.lower() not in valid_statuses:
-            raise ValueError(f"Estado inválido. Estados válidos: {', '.join(valid_statuses)}")
+        new_status = self.validate_status(new_status)
         
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
-            # Verificar que la inscripción existe
-            check_query = """
-                SELECT registration_id FROM event_registrations 
-                WHERE event_id = %s AND participant_id = %s
-            """
-            cursor.execute(check_query, (event_id, participant_id))
-            if not cursor.fetchone():
+            conn.start_transaction()
+            
+            # Verificar que la inscripción existe (y bloquearla hasta el commit)
+            cursor.execute(LOCK_REGISTRATION_SQL, (event_id, participant_id))
+            result = cursor.fetchone()
+            if not result:
+                conn.rollback()
                 cursor.close()
                 return False
+            old_status = result[0]
             
             # Actualizar estado
-            update_query = """
-                UPDATE event_registrations 
-                SET status = %s
-                WHERE event_id = %s AND participant_id = %s
-            """
-            cursor.execute(update_query, (new_status.lower(), event_id, participant_id))
-            conn.commit()
+            cursor.execute(UPDATE_REGISTRATION_STATUS_SQL, (new_status, event_id, participant_id))
             affected_rows = cursor.rowcount
+            
+            # Mantener el contador de confirmadas del evento
+            delta = self.confirmed_delta(old_status, new_status)
+            if delta:
+                self._adjust_confirmed_count(cursor, event_id, delta)
+            if affected_rows > 0:
+                record_change(cursor, 'registration_status_changed', event_id=event_id, participant_id=participant_id)
+            
+            conn.commit()
             cursor.close()
+            _occupancy_cache.invalidate(event_id)
             
             # Notificar evento de cambio de estado
             if affected_rows > 0:
@@ -207,7 +362,7 @@ class RegistrationController:
                     'registration_status_changed',
                     event_id=event_id,
                     participant_id=participant_id,
-                    new_status=new_status.lower()
+                    new_status=new_status
                 )
             
             return affected_rows > 0
@@ -251,6 +406,97 @@ class RegistrationController:
             if conn:
                 conn.close()
     
+    def get_registrations(self, event_id: Optional[int] = None,
+                          participant_id: Optional[int] = None,
+                          status: Optional[str] = None,
+                          limit: Optional[int] = None,
+                          after: Optional[Tuple[datetime, int]] = None) -> List[Dict]:
+        """
+        Obtiene las inscripciones junto con el título del evento y los datos del
+        participante en una sola consulta (evita una consulta por evento).
+
+        Args:
+            event_id: Filtra por evento (opcional)
+            participant_id: Filtra por participante (opcional)
+            status: Filtra por estado de la inscripción (opcional)
+            limit: Número máximo de filas a devolver (None = todas)
+            after: Cursor de paginación (event_start_datetime, registration_id) de la
+                   última fila de la página anterior
+
+        Returns:
+            Lista de diccionarios ordenados por fecha del evento y registro más reciente
+        """
+        query, params = self.registrations_query(event_id, participant_id, status, limit, after)
+
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(query, params)
+            results = cursor.fetchall()
+            cursor.close()
+
+            return results
+
+        except Error as e:
+            print(f"Error al obtener inscripciones: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @staticmethod
+    def registrations_query(event_id: Optional[int] = None,
+                            participant_id: Optional[int] = None,
+                            status: Optional[str] = None,
+                            limit: Optional[int] = None,
+                            after: Optional[Tuple[datetime, int]] = None) -> Tuple[str, tuple]:
+        """Consulta y parámetros de get_registrations"""
+        conditions = []
+        params = []
+
+        if event_id is not None:
+            conditions.append("er.event_id = %s")
+            params.append(event_id)
+        if participant_id is not None:
+            conditions.append("er.participant_id = %s")
+            params.append(participant_id)
+        if status:
+            conditions.append("er.status = %s")
+            params.append(status.lower())
+        if after is not None:
+            # Paginación por clave (keyset): continuar justo después de la última fila vista
+            last_start, last_registration_id = after
+            conditions.append(
+                "(e.start_datetime < %s OR (e.start_datetime = %s AND er.registration_id < %s))"
+            )
+            params.extend([last_start, last_start, last_registration_id])
+
+        query = """
+            SELECT er.registration_id, er.event_id, er.participant_id,
+                   er.status as registration_status, er.registered_at,
+                   e.title as event_title, e.start_datetime as event_start_datetime,
+                   p.first_name, p.last_name, p.email, p.phone, p.identifier
+            FROM event_registrations er
+            INNER JOIN events e ON e.event_id = er.event_id
+            INNER JOIN participants p ON p.participant_id = er.participant_id
+        """
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY e.start_datetime DESC, er.registration_id DESC"
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(int(limit))
+        return query, tuple(params)
+
+    @staticmethod
+    def next_cursor(page: List[Dict]) -> Optional[Tuple[datetime, int]]:
+        """Devuelve el cursor para pedir la página siguiente a partir de la última fila"""
+        if not page:
+            return None
+        last = page[-1]
+        return last['event_start_datetime'], last['registration_id']
+
     def count_confirmed_registrations(self, event_id: int) -> int:
         """
         Cuenta solo las inscripciones confirmadas de un evento
@@ -259,25 +505,115 @@ class RegistrationController:
         Returns:
             Número de inscripciones confirmadas
         """
+        return self.count_confirmed_bulk([event_id]).get(event_id, 0)
+    
+    def count_confirmed_bulk(self, event_ids: List[int]) -> Dict[int, int]:
+        """
+        Cuenta las inscripciones confirmadas de varios eventos con una sola consulta
+        (lee el contador confirmed_count mantenido en la tabla events).
+        Usa una caché de corta duración que se invalida al inscribir, desinscribir
+        o cambiar el estado de una inscripción.
+        
+        Args:
+            event_ids: IDs de los eventos
+        
+        Returns:
+            Diccionario {event_id: número de inscripciones confirmadas}
+        """
+        event_ids = list(dict.fromkeys(event_ids))
+        counts = _occupancy_cache.get_many(event_ids)
+        missing = [event_id for event_id in event_ids if event_id not in counts]
+        if not missing:
+            return counts
+        
         conn = None
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor()
             
+            cursor.execute(*self.confirmed_counts_query(missing))
+            fetched = {event_id: 0 for event_id in missing}
+            fetched.update({event_id: count for event_id, count in cursor.fetchall()})
+            cursor.close()
+            
+            _occupancy_cache.set_many(fetched)
+            counts.update(fetched)
+            return counts
+            
+        except Error as e:
+            print(f"Error al contar inscripciones confirmadas: {e}")
+            for event_id in missing:
+                counts[event_id] = 0
+            return counts
+        finally:
+            if conn:
+                conn.close()
+    
+    @staticmethod
+    def confirmed_counts_query(event_ids: List[int]) -> Tuple[str, tuple]:
+        """Consulta y parámetros de los contadores confirmed_count de varios eventos"""
+        placeholders = ", ".join(["%s"] * len(event_ids))
+        query = f"""
+            SELECT event_id, confirmed_count
+            FROM events
+            WHERE event_id IN ({placeholders})
+        """
+        return query, tuple(event_ids)
+    
+    def reconcile_confirmed_counts(self, fix: bool = False) -> List[Dict]:
+        """
+        Comprueba que el contador confirmed_count de cada evento coincide con el
+        número real de inscripciones confirmadas.
+        
+        Args:
+            fix: Si es True, corrige los contadores desajustados
+        
+        Returns:
+            Lista de diccionarios con event_id, title, stored y actual de los eventos desajustados
+        """
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor(dictionary=True)
+            
             query = """
-                SELECT COUNT(*) 
-                FROM event_registrations 
-                WHERE event_id = %s AND status = 'confirmado'
+                SELECT e.event_id, e.title, e.confirmed_count as stored,
+                       COALESCE(c.actual, 0) as actual
+                FROM events e
+                LEFT JOIN (
+                    SELECT event_id, COUNT(*) as actual
+                    FROM event_registrations
+                    WHERE status = 'confirmado'
+                    GROUP BY event_id
+                ) c ON c.event_id = e.event_id
+                WHERE e.confirmed_count <> COALESCE(c.actual, 0)
+                ORDER BY e.event_id
             """
-            cursor.execute(query, (event_id,))
-            result = cursor.fetchone()
+            cursor.execute(query)
+            mismatches = cursor.fetchall()
+            
+            if fix and mismatches:
+                fix_query = """
+                    UPDATE events e
+                    SET e.confirmed_count = (
+                        SELECT COUNT(*) FROM event_registrations er
+                        WHERE er.event_id = e.event_id AND er.status = 'confirmado'
+                    ), e.updated_at = e.updated_at
+                    WHERE e.event_id = %s
+                """
+                for row in mismatches:
+                    cursor.execute(fix_query, (row['event_id'],))
+                    _occupancy_cache.invalidate(row['event_id'])
+                conn.commit()
             cursor.close()
             
-            return result[0] if result else 0
+            return mismatches
             
         except Error as e:
-            print(f"Error al contar inscripciones confirmadas: {e}")
-            return 0
+            if conn:
+                conn.rollback()
+            print(f"Error al reconciliar contadores de ocupación: {e}")
+            return []
         finally:
             if conn:
                 conn.close()
@@ -309,12 +645,265 @@ class RegistrationController:
             if conn:
                 conn.close()
     
+    def count_events_by_participant(self, participant_ids: Optional[List[int]] = None) -> Dict[int, int]:
+        """
+        Cuenta en cuántos eventos está inscrito cada participante con una única
+        consulta agrupada (incluye todas las inscripciones, igual que get_participant_events)
+        
+        Args:
+            participant_ids: IDs a contar (None = todos los participantes con inscripciones)
+        
+        Returns:
+            Diccionario {participant_id: número de eventos}. Los participantes sin
+            inscripciones no aparecen en el diccionario.
+        """
+        if participant_ids is not None and not participant_ids:
+            return {}
+        
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            
+            query = """
+                SELECT participant_id, COUNT(*)
+                FROM event_registrations
+            """
+            params = ()
+            if participant_ids is not None:
+                placeholders = ", ".join(["%s"] * len(participant_ids))
+                query += f" WHERE participant_id IN ({placeholders})"
+                params = tuple(participant_ids)
+            query += " GROUP BY participant_id"
+            
+            cursor.execute(query, params)
+            results = cursor.fetchall()
+            cursor.close()
+            
+            return {participant_id: count for participant_id, count in results}
+            
+        except Error as e:
+            print(f"Error al contar eventos por participante: {e}")
+            return {}
+        finally:
+            if conn:
+                conn.close()
+    
+    @retry_with_backoff(policy=get_retry_policy('registrations'))
+    def _register_bulk_internal(self, event_id: int, participant_ids: List[int],
+                                status: str) -> Dict[int, Tuple[str, Optional[int]]]:
+        """
+        Inscribe un conjunto de participantes en una sola transacción (ver register_participants_bulk).
+        Lanza Error para que el decorador reintente la transacción completa.
+        """
+        chunk_size = CONCURRENCY_CONFIG.get('bulk_insert_chunk', 1000)
+        outcomes: Dict[int, Tuple[str, Optional[int]]] = {}
+        
+        resource_id = f"event_{event_id}"
+        lock_timeout = CONCURRENCY_CONFIG.get('lock_timeout', 30)
+        if not self.lock_backend.acquire(resource_id, timeout=lock_timeout):
+            raise TimeoutError(f"No se pudo adquirir el lock para el evento {event_id} en {lock_timeout}s")
+        
+        conn = None
+        try:
+            conn = self.db.get_connection()
+            cursor = conn.cursor()
+            conn.start_transaction()
+            
+            # Un único bloqueo de la fila del evento para todo el lote: mientras dure la
+            # transacción ninguna otra inscripción en este evento puede reservar plaza
+            cursor.execute(LOCK_EVENT_CAPACITY_SQL, (event_id,))
+            row = cursor.fetchone()
+            if not row:
+                conn.rollback()
+                cursor.close()
+                return {pid: (BULK_NOT_FOUND, None) for pid in participant_ids}
+            capacity, confirmed = row
+            
+            # Participantes existentes y ya inscritos, por bloques
+            candidates = []
+            for chunk in self.chunks(participant_ids, chunk_size):
+                cursor.execute(*self.bulk_lookup_query(event_id, chunk))
+                candidates.extend(self.classify_bulk_chunk(chunk, dict(cursor.fetchall()), outcomes))
+            
+            accepted = self.accept_bulk(candidates, capacity, confirmed, status, outcomes)
+            
+            # INSERT multi-fila sin IGNORE: si otra transacción se adelantó (inscribió o
+            # borró a un participante del bloque) el bloque falla entero y se repite fila
+            # a fila para anotar cuáles no se insertaron
+            inserted: List[int] = []
+            for chunk in self.chunks(accepted, chunk_size):
+                try:
+                    cursor.execute(*self.bulk_insert_query(event_id, chunk, status))
+                    inserted.extend(chunk)
+                except IntegrityError as e:
+                    if e.errno not in BULK_INTEGRITY_OUTCOMES:
+                        raise
+                    for pid in chunk:
+                        try:
+                            cursor.execute(INSERT_REGISTRATION_SQL, (event_id, pid, status))
+                            inserted.append(pid)
+                        except IntegrityError as row_error:
+                            if row_error.errno not in BULK_INTEGRITY_OUTCOMES:
+                                raise
+                            outcomes[pid] = (BULK_INTEGRITY_OUTCOMES[row_error.errno], None)
+            
+            if status == 'confirmado' and inserted:
+                self._adjust_confirmed_count(cursor, event_id, len(inserted))
+            
+            # IDs de las inscripciones creadas (con el modo de autoincremento por defecto
+            # de MySQL 8 no son necesariamente consecutivos) y de las que ya existían
+            inserted_set = set(inserted)
+            for chunk in self.chunks(self.readback_targets(inserted, outcomes), chunk_size):
+                cursor.execute(*self.bulk_readback_query(event_id, chunk))
+                self.classify_readback(cursor.fetchall(), inserted_set, outcomes)
+            
+            record_changes(cursor, [('registration_created', event_id, pid, None) for pid in inserted])
+            conn.commit()
+            cursor.close()
+            return outcomes
+            
+        except Error as e:
+            if conn:
+                conn.rollback()
+            print(f"Error en la inscripción masiva: {e}")
+            raise  # Re-lanzar para que el decorador de reintento lo maneje
+        finally:
+            if conn:
+                conn.close()
+            self.lock_backend.release(resource_id)
+    
+    @staticmethod
+    def chunks(items: List[int], size: int) -> List[List[int]]:
+        """Divide una lista en bloques de como máximo size elementos"""
+        return [items[i:i + size] for i in range(0, len(items), size)]
+    
+    @staticmethod
+    def bulk_lookup_query(event_id: int, chunk: List[int]) -> Tuple[str, tuple]:
+        """Participantes del bloque que existen y su inscripción en el evento (o NULL)"""
+        placeholders = ", ".join(["%s"] * len(chunk))
+        query = f"""
+            SELECT p.participant_id, er.registration_id
+            FROM participants p
+            LEFT JOIN event_registrations er
+                ON er.participant_id = p.participant_id AND er.event_id = %s
+            WHERE p.participant_id IN ({placeholders})
+        """
+        return query, (event_id, *chunk)
+    
+    @staticmethod
+    def classify_bulk_chunk(chunk: List[int], found: Dict[int, Optional[int]],
+                            outcomes: Dict[int, Tuple[str, Optional[int]]]) -> List[int]:
+        """
+        Anota en outcomes los participantes inexistentes y los ya inscritos del bloque
+        (found es el resultado de bulk_lookup_query) y devuelve los candidatos a inscribir
+        """
+        candidates = []
+        for pid in chunk:
+            if pid not in found:
+                outcomes[pid] = (BULK_NOT_FOUND, None)
+            elif found[pid] is not None:
+                outcomes[pid] = (BULK_DUPLICATE, found[pid])
+            else:
+                candidates.append(pid)
+        return candidates
+    
+    @staticmethod
+    def accept_bulk(candidates: List[int], capacity: int, confirmed: int, status: str,
+                    outcomes: Dict[int, Tuple[str, Optional[int]]]) -> List[int]:
+        """
+        Candidatos que caben en el evento; el resto se anota como 'full'.
+        Las plazas libres se calculan una sola vez; las no confirmadas no ocupan plaza
+        pero, como en la inscripción individual, no se admiten en eventos llenos.
+        """
+        free = max(0, capacity - confirmed)
+        accepted = candidates[:free] if status == 'confirmado' else (candidates if free else [])
+        for pid in candidates[len(accepted):]:
+            outcomes[pid] = (BULK_FULL, None)
+        return accepted
+    
+    @staticmethod
+    def bulk_insert_query(event_id: int, chunk: List[int], status: str) -> Tuple[str, tuple]:
+        """INSERT multi-fila de un bloque de inscripciones"""
+        values = ", ".join(["(%s, %s, %s)"] * len(chunk))
+        params = tuple(value for pid in chunk for value in (event_id, pid, status))
+        return f"INSERT INTO event_registrations (event_id, participant_id, status) VALUES {values}", params
+    
+    @staticmethod
+    def bulk_readback_query(event_id: int, chunk: List[int]) -> Tuple[str, tuple]:
+        """IDs de las inscripciones de un bloque de participantes en el evento"""
+        placeholders = ", ".join(["%s"] * len(chunk))
+        query = f"""
+            SELECT participant_id, registration_id FROM event_registrations
+            WHERE event_id = %s AND participant_id IN ({placeholders})
+        """
+        return query, (event_id, *chunk)
+    
+    @staticmethod
+    def readback_targets(inserted: List[int],
+                         outcomes: Dict[int, Tuple[str, Optional[int]]]) -> List[int]:
+        """Participantes cuya inscripción hay que leer: los insertados y los duplicados sin ID"""
+        late_duplicates = [pid for pid, (outcome, registration_id) in outcomes.items()
+                           if outcome == BULK_DUPLICATE and registration_id is None]
+        return inserted + late_duplicates
+    
+    @staticmethod
+    def classify_readback(rows, inserted: set, outcomes: Dict[int, Tuple[str, Optional[int]]]):
+        """Anota el registration_id leído: 'registered' solo para las filas insertadas en el lote"""
+        for pid, registration_id in rows:
+            outcomes[pid] = (BULK_REGISTERED if pid in inserted else BULK_DUPLICATE, registration_id)
+    
+    def register_participants_bulk(self, event_id: int, participant_ids: List[int],
+                                   status: str = "confirmado") -> List[Tuple[int, str, Optional[int]]]:
+        """
+        Inscribe muchos participantes en un evento con una sola transacción.
+        Bloquea la fila del evento una vez, calcula una vez las plazas libres e inserta
+        hasta ese número de filas con INSERT multi-fila (en lugar de una transacción
+        por participante que además se serializan en la misma fila del evento).
+        
+        Args:
+            event_id: ID del evento
+            participant_ids: IDs de los participantes (los repetidos se procesan una vez)
+            status: Estado de las inscripciones (por defecto "confirmado")
+        
+        Returns:
+            Lista de tuplas (participant_id, resultado, registration_id) en el orden de
+            entrada, con resultado 'registered', 'duplicate' (ya estaba inscrito; se
+            devuelve su registration_id), 'full' (sin plaza), 'not_found' (no existe el
+            participante o el evento) o 'error'
+        
+        Raises:
+            ValueError: Si el estado no es válido
+        """
+        unique_ids = list(dict.fromkeys(participant_ids))
+        status = self.validate_status(status)
+        try:
+            outcomes = self._register_bulk_internal(event_id, unique_ids, status) if unique_ids else {}
+        except Exception as e:
+            print(f"Error en la inscripción masiva después de reintentos: {e}")
+            return [(pid, BULK_ERROR, None) for pid in unique_ids]
+        
+        registered = [pid for pid in unique_ids if outcomes.get(pid, (None,))[0] == BULK_REGISTERED]
+        if registered:
+            _occupancy_cache.invalidate(event_id)
+            notifications = get_notification_system()
+            for pid in registered:
+                notifications.notify(
+                    'registration_created',
+                    event_id=event_id,
+                    participant_id=pid,
+                    registration_id=outcomes[pid][1]
+                )
+        
+        return [(pid, *outcomes.get(pid, (BULK_ERROR, None))) for pid in unique_ids]
+    
     def register_multiple_participants_parallel(self, event_id: int, 
                                                 participant_ids: List[int],
                                                 status: str = "confirmado") -> List[Tuple[int, Optional[int]]]:
         """
-        Registra múltiples participantes en un evento de forma paralela.
-        Usa worker threads para procesar las inscripciones simultáneamente.
+        Registra múltiples participantes en un evento.
+        Se mantiene por compatibilidad: delega en register_participants_bulk, que hace
+        una sola transacción para todo el lote en lugar de una tarea por participante.
         
         Args:
             event_id: ID del evento
@@ -324,33 +913,13 @@ class RegistrationController:
         Returns:
             Lista de tuplas (participant_id, registration_id o None)
         """
-        processor = get_subscription_processor()
         results = []
-        
-        # Crear tareas para cada inscripción
-        tasks = []
-        for participant_id in participant_ids:
-            tasks.append((
-                self._register_participant_internal,
-                (event_id, participant_id, status),
-                {},
-                None  # callback
-            ))
-        
-        # Enviar todas las tareas a la cola de procesamiento paralelo
-        submitted = processor.submit_batch(tasks)
-        
-        # Esperar a que se completen todas las tareas
-        task_results = processor.wait_for_results(submitted, timeout=60.0)
-        
-        # Procesar resultados
-        for i, (success, result, error) in enumerate(task_results):
-            participant_id = participant_ids[i]
-            if success and result:
-                results.append((participant_id, result))
-            else:
-                print(f"Error al registrar participante {participant_id}: {error}")
-                results.append((participant_id, None))
+        for participant_id, outcome, registration_id in self.register_participants_bulk(
+                event_id, participant_ids, status):
+            if outcome != BULK_REGISTERED:
+                print(f"No se registró el participante {participant_id}: {outcome}")
+                registration_id = None
+            results.append((participant_id, registration_id))
         
         return results
 
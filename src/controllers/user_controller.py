@@ -5,6 +5,9 @@ Maneja la lógica de negocio relacionada con usuarios
 
 from src.database.db_connection import DatabaseConnection
 from src.models.user import User
+from src.utils.concurrency_manager import get_notification_system
+from src.utils.change_feed import record_change
+from src.utils.entity_cache import get_entity_cache
 from mysql.connector import Error
 from typing import List, Optional
 from datetime import datetime
@@ -16,9 +19,16 @@ class UserController:
     
     def __init__(self, db: DatabaseConnection):
         self.db = db
+        # Caché de lectura compartida por todos los controladores de usuarios
+        self.cache = get_entity_cache('users')
     
     def get_all(self) -> List[User]:
-        """Obtiene todos los usuarios"""
+        """Obtiene todos los usuarios (de la caché si el listado está vigente)"""
+        cached = self.cache.get_all()
+        if cached is not None:
+            return [User.from_dict(row) for row in cached]
+        generation = self.cache.generation
+        
         conn = None
         try:
             conn = self.db.get_connection()
@@ -32,6 +42,7 @@ class UserController:
             cursor.execute(query)
             rows = cursor.fetchall()
             cursor.close()
+            self.cache.put_all(rows, generation)
             
             users = []
             for row in rows:
@@ -54,7 +65,12 @@ class UserController:
                 conn.close()
     
     def get_by_id(self, user_id: int) -> Optional[User]:
-        """Obtiene un usuario por ID"""
+        """Obtiene un usuario por ID (de la caché si está vigente)"""
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return User.from_dict(cached)
+        generation = self.cache.generation
+        
         conn = None
         try:
             conn = self.db.get_connection()
@@ -70,6 +86,7 @@ class UserController:
             cursor.close()
             
             if row:
+                self.cache.put(user_id, row, generation)
                 return User(
                     user_id=row['user_id'],
                     username=row['username'],
@@ -144,9 +161,14 @@ class UserController:
             values = (user.username, password_hash, user.role)
             
             cursor.execute(query, values)
-            conn.commit()
             user_id = cursor.lastrowid
+            record_change(cursor, 'user_created', user_id=user_id)
+            conn.commit()
             cursor.close()
+            self.cache.invalidate()
+            
+            # Notificar creación del usuario
+            get_notification_system().notify('user_created', user_id=user_id)
             return user_id
             
         except Error as e:
@@ -185,8 +207,15 @@ class UserController:
             
             cursor.execute(query, values)
             affected_rows = cursor.rowcount
+            if affected_rows > 0:
+                record_change(cursor, 'user_updated', user_id=user.user_id)
             conn.commit()
             cursor.close()
+            self.cache.invalidate(user.user_id)
+            
+            # Notificar actualización del usuario
+            if affected_rows > 0:
+                get_notification_system().notify('user_updated', user_id=user.user_id)
             
             return affected_rows > 0
             
@@ -209,8 +238,15 @@ class UserController:
             query = "DELETE FROM users WHERE user_id = %s"
             cursor.execute(query, (user_id,))
             affected_rows = cursor.rowcount
+            if affected_rows > 0:
+                record_change(cursor, 'user_deleted', user_id=user_id)
             conn.commit()
             cursor.close()
+            self.cache.invalidate(user_id)
+            
+            # Notificar eliminación del usuario
+            if affected_rows > 0:
+                get_notification_system().notify('user_deleted', user_id=user_id)
             
             return affected_rows > 0
             
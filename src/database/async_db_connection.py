@@ -0,0 +1,159 @@
+"""
+Conexión asíncrona (asyncio) a MySQL con pool de aiomysql
+Dependencia opcional: solo la necesitan los controladores asíncronos
+(src/controllers/async_controllers.py), no la aplicación de escritorio
+"""
+
+import sys
+import os
+from contextlib import asynccontextmanager
+
+# Agregar el directorio raíz al path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.config import DB_CONFIG, CONCURRENCY_CONFIG
+from src.database.connection_pool import CONNECTION_LOST_ERRNOS
+from src.utils.concurrency_manager import CircuitBreaker, mysql_errno
+
+try:
+    import aiomysql
+    from pymysql.err import MySQLError as Error, IntegrityError
+    DictCursor = aiomysql.DictCursor
+except ImportError:
+    aiomysql = None
+    DictCursor = None
+
+    class Error(Exception):
+        """Error de base de datos (sustituto mientras aiomysql no esté instalado)"""
+
+    class IntegrityError(Error):
+        """Violación de restricción (sustituto mientras aiomysql no esté instalado)"""
+
+
+class CircuitOpenError(Error):
+    """La base de datos se considera caída (circuito abierto): la conexión se rechaza sin intentarla"""
+
+
+def async_db_config() -> dict:
+    """
+    Parámetros de aiomysql equivalentes a DB_CONFIG. Las conexiones usan autocommit:
+    las lecturas no dejan transacciones abiertas (aiomysql cerraría la conexión al
+    devolverla al pool) y las escrituras de varias sentencias abren la suya con begin()
+    """
+    return {
+        'host': DB_CONFIG['host'],
+        'port': DB_CONFIG['port'],
+        'user': DB_CONFIG['user'],
+        'password': DB_CONFIG['password'],
+        'db': DB_CONFIG['database'],
+        'charset': DB_CONFIG.get('charset', 'utf8mb4'),
+        'autocommit': True
+    }
+
+
+class AsyncDatabaseConnection:
+    """
+    Pool de conexiones asíncrono para los controladores asíncronos
+
+    A diferencia del pool de mysql-connector, al agotarse las conexiones una corrutina
+    espera (sin bloquear el event loop) a que otra devuelva la suya. El pool pertenece
+    al event loop en el que se crea, así que no es un singleton: se crea con connect()
+    dentro del loop y se cierra con close().
+    """
+
+    def __init__(self, minsize: int = 1, maxsize: int = None):
+        """
+        Args:
+            minsize: Conexiones que se abren al crear el pool
+            maxsize: Conexiones máximas (por defecto async_pool_size de CONCURRENCY_CONFIG)
+        """
+        self.minsize = minsize
+        self.maxsize = maxsize or CONCURRENCY_CONFIG.get('async_pool_size', CONCURRENCY_CONFIG.get('pool_size', 20))
+        self.pool = None
+        # Mismo comportamiento que DatabaseConnection: fallar al instante con el servidor caído
+        self.circuit = CircuitBreaker(
+            name="mysql-async",
+            failure_threshold=CONCURRENCY_CONFIG.get('circuit_failure_threshold', 3),
+            cooldown=CONCURRENCY_CONFIG.get('circuit_cooldown', 10.0),
+            success_threshold=CONCURRENCY_CONFIG.get('circuit_success_threshold', 1)
+        )
+
+    async def connect(self):
+        """Crea el pool de conexiones"""
+        if aiomysql is None:
+            raise RuntimeError("Los controladores asíncronos necesitan aiomysql (pip install aiomysql)")
+        if self.pool is None:
+            self.pool = await aiomysql.create_pool(minsize=self.minsize, maxsize=self.maxsize, **async_db_config())
+            print(f"Pool de conexiones asíncrono creado exitosamente (tamaño máximo: {self.maxsize} conexiones)")
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Obtiene una conexión del pool y la devuelve al salir del bloque:
+            async with db.connection() as conn: ...
+
+        Si se cancela la espera o la consulta de prueba (p. ej. con asyncio.wait_for),
+        la prueba del circuito se libera sin contar resultado. Una conexión perdida
+        dentro del bloque (errores 2006/2013/2055) cuenta como fallo en el circuito y
+        la conexión se cierra en lugar de volver al pool.
+        """
+        if self.pool is None:
+            raise Error("No hay pool de conexiones disponible")
+        if not self.circuit.allow():
+            raise CircuitOpenError(
+                f"Base de datos no disponible (nuevo intento en {self.circuit.retry_after():.1f}s)"
+            )
+        probing = self.circuit.state == CircuitBreaker.HALF_OPEN
+        try:
+            conn = await self.pool.acquire()
+        except Error as e:
+            self.circuit.record_failure()
+            print(f"Error al obtener conexión del pool: {e}")
+            raise
+        except BaseException:
+            # Cancelada o vencida la espera: no se sabe si el servidor responde
+            if probing:
+                self.circuit.release_probe()
+            raise
+        try:
+            if probing:
+                try:
+                    async with conn.cursor() as cursor:
+                        await cursor.execute("SELECT 1")
+                        await cursor.fetchall()
+                except Error:
+                    conn.close()
+                    self.circuit.record_failure()
+                    raise
+                except BaseException:
+                    # La consulta pudo quedar a medias: la conexión no se reutiliza
+                    conn.close()
+                    self.circuit.release_probe()
+                    raise
+            self.circuit.record_success()
+            try:
+                yield conn
+            except Error as e:
+                if mysql_errno(e) in CONNECTION_LOST_ERRNOS:
+                    # Igual que DatabaseConnection._on_connection_lost en el pool síncrono
+                    conn.close()
+                    self.circuit.record_failure()
+                raise
+        finally:
+            self.pool.release(conn)
+
+    def pool_stats(self) -> dict:
+        """Ocupación del pool: tamaño máximo, conexiones libres y en uso"""
+        if self.pool is None:
+            return {'size': 0, 'available': None, 'in_use': None}
+        return {
+            'size': self.pool.maxsize,
+            'available': self.pool.freesize + (self.pool.maxsize - self.pool.size),
+            'in_use': self.pool.size - self.pool.freesize
+        }
+
+    async def close(self):
+        """Cierra todas las conexiones del pool"""
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
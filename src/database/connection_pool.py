@@ -0,0 +1,500 @@
+"""
+Pool de conexiones a MySQL con comprobación de salud y métricas
+Sustituye a MySQLConnectionPool de mysql-connector, que hace un ping en cada préstamo
+(bajo un lock global), reinicia la sesión en cada devolución y falla al instante cuando
+no quedan conexiones libres.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+
+# Límites (en milisegundos) del histograma de tiempos de espera al pedir una conexión
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Errores de una consulta que indican que se perdió la conexión con el servidor
+CONNECTION_LOST_ERRNOS = frozenset({
+    2006,  # CR_SERVER_GONE_ERROR
+    2013,  # CR_SERVER_LOST
+    2055,  # CR_SERVER_LOST_EXTENDED
+})
+
+
+class _PoolEntry:
+    """Conexión física del pool con sus instantes de creación, caducidad y último uso"""
+
+    __slots__ = ('conn', 'created_at', 'expires_at', 'last_used')
+
+    def __init__(self, conn, max_lifetime: float):
+        now = time.monotonic()
+        self.conn = conn
+        self.created_at = now
+        # Con variación aleatoria, para que las conexiones del arranque no caduquen a la vez
+        self.expires_at = now + max_lifetime * random.uniform(0.9, 1.0) if max_lifetime > 0 else None
+        self.last_used = now
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+
+class _WatchedCursor:
+    """Cursor de una conexión prestada que avisa al pool si una consulta pierde la conexión"""
+
+    def __init__(self, conn: 'PooledConnection', cursor):
+        self._conn = conn
+        self._cursor = cursor
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._cursor, attr)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+
+    def execute(self, *args, **kwargs):
+        return self._conn._watch(self._cursor.execute, *args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        return self._conn._watch(self._cursor.executemany, *args, **kwargs)
+
+    def callproc(self, *args, **kwargs):
+        return self._conn._watch(self._cursor.callproc, *args, **kwargs)
+
+    def fetchone(self):
+        return self._conn._watch(self._cursor.fetchone)
+
+    def fetchmany(self, *args, **kwargs):
+        return self._conn._watch(self._cursor.fetchmany, *args, **kwargs)
+
+    def fetchall(self):
+        return self._conn._watch(self._cursor.fetchall)
+
+
+class PooledConnection:
+    """
+    Conexión prestada por ConnectionPool: se usa como una conexión de mysql-connector
+    y close() la devuelve al pool en lugar de cerrarla
+
+    Los errores de conexión perdida de sus consultas (CONNECTION_LOST_ERRNOS) se
+    comunican al pool, que descarta la conexión al devolverla.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', entry: _PoolEntry):
+        self._pool = pool
+        self._entry = entry
+        self._reset = False
+        self._lost = False
+
+    def _target(self):
+        if self._entry is None:
+            raise Error("La conexión ya se devolvió al pool")
+        return self._entry.conn
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._target(), attr)
+
+    def _watch(self, call: Callable, *args, **kwargs):
+        """Ejecuta una llamada al servidor y avisa al pool si se perdió la conexión"""
+        try:
+            return call(*args, **kwargs)
+        except Error as e:
+            if getattr(e, 'errno', None) in CONNECTION_LOST_ERRNOS and not self._lost:
+                self._lost = True
+                self._pool._connection_lost(e)
+            raise
+
+    def cursor(self, *args, **kwargs):
+        return _WatchedCursor(self, self._watch(self._target().cursor, *args, **kwargs))
+
+    def start_transaction(self, *args, **kwargs):
+        return self._watch(self._target().start_transaction, *args, **kwargs)
+
+    def commit(self):
+        return self._watch(self._target().commit)
+
+    def rollback(self):
+        return self._watch(self._target().rollback)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def require_reset(self):
+        """
+        Pide reiniciar la sesión al devolver la conexión aunque pool_reset_session esté
+        desactivado (p. ej. si pudo quedar un lock con nombre sin liberar)
+        """
+        self._reset = True
+
+    def close(self):
+        """Devuelve la conexión al pool (una segunda llamada no hace nada)"""
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._pool._release(entry, self._reset, self._lost)
+
+
+class PoolMetrics:
+    """
+    Métricas de préstamo de conexiones: préstamos por segundo (en una ventana
+    deslizante), histograma de tiempos de espera y eventos de agotamiento
+    """
+
+    def __init__(self, window: float = 60.0):
+        """
+        Args:
+            window: Segundos de la ventana con la que se calculan los préstamos por segundo
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._recent: Deque[float] = deque()
+            self._started = time.monotonic()
+            self._counters = {
+                'checkouts': 0, 'exhausted': 0, 'timeouts': 0, 'created': 0,
+                'create_failures': 0, 'validations': 0, 'validation_failures': 0,
+                'expired': 0, 'idle_closed': 0, 'resets': 0, 'rollbacks': 0, 'discarded': 0,
+                'connection_errors': 0
+            }
+            self._histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+            self._peak_in_use = 0
+
+    def count(self, key: str, amount: int = 1):
+        with self._lock:
+            self._counters[key] += amount
+
+    def record_checkout(self, waited: float, in_use: int):
+        """Registra un préstamo, lo que esperó y las conexiones en uso tras él"""
+        now = time.monotonic()
+        waited_ms = waited * 1000
+        bucket = next((i for i, limit in enumerate(WAIT_BUCKETS_MS) if waited_ms <= limit), len(WAIT_BUCKETS_MS))
+        with self._lock:
+            self._counters['checkouts'] += 1
+            self._histogram[bucket] += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            self._peak_in_use = max(self._peak_in_use, in_use)
+            self._recent.append(now)
+            self._trim(now)
+
+    def _trim(self, now: float):
+        while self._recent and self._recent[0] < now - self.window:
+            self._recent.popleft()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            elapsed = min(self.window, now - self._started) or 1e-9
+            checkouts = self._counters['checkouts']
+            labels = [f"<={limit}ms" for limit in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+            return {
+                **self._counters,
+                'checkouts_per_sec': len(self._recent) / elapsed,
+                'avg_wait_ms': self._wait_total / checkouts * 1000 if checkouts else 0.0,
+                'max_wait_ms': self._wait_max * 1000,
+                'wait_histogram': dict(zip(labels, self._histogram)),
+                'peak_in_use': self._peak_in_use
+            }
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones con apertura bajo demanda, comprobación de salud y métricas
+
+    - Al crearse abre min_idle conexiones (warm-up) y crece bajo demanda hasta size.
+    - Con todas en uso, quien pide una conexión espera hasta checkout_timeout segundos
+      a que se devuelva otra (evento de agotamiento); vencido el plazo, PoolError.
+    - Una conexión que lleva más de validation_interval segundos sin usarse se comprueba
+      con un ping antes de prestarla; si el servidor la cerró, se abre otra.
+    - Las conexiones se cierran al superar max_lifetime (al devolverlas o antes de
+      prestarlas) y las que sobran por encima de min_idle, al pasar idle_timeout sin uso.
+    - Al devolver una conexión se reinicia la sesión (por defecto), así el siguiente
+      usuario no hereda variables, tablas temporales ni locks; con reset_session=False
+      solo se deshace la transacción que hubiera quedado abierta.
+    - Si una consulta pierde la conexión (errores 2006/2013/2055), esa conexión se
+      descarta, las libres de antes del fallo se comprueban al prestarlas aunque no
+      haya pasado validation_interval y se llama a on_connection_error(error).
+    """
+
+    def __init__(self, connect: Callable[[], Any], size: int = 20, min_idle: int = 2,
+                 checkout_timeout: float = 2.0, validation_interval: float = 30.0,
+                 max_lifetime: float = 1800.0, idle_timeout: float = 300.0,
+                 reset_session: bool = True, metrics_window: float = 60.0,
+                 on_connection_error: Optional[Callable[[Error], None]] = None):
+        """
+        Args:
+            connect: Función que abre una conexión física nueva
+            size: Conexiones abiertas como máximo
+            min_idle: Conexiones que se abren al arrancar y que se conservan aunque no se usen
+            checkout_timeout: Segundos de espera con el pool agotado (0 = fallar al instante)
+            validation_interval: Inactividad tras la que se comprueba la conexión (0 = siempre)
+            max_lifetime: Segundos de vida máxima de una conexión (0 = sin límite)
+            idle_timeout: Inactividad tras la que se cierran las conexiones sobrantes (0 = nunca)
+            reset_session: Reiniciar la sesión (variables, tablas temporales, locks) al devolverla;
+                desactivarlo ahorra un viaje al servidor si ningún código deja estado de sesión
+            metrics_window: Ventana (segundos) de los préstamos por segundo
+            on_connection_error: Callback opcional cuando una consulta pierde la conexión
+                (p. ej. para contarlo como fallo en el circuit breaker)
+        """
+        self._connect = connect
+        self.size = max(1, int(size))
+        self.min_idle = max(0, min(int(min_idle), self.size))
+        self.checkout_timeout = checkout_timeout
+        self.validation_interval = validation_interval
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.reset_session = reset_session
+        self.on_connection_error = on_connection_error
+        self.metrics = PoolMetrics(metrics_window)
+        # Las conexiones libres desde antes de este instante se comprueban al prestarlas
+        self._suspect_before = float('-inf')
+        self._idle: Deque[_PoolEntry] = deque()
+        self._open = 0
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._closed = False
+
+    @property
+    def pool_size(self) -> int:
+        """Conexiones máximas (mismo nombre que en MySQLConnectionPool)"""
+        return self.size
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """
+        Abre conexiones hasta tener count libres (por defecto min_idle, y al menos una
+        para comprobar que el servidor responde)
+
+        Returns:
+            Número de conexiones abiertas
+
+        Raises:
+            Error: Si no se puede abrir la primera conexión
+        """
+        target = max(1, self.min_idle if count is None else count)
+        opened = 0
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) >= target or self._open >= self.size:
+                    return opened
+                self._open += 1
+            try:
+                entry = self._new_entry()
+            except Error:
+                with self._cond:
+                    self._open -= 1
+                if opened == 0:
+                    raise
+                return opened
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+            opened += 1
+
+    def get_connection(self) -> PooledConnection:
+        """
+        Presta una conexión comprobada
+
+        Raises:
+            PoolError: Si no queda ninguna libre tras checkout_timeout segundos
+            Error: Si hay que abrir una conexión y el servidor no responde
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        exhausted = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolError("El pool de conexiones está cerrado")
+                if self._idle:
+                    # La más reciente: las que no se usan envejecen y se cierran por inactividad
+                    entry = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    entry = None
+                    break
+                if not exhausted:
+                    exhausted = True
+                    self.metrics.count('exhausted')
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.metrics.count('timeouts')
+                    raise PoolError("Failed getting connection; pool exhausted")
+                self._cond.wait(remaining)
+            self._in_use += 1
+
+        try:
+            entry = self._checked(entry)
+        except Error:
+            with self._cond:
+                self._in_use -= 1
+                self._open -= 1
+                self._cond.notify()
+            raise
+        self.metrics.record_checkout(time.monotonic() - start, self._in_use)
+        return PooledConnection(self, entry)
+
+    def _new_entry(self) -> _PoolEntry:
+        try:
+            conn = self._connect()
+        except Error:
+            self.metrics.count('create_failures')
+            raise
+        self.metrics.count('created')
+        return _PoolEntry(conn, self.max_lifetime)
+
+    def _checked(self, entry: Optional[_PoolEntry]) -> _PoolEntry:
+        """Conexión lista para prestar: nueva, o la libre si no caducó y sigue viva"""
+        if entry is None:
+            return self._new_entry()
+        now = time.monotonic()
+        if entry.expired(now):
+            self.metrics.count('expired')
+            self._disconnect(entry)
+            return self._new_entry()
+        if now - entry.last_used >= self.validation_interval or entry.last_used <= self._suspect_before:
+            self.metrics.count('validations')
+            if not entry.conn.is_connected():
+                self.metrics.count('validation_failures')
+                self._disconnect(entry)
+                return self._new_entry()
+        return entry
+
+    def _connection_lost(self, error: Error):
+        """
+        Una consulta perdió la conexión: probablemente el servidor cerró también las
+        demás, así que las libres se comprobarán antes de prestarlas
+        """
+        self._suspect_before = time.monotonic()
+        self.metrics.count('connection_errors')
+        if self.on_connection_error:
+            try:
+                self.on_connection_error(error)
+            except Exception as e:
+                print(f"Error en on_connection_error del pool: {e}")
+
+    def _release(self, entry: _PoolEntry, reset: bool = False, lost: bool = False):
+        """Devuelve una conexión prestada (la cierra si caducó o quedó inutilizable)"""
+        keep = not self._closed and not lost and not entry.expired(time.monotonic())
+        if lost:
+            # Una conexión perdida no se devuelve al pool
+            self.metrics.count('discarded')
+        elif keep:
+            try:
+                if self.reset_session or reset:
+                    entry.conn.reset_session()
+                    self.metrics.count('resets')
+                elif entry.conn.in_transaction:
+                    # No debe pasar al siguiente usuario una transacción a medias
+                    entry.conn.rollback()
+                    self.metrics.count('rollbacks')
+            except Error:
+                keep = False
+                self.metrics.count('discarded')
+        elif not self._closed:
+            self.metrics.count('expired')
+
+        if not keep:
+            self._disconnect(entry)
+        entry.last_used = time.monotonic()
+        with self._cond:
+            self._in_use -= 1
+            if keep:
+                self._idle.append(entry)
+            else:
+                self._open -= 1
+            self._cond.notify()
+
+    def close_idle(self) -> int:
+        """
+        Cierra las conexiones libres caducadas y las que superan idle_timeout por
+        encima de min_idle (se llama periódicamente desde DatabaseConnection)
+
+        Returns:
+            Número de conexiones cerradas
+        """
+        now = time.monotonic()
+        closing: List[_PoolEntry] = []
+        with self._cond:
+            keep: Deque[_PoolEntry] = deque()
+            # De la más reciente a la más antigua: se conservan las min_idle más usadas
+            while self._idle:
+                entry = self._idle.pop()
+                idle_too_long = (self.idle_timeout > 0 and len(keep) >= self.min_idle
+                                 and now - entry.last_used >= self.idle_timeout)
+                if entry.expired(now) or idle_too_long:
+                    closing.append(entry)
+                else:
+                    keep.appendleft(entry)
+            self._idle = keep
+            self._open -= len(closing)
+            self._cond.notify_all()
+        for entry in closing:
+            self.metrics.count('expired' if entry.expired(now) else 'idle_closed')
+            self._disconnect(entry)
+        return len(closing)
+
+    @staticmethod
+    def _disconnect(entry: _PoolEntry):
+        try:
+            entry.conn.close()
+        except Exception:
+            pass  # Una conexión caída ya está cerrada
+
+    def drain(self) -> int:
+        """
+        Cierra todas las conexiones libres; el pool sigue en uso y vuelve a abrirlas
+        bajo demanda
+
+        Returns:
+            Número de conexiones cerradas
+        """
+        with self._cond:
+            closing = list(self._idle)
+            self._idle.clear()
+            self._open -= len(closing)
+            self._cond.notify_all()
+        for entry in closing:
+            self._disconnect(entry)
+        return len(closing)
+
+    def close(self):
+        """Cierra el pool: las conexiones libres ahora y las prestadas al devolverlas"""
+        with self._cond:
+            self._closed = True
+            closing = list(self._idle)
+            self._idle.clear()
+            self._open -= len(closing)
+            self._cond.notify_all()
+        for entry in closing:
+            self._disconnect(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        """Ocupación del pool y métricas de préstamo"""
+        with self._cond:
+            occupancy = {
+                'size': self.size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                # Libres sin esperar: las abiertas sin usar más las que aún se pueden abrir
+                'available': len(self._idle) + (self.size - self._open)
+            }
+        return {**occupancy, **self.metrics.stats()}
@@ -3,7 +3,8 @@ Gestión de la conexión a la base de datos MySQL
 """
 
 import mysql.connector
-from mysql.connector import Error, pooling
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
 import sys
 import os
 import threading
@@ -11,6 +12,15 @@ import threading
 # Agregar el directorio raíz al path para imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from config.config import DB_CONFIG, CONCURRENCY_CONFIG
+from src.database.connection_pool import ConnectionPool
+from src.utils.concurrency_manager import CircuitBreaker
+
+
+class CircuitOpenError(Error):
+    """
+    La base de datos se considera caída (circuito abierto): la conexión se rechaza
+    sin intentarla. Su errno no es transitorio, así que las políticas de reintento no la repiten.
+    """
 
 
 class DatabaseConnection:
@@ -32,6 +42,15 @@ class DatabaseConnection:
             return
         
         self.pool = None
+        self._maintenance_stop = threading.Event()
+        self._maintenance_thread = None
+        # Tras varios fallos seguidos de conexión se deja de intentar durante un tiempo
+        self.circuit = CircuitBreaker(
+            name="mysql",
+            failure_threshold=CONCURRENCY_CONFIG.get('circuit_failure_threshold', 3),
+            cooldown=CONCURRENCY_CONFIG.get('circuit_cooldown', 10.0),
+            success_threshold=CONCURRENCY_CONFIG.get('circuit_success_threshold', 1)
+        )
         try:
             self._create_connection_pool()
         except Exception as e:
@@ -40,22 +59,50 @@ class DatabaseConnection:
         self._initialized = True
     
     def _create_connection_pool(self):
-        """Crea un pool de conexiones a la base de datos para soportar múltiples usuarios simultáneos"""
+        """
+        Crea un pool de conexiones a la base de datos para soportar múltiples usuarios
+        simultáneos y abre las primeras (warm-up); el resto se abre bajo demanda
+        """
         try:
             pool_size = CONCURRENCY_CONFIG.get('pool_size', 20)
-            self.pool = pooling.MySQLConnectionPool(
-                pool_name="eventos_pool",
-                pool_size=pool_size,
-                pool_reset_session=True,
-                **DB_CONFIG
+            pool = ConnectionPool(
+                connect=lambda: mysql.connector.connect(**DB_CONFIG),
+                size=pool_size,
+                min_idle=CONCURRENCY_CONFIG.get('pool_min_idle', 4),
+                checkout_timeout=CONCURRENCY_CONFIG.get('pool_checkout_timeout', 2.0),
+                validation_interval=CONCURRENCY_CONFIG.get('pool_validation_interval', 30.0),
+                max_lifetime=CONCURRENCY_CONFIG.get('pool_max_lifetime', 1800.0),
+                idle_timeout=CONCURRENCY_CONFIG.get('pool_idle_timeout', 300.0),
+                reset_session=CONCURRENCY_CONFIG.get('pool_reset_session', True),
+                metrics_window=CONCURRENCY_CONFIG.get('pool_metrics_window', 60.0),
+                on_connection_error=self._on_connection_lost
             )
-            print(f"Pool de conexiones creado exitosamente (tamaño: {pool_size} conexiones)")
+            opened = pool.warm_up()
+            self.pool = pool
+            self._start_maintenance()
+            print(f"Pool de conexiones creado exitosamente (tamaño: {pool_size} conexiones, {opened} abiertas)")
         except (Error, Exception) as e:
             # No crear pool si hay error
             self.pool = None
             # Re-lanzar la excepción para que main.py la capture
             raise
     
+    def _start_maintenance(self):
+        """Thread que cierra periódicamente las conexiones caducadas o inactivas de más"""
+        interval = CONCURRENCY_CONFIG.get('pool_maintenance_interval', 30.0)
+        if interval <= 0 or self._maintenance_thread is not None:
+            return
+        
+        def run():
+            while not self._maintenance_stop.wait(interval):
+                try:
+                    self.pool.close_idle()
+                except Exception as e:
+                    print(f"Error en el mantenimiento del pool de conexiones: {e}")
+        
+        self._maintenance_thread = threading.Thread(target=run, name="PoolMaintenance", daemon=True)
+        self._maintenance_thread.start()
+    
     def get_connection(self):
         """
         Obtiene una conexión del pool.
@@ -64,12 +111,86 @@ class DatabaseConnection:
         """
         if not self.pool:
             raise Error("No hay pool de conexiones disponible")
+        if not self.circuit.allow():
+            # Circuito abierto: fallar al instante en lugar de esperar el timeout de conexión
+            raise CircuitOpenError(
+                f"Base de datos no disponible (nuevo intento en {self.circuit.retry_after():.1f}s)"
+            )
+        # Pasado el cooldown, la conexión admitida es la prueba: se comprueba con una consulta
+        probing = self.circuit.state == CircuitBreaker.HALF_OPEN
         try:
             conn = self.pool.get_connection()
-            return conn
+            if probing:
+                self._probe(conn)
+        except PoolError as e:
+            # Pool agotado: el servidor responde, no es un fallo de conexión
+            if probing:
+                self.circuit.release_probe()
+            print(f"Error al obtener conexión del pool: {e}")
+            raise
         except Error as e:
+            self.circuit.record_failure()
             print(f"Error al obtener conexión del pool: {e}")
             raise
+        except BaseException:
+            # Un error inesperado no dice si el servidor responde: se admite otra prueba
+            if probing:
+                self.circuit.release_probe()
+            raise
+        self.circuit.record_success()
+        return conn
+    
+    def _on_connection_lost(self, error: Error):
+        """
+        Una consulta perdió la conexión (servidor caído o reiniciado): cuenta como fallo
+        en el circuito, igual que un fallo al conectar. El pool comprobará las conexiones
+        libres antes de prestarlas, así que si el servidor sigue caído los siguientes
+        préstamos también fallan y el circuito se abre.
+        """
+        self.circuit.record_failure()
+    
+    @staticmethod
+    def _probe(conn):
+        """Consulta mínima que confirma que el servidor responde"""
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+        except BaseException:
+            conn.close()
+            raise
+    
+    def circuit_state(self) -> str:
+        """Estado del circuito de la base de datos: 'closed', 'open' o 'half_open'"""
+        return self.circuit.state
+    
+    def is_available(self) -> bool:
+        """
+        Indica si la base de datos se considera disponible (hay pool y el circuito
+        está cerrado); no bloquea, solo consulta el estado del circuito
+        """
+        return self.pool is not None and self.circuit.state == CircuitBreaker.CLOSED
+    
+    def pool_stats(self) -> dict:
+        """
+        Ocupación y métricas del pool para dimensionar pool_size
+        
+        Returns:
+            size, open, idle, in_use y available (conexiones que se pueden prestar sin
+            esperar), más checkouts, checkouts_per_sec, wait_histogram, avg_wait_ms,
+            max_wait_ms, peak_in_use, exhausted (préstamos que tuvieron que esperar),
+            timeouts y los contadores de conexiones creadas, validadas, caducadas y
+            cerradas (available e in_use son None si no hay pool)
+        """
+        if not self.pool:
+            return {'size': 0, 'available': None, 'in_use': None}
+        return self.pool.stats()
+    
+    def reset_pool_stats(self):
+        """Pone a cero las métricas del pool (p. ej. antes de una prueba de carga)"""
+        if self.pool:
+            self.pool.metrics.reset()
     
     def test_connection(self):
         """Prueba la conexión a la base de datos"""
@@ -84,7 +205,10 @@ class DatabaseConnection:
         return False
     
     def close(self):
-        """Cierra todas las conexiones del pool"""
-        # El pool se cierra automáticamente cuando se destruye el objeto
-        pass
+        """
+        Cierra las conexiones libres del pool (al cerrar sesión); la instancia es
+        compartida y el pool las vuelve a abrir bajo demanda
+        """
+        if self.pool:
+            self.pool.drain()
 
@@ -5,6 +5,9 @@ Modelo de datos para Eventos
 from datetime import datetime
 from typing import Optional
 
+# Estados que se respetan tal cual; con cualquier otro el estado se calcula por fechas
+EVENT_STATUSES = ('cancelado', 'activo', 'planificado', 'finalizado')
+
 
 class Event:
     """Clase que representa un evento"""
@@ -31,6 +34,22 @@ class Event:
     def __repr__(self):
         return self.__str__()
     
+    def display_status(self, now: Optional[datetime] = None) -> str:
+        """
+        Estado que se muestra en la interfaz: se respeta el estado establecido
+        manualmente o se calcula a partir de las fechas (igual que DERIVED_STATUS_SQL)
+        """
+        now = now or datetime.now()
+        if self.status and self.status.lower() in EVENT_STATUSES:
+            return self.status.lower()
+        elif self.end_datetime and self.end_datetime < now:
+            return "finalizado"
+        elif self.start_datetime and self.start_datetime <= now <= (self.end_datetime or now):
+            return "activo"
+        elif self.start_datetime and self.start_datetime > now:
+            return "planificado"
+        return self.status.lower() if self.status else "activo"
+    
     def to_dict(self):
         """Convierte el evento a diccionario"""
         return {
@@ -0,0 +1,261 @@
+"""
+Carga de datos en segundo plano para las vistas Tkinter
+Las consultas a la base de datos se ejecutan en worker threads y los resultados
+se entregan en el hilo de Tk mediante root.after, de modo que la latencia de MySQL
+no congela la interfaz
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.utils.concurrency_manager import (
+    NotificationBatch, ParallelSubscriptionProcessor, get_notification_system, logger
+)
+
+
+class BackgroundLoader:
+    """
+    Ejecutor de cargas de datos para las vistas
+
+    Cada petición se identifica con una clave (p. ej. 'events'); una petición nueva con
+    la misma clave deja obsoletas las anteriores, cuyos resultados se descartan (y si aún
+    no habían empezado, ni siquiera se ejecutan). Todos los métodos públicos deben
+    llamarse desde el hilo de Tk.
+    """
+
+    def __init__(self, root, num_workers: int = 4, poll_interval_ms: int = 30, change_window_ms: int = 100):
+        """
+        Args:
+            root: Ventana raíz de Tk (se usa su método after para volver al hilo de Tk)
+            num_workers: Número de worker threads
+            poll_interval_ms: Intervalo de recogida de resultados mientras hay cargas en curso
+            change_window_ms: Ventana de agrupación de las notificaciones de watch (y
+                intervalo de recogida cuando solo hay watches activos)
+        """
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self.change_window_ms = change_window_ms
+        self.processor = ParallelSubscriptionProcessor(
+            num_workers=num_workers,
+            max_queue_size=0,
+            name="BackgroundLoader"
+        )
+        self._generations: Dict[str, int] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._done: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._busy_listeners: List[Callable[[bool], None]] = []
+        self._busy = False
+        self._poll_job = None
+        # Suscripciones de las vistas a cambios: token -> (tipos de evento, callback, on_batch, widget)
+        self._watches: Dict[int, tuple] = {}
+        self._watch_seq = 0
+        self._batches: queue.Queue = queue.Queue()
+
+    def submit(self, key: str, func: Callable, *args, on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None, widget=None, **kwargs) -> int:
+        """
+        Ejecuta func(*args, **kwargs) en segundo plano
+
+        Args:
+            key: Clave de la petición; cancela las peticiones anteriores con la misma clave
+            func: Función a ejecutar (normalmente una llamada a un controlador)
+            on_success: Callback con el resultado, ejecutado en el hilo de Tk
+            on_error: Callback con la excepción, ejecutado en el hilo de Tk
+            widget: Si se indica y ya no existe al terminar, el resultado se descarta
+
+        Returns:
+            Número de generación de la petición
+        """
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            self._in_flight[key] = generation
+
+        def task():
+            # Petición ya obsoleta: no llegar a consultar la base de datos
+            if self._generations.get(key) != generation:
+                return
+            try:
+                result = func(*args, **kwargs)
+                self._done.put((key, generation, True, result, on_success, on_error, widget))
+            except Exception as e:
+                self._done.put((key, generation, False, e, on_success, on_error, widget))
+
+        self.processor.submit(task)
+        self._update_busy()
+        self._schedule_poll()
+        return generation
+
+    def cancel(self, key: str):
+        """Cancela la petición en curso con esa clave (su resultado se descartará)"""
+        with self._lock:
+            if key in self._in_flight:
+                self._generations[key] += 1
+                del self._in_flight[key]
+        self._update_busy()
+
+    def cancel_all(self):
+        """Cancela todas las peticiones en curso y los watch (p. ej. al cambiar de pestaña)"""
+        with self._lock:
+            for key in list(self._in_flight):
+                self._generations[key] += 1
+            self._in_flight.clear()
+        for token in list(self._watches):
+            self.unwatch(token)
+        self._update_busy()
+    
+    def watch(self, event_types: Iterable[str], on_batch: Callable[[NotificationBatch], None], widget) -> int:
+        """
+        Entrega en el hilo de Tk los cambios notificados por los controladores, agrupados
+        en un NotificationBatch por ventana de change_window_ms (una ráfaga de 500
+        inscripciones produce un solo refresco)
+        
+        Args:
+            event_types: Tipos de notificación (ej: 'registration_created')
+            on_batch: Callback con el lote, ejecutado en el hilo de Tk
+            widget: El watch se cancela solo cuando el widget deja de existir
+        
+        Returns:
+            Token para cancelar el watch con unwatch
+        """
+        self._watch_seq += 1
+        token = self._watch_seq
+        event_types = list(event_types)
+        
+        def callback(batch: NotificationBatch):
+            self._batches.put((token, batch))
+        
+        self._watches[token] = (event_types, callback, on_batch, widget)
+        get_notification_system().subscribe_coalesced(
+            event_types,
+            callback,
+            window=self.change_window_ms / 1000,
+            subscriber=f"BackgroundLoader.watch-{token}"
+        )
+        self._schedule_poll()
+        return token
+    
+    def unwatch(self, token: int):
+        """Cancela un watch"""
+        watch = self._watches.pop(token, None)
+        if watch is None:
+            return
+        event_types, callback = watch[0], watch[1]
+        notifications = get_notification_system()
+        for event_type in event_types:
+            notifications.unsubscribe(event_type, callback)
+
+    def is_loading(self, key: Optional[str] = None) -> bool:
+        """Indica si hay una petición en curso con esa clave (o cualquiera si no se indica)"""
+        with self._lock:
+            return key in self._in_flight if key is not None else bool(self._in_flight)
+
+    def add_busy_listener(self, callback: Callable[[bool], None]):
+        """Registra un callback que recibe True/False al empezar/terminar las cargas"""
+        self._busy_listeners.append(callback)
+
+    def remove_busy_listener(self, callback: Callable[[bool], None]):
+        """Elimina un callback de estado de carga"""
+        try:
+            self._busy_listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            # Sin cargas en curso basta con recoger los lotes de los watch una vez por ventana
+            interval = self.poll_interval_ms if self.is_loading() else self.change_window_ms
+            try:
+                self._poll_job = self.root.after(interval, self._poll)
+            except Exception as e:
+                # La ventana raíz ya no existe
+                logger.error(f"No se pudo programar la recogida de resultados: {e}")
+
+    def _poll(self):
+        """Entrega en el hilo de Tk los resultados terminados y vigentes"""
+        self._poll_job = None
+        while True:
+            try:
+                key, generation, ok, value, on_success, on_error, widget = self._done.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._lock:
+                if self._in_flight.get(key) != generation:
+                    continue  # Resultado obsoleto o cancelado
+                del self._in_flight[key]
+
+            if widget is not None and not widget.winfo_exists():
+                continue
+            try:
+                if ok:
+                    if on_success:
+                        on_success(value)
+                elif on_error:
+                    on_error(value)
+                else:
+                    logger.error(f"Error en la carga en segundo plano '{key}': {value}")
+            except Exception as e:
+                logger.error(f"Error en el callback de la carga '{key}': {e}")
+
+        self._deliver_batches()
+        self._update_busy()
+        if self.is_loading() or self._watches:
+            self._schedule_poll()
+    
+    def _deliver_batches(self):
+        """Entrega en el hilo de Tk los lotes de cambios de los watch vigentes"""
+        while True:
+            try:
+                token, batch = self._batches.get_nowait()
+            except queue.Empty:
+                break
+            watch = self._watches.get(token)
+            if watch is None:
+                continue
+            on_batch, widget = watch[2], watch[3]
+            if not widget.winfo_exists():
+                self.unwatch(token)
+                continue
+            try:
+                on_batch(batch)
+            except Exception as e:
+                logger.error(f"Error en el callback de cambios: {e}")
+
+    def _update_busy(self):
+        busy = self.is_loading()
+        if busy == self._busy:
+            return
+        self._busy = busy
+        for callback in list(self._busy_listeners):
+            try:
+                callback(busy)
+            except Exception as e:
+                logger.error(f"Error al notificar el estado de carga: {e}")
+
+
+# Instancia global del cargador en segundo plano
+_background_loader: Optional[BackgroundLoader] = None
+
+
+def get_background_loader(widget) -> BackgroundLoader:
+    """
+    Obtiene la instancia global del cargador, asociada a la ventana raíz del widget
+    """
+    global _background_loader
+    root = widget.nametowidget('.')
+    if _background_loader is None:
+        from config.config import CONCURRENCY_CONFIG
+        _background_loader = BackgroundLoader(
+            root,
+            num_workers=CONCURRENCY_CONFIG.get('ui_loader_workers', 4),
+            poll_interval_ms=CONCURRENCY_CONFIG.get('ui_loader_poll_ms', 30),
+            change_window_ms=CONCURRENCY_CONFIG.get('ui_change_window_ms', 100)
+        )
+    elif _background_loader.root is not root:
+        _background_loader.cancel_all()
+        _background_loader.root = root
+        _background_loader._poll_job = None
+    return _background_loader
@@ -0,0 +1,303 @@
+"""
+Registro de cambios compartido entre instancias (tabla change_log)
+Los controladores añaden una fila por cambio en la misma transacción que lo produce y
+cada instancia de la aplicación la sigue con ChangeFeedPoller, que reenvía los cambios
+de las demás instancias a EventNotificationSystem como si fueran locales.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from mysql.connector import Error
+
+from config.config import CONCURRENCY_CONFIG
+from src.utils.concurrency_manager import get_notification_system
+from src.utils.entity_cache import get_entity_cache
+
+logger = logging.getLogger(__name__)
+
+# Identificador de esta instancia: sus propios cambios ya se notificaron localmente
+INSTANCE_ID = uuid.uuid4().hex
+
+INSERT_CHANGES_SQL = "INSERT INTO change_log (change_type, event_id, participant_id, user_id, origin) VALUES "
+SELECT_LAST_CHANGE_SQL = "SELECT COALESCE(MAX(change_id), 0) AS last_id FROM change_log"
+# IDs ya confirmados justo por debajo del punto de partida (los que falten son huecos)
+SELECT_RECENT_IDS_SQL = "SELECT change_id FROM change_log WHERE change_id > %s AND change_id <= %s"
+# Recorrido por rango de la clave primaria: una consulta barata por sondeo
+SELECT_CHANGES_SQL = """
+    SELECT change_id, change_type, event_id, participant_id, user_id, origin
+    FROM change_log
+    WHERE change_id > %s
+    ORDER BY change_id
+    LIMIT %s
+"""
+PURGE_CHANGE_LOG_SQL = "DELETE FROM change_log WHERE changed_at < NOW() - INTERVAL %s HOUR"
+
+# Cachés de entidades que invalida cada prefijo de tipo de cambio: (caché, argumento con el ID)
+_CACHE_BY_PREFIX = {
+    'event_': ('events', 'event_id'),
+    'participant_': ('participants', 'participant_id'),
+    'user_': ('users', 'user_id')
+}
+
+
+def change_feed_enabled() -> bool:
+    return CONCURRENCY_CONFIG.get('change_feed_enabled', True)
+
+
+def record_change(cursor, change_type: str, event_id: Optional[int] = None,
+                  participant_id: Optional[int] = None, user_id: Optional[int] = None):
+    """
+    Añade un cambio al registro. Debe llamarse dentro de la transacción que lo produce
+    (antes del commit), con el mismo tipo y los mismos IDs que la notificación local.
+    """
+    record_changes(cursor, [(change_type, event_id, participant_id, user_id)])
+
+
+def record_changes(cursor, changes: List[Tuple[str, Optional[int], Optional[int], Optional[int]]]):
+    """Añade varios cambios (change_type, event_id, participant_id, user_id) con INSERT multi-fila"""
+    for query, params in changes_insert_queries(changes):
+        cursor.execute(query, params)
+
+
+def changes_insert_queries(changes: List[Tuple[str, Optional[int], Optional[int], Optional[int]]]) -> List[Tuple[str, tuple]]:
+    """Sentencias INSERT multi-fila (por bloques de bulk_insert_chunk) de record_changes"""
+    if not changes or not change_feed_enabled():
+        return []
+    chunk_size = CONCURRENCY_CONFIG.get('bulk_insert_chunk', 1000)
+    queries = []
+    for start in range(0, len(changes), chunk_size):
+        chunk = changes[start:start + chunk_size]
+        values = ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+        params = tuple(value for change in chunk for value in (*change, INSTANCE_ID))
+        queries.append((INSERT_CHANGES_SQL + values, params))
+    return queries
+
+
+def gap_query(change_ids: List[int]) -> Tuple[str, tuple]:
+    """Consulta de cambios concretos que faltaban (huecos en la secuencia)"""
+    placeholders = ", ".join(["%s"] * len(change_ids))
+    query = f"""
+        SELECT change_id, change_type, event_id, participant_id, user_id, origin
+        FROM change_log
+        WHERE change_id IN ({placeholders})
+    """
+    return query, tuple(change_ids)
+
+
+class ChangeFeedPoller:
+    """
+    Sigue la tabla change_log por change_id creciente y reenvía a EventNotificationSystem
+    los cambios de otras instancias (con remote=True), de modo que las cachés, los
+    índices de búsqueda y las vistas se actualizan sin recargar tablas completas.
+
+    Un change_id se asigna al insertar pero la fila solo es visible al confirmar, así que
+    una transacción lenta puede aparecer después de otra con un ID mayor. Los IDs
+    saltados se vigilan durante gap_timeout segundos (los de transacciones deshechas no
+    llegan nunca y se olvidan al vencer). Al arrancar se empieza por el último change_id
+    y se vigilan como huecos los que falten en los start_window IDs anteriores, que
+    pueden ser de transacciones aún sin confirmar.
+    """
+
+    def __init__(self, db, interval: float = 1.0, batch_size: int = 500,
+                 gap_timeout: float = 10.0, max_gaps: int = 1000, start_window: int = 200):
+        """
+        Args:
+            db: DatabaseConnection
+            interval: Segundos entre sondeos (sin cambios pendientes)
+            batch_size: Cambios leídos como máximo por consulta
+            gap_timeout: Segundos que se espera a un change_id saltado
+            max_gaps: Huecos vigilados como máximo (los que no caben se cuentan en gaps_dropped)
+            start_window: IDs anteriores al punto de partida en los que se buscan huecos
+        """
+        self.db = db
+        self.interval = interval
+        self.batch_size = batch_size
+        self.gap_timeout = gap_timeout
+        self.max_gaps = max_gaps
+        self.start_window = max(0, int(start_window))
+        self.last_id: Optional[int] = None
+        self._gaps: Dict[int, float] = {}  # change_id -> instante en que se deja de esperar
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {'polls': 0, 'received': 0, 'delivered': 0, 'late': 0, 'gaps_expired': 0,
+                       'gaps_dropped': 0, 'errors': 0}
+        self._stats_lock = threading.Lock()
+
+    def start(self):
+        """Arranca el thread de sondeo (desde el último cambio existente)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ChangeFeedPoller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Detiene el thread de sondeo"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                more = self.poll_once()
+            except Error as e:
+                self._count('errors')
+                logger.warning(f"Error al leer el registro de cambios: {e}")
+                more = False
+            except Exception as e:
+                self._count('errors')
+                logger.error(f"Error al reenviar los cambios de otras instancias: {e}")
+                more = False
+            if not more:
+                self._stop.wait(self.interval)
+
+    def poll_once(self) -> bool:
+        """
+        Lee y reenvía los cambios nuevos y los huecos que hayan aparecido
+
+        Returns:
+            True si se llenó el lote (quedan cambios por leer)
+        """
+        conn = self.db.get_connection()
+        try:
+            cursor = conn.cursor(dictionary=True)
+            if self.last_id is None:
+                # Primera lectura: se empieza por el final, lo anterior ya lo cargaron las vistas
+                cursor.execute(SELECT_LAST_CHANGE_SQL)
+                last_id = cursor.fetchone()['last_id']
+                first_id = max(0, last_id - self.start_window)
+                cursor.execute(SELECT_RECENT_IDS_SQL, (first_id, last_id))
+                confirmed = {row['change_id'] for row in cursor.fetchall()}
+                cursor.close()
+                # Lo que falta por debajo del final puede ser de transacciones aún sin confirmar
+                now = time.monotonic()
+                self._add_gaps([change_id for change_id in range(first_id + 1, last_id)
+                                if change_id not in confirmed], now)
+                self.last_id = last_id
+                return False
+
+            cursor.execute(SELECT_CHANGES_SQL, (self.last_id, self.batch_size))
+            rows = cursor.fetchall()
+            late = []
+            if self._gaps:
+                cursor.execute(*gap_query(sorted(self._gaps)))
+                late = cursor.fetchall()
+            cursor.close()
+        finally:
+            conn.close()
+
+        self._count('polls')
+        now = time.monotonic()
+        for row in late:
+            self._gaps.pop(row['change_id'], None)
+            self._count('late')
+            self._deliver(row)
+        for row in rows:
+            self._track_gaps(row['change_id'], now)
+            self.last_id = row['change_id']
+            self._deliver(row)
+        self._expire_gaps(now)
+        return len(rows) >= self.batch_size
+
+    def _track_gaps(self, change_id: int, now: float):
+        """Anota como huecos los IDs saltados entre el último leído y change_id"""
+        if change_id > self.last_id + 1:
+            self._add_gaps(range(self.last_id + 1, change_id), now)
+
+    def _add_gaps(self, change_ids, now: float):
+        """Vigila los IDs indicados hasta gap_timeout; los que superan max_gaps se descartan"""
+        room = max(0, self.max_gaps - len(self._gaps))
+        deadline = now + self.gap_timeout
+        for change_id in change_ids[:room]:
+            self._gaps[change_id] = deadline
+        dropped = len(change_ids) - room
+        if dropped > 0:
+            self._count('gaps_dropped', dropped)
+            # Esos cambios, si se confirman, no se reenviarán: las vistas los verán al recargar
+            logger.warning(f"Demasiados huecos en el registro de cambios: {dropped} IDs sin vigilar "
+                           f"(máximo {self.max_gaps})")
+
+    def _expire_gaps(self, now: float):
+        expired = [change_id for change_id, deadline in self._gaps.items() if deadline <= now]
+        for change_id in expired:
+            del self._gaps[change_id]
+        if expired:
+            self._count('gaps_expired', len(expired))
+
+    def _deliver(self, row: Dict[str, Any]):
+        """Invalida las cachés afectadas y notifica el cambio de otra instancia"""
+        self._count('received')
+        if row['origin'] == INSTANCE_ID:
+            return
+        ids = {name: row[name] for name in ('event_id', 'participant_id', 'user_id') if row[name] is not None}
+        change_type = row['change_type']
+        # Antes de notificar: otros suscriptores pueden releer la entidad en cuanto les llegue
+        for prefix, (kind, id_arg) in _CACHE_BY_PREFIX.items():
+            if change_type.startswith(prefix):
+                get_entity_cache(kind).invalidate(ids.get(id_arg))
+        get_notification_system().notify(change_type, remote=True, **ids)
+        self._count('delivered')
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        """Sondeos, cambios recibidos y reenviados, llegadas tardías, huecos (vencidos y descartados) y errores"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats.update({
+            'last_id': self.last_id,
+            'pending_gaps': len(self._gaps),
+            'running': self._thread is not None and self._thread.is_alive()
+        })
+        return stats
+
+
+def purge_change_log(db, retention_hours: Optional[int] = None) -> int:
+    """
+    Elimina los cambios más antiguos que change_log_retention_hours
+
+    Returns:
+        Número de cambios eliminados
+    """
+    if retention_hours is None:
+        retention_hours = CONCURRENCY_CONFIG.get('change_log_retention_hours', 24)
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(PURGE_CHANGE_LOG_SQL, (int(retention_hours),))
+        purged = cursor.rowcount
+        conn.commit()
+        cursor.close()
+        return purged
+    finally:
+        conn.close()
+
+
+# Instancia global del lector de cambios
+_change_feed: Optional[ChangeFeedPoller] = None
+_change_feed_lock = threading.Lock()
+
+
+def get_change_feed(db) -> ChangeFeedPoller:
+    """Obtiene el lector de cambios global (sin arrancarlo)"""
+    global _change_feed
+    if _change_feed is None:
+        with _change_feed_lock:
+            if _change_feed is None:
+                _change_feed = ChangeFeedPoller(
+                    db,
+                    interval=CONCURRENCY_CONFIG.get('change_feed_poll_interval', 1.0),
+                    batch_size=CONCURRENCY_CONFIG.get('change_feed_batch_size', 500),
+                    gap_timeout=CONCURRENCY_CONFIG.get('change_feed_gap_timeout', 10.0),
+                    max_gaps=CONCURRENCY_CONFIG.get('change_feed_max_gaps', 1000),
+                    start_window=CONCURRENCY_CONFIG.get('change_feed_start_window', 200)
+                )
+    return _change_feed
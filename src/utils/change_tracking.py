@@ -0,0 +1,184 @@
+"""
+Consultas de cambios ("changed since") para refrescos incrementales
+Las altas y modificaciones se detectan con la columna updated_at de cada tabla y las
+bajas con las lápidas (tombstones) de la tabla deleted_entities, que los controladores
+escriben en la misma transacción que el DELETE.
+Purga de lápidas y cambios antiguos: python -m src.utils.change_tracking [--days N] [--hours N]
+"""
+
+import argparse
+import sys
+import os
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Agregar el directorio raíz al path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.config import CONCURRENCY_CONFIG
+
+# Tablas con seguimiento de cambios: columna del ID de cada una
+TRACKED_TABLES = {
+    'events': 'event_id',
+    'participants': 'participant_id'
+}
+
+INSERT_TOMBSTONE_SQL = "INSERT INTO deleted_entities (entity, entity_id) VALUES (%s, %s)"
+SELECT_TOMBSTONES_SQL = """
+    SELECT DISTINCT entity_id FROM deleted_entities
+    WHERE entity = %s AND deleted_at >= %s
+"""
+PURGE_TOMBSTONES_SQL = "DELETE FROM deleted_entities WHERE deleted_at < NOW() - INTERVAL %s DAY"
+
+
+class ChangeSet:
+    """
+    Resultado de get_changed_since
+
+    Atributos:
+        changed: Entidades creadas o modificadas desde la marca pedida (o todas si full)
+        deleted: IDs eliminados desde la marca pedida
+        watermark: Marca (hora del servidor) que se pasa en la siguiente llamada
+        full: True si changed es el listado completo y sustituye a lo que tenga el cliente
+            (primera llamada o marca más antigua que la retención de las lápidas)
+    """
+
+    def __init__(self, changed: List[Any], deleted: List[int], watermark: datetime, full: bool):
+        self.changed = changed
+        self.deleted = deleted
+        self.watermark = watermark
+        self.full = full
+
+    def __len__(self) -> int:
+        return len(self.changed) + len(self.deleted)
+
+    def __repr__(self) -> str:
+        kind = 'completo' if self.full else 'delta'
+        return f"ChangeSet({kind}: {len(self.changed)} cambios, {len(self.deleted)} bajas, hasta {self.watermark})"
+
+    def apply(self, entities: Dict[Any, Any], key: Callable[[Any], Any]) -> Tuple[List[Any], List[Any]]:
+        """
+        Aplica el cambio a un diccionario ID -> entidad del cliente
+
+        Returns:
+            (IDs añadidos o actualizados, IDs eliminados)
+        """
+        removed = []
+        if self.full:
+            fresh = {key(entity) for entity in self.changed}
+            removed = [entity_id for entity_id in entities if entity_id not in fresh]
+            entities.clear()
+        upserted = []
+        for entity in self.changed:
+            entity_id = key(entity)
+            entities[entity_id] = entity
+            upserted.append(entity_id)
+        for entity_id in self.deleted:
+            if entities.pop(entity_id, None) is not None:
+                removed.append(entity_id)
+        return upserted, removed
+
+
+def record_tombstone(cursor, table: str, entity_id: int):
+    """Registra la baja de una entidad (dentro de la transacción del DELETE)"""
+    cursor.execute(INSERT_TOMBSTONE_SQL, (table, entity_id))
+
+
+def changed_rows_query(table: str, since: datetime) -> Tuple[str, tuple]:
+    """Consulta de las filas modificadas desde since (usa el índice de updated_at)"""
+    if table not in TRACKED_TABLES:
+        raise ValueError(f"Tabla sin seguimiento de cambios: {table}")
+    query = f"""
+        SELECT * FROM {table}
+        WHERE updated_at >= %s
+        ORDER BY updated_at, {TRACKED_TABLES[table]}
+    """
+    return query, (since,)
+
+
+def changes_lower_bound(since: datetime) -> datetime:
+    """
+    Límite inferior de la consulta de cambios: updated_at tiene resolución de segundos y
+    una transacción puede confirmarse después de la marca con un updated_at anterior, así
+    que se vuelve a pedir un margen (las filas repetidas se aplican de nuevo sin efecto)
+    """
+    return since - timedelta(seconds=CONCURRENCY_CONFIG.get('changes_overlap_seconds', 2.0))
+
+
+def fetch_changes(cursor, table: str, since: Optional[datetime],
+                  select_all_sql: str) -> Tuple[List[dict], List[int], datetime, bool]:
+    """
+    Lee los cambios de una tabla con un cursor de diccionarios
+
+    Args:
+        cursor: Cursor con dictionary=True
+        table: Tabla con seguimiento de cambios
+        since: Marca de la llamada anterior (None = listado completo)
+        select_all_sql: Consulta del listado completo
+
+    Returns:
+        (filas, IDs eliminados, nueva marca, es listado completo)
+    """
+    # La marca se toma antes de leer: lo que cambie durante la lectura sale en la siguiente
+    cursor.execute("SELECT NOW() AS now")
+    watermark = cursor.fetchone()['now']
+    retention = timedelta(days=CONCURRENCY_CONFIG.get('tombstone_retention_days', 7))
+
+    if since is None or since < watermark - retention:
+        cursor.execute(select_all_sql)
+        return cursor.fetchall(), [], watermark, True
+
+    lower = changes_lower_bound(since)
+    cursor.execute(*changed_rows_query(table, lower))
+    rows = cursor.fetchall()
+    cursor.execute(SELECT_TOMBSTONES_SQL, (table, lower))
+    deleted = [row['entity_id'] for row in cursor.fetchall()]
+    return rows, deleted, watermark, False
+
+
+def purge_tombstones(db, retention_days: Optional[int] = None) -> int:
+    """
+    Elimina las lápidas más antiguas que la retención (tombstone_retention_days). Los
+    clientes con una marca anterior reciben el listado completo en su siguiente refresco.
+
+    Returns:
+        Número de lápidas eliminadas
+    """
+    if retention_days is None:
+        retention_days = CONCURRENCY_CONFIG.get('tombstone_retention_days', 7)
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(PURGE_TOMBSTONES_SQL, (int(retention_days),))
+        purged = cursor.rowcount
+        conn.commit()
+        cursor.close()
+        return purged
+    finally:
+        conn.close()
+
+
+def main(argv=None) -> int:
+    """Purga las lápidas y los cambios entre instancias más antiguos que su retención"""
+    parser = argparse.ArgumentParser(
+        description="Elimina las lápidas de bajas (deleted_entities) y los cambios (change_log) antiguos"
+    )
+    parser.add_argument("--days", type=int, default=None, help="Días que se conservan las lápidas (tombstone_retention_days)")
+    parser.add_argument("--hours", type=int, default=None, help="Horas que se conservan los cambios (change_log_retention_hours)")
+    args = parser.parse_args(argv)
+
+    from src.database.db_connection import DatabaseConnection
+    from src.utils.change_feed import purge_change_log
+    db = DatabaseConnection()
+    if not db.pool:
+        print("No hay conexión a la base de datos")
+        return 2
+
+    purged = purge_tombstones(db, args.days)
+    print(f"Eliminadas {purged} lápidas")
+    purged = purge_change_log(db, args.hours)
+    print(f"Eliminados {purged} cambios del registro")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,21 @@
 """
 Gestión avanzada de concurrencia para el Gestor de Eventos Locales
-Incluye: locks por recurso, reintentos, worker threads, y procesamiento en paralelo
+Incluye: locks por recurso, reintentos, circuit breaker, worker threads, y procesamiento en paralelo
 """
 
+import asyncio
+import heapq
+import itertools
+import random
+import sys
 import threading
 import queue
 import time
-from typing import Callable, Optional, Any, Dict, List
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import as_completed as futures_as_completed, wait as futures_wait
+from contextlib import contextmanager
+from typing import Callable, Optional, Any, Dict, Iterable, Iterator, List, Sequence
 from functools import wraps
 import logging
 
@@ -15,50 +24,146 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class ResourceLockManager:
+class LockBackend:
+    """
+    Interfaz de los backends de locks por recurso
+    
+    Implementaciones: ResourceLockManager (locks del propio proceso) y, en
+    src/utils/lock_backends.py, MySQLLockBackend (GET_LOCK, válido entre instancias)
+    y NullLockBackend (sin lock de aplicación)
+    """
+    
+    name = 'base'
+    
+    def acquire(self, resource_id: str, timeout: Optional[float] = None) -> bool:
+        """Adquiere el lock de un recurso; devuelve False si vence el timeout"""
+        raise NotImplementedError
+    
+    def release(self, resource_id: str):
+        """Libera el lock de un recurso"""
+        raise NotImplementedError
+    
+    @contextmanager
+    def locked(self, resource_id: str, timeout: Optional[float] = None):
+        """
+        Context manager para locks
+        
+        Raises:
+            TimeoutError: Si no se adquiere el lock en el tiempo indicado
+        """
+        if not self.acquire(resource_id, timeout):
+            raise TimeoutError(f"No se pudo adquirir el lock para el recurso {resource_id} en {timeout}s")
+        try:
+            yield self
+        finally:
+            self.release(resource_id)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Métricas del backend"""
+        return {'backend': self.name}
+
+
+class ResourceLockManager(LockBackend):
     """
     Gestor de locks por recurso para sincronización de acceso
     Permite bloquear recursos específicos (ej: eventos, participantes) de forma individual
+    Es el backend 'process': solo sincroniza threads de la misma instancia de la aplicación
+    
+    Usa una tabla fija de locks (striping): cada resource_id se asigna por hash a uno de
+    num_stripes RLocks, de modo que la memoria no crece con el número de recursos distintos.
+    Dos recursos que caen en la misma franja se serializan entre sí; con suficientes franjas
+    esta contención falsa es rara. No se deben mantener locks de varios recursos a la vez
+    (dos franjas adquiridas en orden distinto por dos threads podrían bloquearse mutuamente).
     """
     
-    def __init__(self):
-        self._locks: Dict[str, threading.RLock] = {}
-        self._global_lock = threading.RLock()
+    name = 'process'
+    
+    def __init__(self, num_stripes: int = 256):
+        """
+        Args:
+            num_stripes: Número de franjas (locks) de la tabla
+        """
+        self.num_stripes = max(1, int(num_stripes))
+        self._stripes: List[threading.RLock] = [threading.RLock() for _ in range(self.num_stripes)]
+        self._stats_lock = threading.Lock()
+        self._acquisitions = 0
+        self._contended = 0
+        self._timeouts = 0
+        self._wait_time = 0.0
+    
+    def _stripe_index(self, resource_id: str) -> int:
+        return hash(resource_id) % self.num_stripes
     
     def get_lock(self, resource_id: str) -> threading.RLock:
-        """Obtiene o crea un lock para un recurso específico"""
-        if resource_id not in self._locks:
-            with self._global_lock:
-                if resource_id not in self._locks:
-                    self._locks[resource_id] = threading.RLock()
-        return self._locks[resource_id]
+        """Obtiene el lock (franja) que protege un recurso específico"""
+        return self._stripes[self._stripe_index(resource_id)]
     
     def acquire(self, resource_id: str, timeout: Optional[float] = None) -> bool:
         """Adquiere el lock de un recurso con timeout opcional"""
         lock = self.get_lock(resource_id)
-        return lock.acquire(timeout=timeout)
+        
+        # Camino rápido sin espera; si falla, se cuenta como acquire con contención
+        if lock.acquire(blocking=False):
+            with self._stats_lock:
+                self._acquisitions += 1
+            return True
+        
+        start = time.perf_counter()
+        acquired = lock.acquire(timeout=-1 if timeout is None else timeout)
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self._contended += 1
+            self._wait_time += waited
+            if acquired:
+                self._acquisitions += 1
+            else:
+                self._timeouts += 1
+        return acquired
     
     def release(self, resource_id: str):
         """Libera el lock de un recurso"""
-        if resource_id in self._locks:
-            try:
-                self._locks[resource_id].release()
-            except RuntimeError:
-                # El lock no está adquirido, ignorar
-                pass
+        try:
+            self.get_lock(resource_id).release()
+        except RuntimeError:
+            # El lock no está adquirido por este thread, ignorar
+            pass
     
-    def __enter__(self, resource_id: str):
-        """Context manager para locks"""
-        self.acquire(resource_id)
-        return self
+    def stats(self) -> Dict[str, Any]:
+        """Estadísticas de memoria y contención"""
+        with self._stats_lock:
+            acquisitions = self._acquisitions
+            contended = self._contended
+            return {
+                'backend': self.name,
+                'stripes': self.num_stripes,
+                'memory_bytes': sys.getsizeof(self._stripes) + sum(sys.getsizeof(l) for l in self._stripes),
+                'acquisitions': acquisitions,
+                'contended': contended,
+                'contention_ratio': contended / (acquisitions + self._timeouts) if acquisitions + self._timeouts else 0.0,
+                'timeouts': self._timeouts,
+                'total_wait_seconds': self._wait_time
+            }
     
-    def __exit__(self, resource_id: str, exc_type, exc_val, exc_tb):
-        """Libera el lock al salir del contexto"""
-        self.release(resource_id)
+    def reset_stats(self):
+        """Pone a cero los contadores"""
+        with self._stats_lock:
+            self._acquisitions = 0
+            self._contended = 0
+            self._timeouts = 0
+            self._wait_time = 0.0
 
 
 # Instancia global del gestor de locks
-_resource_lock_manager = ResourceLockManager()
+_resource_lock_manager: Optional[ResourceLockManager] = None
+
+
+def get_lock_manager() -> ResourceLockManager:
+    """Obtiene la instancia global del gestor de locks"""
+    global _resource_lock_manager
+    if _resource_lock_manager is None:
+        from config.config import CONCURRENCY_CONFIG
+        _resource_lock_manager = ResourceLockManager(num_stripes=CONCURRENCY_CONFIG.get('lock_stripes', 256))
+    return _resource_lock_manager
 
 
 def with_resource_lock(resource_id_getter: Callable[[Any], str], timeout: float = 30.0):
@@ -74,80 +179,547 @@ def with_resource_lock(resource_id_getter: Callable[[Any], str], timeout: float
         def wrapper(*args, **kwargs):
             # Obtener el ID del recurso
             resource_id = resource_id_getter(*args, **kwargs)
-            lock = _resource_lock_manager.get_lock(resource_id)
             
             # Intentar adquirir el lock con timeout
-            acquired = lock.acquire(timeout=timeout)
-            if not acquired:
-                raise TimeoutError(f"No se pudo adquirir el lock para el recurso {resource_id} en {timeout}s")
-            
-            try:
+            with get_lock_manager().locked(resource_id, timeout):
                 return func(*args, **kwargs)
-            finally:
-                lock.release()
         
         return wrapper
     return decorator
 
 
+# Errores de MySQL transitorios: repetir la transacción completa puede funcionar
+TRANSIENT_MYSQL_ERRNOS = frozenset({
+    1205,  # ER_LOCK_WAIT_TIMEOUT
+    1213,  # ER_LOCK_DEADLOCK
+    2006,  # CR_SERVER_GONE_ERROR
+    2013,  # CR_SERVER_LOST
+    2055,  # CR_SERVER_LOST_EXTENDED
+})
+
+
+def mysql_errno(error: BaseException) -> Optional[int]:
+    """
+    Código de error de MySQL de una excepción: atributo errno en mysql-connector y
+    primer argumento en los drivers basados en PyMySQL (aiomysql)
+    """
+    errno = getattr(error, 'errno', None)
+    if errno is None and error.args and isinstance(error.args[0], int):
+        errno = error.args[0]
+    return errno
+
+
+class RetryPolicy:
+    """
+    Política de reintentos con clasificación de errores, jitter y plazo máximo
+    
+    - Solo se reintentan las excepciones de exceptions que el clasificador considera
+      transitorias; por defecto, errores de MySQL cuyo errno está en retryable_errnos
+      (deadlock, lock wait timeout, conexión perdida). El resto falla a la primera
+      (p. ej. violaciones de restricciones)
+    - Full jitter: cada espera es aleatoria entre 0 y min(max_delay, base_delay * 2^intento),
+      para que los threads que chocaron en el mismo evento no vuelvan a chocar a la vez
+    - deadline: tiempo total máximo (segundos) desde el primer intento; no se reintenta
+      si la espera lo superaría
+    - stats(): contadores de llamadas, reintentos (por errno), fallos inmediatos y agotados
+    """
+    
+    def __init__(self, name: str = "default", max_retries: int = 3, base_delay: float = 0.1,
+                 max_delay: float = 2.0, deadline: Optional[float] = None, exceptions: tuple = (Exception,),
+                 retryable_errnos: Optional[Iterable[int]] = None,
+                 classifier: Optional[Callable[[BaseException], bool]] = None):
+        """
+        Args:
+            name: Nombre de la política (aparece en los logs y en stats)
+            max_retries: Número máximo de reintentos
+            base_delay: Retraso base en segundos
+            max_delay: Retraso máximo en segundos
+            deadline: Tiempo total máximo de todos los intentos (None = sin límite)
+            exceptions: Tipos de excepción que se evalúan para reintentar
+            retryable_errnos: Códigos de error transitorios (por defecto TRANSIENT_MYSQL_ERRNOS)
+            classifier: Función excepción -> bool que sustituye a la clasificación por errno
+        """
+        self.name = name
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.exceptions = exceptions
+        self.retryable_errnos = frozenset(TRANSIENT_MYSQL_ERRNOS if retryable_errnos is None else retryable_errnos)
+        self.classifier = classifier
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            'calls': 0, 'retries': 0, 'recovered': 0, 'fail_fast': 0, 'exhausted': 0, 'deadline_exceeded': 0
+        }
+        self._retries_by_errno: Dict[Any, int] = {}
+    
+    def is_retryable(self, error: BaseException) -> bool:
+        """Indica si un error es transitorio"""
+        if not isinstance(error, self.exceptions):
+            return False
+        if self.classifier is not None:
+            return self.classifier(error)
+        return mysql_errno(error) in self.retryable_errnos
+    
+    def backoff(self, attempt: int) -> float:
+        """Espera antes del reintento attempt (0 = primero), con full jitter"""
+        return self._random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+    
+    def call(self, func: Callable, *args, **kwargs):
+        """Ejecuta func aplicando la política; relanza el último error si no se recupera"""
+        self._count('calls')
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                result = func(*args, **kwargs)
+                if attempt:
+                    self._count('recovered')
+                return result
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started, func)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+    
+    async def call_async(self, func: Callable, *args, **kwargs):
+        """Como call, pero func es una corrutina y las esperas no bloquean el event loop"""
+        self._count('calls')
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                result = await func(*args, **kwargs)
+                if attempt:
+                    self._count('recovered')
+                return result
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started, func)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+    
+    def _next_delay(self, error: Exception, attempt: int, started: float, func: Callable) -> Optional[float]:
+        """Espera antes de reintentar tras el fallo del intento attempt, o None si no se reintenta"""
+        name = getattr(func, '__name__', repr(func))
+        if not self.is_retryable(error):
+            if isinstance(error, self.exceptions):
+                self._count('fail_fast')
+            return None
+        if attempt >= self.max_retries:
+            self._count('exhausted')
+            logger.error(f"Todos los reintentos fallaron para {name} ({self.name})")
+            return None
+        delay = self.backoff(attempt)
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            self._count('deadline_exceeded')
+            logger.error(f"Plazo de {self.deadline}s agotado para {name} ({self.name})")
+            return None
+        
+        errno = mysql_errno(error)
+        with self._lock:
+            self._counters['retries'] += 1
+            self._retries_by_errno[errno] = self._retries_by_errno.get(errno, 0) + 1
+        logger.warning(f"Intento {attempt + 1}/{self.max_retries + 1} falló para {name}: {error}. "
+                       f"Reintentando en {delay:.3f}s...")
+        return delay
+    
+    def _count(self, key: str):
+        with self._lock:
+            self._counters[key] += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de la política"""
+        with self._lock:
+            return dict(self._counters, name=self.name, retries_by_errno=dict(self._retries_by_errno))
+    
+    def reset_stats(self):
+        """Pone a cero los contadores"""
+        with self._lock:
+            for key in self._counters:
+                self._counters[key] = 0
+            self._retries_by_errno.clear()
+
+
+# Políticas de reintento con nombre (una por área, para separar sus contadores)
+_retry_policies: Dict[str, RetryPolicy] = {}
+_retry_policies_lock = threading.Lock()
+
+
+def get_retry_policy(name: str = "default", exceptions: Optional[tuple] = None) -> RetryPolicy:
+    """
+    Obtiene la política de reintentos con ese nombre, creada con CONCURRENCY_CONFIG
+    y que reintenta solo errores transitorios de MySQL
+    
+    Args:
+        name: Nombre de la política
+        exceptions: Excepciones del driver que se evalúan (por defecto mysql.connector.Error);
+            solo se usa al crear la política
+    """
+    with _retry_policies_lock:
+        policy = _retry_policies.get(name)
+        if policy is None:
+            from mysql.connector import Error
+            from config.config import CONCURRENCY_CONFIG
+            policy = RetryPolicy(
+                name=name,
+                max_retries=CONCURRENCY_CONFIG.get('max_retries', 3),
+                base_delay=CONCURRENCY_CONFIG.get('retry_base_delay', 0.1),
+                max_delay=CONCURRENCY_CONFIG.get('retry_max_delay', 2.0),
+                deadline=CONCURRENCY_CONFIG.get('retry_deadline'),
+                exceptions=exceptions or (Error,),
+                retryable_errnos=CONCURRENCY_CONFIG.get('retry_errnos')
+            )
+            _retry_policies[name] = policy
+        return policy
+
+
+def get_retry_stats() -> List[Dict[str, Any]]:
+    """Contadores de todas las políticas de reintento creadas"""
+    with _retry_policies_lock:
+        policies = list(_retry_policies.values())
+    return [policy.stats() for policy in policies]
+
+
 def retry_with_backoff(max_retries: int = 3, base_delay: float = 0.1, max_delay: float = 2.0, 
-                      exceptions: tuple = (Exception,)):
+                      exceptions: tuple = (Exception,), policy: Optional[RetryPolicy] = None):
     """
-    Decorador para reintentar operaciones con backoff exponencial
+    Decorador para reintentar operaciones con backoff exponencial (con jitter)
     
     Args:
         max_retries: Número máximo de reintentos
         base_delay: Retraso inicial en segundos
         max_delay: Retraso máximo en segundos
         exceptions: Tupla de excepciones que deben activar el reintento
+        policy: RetryPolicy a aplicar; si se indica, sustituye a los demás argumentos
+            (sin ella se reintenta cualquier excepción de exceptions)
+    
+    Si la función decorada es una corrutina, las esperas usan asyncio.sleep.
     """
+    if policy is None:
+        policy = RetryPolicy(
+            max_retries=max_retries,
+            base_delay=base_delay,
+            max_delay=max_delay,
+            exceptions=exceptions,
+            classifier=lambda error: True
+        )
+    
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            delay = base_delay
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(f"Intento {attempt + 1}/{max_retries + 1} falló para {func.__name__}: {e}. Reintentando en {delay}s...")
-                        time.sleep(delay)
-                        delay = min(delay * 2, max_delay)  # Backoff exponencial
-                    else:
-                        logger.error(f"Todos los reintentos fallaron para {func.__name__}")
-                        raise
-            
-            if last_exception:
-                raise last_exception
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await policy.call_async(func, *args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return policy.call(func, *args, **kwargs)
         
+        wrapper.retry_policy = policy
         return wrapper
     return decorator
 
 
+class CircuitBreaker:
+    """
+    Circuit breaker para un recurso externo (p. ej. el servidor MySQL)
+
+    - 'closed': las llamadas pasan; failure_threshold fallos consecutivos lo abren
+    - 'open': allow() rechaza al instante durante cooldown segundos, en lugar de que
+      cada llamada espere el timeout de conexión
+    - 'half_open': pasado el cooldown se admite una única llamada de prueba a la vez;
+      success_threshold pruebas correctas lo cierran y un fallo lo vuelve a abrir
+
+    El llamante protege la operación con allow() y comunica el resultado con
+    record_success()/record_failure(). Los listeners reciben (anterior, nuevo) en el
+    thread que provoca el cambio.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str = "default", failure_threshold: int = 5, cooldown: float = 10.0,
+                 success_threshold: int = 1):
+        """
+        Args:
+            name: Nombre del circuito (aparece en los logs y en stats)
+            failure_threshold: Fallos consecutivos que abren el circuito
+            cooldown: Segundos que el circuito permanece abierto antes de admitir pruebas
+            success_threshold: Pruebas correctas necesarias para volver a cerrarlo
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.success_threshold = max(1, success_threshold)
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._listeners: List[Callable[[str, str], None]] = []
+        self._counters: Dict[str, int] = {'rejected': 0, 'opened': 0, 'probes': 0}
+
+    @property
+    def state(self) -> str:
+        """Estado actual ('open' pasa a 'half_open' al terminar el cooldown)"""
+        with self._lock:
+            changed = self._check_cooldown()
+            state = self._state
+        self._notify(changed)
+        return state
+
+    def retry_after(self) -> float:
+        """Segundos que faltan para admitir una prueba (0 si ya se admiten llamadas)"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Indica si la llamada puede hacerse; en 'half_open' solo la admite si no hay
+        otra prueba en curso (y entonces esa llamada es la prueba)
+        """
+        with self._lock:
+            changed = self._check_cooldown()
+            if self._state == self.CLOSED:
+                allowed = True
+            elif self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                self._counters['probes'] += 1
+                allowed = True
+            else:
+                self._counters['rejected'] += 1
+                allowed = False
+        self._notify(changed)
+        return allowed
+
+    def record_success(self):
+        """Comunica que la llamada admitida terminó bien"""
+        changed = None
+        with self._lock:
+            self._failures = 0
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                self._successes += 1
+                if self._successes >= self.success_threshold:
+                    changed = self._transition(self.CLOSED)
+        self._notify(changed)
+
+    def record_failure(self):
+        """Comunica que la llamada admitida falló por indisponibilidad del recurso"""
+        changed = None
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                changed = self._transition(self.OPEN)
+            elif self._state == self.CLOSED:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    changed = self._transition(self.OPEN)
+        self._notify(changed)
+
+    def release_probe(self):
+        """Libera la prueba admitida sin contar resultado (la llamada falló por otro motivo)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def reset(self):
+        """Cierra el circuito y pone a cero los fallos"""
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            changed = self._transition(self.CLOSED)
+        self._notify(changed)
+
+    def add_listener(self, callback: Callable[[str, str], None]):
+        """Registra un callback(anterior, nuevo) para los cambios de estado"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, str], None]):
+        """Elimina un callback de cambios de estado"""
+        with self._lock:
+            try:
+                self._listeners.remove(callback)
+            except ValueError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado, fallos consecutivos y contadores de rechazos, aperturas y pruebas"""
+        retry_after = self.retry_after()
+        with self._lock:
+            return dict(
+                self._counters,
+                name=self.name,
+                state=self._state,
+                consecutive_failures=self._failures,
+                retry_after=retry_after
+            )
+
+    def _check_cooldown(self) -> Optional[tuple]:
+        # Llamar con _lock adquirido
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            return self._transition(self.HALF_OPEN)
+        return None
+
+    def _transition(self, state: str) -> Optional[tuple]:
+        # Llamar con _lock adquirido; devuelve (anterior, nuevo) para _notify
+        previous = self._state
+        if previous == state:
+            return None
+        self._state = state
+        self._successes = 0
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            self._counters['opened'] += 1
+            logger.warning(f"Circuito {self.name} abierto: se rechazan las llamadas durante {self.cooldown}s")
+        elif state == self.CLOSED:
+            self._failures = 0
+            logger.info(f"Circuito {self.name} cerrado")
+        return previous, state
+
+    def _notify(self, changed: Optional[tuple]):
+        if changed is None:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(*changed)
+            except Exception as e:
+                logger.error(f"Error al notificar el cambio del circuito {self.name}: {e}")
+
+
+class TaskHandle(Future):
+    """
+    Resultado pendiente de una tarea enviada a ParallelSubscriptionProcessor
+    
+    Es un concurrent.futures.Future (result, exception, done, cancel, add_done_callback)
+    que además identifica la tarea: task_id es un número único y key el valor que indicó
+    quien la envió (p. ej. el participant_id de una inscripción)
+    """
+    
+    _ids = itertools.count(1)
+    
+    def __init__(self, key: Any = None):
+        super().__init__()
+        self.task_id = next(self._ids)
+        self.key = key
+    
+    def __repr__(self) -> str:
+        return f"<TaskHandle {self.task_id} key={self.key!r} {self._state.lower()}>"
+
+
+def as_completed(handles: Iterable[TaskHandle], timeout: Optional[float] = None) -> Iterator[TaskHandle]:
+    """
+    Itera sobre los handles a medida que terminan
+    
+    Raises:
+        TimeoutError: Si vence el timeout antes de que terminen todos
+    """
+    return futures_as_completed(handles, timeout=timeout)
+
+
+def gather(handles: Sequence[TaskHandle], timeout: Optional[float] = None,
+           return_exceptions: bool = False) -> List[Any]:
+    """
+    Espera a que terminen todos los handles y devuelve sus resultados en el mismo orden
+    
+    Args:
+        handles: Handles devueltos por submit/submit_batch
+        timeout: Tiempo máximo de espera para el conjunto (None = infinito)
+        return_exceptions: Devolver las excepciones (incluido TimeoutError para las tareas
+            sin terminar y CancelledError para las canceladas) en lugar de lanzarlas
+    
+    Raises:
+        TimeoutError: Si vence el timeout y return_exceptions es False
+    """
+    futures_wait(handles, timeout=timeout)
+    results = []
+    for handle in handles:
+        if not handle.done():
+            error = TimeoutError(f"La tarea {handle.task_id} no terminó en {timeout}s")
+            if not return_exceptions:
+                raise error
+            results.append(error)
+        elif handle.cancelled():
+            if not return_exceptions:
+                raise CancelledError(f"La tarea {handle.task_id} fue cancelada")
+            results.append(CancelledError(f"La tarea {handle.task_id} fue cancelada"))
+        elif handle.exception() is not None:
+            if not return_exceptions:
+                raise handle.exception()
+            results.append(handle.exception())
+        else:
+            results.append(handle.result())
+    return results
+
+
 class ParallelSubscriptionProcessor:
     """
     Procesador de suscripciones en paralelo usando worker threads
     Permite procesar múltiples inscripciones simultáneamente de forma segura
+    
+    Cada tarea enviada devuelve un TaskHandle con su resultado, de modo que varios
+    llamadores pueden compartir el procesador sin mezclar resultados.
+    
+    Con max_workers mayor que num_workers el número de workers es adaptativo:
+    - Se añade un worker cuando hay más tareas en cola que workers libres, siempre que
+      la latencia media de las tareas no se haya disparado (latency_factor veces la
+      mejor observada, señal de que la base de datos está saturada) y capacity_probe
+      indique más de reserve_capacity conexiones libres (las que se dejan a la interfaz)
+    - Un worker sin tareas durante idle_timeout segundos termina (sin bajar de num_workers)
     """
     
-    def __init__(self, num_workers: int = 5, max_queue_size: int = 100):
+    def __init__(self, num_workers: int = 5, max_queue_size: int = 100, name: str = "SubscriptionWorker",
+                 max_workers: Optional[int] = None, capacity_probe: Optional[Callable[[], Optional[int]]] = None,
+                 reserve_capacity: int = 2, idle_timeout: float = 5.0, latency_factor: float = 2.0):
         """
         Inicializa el procesador de suscripciones
         
         Args:
-            num_workers: Número de threads worker para procesar suscripciones
-            max_queue_size: Tamaño máximo de la cola de tareas
+            num_workers: Número de threads worker (mínimo si el tamaño es adaptativo)
+            max_queue_size: Tamaño máximo de la cola de tareas (0 = sin límite)
+            name: Prefijo del nombre de los worker threads
+            max_workers: Máximo de workers (por defecto num_workers: tamaño fijo)
+            capacity_probe: Función que devuelve las conexiones libres del pool (None = sin dato)
+            reserve_capacity: Conexiones libres que no se deben ocupar al crecer
+            idle_timeout: Segundos sin tareas tras los que sobra un worker
+            latency_factor: Crecimiento de la latencia media que detiene el escalado
         """
         self.num_workers = num_workers
+        self.min_workers = num_workers
+        self.max_workers = max(num_workers, max_workers or num_workers)
+        self.capacity_probe = capacity_probe
+        self.reserve_capacity = reserve_capacity
+        self.idle_timeout = idle_timeout
+        self.latency_factor = latency_factor
+        self.name = name
         self.task_queue = queue.Queue(maxsize=max_queue_size)
-        self.result_queue = queue.Queue()
         self.workers: List[threading.Thread] = []
         self.stop_event = threading.Event()
         self._started = False
         self._lock = threading.Lock()
+        self._workers_lock = threading.Lock()
+        self._worker_seq = itertools.count()
+        # Métricas de escalado
+        self._busy = 0
+        self._latency_ewma: Optional[float] = None
+        self._best_latency: Optional[float] = None
+        self._tasks_done = 0
+        self._scale_ups = 0
+        self._scale_downs = 0
+        self._peak_workers = 0
+    
+    @property
+    def adaptive(self) -> bool:
+        return self.max_workers > self.min_workers
     
     def start(self):
         """Inicia los worker threads"""
@@ -159,20 +731,27 @@ class ParallelSubscriptionProcessor:
                 return
             
             self.stop_event.clear()
-            for i in range(self.num_workers):
-                worker = threading.Thread(
-                    target=self._worker_loop,
-                    name=f"SubscriptionWorker-{i}",
-                    daemon=True
-                )
-                worker.start()
-                self.workers.append(worker)
+            with self._workers_lock:
+                for _ in range(self.min_workers):
+                    self._spawn_worker()
             
             self._started = True
-            logger.info(f"Iniciados {self.num_workers} worker threads para procesamiento paralelo")
+            logger.info(f"Iniciados {self.min_workers} worker threads para procesamiento paralelo"
+                        + (f" (máximo {self.max_workers})" if self.adaptive else ""))
+    
+    def _spawn_worker(self):
+        """Crea un worker (con self._workers_lock tomado)"""
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"{self.name}-{next(self._worker_seq)}",
+            daemon=True
+        )
+        self.workers.append(worker)
+        self._peak_workers = max(self._peak_workers, len(self.workers))
+        worker.start()
     
     def stop(self, timeout: float = 5.0):
-        """Detiene los worker threads"""
+        """Detiene los worker threads y cancela las tareas que seguían en cola"""
         if not self._started:
             return
         
@@ -183,131 +762,201 @@ class ParallelSubscriptionProcessor:
             self.stop_event.set()
             
             # Esperar a que los workers terminen
-            for worker in self.workers:
+            with self._workers_lock:
+                workers = list(self.workers)
+            for worker in workers:
                 worker.join(timeout=timeout)
             
-            self.workers.clear()
+            with self._workers_lock:
+                self.workers.clear()
             self._started = False
+            
+            while True:
+                try:
+                    handle = self.task_queue.get_nowait()[0]
+                except queue.Empty:
+                    break
+                handle.cancel()
+                self.task_queue.task_done()
             logger.info("Worker threads detenidos")
     
     def _worker_loop(self):
         """Loop principal de cada worker thread"""
+        idle_since = time.monotonic()
         while not self.stop_event.is_set():
             try:
                 # Obtener tarea de la cola con timeout para poder verificar stop_event
                 try:
                     task = self.task_queue.get(timeout=0.5)
                 except queue.Empty:
+                    if self._retire_if_idle(idle_since):
+                        return
                     continue
                 
                 try:
-                    # Ejecutar la tarea
-                    func, args, kwargs, callback = task
-                    result = func(*args, **kwargs)
-                    
-                    # Si hay callback, ejecutarlo
-                    if callback:
-                        callback(result)
-                    
-                    # Enviar resultado a la cola de resultados
-                    self.result_queue.put((True, result, None))
-                except Exception as e:
-                    logger.error(f"Error en worker thread al procesar tarea: {e}")
-                    self.result_queue.put((False, None, e))
+                    self._run_task(*task)
                 finally:
                     self.task_queue.task_done()
+                    idle_since = time.monotonic()
             
             except Exception as e:
                 logger.error(f"Error en worker loop: {e}")
     
-    def submit(self, func: Callable, *args, callback: Optional[Callable] = None, **kwargs) -> bool:
+    def _run_task(self, handle: TaskHandle, func: Callable, args: tuple, kwargs: dict,
+                  callback: Optional[Callable]):
+        # Tarea cancelada antes de empezar
+        if not handle.set_running_or_notify_cancel():
+            return
+        
+        with self._workers_lock:
+            self._busy += 1
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error en worker thread al procesar tarea {handle.task_id}: {e}")
+            handle.set_exception(e)
+            return
+        finally:
+            self._record_latency(time.perf_counter() - start)
+        
+        # Si hay callback, ejecutarlo
+        if callback:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"Error en el callback de la tarea {handle.task_id}: {e}")
+        handle.set_result(result)
+    
+    def _record_latency(self, elapsed: float):
+        with self._workers_lock:
+            self._busy -= 1
+            self._tasks_done += 1
+            # Media móvil exponencial; la mejor se toma cuando ya hay suficientes muestras
+            ewma = elapsed if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * elapsed
+            self._latency_ewma = ewma
+            if self._tasks_done >= 10 and (self._best_latency is None or ewma < self._best_latency):
+                self._best_latency = ewma
+    
+    def _retire_if_idle(self, idle_since: float) -> bool:
+        """Termina el worker actual si lleva idle_timeout sin tareas y sobran workers"""
+        if not self.adaptive or time.monotonic() - idle_since < self.idle_timeout:
+            return False
+        with self._workers_lock:
+            if len(self.workers) <= self.min_workers:
+                return False
+            self.workers.remove(threading.current_thread())
+            self._scale_downs += 1
+        return True
+    
+    def _maybe_scale_up(self):
+        """Añade un worker si hay cola, la latencia es estable y quedan conexiones libres"""
+        if not self.adaptive or self.stop_event.is_set():
+            return
+        depth = self.task_queue.qsize()
+        with self._workers_lock:
+            current = len(self.workers)
+            if current >= self.max_workers or depth <= current - self._busy:
+                return
+            if (self._best_latency is not None and self._latency_ewma is not None
+                    and self._latency_ewma > self._best_latency * self.latency_factor):
+                return
+        
+        if self.capacity_probe:
+            try:
+                free = self.capacity_probe()
+            except Exception as e:
+                logger.warning(f"No se pudo consultar la capacidad libre: {e}")
+                return
+            if free is not None and free <= self.reserve_capacity:
+                return
+        
+        with self._workers_lock:
+            if len(self.workers) < self.max_workers:
+                self._spawn_worker()
+                self._scale_ups += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Tamaño actual y métricas de escalado del procesador"""
+        with self._workers_lock:
+            return {
+                'workers': len(self.workers),
+                'min_workers': self.min_workers,
+                'max_workers': self.max_workers,
+                'peak_workers': self._peak_workers,
+                'busy': self._busy,
+                'queued': self.task_queue.qsize(),
+                'tasks_done': self._tasks_done,
+                'avg_latency_ms': (self._latency_ewma or 0.0) * 1000,
+                'best_latency_ms': (self._best_latency or 0.0) * 1000,
+                'scale_ups': self._scale_ups,
+                'scale_downs': self._scale_downs
+            }
+    
+    def submit(self, func: Callable, *args, callback: Optional[Callable] = None, task_key: Any = None,
+               **kwargs) -> Optional[TaskHandle]:
         """
-        Envía una tarea a la cola de procesamiento
+        Envía una tarea a la cola de procesamiento (sin esperar si está llena)
         
         Args:
             func: Función a ejecutar
             *args: Argumentos posicionales
             callback: Función opcional a ejecutar con el resultado
+            task_key: Identificador de la tarea para quien la envía (queda en handle.key)
             **kwargs: Argumentos con nombre
         
         Returns:
-            True si la tarea fue encolada, False si la cola está llena
+            TaskHandle de la tarea, o None si la cola está llena
         """
-        if not self._started:
-            self.start()
-        
-        try:
-            self.task_queue.put((func, args, kwargs, callback), block=False)
-            return True
-        except queue.Full:
-            logger.warning("Cola de tareas llena, no se pudo encolar la tarea")
-            return False
+        handle = TaskHandle(task_key)
+        if self._put(handle, func, args, kwargs, callback, block=False):
+            return handle
+        logger.warning("Cola de tareas llena, no se pudo encolar la tarea")
+        return None
     
-    def submit_batch(self, tasks: List[tuple]) -> int:
+    def submit_batch(self, tasks: List[tuple], timeout: Optional[float] = None) -> List[TaskHandle]:
         """
-        Envía múltiples tareas a la cola
+        Envía múltiples tareas a la cola, esperando a que haya sitio cuando está llena
+        
+        No debe llamarse desde una tarea de este mismo procesador: con la cola llena
+        esperaría a unos workers que están ocupados esperando.
         
         Args:
-            tasks: Lista de tuplas (func, args, kwargs, callback)
+            tasks: Lista de tuplas (func, args, kwargs, callback) o (func, args, kwargs, callback, task_key)
+            timeout: Tiempo máximo total de espera por sitio en la cola (None = infinito)
         
         Returns:
-            Número de tareas encoladas exitosamente
+            Un TaskHandle por tarea, en el mismo orden; las que no se pudieron encolar
+            antes del timeout terminan con TimeoutError
         """
-        if not self._started:
-            self.start()
-        
-        count = 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        handles = []
         for task in tasks:
-            func, args, kwargs, callback = task
-            if self.submit(func, *args, callback=callback, **kwargs):
-                count += 1
-            else:
-                break
+            func, args, kwargs, callback = task[:4]
+            handle = TaskHandle(task[4] if len(task) > 4 else None)
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._put(handle, func, args, kwargs, callback, block=True, timeout=remaining):
+                handle.set_running_or_notify_cancel()
+                handle.set_exception(TimeoutError(f"No se pudo encolar la tarea {handle.task_id} en {timeout}s"))
+            handles.append(handle)
         
-        return count
+        return handles
     
-    def wait_for_results(self, num_tasks: int, timeout: Optional[float] = None) -> List[Any]:
-        """
-        Espera a que se completen un número de tareas
-        
-        Args:
-            num_tasks: Número de tareas a esperar
-            timeout: Tiempo máximo de espera (None = infinito)
-        
-        Returns:
-            Lista de resultados (éxito, resultado, error)
-        """
-        results = []
-        start_time = time.time()
-        
-        for i in range(num_tasks):
-            if timeout:
-                remaining = timeout - (time.time() - start_time)
-                if remaining <= 0:
-                    break
-                try:
-                    result = self.result_queue.get(timeout=remaining)
-                except queue.Empty:
-                    break
-            else:
-                result = self.result_queue.get()
-            
-            results.append(result)
-        
-        return results
+    def _put(self, handle: TaskHandle, func: Callable, args: tuple, kwargs: dict,
+             callback: Optional[Callable], block: bool, timeout: Optional[float] = None) -> bool:
+        if not self._started:
+            self.start()
+        try:
+            self.task_queue.put((handle, func, args, kwargs, callback), block=block, timeout=timeout)
+        except queue.Full:
+            self._maybe_scale_up()
+            return False
+        self._maybe_scale_up()
+        return True
     
-    def wait_all(self, timeout: Optional[float] = None):
+    def wait_all(self):
         """Espera a que se completen todas las tareas en la cola"""
         self.task_queue.join()
-        # Recoger todos los resultados pendientes
-        results = []
-        while True:
-            try:
-                result = self.result_queue.get_nowait()
-                results.append(result)
-            except queue.Empty:
-                break
-        return results
 
 
 # Instancia global del procesador de suscripciones
@@ -315,65 +964,501 @@ _subscription_processor: Optional[ParallelSubscriptionProcessor] = None
 
 
 def get_subscription_processor() -> ParallelSubscriptionProcessor:
-    """Obtiene la instancia global del procesador de suscripciones"""
+    """
+    Obtiene la instancia global del procesador de suscripciones
+    Su tamaño se adapta a la cola y a las conexiones libres del pool de la base de datos
+    """
     global _subscription_processor
     if _subscription_processor is None:
         from config.config import CONCURRENCY_CONFIG
-        num_workers = CONCURRENCY_CONFIG.get('subscription_workers', 5)
-        max_queue = CONCURRENCY_CONFIG.get('max_queue_size', 100)
+        from src.database.db_connection import DatabaseConnection
+        db = DatabaseConnection()
         _subscription_processor = ParallelSubscriptionProcessor(
-            num_workers=num_workers,
-            max_queue_size=max_queue
+            num_workers=CONCURRENCY_CONFIG.get('subscription_workers', 5),
+            max_queue_size=CONCURRENCY_CONFIG.get('max_queue_size', 100),
+            max_workers=CONCURRENCY_CONFIG.get('subscription_max_workers'),
+            capacity_probe=lambda: db.pool_stats().get('available'),
+            reserve_capacity=CONCURRENCY_CONFIG.get('subscription_reserved_connections', 4),
+            idle_timeout=CONCURRENCY_CONFIG.get('subscription_idle_timeout', 5.0),
+            latency_factor=CONCURRENCY_CONFIG.get('subscription_latency_factor', 2.0)
         )
         _subscription_processor.start()
     return _subscription_processor
 
 
+class _SubscriberQueue:
+    """
+    Cola ordenada de notificaciones pendientes de un suscriptor
+    
+    Solo un worker la procesa a la vez (flag scheduled), así que el suscriptor recibe
+    sus notificaciones en el orden en que se emitieron y nunca en paralelo consigo mismo
+    """
+    
+    def __init__(self, name: str, max_pending: int, overflow: str, block_timeout: float):
+        self.name = name
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.pending: deque = deque()  # (instante de encolado, callback, args, kwargs, tipo de evento)
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.scheduled = False
+        self.subscriptions = 0
+        # Métricas
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'subscriber': self.name,
+                'depth': len(self.pending),
+                'max_depth': self.max_depth,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'avg_latency_ms': self.total_latency / self.delivered * 1000 if self.delivered else 0.0,
+                'max_latency_ms': self.max_latency * 1000
+            }
+
+
+class NotificationBatch:
+    """
+    Notificaciones agrupadas de una ventana de tiempo (suscripciones con coalescing)
+    
+    Atributos:
+        counts: Número de notificaciones recibidas por tipo de evento
+        ids: Valores de los argumentos que son IDs (nombre terminado en '_id'), p. ej.
+            {'event_id': {3, 7}, 'participant_id': {12, 15, 40}}
+        first_at, last_at: Instantes (time.time) de la primera y la última notificación
+    """
+    
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.ids: Dict[str, set] = {}
+        self.first_at = time.time()
+        self.last_at = self.first_at
+    
+    def add(self, event_type: str, kwargs: Dict[str, Any]):
+        self.counts[event_type] = self.counts.get(event_type, 0) + 1
+        for name, value in kwargs.items():
+            if name.endswith('_id') and value is not None:
+                self.ids.setdefault(name, set()).add(value)
+        self.last_at = time.time()
+    
+    @property
+    def event_ids(self) -> set:
+        return self.ids.get('event_id', set())
+    
+    @property
+    def participant_ids(self) -> set:
+        return self.ids.get('participant_id', set())
+    
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+    
+    def __repr__(self) -> str:
+        return f"NotificationBatch({self.counts}, ids={ {k: len(v) for k, v in self.ids.items()} })"
+
+
+class _Coalescer:
+    """Acumula las notificaciones de una suscripción con coalescing hasta que vence su ventana"""
+    
+    def __init__(self, callback: Callable, subscriber_queue: _SubscriberQueue, window: float):
+        self.callback = callback
+        self.queue = subscriber_queue
+        self.window = window
+        self.lock = threading.Lock()
+        self.batch: Optional[NotificationBatch] = None
+        self.active = True
+        self.received = 0
+        self.batches = 0
+    
+    def collect(self, event_type: str, kwargs: Dict[str, Any]) -> bool:
+        """Añade una notificación al lote; devuelve True si abre una ventana nueva"""
+        with self.lock:
+            self.received += 1
+            opened = self.batch is None
+            if opened:
+                self.batch = NotificationBatch()
+            self.batch.add(event_type, kwargs)
+            return opened
+    
+    def flush(self):
+        """Entrega el lote acumulado (se ejecuta en un worker, en la cola del suscriptor)"""
+        with self.lock:
+            batch, self.batch = self.batch, None
+            if not self.active:
+                return
+            if batch:
+                self.batches += 1
+        if batch:
+            self.callback(batch)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'received': self.received,
+                'batches': self.batches,
+                'avg_batch_size': self.received / self.batches if self.batches else 0.0
+            }
+
+
 class EventNotificationSystem:
     """
-    Sistema de notificaciones de eventos usando threading.Event
+    Sistema de notificaciones de eventos
     Permite notificar a múltiples listeners cuando ocurren cambios
+    
+    Los callbacks se ejecutan en un conjunto fijo de worker threads. Cada suscriptor tiene
+    su propia cola ordenada y acotada; cuando se llena se aplica la política de desbordamiento:
+        'drop_oldest': descarta la notificación pendiente más antigua (por defecto)
+        'drop_newest': descarta la notificación nueva
+        'block': notify espera hasta block_timeout a que haya sitio (después descarta la nueva);
+            solo para productores en segundo plano: si notify se llama desde el hilo de Tk,
+            la interfaz se congela mientras espera
+    notify no toma el lock del sistema: lee una instantánea inmutable de los suscriptores,
+    que subscribe/unsubscribe sustituyen (copy-on-write).
+    
+    Con subscribe_coalesced el suscriptor recibe, en lugar de cada notificación, un
+    NotificationBatch por ventana de tiempo con los IDs afectados.
     """
     
-    def __init__(self):
+    OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_newest')
+    
+    def __init__(self, num_workers: int = 4, max_pending: int = 1000, overflow: str = 'drop_oldest',
+                 block_timeout: float = 1.0, batch_size: int = 32):
+        """
+        Args:
+            num_workers: Número de worker threads que ejecutan los callbacks
+            max_pending: Notificaciones pendientes máximas por suscriptor (0 = sin límite)
+            overflow: Política por defecto cuando la cola de un suscriptor está llena
+            block_timeout: Espera máxima de notify con la política 'block' (segundos)
+            batch_size: Notificaciones que procesa un worker de un suscriptor antes de pasar a otro
+        """
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Política de desbordamiento desconocida: {overflow}")
+        self.num_workers = max(1, int(num_workers))
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.batch_size = max(1, int(batch_size))
         self._events: Dict[str, threading.Event] = {}
         self._lock = threading.Lock()
-        self._callbacks: Dict[str, List[Callable]] = {}
+        # Instantánea inmutable: tipo de evento -> ((callback, cola), ...)
+        self._subscribers: Dict[str, tuple] = {}
+        self._queues: Dict[Any, _SubscriberQueue] = {}
+        self._ready: queue.Queue = queue.Queue()  # Colas de suscriptor con trabajo pendiente
+        self._workers: List[threading.Thread] = []
+        self._worker_ids: set = set()
+        # Notificaciones encoladas y aún no entregadas ni descartadas
+        self._in_flight = 0
+        self._idle = threading.Condition(threading.Lock())
+        # Ventanas de coalescing abiertas: heap de (vencimiento, secuencia, coalescer)
+        self._timers: List[tuple] = []
+        self._timer_seq = 0
+        self._timer_cond = threading.Condition(threading.Lock())
+        self._timer_thread: Optional[threading.Thread] = None
+    
+    def subscribe(self, event_type: str, callback: Callable, subscriber: Any = None,
+                  max_pending: Optional[int] = None, overflow: Optional[str] = None):
+        """
+        Suscribe un callback a un tipo de evento
+        
+        Args:
+            event_type: Tipo de evento
+            callback: Función a llamar con los argumentos de notify
+            subscriber: Clave del suscriptor; los callbacks con la misma clave comparten una
+                cola y reciben sus notificaciones en orden aunque sean de tipos distintos
+                (por defecto cada callback es su propio suscriptor)
+            max_pending, overflow: Sustituyen los valores por defecto del sistema para la
+                cola de este suscriptor (solo al crearla)
+        """
+        overflow = overflow or self.overflow
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Política de desbordamiento desconocida: {overflow}")
+        
+        with self._lock:
+            subscriber_queue = self._get_queue(callback, subscriber, max_pending, overflow)
+            self._add_entry(event_type, callback, subscriber_queue)
     
-    def subscribe(self, event_type: str, callback: Callable):
-        """Suscribe un callback a un tipo de evento"""
+    def subscribe_coalesced(self, event_types: Iterable[str], callback: Callable[[NotificationBatch], None],
+                            window: float = 0.1, subscriber: Any = None):
+        """
+        Suscribe un callback que recibe las notificaciones agrupadas por ventanas de tiempo
+        
+        La primera notificación abre una ventana de window segundos; al vencer, el callback
+        recibe un único NotificationBatch con todas las notificaciones de la ventana (tipos
+        y IDs afectados). Útil para refrescar una vista una sola vez tras una ráfaga de cambios.
+        Se cancela con unsubscribe(event_type, callback) para cada tipo.
+        
+        Args:
+            event_types: Tipos de evento que se agrupan en el mismo lote
+            callback: Función que recibe el NotificationBatch
+            window: Duración de la ventana (segundos)
+            subscriber: Clave del suscriptor (ver subscribe)
+        """
         with self._lock:
-            if event_type not in self._callbacks:
-                self._callbacks[event_type] = []
-            self._callbacks[event_type].append(callback)
+            subscriber_queue = self._get_queue(callback, subscriber, None, self.overflow)
+            coalescer = _Coalescer(callback, subscriber_queue, window)
+            for event_type in event_types:
+                subscriber_queue.subscriptions += 1
+                self._add_entry(event_type, callback, coalescer)
+            subscriber_queue.subscriptions -= 1  # _get_queue ya contó una suscripción
+    
+    def _get_queue(self, callback: Callable, subscriber: Any, max_pending: Optional[int],
+                   overflow: str) -> _SubscriberQueue:
+        """Obtiene o crea la cola del suscriptor y cuenta la suscripción (con self._lock tomado)"""
+        key = callback if subscriber is None else subscriber
+        subscriber_queue = self._queues.get(key)
+        if subscriber_queue is None:
+            subscriber_queue = _SubscriberQueue(
+                name=self._subscriber_name(callback, subscriber),
+                max_pending=self.max_pending if max_pending is None else max_pending,
+                overflow=overflow,
+                block_timeout=self.block_timeout
+            )
+            self._queues[key] = subscriber_queue
+        subscriber_queue.subscriptions += 1
+        return subscriber_queue
+    
+    def _add_entry(self, event_type: str, callback: Callable, target):
+        self._subscribers[event_type] = self._subscribers.get(event_type, ()) + ((callback, target),)
+    
+    @staticmethod
+    def _subscriber_name(callback: Callable, subscriber: Any) -> str:
+        if subscriber is None:
+            return getattr(callback, '__qualname__', repr(callback))
+        return subscriber if isinstance(subscriber, str) else type(subscriber).__name__
     
     def unsubscribe(self, event_type: str, callback: Callable):
-        """Desuscribe un callback de un tipo de evento"""
+        """
+        Desuscribe un callback de un tipo de evento y descarta sus notificaciones pendientes
+        de ese tipo (las de otros tipos que comparten su cola se siguen entregando)
+        """
         with self._lock:
-            if event_type in self._callbacks:
-                try:
-                    self._callbacks[event_type].remove(callback)
-                except ValueError:
-                    pass
+            entries = self._subscribers.get(event_type, ())
+            for i, (cb, target) in enumerate(entries):
+                if cb == callback:
+                    break
+            else:
+                return
+            self._subscribers[event_type] = entries[:i] + entries[i + 1:]
+            subscriber_queue = target
+            if isinstance(target, _Coalescer):
+                subscriber_queue = target.queue
+                # Sin tipos suscritos, el lote pendiente ya no se entrega
+                target.active = any(t is target for entries in self._subscribers.values() for _, t in entries)
+            subscriber_queue.subscriptions -= 1
+            if subscriber_queue.subscriptions == 0:
+                for key, q in list(self._queues.items()):
+                    if q is subscriber_queue:
+                        del self._queues[key]
+                        break
+            # Si el callback sigue suscrito a este tipo (suscripción repetida), se conservan
+            still_subscribed = any(cb == callback and t is target for cb, t in self._subscribers[event_type])
+        
+        if still_subscribed:
+            return
+        with subscriber_queue.lock:
+            kept = deque(item for item in subscriber_queue.pending
+                         if item[1] != callback or item[4] != event_type)
+            removed = len(subscriber_queue.pending) - len(kept)
+            subscriber_queue.pending = kept
+            subscriber_queue.not_full.notify_all()
+        self._finished(removed)
     
     def notify(self, event_type: str, *args, **kwargs):
-        """Notifica a todos los suscriptores de un evento"""
+        """Encola la notificación para todos los suscriptores del evento"""
+        entries = self._subscribers.get(event_type)
+        if not entries:
+            return
+        
+        now = time.perf_counter()
+        for callback, target in entries:
+            if isinstance(target, _Coalescer):
+                if target.collect(event_type, kwargs):
+                    self._schedule_flush(target)
+            else:
+                self._enqueue(target, (now, callback, args, kwargs, event_type))
+    
+    def _schedule_flush(self, coalescer: _Coalescer):
+        """Programa la entrega del lote de una ventana recién abierta"""
+        with self._idle:
+            self._in_flight += 1  # La ventana abierta cuenta como pendiente para wait_idle
+        with self._timer_cond:
+            self._timer_seq += 1
+            heapq.heappush(self._timers, (time.monotonic() + coalescer.window, self._timer_seq, coalescer))
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._timer_loop, name="NotificationTimer", daemon=True)
+                self._timer_thread.start()
+            self._timer_cond.notify()
+    
+    def _timer_loop(self):
+        """Encola la entrega de los lotes cuyas ventanas han vencido"""
+        while True:
+            with self._timer_cond:
+                while True:
+                    if self._timer_thread is not threading.current_thread():
+                        return
+                    now = time.monotonic()
+                    if self._timers and self._timers[0][0] <= now:
+                        coalescer = heapq.heappop(self._timers)[2]
+                        break
+                    self._timer_cond.wait(self._timers[0][0] - now if self._timers else None)
+            # La entrega de un lote no se descarta ni espera sitio: si se perdiera, el lote
+            # abierto no se vaciaría nunca y la suscripción dejaría de recibir lotes
+            self._enqueue(coalescer.queue, (time.perf_counter(), coalescer.flush, (), {}, None), bounded=False)
+            self._finished(1)
+    
+    def _enqueue(self, subscriber_queue: _SubscriberQueue, item: tuple, bounded: bool = True):
+        """
+        Añade una notificación a la cola del suscriptor aplicando su política de
+        desbordamiento (salvo con bounded=False, que se usa para las entregas de lotes)
+        """
+        with subscriber_queue.lock:
+            limit = subscriber_queue.max_pending if bounded else 0
+            if limit and len(subscriber_queue.pending) >= limit:
+                overflow = subscriber_queue.overflow
+                # Un callback que notifica desde un worker no debe esperar a los workers
+                if overflow == 'block' and threading.get_ident() in self._worker_ids:
+                    overflow = 'drop_newest'
+                if overflow == 'block':
+                    deadline = time.monotonic() + subscriber_queue.block_timeout
+                    while len(subscriber_queue.pending) >= limit:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not subscriber_queue.not_full.wait(remaining):
+                            break
+                if len(subscriber_queue.pending) >= limit:
+                    subscriber_queue.dropped += 1
+                    # Avisar solo del primer descarte y de cada mil (la métrica lleva la cuenta exacta)
+                    if subscriber_queue.dropped % 1000 == 1:
+                        logger.warning(f"Cola de notificaciones llena para {subscriber_queue.name} "
+                                       f"({subscriber_queue.dropped} descartadas, política {overflow})")
+                    if overflow != 'drop_oldest':
+                        return
+                    # Se descarta la notificación más antigua, nunca una entrega de lote (tipo None)
+                    for index, pending in enumerate(subscriber_queue.pending):
+                        if pending[4] is not None:
+                            del subscriber_queue.pending[index]
+                            self._finished(1)
+                            break
+                    else:
+                        return
+            
+            subscriber_queue.pending.append(item)
+            subscriber_queue.max_depth = max(subscriber_queue.max_depth, len(subscriber_queue.pending))
+            with self._idle:
+                self._in_flight += 1
+            schedule = not subscriber_queue.scheduled
+            subscriber_queue.scheduled = True
+        
+        if schedule:
+            self._start_workers()
+            self._ready.put(subscriber_queue)
+    
+    def _start_workers(self):
+        if self._workers:
+            return
         with self._lock:
-            if event_type not in self._callbacks:
+            if self._workers:
                 return
+            for i in range(self.num_workers):
+                worker = threading.Thread(target=self._worker_loop, name=f"NotificationWorker-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+    
+    def _worker_loop(self):
+        self._worker_ids.add(threading.get_ident())
+        while True:
+            subscriber_queue = self._ready.get()
+            if subscriber_queue is None:
+                break
+            self._drain(subscriber_queue)
+    
+    def _drain(self, subscriber_queue: _SubscriberQueue):
+        """Entrega hasta batch_size notificaciones de un suscriptor, en orden"""
+        for _ in range(self.batch_size):
+            with subscriber_queue.lock:
+                if not subscriber_queue.pending:
+                    subscriber_queue.scheduled = False
+                    return
+                enqueued_at, callback, args, kwargs, _ = subscriber_queue.pending.popleft()
+                subscriber_queue.not_full.notify()
             
-            # Ejecutar callbacks en threads separados para no bloquear
-            for callback in self._callbacks[event_type]:
-                try:
-                    thread = threading.Thread(
-                        target=callback,
-                        args=args,
-                        kwargs=kwargs,
-                        daemon=True
-                    )
-                    thread.start()
-                except Exception as e:
-                    logger.error(f"Error al ejecutar callback para {event_type}: {e}")
+            latency = time.perf_counter() - enqueued_at
+            failed = False
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                failed = True
+                logger.error(f"Error al ejecutar callback de {subscriber_queue.name}: {e}")
+            
+            with subscriber_queue.lock:
+                subscriber_queue.delivered += 1
+                subscriber_queue.errors += failed
+                subscriber_queue.total_latency += latency
+                subscriber_queue.max_latency = max(subscriber_queue.max_latency, latency)
+            self._finished(1)
+        
+        # Lote completo: ceder el worker a otros suscriptores y continuar después
+        with subscriber_queue.lock:
+            if subscriber_queue.pending:
+                self._ready.put(subscriber_queue)
+            else:
+                subscriber_queue.scheduled = False
+    
+    def _finished(self, count: int):
+        if not count:
+            return
+        with self._idle:
+            self._in_flight -= count
+            if self._in_flight <= 0:
+                self._idle.notify_all()
+    
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que se entreguen todas las notificaciones pendientes; False si vence el timeout"""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight <= 0, timeout)
+    
+    def shutdown(self, timeout: float = 5.0):
+        """Detiene los worker threads (las notificaciones pendientes que queden se pierden)"""
+        with self._timer_cond:
+            self._timer_thread = None
+            self._timer_cond.notify()
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._ready.put(None)
+        for worker in workers:
+            worker.join(timeout=timeout)
+        self._worker_ids.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Métricas: profundidad de las colas, descartes y latencia de entrega por suscriptor"""
+        with self._lock:
+            queues = list(self._queues.values())
+            coalescers = {id(target): target for entries in self._subscribers.values()
+                          for _, target in entries if isinstance(target, _Coalescer)}
+        subscribers = [q.stats() for q in queues]
+        for subscriber_stats, q in zip(subscribers, queues):
+            coalesced = [c.stats() for c in coalescers.values() if c.queue is q]
+            if coalesced:
+                subscriber_stats['coalesced'] = coalesced
+        return {
+            'workers': len(self._workers),
+            'ready_queue': self._ready.qsize(),
+            'in_flight': self._in_flight,
+            'queued': sum(s['depth'] for s in subscribers),
+            'delivered': sum(s['delivered'] for s in subscribers),
+            'dropped': sum(s['dropped'] for s in subscribers),
+            'errors': sum(s['errors'] for s in subscribers),
+            'max_latency_ms': max((s['max_latency_ms'] for s in subscribers), default=0.0),
+            'subscribers': subscribers
+        }
     
     def get_event(self, event_type: str) -> threading.Event:
         """Obtiene o crea un threading.Event para un tipo de evento"""
@@ -385,10 +1470,22 @@ class EventNotificationSystem:
 
 
 # Instancia global del sistema de notificaciones
-_event_notification_system = EventNotificationSystem()
+_event_notification_system: Optional[EventNotificationSystem] = None
+_notification_system_lock = threading.Lock()
 
 
 def get_notification_system() -> EventNotificationSystem:
     """Obtiene la instancia global del sistema de notificaciones"""
+    global _event_notification_system
+    if _event_notification_system is None:
+        with _notification_system_lock:
+            if _event_notification_system is None:
+                from config.config import CONCURRENCY_CONFIG
+                _event_notification_system = EventNotificationSystem(
+                    num_workers=CONCURRENCY_CONFIG.get('notification_workers', 4),
+                    max_pending=CONCURRENCY_CONFIG.get('notification_queue_size', 1000),
+                    overflow=CONCURRENCY_CONFIG.get('notification_overflow', 'drop_oldest'),
+                    block_timeout=CONCURRENCY_CONFIG.get('notification_block_timeout', 1.0)
+                )
     return _event_notification_system
 
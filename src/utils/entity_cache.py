@@ -0,0 +1,220 @@
+"""
+Caché de lectura (read-through) de entidades para los controladores
+Guarda las filas de eventos, participantes y usuarios leídas por get_by_id/get_all
+(LRU con TTL y tamaño máximo). Se invalida con las escrituras de los controladores y
+con las notificaciones de EventNotificationSystem.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from src.utils.concurrency_manager import get_notification_system
+
+
+class EntityCache:
+    """
+    Caché LRU con caducidad (TTL) de filas de una entidad, indexadas por su ID
+
+    Además de las filas sueltas guarda el listado completo (get_all), que al cargarse
+    rellena también las entradas por ID. Se guardan las filas y no los modelos: cada
+    lectura construye objetos nuevos, así que quien modifique el modelo devuelto no
+    altera la caché.
+
+    Para no guardar datos leídos antes de una invalidación, quien consulta la base de
+    datos toma antes la generación (generation) y la pasa a put/put_all: si entretanto
+    se invalidó algo, la fila leída se descarta.
+    """
+
+    def __init__(self, name: str, key_field: str, max_size: int = 1000, ttl: float = 15.0):
+        """
+        Args:
+            name: Nombre de la caché (estadísticas y logs)
+            key_field: Columna con el ID de la entidad
+            max_size: Filas máximas en caché (0 desactiva la caché)
+            ttl: Segundos que una fila se considera vigente
+        """
+        self.name = name
+        self.key_field = key_field
+        self.max_size = max(0, int(max_size))
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._all: Optional[tuple] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    @property
+    def generation(self) -> int:
+        """Contador que cambia con cada invalidación (se toma antes de consultar)"""
+        return self._generation
+
+    @staticmethod
+    def _key(key: Any) -> Any:
+        """Los IDs pueden llegar como texto (p. ej. desde las etiquetas de un Treeview)"""
+        if isinstance(key, str) and key.isdigit():
+            return int(key)
+        return key
+
+    def get(self, key: Any) -> Optional[dict]:
+        """Devuelve la fila vigente de un ID, o None si no está en caché"""
+        if not self.enabled:
+            return None
+        key = self._key(key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry[0]
+                del self._entries[key]
+            self._stats['misses'] += 1
+            return None
+
+    def get_all(self) -> Optional[List[dict]]:
+        """Devuelve el listado completo vigente, o None si no está en caché"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self._all is not None and self._all[1] > time.monotonic():
+                self._stats['hits'] += 1
+                return self._all[0]
+            self._all = None
+            self._stats['misses'] += 1
+            return None
+
+    def put(self, key: Any, row: dict, generation: int):
+        """Guarda una fila leída con la generación tomada antes de la consulta"""
+        if not self.enabled or row is None:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._store(self._key(key), row, time.monotonic() + self.ttl)
+
+    def put_all(self, rows: List[dict], generation: int):
+        """Guarda el listado completo (y cada fila por su ID)"""
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            # Un listado mayor que la caché no cabe: solo se guardan sus últimas filas
+            if len(rows) <= self.max_size:
+                self._all = (rows, expires_at)
+            for row in rows[-self.max_size:]:
+                self._store(row[self.key_field], row, expires_at)
+
+    def _store(self, key: Any, row: dict, expires_at: float):
+        """Inserta una fila y expulsa las menos usadas (con self._lock tomado)"""
+        self._entries[key] = (row, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def invalidate(self, key: Any = None):
+        """
+        Invalida la fila de un ID (si se indica) y el listado completo, que la contiene
+        o deja de estar completo tras un alta
+        """
+        with self._lock:
+            self._generation += 1
+            self._stats['invalidations'] += 1
+            if key is not None:
+                self._entries.pop(self._key(key), None)
+            self._all = None
+
+    def clear(self):
+        """Vacía la caché"""
+        with self._lock:
+            self._generation += 1
+            self._stats['invalidations'] += 1
+            self._entries.clear()
+            self._all = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Aciertos, fallos, expulsiones, invalidaciones y ocupación"""
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                'name': self.name,
+                **self._stats,
+                'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'has_all': self._all is not None
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+# Entidades cacheables: columna del ID y notificaciones que las invalidan
+# {tipo de notificación: argumento con el ID}
+_ENTITIES = {
+    'events': ('event_id', {
+        'event_created': 'event_id', 'event_updated': 'event_id', 'event_deleted': 'event_id'
+    }),
+    'participants': ('participant_id', {
+        'participant_created': 'participant_id', 'participant_updated': 'participant_id',
+        'participant_deleted': 'participant_id'
+    }),
+    'users': ('user_id', {
+        'user_created': 'user_id', 'user_updated': 'user_id', 'user_deleted': 'user_id'
+    })
+}
+
+# Cachés globales compartidas por todos los controladores del proceso
+_entity_caches: Dict[str, EntityCache] = {}
+_entity_caches_lock = threading.Lock()
+
+
+def _subscribe_invalidation(cache: EntityCache, events: Dict[str, str]):
+    """Invalida la caché con las notificaciones de cambios de la entidad"""
+    notifications = get_notification_system()
+    for event_type, arg_name in events.items():
+        def on_change(*args, _arg_name=arg_name, **kwargs):
+            cache.invalidate(kwargs.get(_arg_name))
+        notifications.subscribe(event_type, on_change, subscriber=cache)
+
+
+def get_entity_cache(kind: str) -> EntityCache:
+    """Obtiene la caché global de 'events', 'participants' o 'users'"""
+    cache = _entity_caches.get(kind)
+    if cache is None:
+        with _entity_caches_lock:
+            cache = _entity_caches.get(kind)
+            if cache is None:
+                if kind not in _ENTITIES:
+                    raise ValueError(f"Tipo de caché inválido: {kind}")
+                from config.config import CONCURRENCY_CONFIG
+                key_field, events = _ENTITIES[kind]
+                enabled = CONCURRENCY_CONFIG.get('entity_cache_enabled', True)
+                cache = EntityCache(
+                    name=kind,
+                    key_field=key_field,
+                    max_size=CONCURRENCY_CONFIG.get('entity_cache_size', 1000) if enabled else 0,
+                    ttl=CONCURRENCY_CONFIG.get('entity_cache_ttl', 15.0)
+                )
+                if cache.enabled:
+                    _subscribe_invalidation(cache, events)
+                _entity_caches[kind] = cache
+    return cache
+
+
+def get_entity_cache_stats() -> List[Dict[str, Any]]:
+    """Estadísticas de las cachés de entidades creadas"""
+    with _entity_caches_lock:
+        caches = list(_entity_caches.values())
+    return [cache.stats() for cache in caches]
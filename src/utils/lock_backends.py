@@ -0,0 +1,230 @@
+"""
+Backends de locks por recurso seleccionables desde CONCURRENCY_CONFIG
+- 'process': locks del propio proceso (ResourceLockManager); no protege entre instancias
+- 'mysql': locks con nombre de MySQL (GET_LOCK/RELEASE_LOCK), compartidos por todas
+  las instancias conectadas a la misma base de datos
+- 'none': sin lock de aplicación (la consistencia la garantizan las sentencias SQL)
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.concurrency_manager import LockBackend, get_lock_manager, logger
+
+# Longitud máxima de un nombre de lock en MySQL
+MYSQL_LOCK_NAME_MAX = 64
+
+
+class NullLockBackend(LockBackend):
+    """Backend que no bloquea: para operaciones cuya exclusión mutua ya garantiza MySQL"""
+
+    name = 'none'
+
+    def acquire(self, resource_id: str, timeout: Optional[float] = None) -> bool:
+        return True
+
+    def release(self, resource_id: str):
+        pass
+
+
+class MySQLLockBackend(LockBackend):
+    """
+    Locks con nombre de MySQL (GET_LOCK/RELEASE_LOCK)
+
+    Un lock con nombre pertenece a la sesión que lo obtiene, así que cada lock retiene
+    una conexión del pool desde acquire hasta release (la operación protegida usa otra
+    conexión). Para que los poseedores de locks no agoten el pool esperando esa segunda
+    conexión, como mucho max_holders threads tienen un lock a la vez (por defecto menos
+    de la mitad del pool); el resto espera su turno dentro del timeout de acquire.
+    El mismo thread puede volver a adquirir un lock que ya tiene: se cuenta y solo se
+    libera en el último release.
+    """
+
+    name = 'mysql'
+
+    def __init__(self, db, prefix: Optional[str] = None, collect_metrics: bool = True,
+                 max_holders: Optional[int] = None):
+        """
+        Args:
+            db: DatabaseConnection de la que se toman las conexiones
+            prefix: Prefijo de los nombres de lock (por defecto el nombre de la base de datos)
+            collect_metrics: Registrar tiempos de espera y timeouts
+            max_holders: Locks adquiridos a la vez como máximo (por defecto (pool_size - 1) // 2)
+        """
+        self.db = db
+        if prefix is None:
+            from config.config import DB_CONFIG
+            prefix = DB_CONFIG.get('database', 'app')
+        self.prefix = prefix
+        self.collect_metrics = collect_metrics
+        if max_holders is None:
+            max_holders = self.default_max_holders(db)
+        self.max_holders = max(1, int(max_holders))
+        self._slots = threading.BoundedSemaphore(self.max_holders)
+        self._held: Dict[Tuple[int, str], list] = {}  # (thread, recurso) -> [conexión, contador]
+        self._lock = threading.Lock()
+        self._acquisitions = 0
+        self._timeouts = 0
+        self._errors = 0
+        self._wait_time = 0.0
+        self._max_wait = 0.0
+
+    @staticmethod
+    def default_max_holders(db) -> int:
+        """
+        Cada poseedor ocupa dos conexiones (la del lock y la de la operación): con menos
+        de la mitad del pool como poseedores siempre quedan conexiones para terminar
+        """
+        pool = getattr(db, 'pool', None)
+        if pool is not None:
+            pool_size = pool.size
+        else:
+            from config.config import CONCURRENCY_CONFIG
+            pool_size = CONCURRENCY_CONFIG.get('pool_size', 20)
+        return max(1, (pool_size - 1) // 2)
+
+    def lock_name(self, resource_id: str) -> str:
+        """Nombre del lock en MySQL (se resume con un hash si supera 64 caracteres)"""
+        name = f"{self.prefix}:{resource_id}"
+        if len(name) > MYSQL_LOCK_NAME_MAX:
+            name = f"{self.prefix[:20]}:{hashlib.sha1(resource_id.encode('utf-8')).hexdigest()}"
+        return name
+
+    def acquire(self, resource_id: str, timeout: Optional[float] = None) -> bool:
+        key = (threading.get_ident(), resource_id)
+        with self._lock:
+            held = self._held.get(key)
+            if held:
+                held[1] += 1
+                return True
+
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=timeout):
+            # Ya hay max_holders locks adquiridos y ninguno se liberó a tiempo
+            self._record(time.perf_counter() - start, timeout=True)
+            return False
+        try:
+            conn = self.db.get_connection()
+        except Exception:
+            self._slots.release()
+            self._record(time.perf_counter() - start, error=True)
+            raise
+        try:
+            cursor = conn.cursor()
+            # Un timeout negativo espera indefinidamente; se descuenta la espera de turno
+            remaining = -1 if timeout is None else max(0.0, timeout - (time.perf_counter() - start))
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (self.lock_name(resource_id), remaining))
+            row = cursor.fetchone()
+            cursor.close()
+        except Exception:
+            # El lock pudo obtenerse antes del error: se libera al reiniciar la sesión
+            conn.require_reset()
+            conn.close()
+            self._slots.release()
+            self._record(time.perf_counter() - start, error=True)
+            raise
+
+        acquired = bool(row and row[0] == 1)
+        self._record(time.perf_counter() - start, timeout=not acquired)
+        if not acquired:
+            # 0 = timeout, NULL = error (p. ej. sesión terminada)
+            conn.close()
+            self._slots.release()
+            return False
+
+        with self._lock:
+            self._held[key] = [conn, 1]
+        return True
+
+    def release(self, resource_id: str):
+        key = (threading.get_ident(), resource_id)
+        with self._lock:
+            held = self._held.get(key)
+            if not held:
+                return  # No adquirido por este thread, ignorar
+            held[1] -= 1
+            if held[1] > 0:
+                return
+            del self._held[key]
+
+        conn = held[0]
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (self.lock_name(resource_id),))
+            cursor.fetchone()
+            cursor.close()
+        except Exception as e:
+            # Al devolver la conexión al pool se reinicia la sesión, lo que también libera el lock
+            conn.require_reset()
+            logger.warning(f"Error al liberar el lock {resource_id} en MySQL: {e}")
+        finally:
+            conn.close()
+            self._slots.release()
+
+    def _record(self, waited: float, timeout: bool = False, error: bool = False):
+        if not self.collect_metrics:
+            return
+        with self._lock:
+            if error:
+                self._errors += 1
+            elif timeout:
+                self._timeouts += 1
+            else:
+                self._acquisitions += 1
+            self._wait_time += waited
+            self._max_wait = max(self._max_wait, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """Métricas de espera de los locks (si collect_metrics está activado)"""
+        with self._lock:
+            attempts = self._acquisitions + self._timeouts + self._errors
+            return {
+                'backend': self.name,
+                'held': len(self._held),
+                'max_holders': self.max_holders,
+                'acquisitions': self._acquisitions,
+                'timeouts': self._timeouts,
+                'errors': self._errors,
+                'total_wait_seconds': self._wait_time,
+                'avg_wait_seconds': self._wait_time / attempts if attempts else 0.0,
+                'max_wait_seconds': self._max_wait
+            }
+
+
+# Backends creados (uno por tipo y conexión de base de datos)
+_backends: Dict[Tuple[str, int], LockBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_lock_backend(name: Optional[str] = None, db=None) -> LockBackend:
+    """
+    Obtiene el backend de locks indicado
+
+    Args:
+        name: 'process', 'mysql' o 'none' (por defecto CONCURRENCY_CONFIG['lock_backend'])
+        db: DatabaseConnection para el backend 'mysql' (por defecto la instancia global)
+    """
+    from config.config import CONCURRENCY_CONFIG
+    name = (name or CONCURRENCY_CONFIG.get('lock_backend', 'process')).lower()
+
+    if name == 'process':
+        return get_lock_manager()
+
+    key = (name, id(db))
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            if name == 'none':
+                backend = NullLockBackend()
+            elif name == 'mysql':
+                if db is None:
+                    from src.database.db_connection import DatabaseConnection
+                    db = DatabaseConnection()
+                backend = MySQLLockBackend(db, collect_metrics=CONCURRENCY_CONFIG.get('lock_metrics', True),
+                                           max_holders=CONCURRENCY_CONFIG.get('mysql_lock_max_holders'))
+            else:
+                raise ValueError(f"Backend de locks desconocido: {name}")
+            _backends[key] = backend
+        return backend
@@ -0,0 +1,47 @@
+"""
+Comprobación del contador de inscripciones confirmadas (events.confirmed_count)
+Uso: python -m src.utils.reconcile_occupancy [--fix]
+"""
+
+import argparse
+import sys
+import os
+
+# Agregar el directorio raíz al path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.database.db_connection import DatabaseConnection
+from src.controllers.registration_controller import RegistrationController
+
+
+def main(argv=None) -> int:
+    """Compara confirmed_count con las inscripciones reales y opcionalmente lo corrige"""
+    parser = argparse.ArgumentParser(
+        description="Comprueba el contador de inscripciones confirmadas de cada evento"
+    )
+    parser.add_argument("--fix", action="store_true", help="Corrige los contadores desajustados")
+    args = parser.parse_args(argv)
+    
+    db = DatabaseConnection()
+    if not db.pool:
+        print("No hay conexión a la base de datos")
+        return 2
+    
+    controller = RegistrationController(db)
+    mismatches = controller.reconcile_confirmed_counts(fix=args.fix)
+    
+    if not mismatches:
+        print("Todos los contadores de ocupación son correctos")
+        return 0
+    
+    for row in mismatches:
+        print(f"Evento {row['event_id']} ({row['title']}): guardado={row['stored']} real={row['actual']}")
+    
+    if args.fix:
+        print(f"Corregidos {len(mismatches)} eventos")
+        return 0
+    print(f"{len(mismatches)} eventos con el contador desajustado (usa --fix para corregirlos)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
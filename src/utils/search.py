@@ -0,0 +1,46 @@
+"""
+Utilidades para búsquedas FULLTEXT en MySQL
+"""
+
+import re
+from typing import List, Optional
+
+# Longitud mínima de palabra indexada por InnoDB (innodb_ft_min_token_size)
+FULLTEXT_MIN_TOKEN_SIZE = 3
+
+# Caracteres con significado especial en el modo booleano de MATCH ... AGAINST
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]+')
+
+SEARCH_MODES = ('like', 'natural', 'boolean')
+
+
+class FullTextSearch:
+    """Clase con métodos para construir búsquedas FULLTEXT"""
+    
+    @staticmethod
+    def tokenize(search_term: str) -> List[str]:
+        """Divide el término de búsqueda en palabras sin operadores booleanos"""
+        cleaned = _BOOLEAN_OPERATORS.sub(' ', search_term or '')
+        return [word for word in cleaned.split() if word]
+    
+    @staticmethod
+    def boolean_query(search_term: str) -> Optional[str]:
+        """
+        Construye una consulta en modo booleano donde todas las palabras son
+        obligatorias y se buscan por prefijo ("conc verano" -> "+conc* +verano*").
+        
+        Returns:
+            La consulta, o None si alguna palabra es más corta que el mínimo
+            indexado por MySQL (en ese caso hay que recurrir a LIKE)
+        """
+        words = FullTextSearch.tokenize(search_term)
+        if not words or any(len(word) < FULLTEXT_MIN_TOKEN_SIZE for word in words):
+            return None
+        return ' '.join(f'+{word}*' for word in words)
+    
+    @staticmethod
+    def validate_mode(mode: str) -> str:
+        """Valida el modo de búsqueda ('like', 'natural' o 'boolean')"""
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Modo de búsqueda inválido. Modos válidos: {', '.join(SEARCH_MODES)}")
+        return mode
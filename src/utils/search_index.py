@@ -0,0 +1,550 @@
+"""
+Índice de búsqueda en memoria (n-gramas) para filtrar mientras se escribe
+Pensado para puestos sin conexión o tipo kiosko: las consultas no acceden a MySQL
+y el índice se mantiene al día con las notificaciones de los controladores
+"""
+
+import threading
+import unicodedata
+import heapq
+import bisect
+import itertools
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.utils.concurrency_manager import get_notification_system
+
+logger = logging.getLogger(__name__)
+
+_EMPTY: Set[Any] = frozenset()
+
+# Coste relativo de visitar un documento en el recorrido ordenado frente a
+# cada elemento del conjunto más pequeño en la intersección
+_SCAN_COST_RATIO = 8
+
+
+def _entry_key(entry):
+    return entry[0]
+
+
+def normalize_text(text: str) -> str:
+    """Pasa a minúsculas y elimina tildes para comparar sin distinguirlas"""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+class NGramIndex:
+    """
+    Índice invertido de n-gramas (trigramas por defecto)
+    Cada palabra de la consulta debe aparecer como subcadena en el documento.
+    Las palabras más cortas que n se buscan como prefijo de alguna palabra.
+    """
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self._postings: Dict[str, Set[Any]] = {}
+        self._prefixes: Dict[str, Set[Any]] = {}
+        self._texts: Dict[Any, str] = {}
+        self._payloads: Dict[Any, Any] = {}
+        self._order: Dict[Any, Any] = {}
+        # Entrada vigente de cada documento en _sorted (las demás son de versiones anteriores)
+        self._entries: Dict[Any, Tuple[Any, Any]] = {}
+        self._sorted: List[Tuple[Any, Any]] = []
+        self._unsorted = False
+        # Cambia con cada alta, baja o vaciado (para invalidar resultados guardados)
+        self.version = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._texts
+
+    def _grams(self, text: str) -> Set[str]:
+        """n-gramas de cada palabra del texto"""
+        grams = set()
+        for word in text.split():
+            for i in range(len(word) - self.n + 1):
+                grams.add(word[i:i + self.n])
+        return grams
+
+    def _short_prefixes(self, text: str) -> Set[str]:
+        """Prefijos de cada palabra más cortos que n"""
+        prefixes = set()
+        for word in text.split():
+            for length in range(1, min(self.n, len(word) + 1)):
+                prefixes.add(word[:length])
+        return prefixes
+
+    def add(self, doc_id, text: str, payload: Any = None, sort_key: Any = None):
+        """
+        Añade (o reemplaza) un documento en el índice
+
+        Args:
+            doc_id: Identificador del documento
+            text: Texto a indexar
+            payload: Objeto que se devuelve en los resultados (por ejemplo, el modelo)
+            sort_key: Clave de orden de los resultados (por defecto doc_id)
+        """
+        normalized = normalize_text(text)
+        with self._lock:
+            self.version += 1
+            if doc_id in self._texts:
+                self._remove_unlocked(doc_id)
+            key = sort_key if sort_key is not None else doc_id
+            self._texts[doc_id] = normalized
+            self._payloads[doc_id] = payload
+            self._order[doc_id] = key
+            entry = (key, doc_id)
+            self._entries[doc_id] = entry
+            self._sorted.append(entry)
+            self._unsorted = True
+            for gram in self._grams(normalized):
+                self._postings.setdefault(gram, set()).add(doc_id)
+            for prefix in self._short_prefixes(normalized):
+                self._prefixes.setdefault(prefix, set()).add(doc_id)
+
+    def remove(self, doc_id):
+        """Elimina un documento del índice"""
+        with self._lock:
+            self.version += 1
+            self._remove_unlocked(doc_id)
+
+    def _remove_unlocked(self, doc_id):
+        text = self._texts.pop(doc_id, None)
+        self._payloads.pop(doc_id, None)
+        self._order.pop(doc_id, None)
+        self._entries.pop(doc_id, None)
+        if text is None:
+            return
+        for index, keys in ((self._postings, self._grams(text)),
+                            (self._prefixes, self._short_prefixes(text))):
+            for key in keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(doc_id)
+                    if not ids:
+                        del index[key]
+
+    def clear(self):
+        """Vacía el índice"""
+        with self._lock:
+            self.version += 1
+            self._postings.clear()
+            self._prefixes.clear()
+            self._texts.clear()
+            self._payloads.clear()
+            self._order.clear()
+            self._entries.clear()
+            self._sorted.clear()
+            self._unsorted = False
+
+    def _posting_sets(self, word: str) -> List[Set[Any]]:
+        """
+        Conjuntos de documentos que debe contener un resultado para la palabra.
+        Solo se usan los dos n-gramas menos frecuentes: el resto lo cubre la
+        verificación de la subcadena completa.
+        """
+        if len(word) < self.n:
+            return [self._prefixes.get(word, _EMPTY)]
+        sets = [self._postings.get(word[i:i + self.n], _EMPTY)
+                for i in range(len(word) - self.n + 1)]
+        sets.sort(key=len)
+        return sets[:2]
+
+    def _ordered_ids(self) -> List[Any]:
+        """Lista (clave de orden, doc_id) ordenada; se reordena solo si ha cambiado"""
+        if len(self._sorted) > 2 * len(self._texts) + 1024:
+            # Compactar entradas de documentos eliminados o reemplazados
+            entries = self._entries
+            self._sorted = [entry for entry in self._sorted if entries.get(entry[1]) is entry]
+        if self._unsorted:
+            self._sorted.sort(key=_entry_key)
+            self._unsorted = False
+        return self._sorted
+
+    def search(self, query: str, limit: Optional[int] = None, after: Any = None,
+               before: Any = None, where: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        """
+        Busca documentos que contengan todas las palabras de la consulta
+
+        Se usa como fuente de páginas por clave (keyset): con after solo se devuelven
+        documentos con clave de orden mayor y con before, los limit anteriores a esa clave.
+
+        Args:
+            query: Texto a buscar (vacío: todos los documentos)
+            limit: Máximo de resultados (None: todos)
+            after: Clave de orden a partir de la cual buscar (excluida)
+            before: Clave de orden hasta la que buscar (excluida)
+            where: Filtro opcional sobre el objeto asociado a cada documento
+
+        Returns:
+            Lista de doc_id ordenados por su clave de orden
+        """
+        words = normalize_text(query).split()
+        with self._lock:
+            total = len(self._texts)
+            sets = []
+            extra_sets = []
+            selectivity = 1.0
+            for word in words:
+                word_sets = self._posting_sets(word)
+                if not word_sets[0]:
+                    return []
+                # Estimación optimista de la fracción de documentos que contienen la palabra
+                selectivity *= len(word_sets[0]) / total
+                sets.append(word_sets[0])
+                extra_sets.extend(word_sets[1:])
+            # Primero el conjunto más raro de cada palabra: los n-gramas de una misma
+            # palabra suelen coincidir en casi los mismos documentos y apenas reducen
+            # la intersección hasta que ya es pequeña
+            sets.sort(key=len)
+            sets.extend(sorted(extra_sets, key=len))
+            # Los n-gramas pueden coincidir por separado: verificar la subcadena completa
+            long_words = [w for w in words if len(w) > self.n]
+
+            if not sets:
+                # Sin palabras todos los documentos coinciden: recorrer en orden
+                return self._scan(sets, long_words, where, limit, after, before, None)
+            if limit is not None:
+                # Recorrer en orden y parar al llegar al límite es más barato que
+                # intersecar conjuntos grandes, pero la estimación es optimista (las
+                # coincidencias pueden agruparse o fallar la verificación): el recorrido
+                # se abandona tras visitar tantos documentos como cuesta la intersección
+                # (comprobar un documento en Python cuesta unas 8 veces más que cada
+                # elemento de la intersección de conjuntos)
+                budget = len(sets[0]) // _SCAN_COST_RATIO
+                if limit / selectivity < budget:
+                    results = self._scan(sets, long_words, where, limit, after, before, budget)
+                    if results is not None:
+                        return results
+            return self._intersect(sets, long_words, where, limit, after, before)
+
+    def _scan(self, sets, long_words, where, limit, after, before, budget) -> Optional[List[Any]]:
+        """
+        Recorre los documentos en orden desde after (o hacia atrás desde before)
+
+        Returns:
+            Los resultados, o None si se visitan más de budget documentos
+        """
+        ordered = self._ordered_ids()
+        current, texts, payloads = self._entries, self._texts, self._payloads
+        if before is not None:
+            end = bisect.bisect_left(ordered, before, key=_entry_key)
+            entries = (ordered[i] for i in range(end - 1, -1, -1))
+        else:
+            start = 0 if after is None else bisect.bisect_right(ordered, after, key=_entry_key)
+            entries = itertools.islice(ordered, start, None)
+        if budget is None:
+            budget = len(ordered)
+        results = []
+        for visited, entry in enumerate(entries):
+            if visited > budget:
+                return None
+            doc_id = entry[1]
+            for ids in sets:
+                if doc_id not in ids:
+                    break
+            else:
+                # Las entradas de documentos reemplazados siguen en la lista (con la misma
+                # clave o con otra): solo cuenta la vigente
+                if current.get(doc_id) is not entry:
+                    continue
+                if long_words and not all(w in texts[doc_id] for w in long_words):
+                    continue
+                if where is not None and not where(payloads[doc_id]):
+                    continue
+                results.append(doc_id)
+                if limit is not None and len(results) >= limit:
+                    break
+        if before is not None:
+            results.reverse()
+        return results
+
+    def _intersect(self, sets, long_words, where, limit, after, before) -> List[Any]:
+        """Interseca los conjuntos (empezando por el más pequeño) y ordena lo que queda"""
+        order = self._order
+        matches = sets[0].intersection(*sets[1:]) if len(sets) > 1 else sets[0]
+        if after is not None:
+            matches = [d for d in matches if order[d] > after]
+        if before is not None:
+            matches = [d for d in matches if order[d] < before]
+        if long_words or where is not None:
+            texts, payloads = self._texts, self._payloads
+            matches = [d for d in matches
+                       if all(w in texts[d] for w in long_words)
+                       and (where is None or where(payloads[d]))]
+
+        if limit is None or limit >= len(matches):
+            return sorted(matches, key=order.__getitem__)
+        if before is not None:
+            return heapq.nlargest(limit, matches, key=order.__getitem__)[::-1]
+        return heapq.nsmallest(limit, matches, key=order.__getitem__)
+
+    def search_payloads(self, query: str, limit: Optional[int] = None, after: Any = None,
+                        before: Any = None, where: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        """Igual que search, pero devuelve los objetos asociados a cada documento"""
+        with self._lock:
+            ids = self.search(query, limit, after, before, where)
+            return [self._payloads[d] for d in ids]
+
+
+class LiveSearchIndex:
+    """
+    Índice de búsqueda de una entidad que se carga desde su controlador y se
+    actualiza de forma incremental con el sistema de notificaciones
+    """
+
+    def __init__(self, loader: Callable[[], Iterable[Any]], id_getter: Callable[[Any], Any],
+                 text_getter: Callable[[Any], str], sort_key: Callable[[Any], Any],
+                 upsert_events: Dict[str, str], delete_events: Dict[str, str],
+                 n: int = 3, fetcher: Optional[Callable[[Any], Any]] = None, id_arg: Optional[str] = None):
+        """
+        Args:
+            loader: Función que devuelve todas las entidades (ej: controller.get_all)
+            id_getter: Obtiene el ID de una entidad
+            text_getter: Obtiene el texto indexado de una entidad
+            sort_key: Clave de orden de los resultados
+            upsert_events: {tipo de notificación: nombre del argumento con la entidad}
+            delete_events: {tipo de notificación: nombre del argumento con el ID}
+            n: Tamaño de los n-gramas
+            fetcher: Obtiene una entidad por su ID (ej: controller.get_by_id); se usa con
+                las notificaciones que solo traen el ID (cambios de otras instancias)
+            id_arg: Nombre del argumento con el ID en esas notificaciones
+        """
+        self.index = NGramIndex(n)
+        self._loader = loader
+        self._id_getter = id_getter
+        self._text_getter = text_getter
+        self._sort_key = sort_key
+        self._upsert_events = upsert_events
+        self._delete_events = delete_events
+        self._fetcher = fetcher
+        self._id_arg = id_arg
+        self._callbacks: Dict[str, Callable] = {}
+        # Notificaciones recibidas durante build (None fuera de build)
+        self._pending: Optional[List[Tuple[Callable, dict]]] = None
+        self._build_lock = threading.Lock()
+        self.ready = threading.Event()
+
+    def add(self, entity):
+        """Añade o actualiza una entidad en el índice"""
+        self.index.add(
+            self._id_getter(entity),
+            self._text_getter(entity),
+            payload=entity,
+            sort_key=self._sort_key(entity)
+        )
+
+    def build(self):
+        """
+        Carga todas las entidades y reconstruye el índice
+
+        Las notificaciones que llegan mientras se lee el listado se guardan y se aplican,
+        en orden, después de cargarlo: si se aplicaran antes, el listado (que pudo leerse
+        antes del cambio) las sobrescribiría.
+        """
+        with self._build_lock:
+            self._pending = []
+        self.subscribe()
+        try:
+            entities = self._loader()
+            self.index.clear()
+            for entity in entities:
+                self.add(entity)
+        finally:
+            self._apply_pending()
+        self.ready.set()
+        logger.info(f"Índice de búsqueda cargado con {len(self.index)} elementos")
+
+    def _apply_pending(self):
+        """Aplica las notificaciones guardadas durante build y vuelve a aplicarlas al llegar"""
+        while True:
+            with self._build_lock:
+                if not self._pending:
+                    self._pending = None
+                    return
+                pending, self._pending = self._pending, []
+            # Las que lleguen mientras tanto se guardan y se aplican en la siguiente vuelta
+            for apply, kwargs in pending:
+                apply(**kwargs)
+
+    def _dispatch(self, apply: Callable, kwargs: dict):
+        """Aplica una notificación, o la guarda si se está cargando el listado"""
+        with self._build_lock:
+            if self._pending is not None:
+                self._pending.append((apply, kwargs))
+                return
+            apply(**kwargs)
+
+    def build_async(self):
+        """Construye el índice en segundo plano (search devuelve None hasta que esté listo)"""
+        thread = threading.Thread(target=self._safe_build, name="SearchIndexBuilder", daemon=True)
+        thread.start()
+        return thread
+
+    def _safe_build(self):
+        try:
+            self.build()
+        except Exception as e:
+            logger.error(f"Error al construir el índice de búsqueda: {e}")
+
+    def subscribe(self):
+        """Se suscribe a las notificaciones que modifican la entidad"""
+        if self._callbacks:
+            return
+        notifications = get_notification_system()
+        # Un único suscriptor para todos los tipos: altas, cambios y bajas se aplican en orden
+        for event_type, arg_name in self._upsert_events.items():
+            callback = self._make_upsert_callback(arg_name)
+            self._callbacks[event_type] = callback
+            notifications.subscribe(event_type, callback, subscriber=self)
+        for event_type, arg_name in self._delete_events.items():
+            callback = self._make_delete_callback(arg_name)
+            self._callbacks[event_type] = callback
+            notifications.subscribe(event_type, callback, subscriber=self)
+
+    def unsubscribe(self):
+        """Cancela las suscripciones a notificaciones"""
+        notifications = get_notification_system()
+        for event_type, callback in self._callbacks.items():
+            notifications.unsubscribe(event_type, callback)
+        self._callbacks.clear()
+
+    def _make_upsert_callback(self, arg_name: str) -> Callable:
+        def upsert(**kwargs):
+            entity = kwargs.get(arg_name)
+            if entity is None and self._fetcher is not None and kwargs.get(self._id_arg) is not None:
+                entity = self._fetcher(kwargs[self._id_arg])
+            if entity is not None:
+                self.add(entity)
+
+        def on_upsert(*args, **kwargs):
+            self._dispatch(upsert, kwargs)
+        return on_upsert
+
+    def _make_delete_callback(self, arg_name: str) -> Callable:
+        def delete(**kwargs):
+            doc_id = kwargs.get(arg_name)
+            if doc_id is not None:
+                self.index.remove(doc_id)
+
+        def on_delete(*args, **kwargs):
+            self._dispatch(delete, kwargs)
+        return on_delete
+
+    def search(self, query: str, limit: Optional[int] = None, after: Any = None, before: Any = None,
+               where: Optional[Callable[[Any], bool]] = None) -> Optional[List[Any]]:
+        """
+        Busca entidades por texto (argumentos como en NGramIndex.search)
+
+        Returns:
+            Lista de entidades, o None si el índice aún no está cargado
+        """
+        if not self.ready.is_set():
+            return None
+        return self.index.search_payloads(query, limit, after, before, where)
+
+    def page_source(self, query: str, where: Optional[Callable[[Any], bool]] = None,
+                    order_key: Optional[Callable[[Any], Any]] = None) -> Tuple[Callable, Callable]:
+        """
+        Fuente de páginas por clave para PagedTreeview.set_source con los resultados de
+        una búsqueda: cada página solo recorre o interseca lo necesario para limit filas
+
+        Con order_key se ordena por otro criterio (desempatando por la clave del índice);
+        ese orden no está precalculado: la primera página ordena todas las coincidencias
+        y las siguientes reutilizan esa lista (búsqueda binaria) mientras el índice no cambie
+
+        Returns:
+            (fetch(after=clave, before=clave, limit=n), key_getter)
+        """
+        sort_key = self._sort_key
+        if order_key is None:
+            def fetch(after=None, before=None, limit=100):
+                return self.search(query, limit, after, before, where) or []
+            return fetch, sort_key
+
+        def key_getter(entity):
+            return order_key(entity), sort_key(entity)
+
+        # Coincidencias ordenadas: (versión del índice, claves, entidades)
+        cached = [None, [], []]
+
+        def ordered():
+            version = self.index.version
+            if cached[0] != version:
+                keyed = [(key_getter(e), e) for e in self.search(query, where=where) or []]
+                keyed.sort(key=_entry_key)
+                cached[:] = [version, [k for k, _ in keyed], [e for _, e in keyed]]
+            return cached[1], cached[2]
+
+        def fetch(after=None, before=None, limit=100):
+            keys, entities = ordered()
+            if before is not None:
+                end = bisect.bisect_left(keys, before)
+                return entities[max(0, end - limit):end]
+            start = 0 if after is None else bisect.bisect_right(keys, after)
+            return entities[start:start + limit]
+        return fetch, key_getter
+
+
+def _participant_text(participant) -> str:
+    return f"{participant.first_name or ''} {participant.last_name or ''} {participant.email or ''} {participant.identifier or ''}"
+
+
+def _event_text(event) -> str:
+    return f"{event.title or ''} {event.location or ''}"
+
+
+def create_participant_index(participant_controller, n: int = 3) -> LiveSearchIndex:
+    """Crea el índice de participantes (nombre, apellidos, email y DNI)"""
+    return LiveSearchIndex(
+        loader=participant_controller.get_all,
+        id_getter=lambda p: p.participant_id,
+        text_getter=_participant_text,
+        sort_key=lambda p: (normalize_text(p.last_name), normalize_text(p.first_name), p.participant_id),
+        upsert_events={'participant_created': 'participant', 'participant_updated': 'participant'},
+        delete_events={'participant_deleted': 'participant_id'},
+        n=n,
+        fetcher=participant_controller.get_by_id,
+        id_arg='participant_id'
+    )
+
+
+def create_event_index(event_controller, n: int = 3) -> LiveSearchIndex:
+    """Crea el índice de eventos (título y ubicación)"""
+    return LiveSearchIndex(
+        loader=event_controller.get_all,
+        id_getter=lambda e: e.event_id,
+        text_getter=_event_text,
+        sort_key=lambda e: (-(e.start_datetime.timestamp()) if e.start_datetime else 0, -(e.event_id or 0)),
+        upsert_events={'event_created': 'event', 'event_updated': 'event'},
+        delete_events={'event_deleted': 'event_id'},
+        n=n,
+        fetcher=event_controller.get_by_id,
+        id_arg='event_id'
+    )
+
+
+# Índices globales compartidos por las vistas
+_indexes: Dict[str, LiveSearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(kind: str, controller) -> LiveSearchIndex:
+    """
+    Obtiene el índice global de 'participants' o 'events', creándolo y
+    cargándolo en segundo plano la primera vez
+    """
+    from config.config import SEARCH_CONFIG
+    with _indexes_lock:
+        index = _indexes.get(kind)
+        if index is None:
+            factories = {'participants': create_participant_index, 'events': create_event_index}
+            if kind not in factories:
+                raise ValueError(f"Tipo de índice inválido: {kind}")
+            index = factories[kind](controller, n=SEARCH_CONFIG.get('ngram_size', 3))
+            _indexes[kind] = index
+            index.build_async()
+        return index
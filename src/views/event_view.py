@@ -3,6 +3,7 @@ Vista de eventos
 Basada en diseno_eventos.html
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
@@ -10,6 +11,11 @@ from src.views.styles import COLORS
 from src.models.event import Event
 from src.utils.validators import Validator
 from src.utils.exporters import CSVExporter, PDFExporter
+from src.utils.search import FullTextSearch
+from src.utils.search_index import get_search_index
+from src.utils.background_loader import get_background_loader
+from src.views.paged_table import OffsetPageSource, PagedTreeview
+from config.config import SEARCH_CONFIG, APP_CONFIG
 
 
 class EventView:
@@ -21,8 +27,22 @@ class EventView:
         self.registration_controller = registration_controller
         self.is_admin = is_admin
         self.current_event = None
+        self._filter_job = None
+        # Las consultas se hacen en segundo plano para no bloquear la interfaz
+        self.loader = get_background_loader(parent)
+        # Índice de búsqueda en memoria (opcional, para puestos kiosko/sin conexión)
+        self.search_index = None
+        if SEARCH_CONFIG.get('local_index') and event_controller:
+            self.search_index = get_search_index('events', event_controller)
         self.create_widgets()
         self.load_events()
+        
+        # Cambios hechos desde otras ventanas o instancias: solo se tocan las filas afectadas
+        self.loader.watch(
+            ['event_created', 'event_updated', 'event_deleted'],
+            self.on_events_changed,
+            widget=self.tree
+        )
     
     def create_widgets(self):
         """Crea los widgets de la vista"""
@@ -103,7 +123,7 @@ class EventView:
         self.search_entry.insert(0, "Buscar por título o ubicación")
         self.search_entry.config(fg=COLORS['text_secondary'])
         self.search_entry.bind('<FocusIn>', lambda e: self.on_search_focus_in())
-        self.search_entry.bind('<KeyRelease>', lambda e: self.filter_events())
+        self.search_entry.bind('<KeyRelease>', lambda e: self.schedule_filter())
         
         self.status_filter = ttk.Combobox(
             filters_frame,
@@ -171,6 +191,24 @@ class EventView:
         
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Carga por páginas al hacer scroll, manteniendo acotadas las filas en memoria
+        self.table = PagedTreeview(
+            self.tree,
+            scrollbar,
+            self.event_to_row,
+            page_size=APP_CONFIG.get('table_page_size', 100),
+            max_rows=APP_CONFIG.get('table_max_rows', 500),
+            loader=self.loader,
+            load_key='events',
+            row_id=lambda event: event.event_id
+        )
+        
+        # Configurar colores de tags
+        self.tree.tag_configure("activo", foreground=COLORS['success_text'])
+        self.tree.tag_configure("finalizado", foreground=COLORS['danger_text'])
+        self.tree.tag_configure("cancelado", foreground=COLORS['danger_text'])
+        self.tree.tag_configure("planificado", foreground=COLORS['badge_text'])
+        
         # Bind doble clic para ver detalles
         self.tree.bind('<Double-1>', lambda e: self.view_selected_event())
         
@@ -226,153 +264,85 @@ class EventView:
         self.btn_delete = btn_delete  # Guardar referencia
     
     def load_events(self):
-        """Carga los eventos en la tabla"""
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Obtener eventos
-        events = self.event_controller.get_all()
-        
-        # Ordenar por fecha inicio
-        events.sort(key=lambda x: x.start_datetime if x.start_datetime else datetime.min, reverse=True)
-        
-        now = datetime.now()
-        
-        for event in events:
-            start_str = event.start_datetime.strftime("%d/%m/%Y %H:%M") if event.start_datetime else ""
-            end_str = event.end_datetime.strftime("%d/%m/%Y %H:%M") if event.end_datetime else ""
-            
-            # Respetar el estado establecido manualmente, o calcular basado en fechas si no está establecido
-            if event.status and event.status.lower() in ['cancelado', 'activo', 'planificado', 'finalizado']:
-                # Si hay un estado explícito, respetarlo
-                status = event.status.lower()
-            elif event.end_datetime and event.end_datetime < now:
-                # Evento finalizado si la fecha de fin ya pasó
-                status = "finalizado"
-            elif event.start_datetime and event.start_datetime <= now <= (event.end_datetime or now):
-                # Evento activo si está en curso
-                status = "activo"
-            elif event.start_datetime and event.start_datetime > now:
-                # Evento planificado si aún no ha comenzado
-                status = "planificado"
-            else:
-                # Por defecto
-                status = event.status.lower() if event.status else "activo"
-            
-            status_display = status.capitalize()
-            
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    event.title,
-                    start_str,
-                    end_str,
-                    event.location or "",
-                    event.capacity,
-                    status_display
-                ),
-                tags=(status,)
-            )
-        
-        # Configurar colores de tags
-        self.tree.tag_configure("activo", foreground=COLORS['success_text'])
-        self.tree.tag_configure("finalizado", foreground=COLORS['danger_text'])
-        self.tree.tag_configure("cancelado", foreground=COLORS['danger_text'])
-        self.tree.tag_configure("planificado", foreground=COLORS['badge_text'])
+        """Carga los eventos en la tabla, por páginas y ordenados por fecha de inicio"""
+        self.table.set_source(self.event_controller.get_page, self.event_controller.page_key)
+    
+    def event_to_row(self, event: Event):
+        """Valores y tags de la fila de la tabla para un evento"""
+        start_str = event.start_datetime.strftime("%d/%m/%Y %H:%M") if event.start_datetime else ""
+        end_str = event.end_datetime.strftime("%d/%m/%Y %H:%M") if event.end_datetime else ""
+        status = event.display_status()
+        values = (
+            event.title,
+            start_str,
+            end_str,
+            event.location or "",
+            event.capacity,
+            status.capitalize()
+        )
+        return values, (status,)
+    
+    def on_events_changed(self, batch):
+        """
+        Aplica a la tabla los cambios notificados: las modificaciones y bajas se aplican
+        fila a fila; un alta puede ir en cualquier posición y se vuelve a cargar la vista
+        (la recarga también es incremental)
+        """
+        if batch.counts.get('event_created'):
+            self.filter_events()
+        else:
+            self.table.refresh_rows(batch.event_ids, self.event_controller.get_by_id)
+    
+    def schedule_filter(self):
+        """Programa el filtrado cuando el usuario deja de escribir (debounce)"""
+        if self._filter_job is not None:
+            self.parent.after_cancel(self._filter_job)
+        self._filter_job = self.parent.after(SEARCH_CONFIG.get('debounce_ms', 250), self.filter_events)
     
     def filter_events(self):
         """Filtra los eventos según los criterios"""
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._filter_job = None
         
-        # Obtener eventos
-        events = self.event_controller.get_all()
+        search_text = self.search_entry.get().strip()
+        if search_text.lower() == "buscar por título o ubicación":
+            search_text = ""
         
-        # Aplicar filtro de búsqueda
-        search_text = self.search_entry.get().lower()
-        if search_text and search_text != "buscar por título o ubicación":
-            events = [e for e in events if 
-                     search_text in (e.title or "").lower() or 
-                     search_text in (e.location or "").lower()]
-        
-        # Aplicar filtro de estado
-        status_filter = self.status_filter.get()
-        if status_filter != "Todos los estados":
-            now = datetime.now()
-            filtered_events = []
-            for event in events:
-                # Calcular estado igual que en load_events
-                if event.status and event.status.lower() in ['cancelado', 'activo', 'planificado', 'finalizado']:
-                    # Si hay un estado explícito, respetarlo
-                    status = event.status.lower()
-                elif event.end_datetime and event.end_datetime < now:
-                    status = "finalizado"
-                elif event.start_datetime and event.start_datetime <= now <= (event.end_datetime or now):
-                    status = "activo"
-                elif event.start_datetime and event.start_datetime > now:
-                    status = "planificado"
-                else:
-                    status = event.status.lower() if event.status else "activo"
-                
-                if status_filter == "Activos" and status == "activo":
-                    filtered_events.append(event)
-                elif status_filter == "Finalizados" and status == "finalizado":
-                    filtered_events.append(event)
-                elif status_filter == "Cancelados" and status == "cancelado":
-                    filtered_events.append(event)
-            
-            events = filtered_events
+        status_map = {
+            "Activos": "activo",
+            "Finalizados": "finalizado",
+            "Cancelados": "cancelado"
+        }
+        status = status_map.get(self.status_filter.get())
         
-        # Ordenar
         sort_option = self.sort_filter.get()
-        if sort_option == "Ordenar por título":
-            events.sort(key=lambda x: (x.title or "").lower())
-        else:
-            events.sort(key=lambda x: x.start_datetime if x.start_datetime else datetime.min, reverse=True)
+        order_by = 'title' if sort_option == "Ordenar por título" else 'start_datetime'
         
-        # Mostrar eventos filtrados
-        now = datetime.now()
-        for event in events:
-            start_str = event.start_datetime.strftime("%d/%m/%Y %H:%M") if event.start_datetime else ""
-            end_str = event.end_datetime.strftime("%d/%m/%Y %H:%M") if event.end_datetime else ""
-            
-            # Calcular estado (igual que en load_events)
-            if event.status and event.status.lower() in ['cancelado', 'activo', 'planificado', 'finalizado']:
-                # Si hay un estado explícito, respetarlo
-                status = event.status.lower()
-            elif event.end_datetime and event.end_datetime < now:
-                status = "finalizado"
-            elif event.start_datetime and event.start_datetime <= now <= (event.end_datetime or now):
-                status = "activo"
-            elif event.start_datetime and event.start_datetime > now:
-                status = "planificado"
-            else:
-                status = event.status.lower() if event.status else "activo"
-            
-            status_display = status.capitalize()
-            
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    event.title,
-                    start_str,
-                    end_str,
-                    event.location or "",
-                    event.capacity,
-                    status_display
-                ),
-                tags=(status,)
-            )
+        # Sin filtros se vuelve a la carga paginada por fecha
+        if not search_text and not status and order_by == 'start_datetime':
+            self.load_events()
+            return
         
-        # Configurar colores de tags
-        self.tree.tag_configure("activo", foreground=COLORS['success_text'])
-        self.tree.tag_configure("finalizado", foreground=COLORS['danger_text'])
-        self.tree.tag_configure("cancelado", foreground=COLORS['danger_text'])
-        self.tree.tag_configure("planificado", foreground=COLORS['badge_text'])
+        # Con el índice en memoria se filtra localmente; si no, búsqueda,
+        # filtro de estado y orden se resuelven en la base de datos, siempre por páginas
+        if self.search_index and self.search_index.ready.is_set():
+            where = (lambda e: e.display_status() == status) if status else None
+            order_key = (lambda e: (e.title or "").lower()) if order_by == 'title' else None
+            fetch, key_getter = self.search_index.page_source(search_text, where, order_key)
+        elif FullTextSearch.boolean_query(search_text) is not None:
+            # Índice FULLTEXT (palabras por prefijo), paginado con LIMIT/OFFSET
+            source = OffsetPageSource(
+                lambda limit, offset: self.event_controller.search(
+                    search_text, mode='boolean', status=status, order_by=order_by,
+                    limit=limit, offset=offset),
+                lambda event: event.event_id
+            )
+            fetch, key_getter = source.fetch, source.key
+        else:
+            # Sin texto o con palabras demasiado cortas para FULLTEXT: subcadena, por clave
+            fetch = functools.partial(self.event_controller.get_page, search_term=search_text,
+                                      status=status, order_by=order_by)
+            key_getter = functools.partial(self.event_controller.page_key, order_by=order_by)
+        self.table.set_source(fetch, key_getter)
     
     def on_search_focus_in(self):
         """Maneja el foco en el campo de búsqueda"""
@@ -387,13 +357,8 @@ class EventView:
             messagebox.showwarning("Advertencia", "Selecciona un evento para ver")
             return
         
-        # Obtener datos del evento seleccionado
-        item = self.tree.item(selection[0])
-        title = item['values'][0]
-        
-        # Buscar el evento completo
-        events = self.event_controller.get_all()
-        event = next((e for e in events if e.title == title), None)
+        # Evento completo asociado a la fila seleccionada
+        event = self.table.get_row(selection[0])
         
         if event:
             self.show_event_details(event)
@@ -405,11 +370,7 @@ class EventView:
             messagebox.showwarning("Advertencia", "Selecciona un evento para editar")
             return
         
-        item = self.tree.item(selection[0])
-        title = item['values'][0]
-        
-        events = self.event_controller.get_all()
-        event = next((e for e in events if e.title == title), None)
+        event = self.table.get_row(selection[0])
         
         if event:
             self.show_event_modal(event)
@@ -421,18 +382,14 @@ class EventView:
             messagebox.showwarning("Advertencia", "Selecciona un evento para eliminar")
             return
         
-        item = self.tree.item(selection[0])
-        title = item['values'][0]
-        
-        events = self.event_controller.get_all()
-        event = next((e for e in events if e.title == title), None)
+        event = self.table.get_row(selection[0])
         
         if event:
             if messagebox.askyesno("Confirmar", f"¿Eliminar el evento '{event.title}'?"):
                 try:
                     if self.event_controller.delete(event.event_id):
                         messagebox.showinfo("Éxito", "Evento eliminado correctamente")
-                        self.load_events()
+                        self.table.remove_row(event.event_id)
                     else:
                         messagebox.showerror("Error", "No se pudo eliminar el evento")
                 except PermissionError as e:
@@ -644,7 +601,7 @@ class EventView:
                     if self.event_controller.update(event):
                         messagebox.showinfo("Éxito", "Evento actualizado correctamente")
                         modal.destroy()
-                        self.load_events()
+                        self.table.refresh_rows([event.event_id], self.event_controller.get_by_id)
                     else:
                         messagebox.showerror(
                             "Error de Concurrencia", 
@@ -762,19 +719,8 @@ class EventView:
         info_frame = tk.Frame(content, bg=COLORS['white'])
         info_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Calcular estado (igual que en load_events)
-        now = datetime.now()
-        if event.status and event.status.lower() in ['cancelado', 'activo', 'planificado', 'finalizado']:
-            # Si hay un estado explícito, respetarlo
-            status = event.status.lower()
-        elif event.end_datetime and event.end_datetime < now:
-            status = "finalizado"
-        elif event.start_datetime and event.start_datetime <= now <= (event.end_datetime or now):
-            status = "activo"
-        elif event.start_datetime and event.start_datetime > now:
-            status = "planificado"
-        else:
-            status = event.status.lower() if event.status else "activo"
+        # Calcular estado (igual que en la tabla)
+        status = event.display_status()
         
         # Asignar colores según el estado
         if status == "cancelado":
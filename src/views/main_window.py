@@ -17,8 +17,10 @@ from src.controllers.event_controller import EventController
 from src.controllers.participant_controller import ParticipantController
 from src.controllers.registration_controller import RegistrationController
 from src.controllers.user_controller import UserController
-from config.config import APP_CONFIG
+from config.config import APP_CONFIG, CONCURRENCY_CONFIG
 from src.views.styles import COLORS
+from src.utils.background_loader import get_background_loader
+from src.utils.change_feed import change_feed_enabled, get_change_feed
 
 # Importar vistas
 try:
@@ -42,7 +44,10 @@ class MainWindow:
         self.is_admin = (user_role == 'admin')  # Flag para verificar si es admin
         self.current_view = None
         self.active_menu_item = None
+        self.active_command = self.show_home  # Vista actual, para redibujarla si cambia la conexión
         self.on_logout = on_logout  # Callback para logout
+        self._db_available = None
+        self._circuit_job = None
         
         # Controladores (solo si hay base de datos)
         if db is not None and hasattr(db, 'pool') and db.pool:  # Verificar que el pool existe
@@ -65,12 +70,22 @@ class MainWindow:
             self.registration_controller = None
             self.user_controller = None
         
+        # Cargas de datos en segundo plano (las vistas no consultan la BD en el hilo de Tk)
+        self.loader = get_background_loader(root)
+        
+        # Cambios hechos desde otras instancias: llegan como notificaciones de los controladores
+        self.change_feed = None
+        if self.event_controller is not None and change_feed_enabled():
+            self.change_feed = get_change_feed(db)
+            self.change_feed.start()
+        
         try:
             print("Configurando ventana...")
             self.setup_window()
             print("Creando widgets...")
             self.create_widgets()
             print("Widgets creados exitosamente")
+            self.watch_database()
         except Exception as e:
             error_msg = f"Error al crear widgets: {e}"
             print(error_msg)
@@ -261,6 +276,27 @@ class MainWindow:
         user_frame = tk.Frame(header, bg=COLORS['primary'])
         user_frame.pack(side=tk.RIGHT, padx=28, pady=14)
         
+        # Indicador de carga en segundo plano
+        self.loading_label = tk.Label(
+            user_frame,
+            text="",
+            font=("Arial", 9),
+            bg=COLORS['primary'],
+            fg="#cbd5e1"
+        )
+        self.loading_label.pack(side=tk.LEFT, padx=(0, 16))
+        self.loader.add_busy_listener(self.on_loading_change)
+        
+        # Indicador de base de datos no disponible (circuito abierto)
+        self.db_status_label = tk.Label(
+            user_frame,
+            text="",
+            font=("Arial", 9, "bold"),
+            bg=COLORS['primary'],
+            fg="#fecaca"
+        )
+        self.db_status_label.pack(side=tk.LEFT, padx=(0, 16))
+        
         user_info = tk.Label(
             user_frame,
             text=f"Usuario: {self.username}",
@@ -284,6 +320,47 @@ class MainWindow:
         )
         btn_logout.pack(side=tk.LEFT)
     
+    def on_loading_change(self, busy: bool):
+        """Muestra u oculta el indicador de carga"""
+        if not self.loading_label.winfo_exists():
+            # La ventana principal ya se destruyó (p. ej. tras cerrar sesión)
+            self.loader.remove_busy_listener(self.on_loading_change)
+            return
+        self.loading_label.config(text="⏳ Cargando..." if busy else "")
+    
+    def is_demo_mode(self) -> bool:
+        """Indica si las vistas deben usar el modo demo (sin base de datos o caída)"""
+        return not self.db or not self.db.is_available()
+    
+    def watch_database(self):
+        """
+        Comprueba periódicamente (en el hilo de Tk, sin bloquear) el estado del circuito
+        de la base de datos; al caer o recuperarse redibuja la vista actual, que pasa
+        al modo demo o vuelve a cargar datos
+        """
+        self._circuit_job = None
+        if not self.db or not hasattr(self.db, 'circuit'):
+            return
+        if not self.db_status_label.winfo_exists():
+            return  # La ventana principal ya se destruyó
+        
+        state = self.db.circuit_state()
+        if state == 'half_open' and not self.loader.is_loading('db_probe'):
+            # Pasado el cooldown, probar la conexión en segundo plano (SELECT 1)
+            self.loader.submit('db_probe', self.db.test_connection, widget=self.db_status_label)
+        
+        available = state == 'closed'
+        if available != self._db_available:
+            first_check = self._db_available is None
+            self._db_available = available
+            self.db_status_label.config(text="" if available else "⚠ Sin conexión - Modo Demo")
+            if not first_check:
+                print("Conexión con la base de datos recuperada" if available
+                      else "Base de datos no disponible: pasando a Modo Demo")
+                self.active_command()
+        
+        self._circuit_job = self.root.after(CONCURRENCY_CONFIG.get('ui_circuit_poll_ms', 1000), self.watch_database)
+    
     def create_sidebar(self, parent):
         """Crea el menú lateral"""
         sidebar = tk.Frame(parent, bg=COLORS['sidebar'], width=220)
@@ -340,12 +417,15 @@ class MainWindow:
         # Activar el botón seleccionado
         button.config(bg=COLORS['primary'], fg="white", font=("Arial", 10, "bold"))
         self.active_menu_item = button
+        self.active_command = command
         
         # Ejecutar comando
         command()
     
     def clear_content(self):
         """Limpia el contenido del panel principal"""
+        # Las cargas de la vista anterior ya no interesan
+        self.loader.cancel_all()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
         self.current_view = None
@@ -383,30 +463,13 @@ class MainWindow:
             cards_frame = tk.Frame(self.content_frame, bg=COLORS['background'])
             cards_frame.pack(fill=tk.X, pady=(0, 24))
             
-            # Obtener datos reales (o datos de ejemplo si no hay BD)
-            try:
-                if self.event_controller:
-                    events = self.event_controller.get_all()
-                    participants = self.participant_controller.get_all()
-                    today_events = [e for e in events if e.start_datetime and e.start_datetime.date() == datetime.now().date()]
-                else:
-                    # Modo demo - datos de ejemplo
-                    events = []
-                    participants = []
-                    today_events = []
-            except Exception as e:
-                print(f"Error al obtener datos: {e}")
-                import traceback
-                traceback.print_exc()
-                events = []
-                participants = []
-                today_events = []
-            
+            # Los datos se cargan en segundo plano; los valores se rellenan al llegar
             stats = [
-                ("Total de eventos", len(events), "Próximos 30 días"),
-                ("Participantes registrados", len(participants), "En todos los eventos"),
-                ("Eventos hoy", len(today_events), "Requieren seguimiento"),
+                ("Total de eventos", "…", "Próximos 30 días"),
+                ("Participantes registrados", "…", "En todos los eventos"),
+                ("Eventos hoy", "…", "Requieren seguimiento"),
             ]
+            card_values = []
             
             for i, (title_text, value, subtitle_text) in enumerate(stats):
                 card = tk.Frame(cards_frame, bg=COLORS['white'], relief=tk.FLAT)
@@ -431,6 +494,7 @@ class MainWindow:
                     fg=COLORS['text_primary']
                 )
                 card_value.pack(anchor=tk.W, padx=18)
+                card_values.append(card_value)
                 
                 card_subtitle = tk.Label(
                     card,
@@ -490,62 +554,32 @@ class MainWindow:
                 )
                 label.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             
-            # Filas de eventos (próximos 7 días)
-            try:
-                from datetime import timedelta
-                next_week = datetime.now() + timedelta(days=7)
-                upcoming_events = [e for e in events if e.start_datetime and e.start_datetime <= next_week][:5]
-            except:
-                upcoming_events = []
+            loading = tk.Label(
+                table_frame,
+                text="Cargando...",
+                font=("Arial", 9),
+                bg=COLORS['white'],
+                fg=COLORS['text_secondary'],
+                padx=6,
+                pady=8
+            )
+            loading.pack(fill=tk.X)
             
-            # Si no hay eventos, mostrar mensaje
-            if not upcoming_events:
-                row_frame = tk.Frame(table_frame, bg=COLORS['white'])
-                row_frame.pack(fill=tk.X)
-                no_data = tk.Label(
-                    row_frame,
-                    text="No hay eventos próximos (Modo Demo - Sin base de datos)",
-                    font=("Arial", 9),
-                    bg=COLORS['white'],
-                    fg=COLORS['text_secondary'],
-                    padx=6,
-                    pady=8
+            def on_error(e):
+                print(f"Error al obtener datos: {e}")
+                self.fill_home(self.empty_home_data(), card_values, table_frame, loading)
+            
+            if self.event_controller and not self.is_demo_mode():
+                self.loader.submit(
+                    'home',
+                    self.load_home_data,
+                    on_success=lambda data: self.fill_home(data, card_values, table_frame, loading),
+                    on_error=on_error,
+                    widget=table_frame
                 )
-                no_data.pack(fill=tk.X)
             else:
-                for i, event in enumerate(upcoming_events):
-                    row_frame = tk.Frame(table_frame, bg=COLORS['white'] if i % 2 == 0 else COLORS['table_row_even'])
-                    row_frame.pack(fill=tk.X)
-                    
-                    # Obtener número de inscritos confirmados (las canceladas no cuentan)
-                    try:
-                        if self.registration_controller:
-                            num_registered = self.registration_controller.count_confirmed_registrations(event.event_id)
-                        else:
-                            num_registered = 0
-                    except:
-                        num_registered = 0
-                    
-                    data = [
-                        event.title[:40],
-                        event.start_datetime.strftime("%d/%m/%Y %H:%M") if event.start_datetime else "",
-                        event.location or "",
-                        str(event.capacity),
-                        str(num_registered)
-                    ]
-                    
-                    for data_item in data:
-                        label = tk.Label(
-                            row_frame,
-                            text=data_item,
-                            font=("Arial", 9),
-                            bg=row_frame.cget('bg'),
-                            fg=COLORS['text_primary'],
-                            padx=6,
-                            pady=8,
-                            anchor=tk.W
-                        )
-                        label.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+                # Modo demo - datos de ejemplo
+                self.fill_home(self.empty_home_data(), card_values, table_frame, loading)
         except Exception as e:
             print(f"Error en show_home: {e}")
             import traceback
@@ -560,12 +594,96 @@ class MainWindow:
             )
             error_label.pack(pady=50)
     
+    @staticmethod
+    def empty_home_data() -> dict:
+        """Datos de la vista de inicio sin base de datos"""
+        return {'events': 0, 'participants': 0, 'today': 0, 'upcoming': [], 'confirmed_counts': {}}
+    
+    def load_home_data(self) -> dict:
+        """Obtiene los datos de la vista de inicio (se ejecuta en segundo plano)"""
+        from datetime import timedelta
+        events = self.event_controller.get_all()
+        participants = self.participant_controller.get_all()
+        today_events = [e for e in events if e.start_datetime and e.start_datetime.date() == datetime.now().date()]
+        
+        # Próximos 7 días
+        next_week = datetime.now() + timedelta(days=7)
+        upcoming_events = [e for e in events if e.start_datetime and e.start_datetime <= next_week][:5]
+        
+        # Obtener número de inscritos confirmados de todos los eventos en una sola consulta
+        # (las canceladas no cuentan)
+        confirmed_counts = {}
+        if upcoming_events and self.registration_controller:
+            confirmed_counts = self.registration_controller.count_confirmed_bulk(
+                [e.event_id for e in upcoming_events]
+            )
+        
+        return {
+            'events': len(events),
+            'participants': len(participants),
+            'today': len(today_events),
+            'upcoming': upcoming_events,
+            'confirmed_counts': confirmed_counts
+        }
+    
+    def fill_home(self, data: dict, card_values, table_frame, loading):
+        """Rellena las estadísticas y la tabla de próximos eventos (hilo de Tk)"""
+        for label, value in zip(card_values, (data['events'], data['participants'], data['today'])):
+            label.config(text=str(value))
+        loading.destroy()
+        
+        upcoming_events = data['upcoming']
+        confirmed_counts = data['confirmed_counts']
+        
+        # Si no hay eventos, mostrar mensaje
+        if not upcoming_events:
+            row_frame = tk.Frame(table_frame, bg=COLORS['white'])
+            row_frame.pack(fill=tk.X)
+            no_data = tk.Label(
+                row_frame,
+                text="No hay eventos próximos (Modo Demo - Sin base de datos)",
+                font=("Arial", 9),
+                bg=COLORS['white'],
+                fg=COLORS['text_secondary'],
+                padx=6,
+                pady=8
+            )
+            no_data.pack(fill=tk.X)
+            return
+        
+        for i, event in enumerate(upcoming_events):
+            row_frame = tk.Frame(table_frame, bg=COLORS['white'] if i % 2 == 0 else COLORS['table_row_even'])
+            row_frame.pack(fill=tk.X)
+            
+            num_registered = confirmed_counts.get(event.event_id, 0)
+            
+            data_items = [
+                event.title[:40],
+                event.start_datetime.strftime("%d/%m/%Y %H:%M") if event.start_datetime else "",
+                event.location or "",
+                str(event.capacity),
+                str(num_registered)
+            ]
+            
+            for data_item in data_items:
+                label = tk.Label(
+                    row_frame,
+                    text=data_item,
+                    font=("Arial", 9),
+                    bg=row_frame.cget('bg'),
+                    fg=COLORS['text_primary'],
+                    padx=6,
+                    pady=8,
+                    anchor=tk.W
+                )
+                label.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    
     def show_events(self):
         """Muestra la vista de eventos"""
         self.clear_content()
         
-        if not self.db:
-            # Modo demo sin base de datos
+        if self.is_demo_mode():
+            # Modo demo sin base de datos (o con el circuito abierto)
             label = tk.Label(
                 self.content_frame,
                 text="Vista de Eventos\n\n(Modo Demo - Sin base de datos)\n\nLa interfaz está disponible pero no se pueden guardar datos.",
@@ -598,8 +716,8 @@ class MainWindow:
         """Muestra la vista de participantes"""
         self.clear_content()
         
-        if not self.db:
-            # Modo demo sin base de datos
+        if self.is_demo_mode():
+            # Modo demo sin base de datos (o con el circuito abierto)
             label = tk.Label(
                 self.content_frame,
                 text="Vista de Participantes\n\n(Modo Demo - Sin base de datos)\n\nLa interfaz está disponible pero no se pueden guardar datos.",
@@ -633,8 +751,8 @@ class MainWindow:
         """Muestra la vista de inscripciones"""
         self.clear_content()
         
-        if not self.db:
-            # Modo demo sin base de datos
+        if self.is_demo_mode():
+            # Modo demo sin base de datos (o con el circuito abierto)
             label = tk.Label(
                 self.content_frame,
                 text="Vista de Inscripciones\n\n(Modo Demo - Sin base de datos)\n\nLa interfaz está disponible pero no se pueden guardar datos.",
@@ -672,8 +790,8 @@ class MainWindow:
         """Muestra la vista de reportes"""
         self.clear_content()
         
-        if not self.db:
-            # Modo demo sin base de datos
+        if self.is_demo_mode():
+            # Modo demo sin base de datos (o con el circuito abierto)
             label = tk.Label(
                 self.content_frame,
                 text="Vista de Reportes\n\n(Modo Demo - Sin base de datos)\n\nLa interfaz está disponible pero no se pueden exportar datos.",
@@ -713,6 +831,14 @@ class MainWindow:
         )
         
         if result:
+            self.loader.cancel_all()
+            self.loader.remove_busy_listener(self.on_loading_change)
+            if self._circuit_job is not None:
+                self.root.after_cancel(self._circuit_job)
+                self._circuit_job = None
+            if self.change_feed is not None:
+                self.change_feed.stop()
+            
             # Cerrar conexión a la base de datos
             if self.db:
                 try:
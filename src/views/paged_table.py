@@ -0,0 +1,413 @@
+"""
+Tabla paginada (Treeview) con carga perezosa al hacer scroll
+Solo mantiene en el Treeview una ventana acotada de filas; el resto se pide por páginas
+y, si se conoce el ID de cada fila, las recargas y los cambios se aplican como diferencias
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+class ListPageSource:
+    """Fuente de páginas sobre una lista ya cargada (por ejemplo, resultados de búsqueda)"""
+
+    def __init__(self, rows: Sequence[Any]):
+        self.rows = list(rows)
+
+    def fetch(self, after: Optional[int] = None, before: Optional[int] = None,
+              limit: int = 100) -> List[Tuple[int, Any]]:
+        """Devuelve pares (índice, fila); el índice hace de clave de paginación"""
+        if before is not None:
+            start = max(0, before - limit)
+            return list(enumerate(self.rows[start:before], start))
+        start = 0 if after is None else after + 1
+        return list(enumerate(self.rows[start:start + limit], start))
+
+
+class OffsetPageSource:
+    """
+    Fuente de páginas por posición (LIMIT/OFFSET) para consultas cuyo orden no sirve de
+    clave, como las búsquedas FULLTEXT. La clave de paginación de una fila es su posición
+    en el resultado, que se anota al leerla.
+    """
+
+    def __init__(self, fetch_page: Callable[[int, int], List[Any]], row_id: Callable[[Any], Any]):
+        """
+        Args:
+            fetch_page: Función (limit, offset) -> filas
+            row_id: Función fila -> ID de la entidad
+        """
+        self.fetch_page = fetch_page
+        self.row_id = row_id
+        self._positions: Dict[Any, int] = {}
+
+    def fetch(self, after: Optional[int] = None, before: Optional[int] = None,
+              limit: int = 100) -> List[Any]:
+        """Devuelve la página anterior a before o posterior a after (posiciones)"""
+        if before is not None:
+            offset = max(0, before - limit)
+            limit = before - offset
+        else:
+            offset = 0 if after is None else after + 1
+        if limit <= 0:
+            return []
+        rows = self.fetch_page(limit, offset)
+        for position, row in enumerate(rows, offset):
+            self._positions[self.row_id(row)] = position
+        return rows
+
+    def key(self, row: Any) -> Optional[int]:
+        """Posición de la fila en el resultado"""
+        return self._positions.get(self.row_id(row))
+
+
+class PagedTreeview:
+    """
+    Envoltorio de ttk.Treeview que pide las filas por páginas al acercarse a los
+    extremos del scroll y descarta las que quedan lejos
+
+    La fuente de datos es una función fetch(after=clave, before=clave, limit=n) que
+    devuelve las filas en el orden de la tabla; key_getter obtiene la clave de
+    paginación de una fila y row_renderer devuelve (values, tags) para insertarla.
+
+    Con row_id (fila -> ID de la entidad) se mantiene un mapa ID -> item: al recargar
+    solo se insertan, mueven, modifican o eliminan los items que cambian, y las filas
+    de una entidad se pueden actualizar o quitar sin recargar (update_row, remove_row,
+    refresh_rows).
+    """
+
+    def __init__(self, tree: ttk.Treeview, scrollbar, row_renderer: Callable[[Any], Tuple[tuple, tuple]],
+                 page_size: int = 100, max_rows: int = 500,
+                 on_page_loaded: Optional[Callable[[List[Any]], None]] = None,
+                 loader=None, load_key: str = 'table',
+                 row_id: Optional[Callable[[Any], Any]] = None):
+        """
+        Args:
+            tree: Treeview donde se muestran las filas
+            scrollbar: Scrollbar vertical asociada al Treeview
+            row_renderer: Función fila -> (values, tags)
+            page_size: Filas por página
+            max_rows: Máximo de filas materializadas en el Treeview
+            on_page_loaded: Callback opcional con las filas de cada página antes de insertarlas;
+                se ejecuta en el mismo hilo que fetch (puede consultar la base de datos)
+            loader: BackgroundLoader opcional; si se indica, las páginas se piden en segundo plano
+            load_key: Clave de las peticiones en el loader (una recarga cancela las anteriores)
+            row_id: Función opcional fila -> ID de la entidad (recargas y cambios por diferencias)
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_renderer = row_renderer
+        self.page_size = page_size
+        self.max_rows = max(max_rows, 2 * page_size)
+        self.on_page_loaded = on_page_loaded
+        self.loader = loader
+        self.load_key = load_key
+        self.row_id = row_id
+        self._on_empty: Optional[Callable[[], None]] = None
+
+        self._fetch: Optional[Callable] = None
+        self._from_list = False
+        self._key_getter: Callable[[Any], Any] = lambda row: row
+        self._rows: Dict[str, Any] = {}
+        self._keys: Dict[str, Any] = {}
+        self._rendered: Dict[str, Tuple[tuple, tuple]] = {}
+        self._items: Dict[Any, str] = {}  # ID de la entidad -> item (solo con row_id)
+        self._pending_ids: Set[Any] = set()
+        self._has_more_after = False
+        self._has_more_before = False
+        self._loading = False
+
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self.scrollbar.config(command=self.tree.yview)
+
+    def set_source(self, fetch: Callable, key_getter: Callable[[Any], Any],
+                   on_empty: Optional[Callable[[], None]] = None):
+        """
+        Cambia la fuente de datos y carga la primera página
+
+        Args:
+            fetch: Función fetch(after=clave, before=clave, limit=n) -> filas
+            key_getter: Función fila -> clave de paginación
+            on_empty: Callback opcional si la primera página llega vacía
+        """
+        self._fetch = fetch
+        self._key_getter = key_getter
+        self._from_list = False
+        self._on_empty = on_empty
+        self.reload()
+
+    def set_rows(self, rows: Sequence[Any]):
+        """Muestra una lista ya cargada, materializando solo una ventana de filas"""
+        source = ListPageSource(rows)
+        self._fetch = source.fetch
+        self._key_getter = lambda pair: pair[0]
+        self._from_list = True
+        self._on_empty = None
+        self.reload()
+
+    def reload(self):
+        """Vuelve a cargar desde el principio (las filas actuales se sustituyen al llegar la primera página)"""
+        if self._fetch is None:
+            self.clear()
+            return
+        self._loading = False
+        self._request({}, self._apply_first_page)
+
+    def clear(self):
+        """Elimina todas las filas"""
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._rows.clear()
+        self._keys.clear()
+        self._rendered.clear()
+        self._items.clear()
+        self._has_more_after = False
+        self._has_more_before = False
+
+    def get_row(self, item_id: str) -> Any:
+        """Devuelve el objeto de datos de un item del Treeview"""
+        return self._rows.get(item_id)
+
+    def selected_rows(self) -> List[Any]:
+        """Objetos de datos de las filas seleccionadas"""
+        return [self.get_row(item) for item in self.tree.selection() if item in self._rows]
+
+    def item_for(self, entity_id: Any) -> Optional[str]:
+        """Item del Treeview que muestra una entidad (None si no está en la ventana)"""
+        return self._items.get(entity_id)
+
+    def update_row(self, data: Any) -> bool:
+        """
+        Sustituye en su sitio los datos de la fila de una entidad (solo se redibuja si
+        cambian sus valores)
+
+        Returns:
+            False si la entidad no está en la ventana
+        """
+        item = self._items.get(self.row_id(data)) if self.row_id else None
+        if item is None:
+            return False
+        self._rows[item] = data
+        self._render(item, data)
+        return True
+
+    def remove_row(self, entity_id: Any) -> bool:
+        """Elimina la fila de una entidad; False si no está en la ventana"""
+        item = self._items.get(entity_id)
+        if item is None:
+            return False
+        self._remove([item])
+        return True
+
+    def rerender(self, entity_ids: Optional[Iterable[Any]] = None):
+        """Vuelve a dibujar las filas de esas entidades (o todas) con sus datos actuales"""
+        items = self._rows if entity_ids is None else [self._items[i] for i in entity_ids if i in self._items]
+        for item in list(items):
+            self._render(item, self._rows[item])
+
+    def refresh_rows(self, entity_ids: Iterable[Any], fetch_one: Callable[[Any], Any]):
+        """
+        Vuelve a leer con fetch_one(id) las entidades de entity_ids que están en la ventana
+        y actualiza o elimina (si ya no existen) solo sus filas
+
+        Si cambia la clave de paginación de alguna, su posición ya no es válida y se recarga.
+        """
+        self._pending_ids.update(i for i in entity_ids if i in self._items)
+        if not self._pending_ids:
+            return
+        # Una petición nueva cancela la anterior, así que se piden todos los pendientes
+        entity_ids = list(self._pending_ids)
+
+        def job():
+            return [(entity_id, fetch_one(entity_id)) for entity_id in entity_ids]
+
+        def done(results):
+            reorder = False
+            for entity_id, data in results:
+                self._pending_ids.discard(entity_id)
+                item = self._items.get(entity_id)
+                if item is None:
+                    continue
+                if data is None:
+                    self._remove([item])
+                    continue
+                if not self._from_list and self._key_getter(data) != self._keys.get(item):
+                    reorder = True
+                self.update_row(data)
+            if reorder:
+                self.reload()
+
+        def failed(error):
+            print(f"Error al actualizar filas: {error}")
+
+        if self.loader is None:
+            try:
+                results = job()
+            except Exception as e:
+                failed(e)
+                return
+            done(results)
+        else:
+            self.loader.submit(f"{self.load_key}.rows", job, on_success=done, on_error=failed, widget=self.tree)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _request(self, fetch_kwargs: Dict[str, Any], apply: Callable[[List[Any]], None]):
+        """Pide una página (en segundo plano si hay loader) y la aplica en el hilo de Tk"""
+        if self._loading:
+            return
+        fetch, from_list, on_page_loaded = self._fetch, self._from_list, self.on_page_loaded
+        limit = self.page_size
+
+        def job():
+            rows = fetch(limit=limit, **fetch_kwargs)
+            if on_page_loaded and rows:
+                on_page_loaded([row[1] for row in rows] if from_list else rows)
+            return rows
+
+        def done(rows):
+            self._loading = False
+            apply(rows)
+
+        def failed(error):
+            self._loading = False
+            print(f"Error al cargar página: {error}")
+
+        self._loading = True
+        if self.loader is None:
+            try:
+                rows = job()
+            except Exception as e:
+                failed(e)
+                return
+            done(rows)
+        else:
+            self.loader.submit(self.load_key, job, on_success=done, on_error=failed, widget=self.tree)
+
+    def _insert(self, row, index):
+        data = row[1] if self._from_list else row
+        rendered = self.row_renderer(data)
+        item_id = self.tree.insert("", index, values=rendered[0], tags=rendered[1])
+        self._rows[item_id] = data
+        self._keys[item_id] = self._key_getter(row)
+        self._rendered[item_id] = rendered
+        if self.row_id:
+            self._items[self.row_id(data)] = item_id
+        return item_id
+
+    def _render(self, item: str, data: Any):
+        """Actualiza los valores de un item solo si han cambiado"""
+        rendered = self.row_renderer(data)
+        if rendered != self._rendered.get(item):
+            self.tree.item(item, values=rendered[0], tags=rendered[1])
+            self._rendered[item] = rendered
+
+    def _remove(self, items):
+        if items:
+            self.tree.delete(*items)
+        for item in items:
+            data = self._rows.pop(item, None)
+            self._keys.pop(item, None)
+            self._rendered.pop(item, None)
+            if self.row_id and data is not None and self._items.get(self.row_id(data)) == item:
+                del self._items[self.row_id(data)]
+
+    def _apply_first_page(self, rows: List[Any]):
+        if self.row_id and self._rows:
+            self._apply_diff(rows)
+        else:
+            self.clear()
+            for row in rows:
+                self._insert(row, tk.END)
+        self._has_more_after = len(rows) >= self.page_size
+        self._has_more_before = False
+        if not rows and self._on_empty:
+            self._on_empty()
+
+    def _apply_diff(self, rows: List[Any]):
+        """
+        Deja en el Treeview exactamente las filas de rows, en su orden, reutilizando los
+        items de las entidades que ya se mostraban: solo hay llamadas a Tk por las filas
+        que se añaden, se eliminan, se mueven o cambian de valores
+        """
+        wanted = []
+        seen = set()
+        for row in rows:
+            data = row[1] if self._from_list else row
+            entity_id = self.row_id(data)
+            if entity_id not in seen:
+                seen.add(entity_id)
+                wanted.append((row, data, entity_id))
+
+        self._remove([item for entity_id, item in self._items.items() if entity_id not in seen])
+        order = list(self.tree.get_children())
+        for index, (row, data, entity_id) in enumerate(wanted):
+            item = self._items.get(entity_id)
+            if item is None:
+                order.insert(index, self._insert(row, index))
+                continue
+            self._rows[item] = data
+            self._keys[item] = self._key_getter(row)
+            self._render(item, data)
+            if index >= len(order) or order[index] != item:
+                self.tree.move(item, "", index)
+                order.remove(item)
+                order.insert(index, item)
+
+    def _load_after(self):
+        """Carga la página siguiente al final de la ventana"""
+        if self._loading or not self._has_more_after:
+            return
+        children = self.tree.get_children()
+        last_key = self._keys.get(children[-1]) if children else None
+        self._request({'after': last_key}, self._apply_after)
+
+    def _apply_after(self, rows: List[Any]):
+        self._has_more_after = len(rows) >= self.page_size
+        for row in rows:
+            self._insert(row, tk.END)
+
+        # Descartar filas del principio si se supera la ventana
+        children = self.tree.get_children()
+        excess = len(children) - self.max_rows
+        if excess > 0:
+            self._remove(children[:excess])
+            self._has_more_before = True
+
+    def _load_before(self):
+        """Carga la página anterior al principio de la ventana"""
+        if self._loading or not self._has_more_before:
+            return
+        children = self.tree.get_children()
+        if not children:
+            return
+        anchor = children[0]
+        self._request({'before': self._keys.get(anchor)}, lambda rows: self._apply_before(rows, anchor))
+
+    def _apply_before(self, rows: List[Any], anchor: str):
+        self._has_more_before = len(rows) >= self.page_size
+        for i, row in enumerate(rows):
+            self._insert(row, i)
+
+        # Descartar filas del final si se supera la ventana
+        children = self.tree.get_children()
+        excess = len(children) - self.max_rows
+        if excess > 0:
+            self._remove(children[-excess:])
+            self._has_more_after = True
+
+        # Mantener visible la fila que estaba arriba
+        if self.tree.exists(anchor):
+            self.tree.see(anchor)
+
+    def _on_scroll(self, first, last):
+        """Actualiza la scrollbar y pide más filas cerca de los extremos"""
+        self.scrollbar.set(first, last)
+        first, last = float(first), float(last)
+        if last >= 0.9 and self._has_more_after:
+            self.tree.after_idle(self._load_after)
+        elif first <= 0.1 and self._has_more_before:
+            self.tree.after_idle(self._load_before)
@@ -3,6 +3,7 @@ Vista de participantes
 Basada en diseno_participantes.html
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
@@ -10,6 +11,11 @@ from src.views.styles import COLORS
 from src.models.participant import Participant
 from src.utils.validators import Validator
 from src.utils.exporters import CSVExporter, PDFExporter
+from src.utils.search import FullTextSearch
+from src.utils.search_index import get_search_index
+from src.utils.background_loader import get_background_loader
+from src.views.paged_table import OffsetPageSource, PagedTreeview
+from config.config import SEARCH_CONFIG, APP_CONFIG
 
 
 class ParticipantView:
@@ -22,8 +28,30 @@ class ParticipantView:
         self.event_controller = event_controller
         self.is_admin = is_admin  # Asignar is_admin ANTES de create_widgets()
         self.current_participant = None
+        self.event_counts = {}
+        self._pending_counts = set()
+        self._filter_job = None
+        # Las consultas se hacen en segundo plano para no bloquear la interfaz
+        self.loader = get_background_loader(parent)
+        # Índice de búsqueda en memoria (opcional, para puestos kiosko/sin conexión)
+        self.search_index = None
+        if SEARCH_CONFIG.get('local_index') and participant_controller:
+            self.search_index = get_search_index('participants', participant_controller)
         self.create_widgets()
         self.load_participants()
+        
+        # Cambios hechos desde otras ventanas o instancias: solo se tocan las filas afectadas
+        if participant_controller:
+            self.loader.watch(
+                ['participant_created', 'participant_updated', 'participant_deleted'],
+                self.on_participants_changed,
+                widget=self.tree
+            )
+            self.loader.watch(
+                ['registration_created', 'registration_status_changed', 'registration_deleted'],
+                lambda batch: self.refresh_event_counts(batch.participant_ids),
+                widget=self.tree
+            )
     
     def create_widgets(self):
         """Crea los widgets de la vista"""
@@ -73,7 +101,7 @@ class ParticipantView:
         self.search_entry.insert(0, "Buscar por nombre, apellidos o email")
         self.search_entry.config(fg=COLORS['text_secondary'])
         self.search_entry.bind('<FocusIn>', lambda e: self.on_search_focus_in())
-        self.search_entry.bind('<KeyRelease>', lambda e: self.filter_participants())
+        self.search_entry.bind('<KeyRelease>', lambda e: self.schedule_filter())
         
         # Tabla de participantes
         self.create_table()
@@ -119,6 +147,19 @@ class ParticipantView:
         
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Carga por páginas al hacer scroll; el número de eventos se pide por página
+        self.table = PagedTreeview(
+            self.tree,
+            scrollbar,
+            self.participant_to_row,
+            page_size=APP_CONFIG.get('table_page_size', 100),
+            max_rows=APP_CONFIG.get('table_max_rows', 500),
+            on_page_loaded=self.load_page_counts,
+            loader=self.loader,
+            load_key='participants',
+            row_id=lambda participant: participant.participant_id
+        )
+        
         # Bind doble clic para ver detalles
         self.tree.bind('<Double-1>', lambda e: self.view_selected_participant())
         
@@ -181,11 +222,7 @@ class ParticipantView:
         btn_inscriptions.pack(side=tk.LEFT, padx=4)
     
     def load_participants(self):
-        """Carga los participantes en la tabla"""
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
+        """Carga los participantes en la tabla, por páginas y ordenados por apellidos"""
         # Verificar que hay controlador
         if not self.participant_controller:
             # Mostrar mensaje de modo demo
@@ -197,51 +234,14 @@ class ParticipantView:
             return
         
         try:
-            # Obtener participantes
-            participants = self.participant_controller.get_all()
-            
-            if not participants:
-                # Mostrar mensaje si no hay participantes
-                messagebox.showinfo(
-                    "Sin datos",
-                    "No hay participantes registrados en la base de datos.\n\n"
-                    "Puedes crear nuevos participantes usando el botón 'Nuevo participante'."
-                )
-                return
-            
-            # Ordenar por apellidos
-            participants.sort(key=lambda x: (x.last_name or "", x.first_name or ""))
+            # El número de eventos se pide solo para los participantes de cada página que se carga
+            self.event_counts = {}
             
-            # Cargar participantes en la tabla
-            for participant in participants:
-                try:
-                    # Obtener número de eventos
-                    if self.registration_controller:
-                        events = self.registration_controller.get_participant_events(participant.participant_id)
-                        num_events = len(events) if events else 0
-                    else:
-                        num_events = 0
-                    
-                    phone_str = str(participant.phone) if participant.phone else ""
-                    
-                    self.tree.insert(
-                        "",
-                        tk.END,
-                        values=(
-                            participant.first_name or "",
-                            participant.last_name or "",
-                            participant.email or "",
-                            phone_str,
-                            participant.identifier or "",
-                            num_events
-                        ),
-                        tags=(participant.participant_id,)
-                    )
-                except Exception as e:
-                    print(f"Error al cargar participante {participant.participant_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+            self.table.set_source(
+                self.participant_controller.get_page,
+                self.participant_controller.page_key,
+                on_empty=self.show_no_participants
+            )
                     
         except Exception as e:
             error_msg = f"Error al cargar participantes: {str(e)}"
@@ -250,46 +250,108 @@ class ParticipantView:
             traceback.print_exc()
             messagebox.showerror("Error", error_msg)
     
+    def show_no_participants(self):
+        """Mensaje cuando no hay participantes en la base de datos"""
+        messagebox.showinfo(
+            "Sin datos",
+            "No hay participantes registrados en la base de datos.\n\n"
+            "Puedes crear nuevos participantes usando el botón 'Nuevo participante'."
+        )
+    
+    def participant_to_row(self, participant: Participant):
+        """Valores y tags de la fila de la tabla para un participante"""
+        phone_str = str(participant.phone) if participant.phone else ""
+        values = (
+            participant.first_name or "",
+            participant.last_name or "",
+            participant.email or "",
+            phone_str,
+            participant.identifier or "",
+            self.event_counts.get(participant.participant_id, 0)
+        )
+        return values, (participant.participant_id,)
+    
+    def load_page_counts(self, participants):
+        """Obtiene el número de eventos de los participantes de una página que aún no se conocen"""
+        missing = [p.participant_id for p in participants if p.participant_id not in self.event_counts]
+        if not missing:
+            return
+        counts = self.get_event_counts(missing)
+        for participant_id in missing:
+            self.event_counts[participant_id] = counts.get(participant_id, 0)
+    
+    def refresh_event_counts(self, participant_ids):
+        """Vuelve a contar los eventos de los participantes mostrados y redibuja solo sus filas"""
+        self._pending_counts.update(pid for pid in participant_ids if self.table.item_for(pid))
+        if not self._pending_counts or not self.registration_controller:
+            return
+        # Una petición nueva cancela la anterior, así que se piden todos los pendientes
+        pending = list(self._pending_counts)
+        
+        def done(counts):
+            for participant_id in pending:
+                self._pending_counts.discard(participant_id)
+                self.event_counts[participant_id] = counts.get(participant_id, 0)
+            self.table.rerender(pending)
+        
+        self.loader.submit(
+            'participants.counts',
+            lambda: self.get_event_counts(pending),
+            on_success=done,
+            widget=self.tree
+        )
+    
+    def on_participants_changed(self, batch):
+        """
+        Aplica a la tabla los cambios notificados: las modificaciones y bajas se aplican
+        fila a fila; un alta puede ir en cualquier posición y se vuelve a cargar la vista
+        (la recarga también es incremental)
+        """
+        if batch.counts.get('participant_created'):
+            self.filter_participants()
+        else:
+            self.table.refresh_rows(batch.participant_ids, self.participant_controller.get_by_id)
+    
+    def schedule_filter(self):
+        """Programa el filtrado cuando el usuario deja de escribir (debounce)"""
+        if self._filter_job is not None:
+            self.parent.after_cancel(self._filter_job)
+        self._filter_job = self.parent.after(SEARCH_CONFIG.get('debounce_ms', 250), self.filter_participants)
+    
     def filter_participants(self):
         """Filtra los participantes según la búsqueda"""
-        search_term = self.search_entry.get().lower()
+        self._filter_job = None
+        search_term = self.search_entry.get().lower().strip()
         
-        if search_term == "buscar por nombre, apellidos o email":
+        if not search_term or search_term == "buscar por nombre, apellidos o email":
             self.load_participants()
             return
         
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Buscar participantes
-        if search_term:
-            participants = self.participant_controller.search(search_term)
+        # Buscar participantes: con el índice en memoria no se consulta MySQL. Siempre
+        # se piden páginas; los conteos se piden por página
+        if self.search_index and self.search_index.ready.is_set():
+            self.table.set_source(*self.search_index.page_source(search_term))
+        elif FullTextSearch.boolean_query(search_term) is not None:
+            # Índice FULLTEXT ordenado por relevancia, paginado con LIMIT/OFFSET
+            source = OffsetPageSource(
+                lambda limit, offset: self.participant_controller.search(
+                    search_term, mode='boolean', limit=limit, offset=offset),
+                lambda participant: participant.participant_id
+            )
+            self.table.set_source(source.fetch, source.key)
         else:
-            participants = self.participant_controller.get_all()
-        
-        participants.sort(key=lambda x: (x.last_name or "", x.first_name or ""))
-        
-        for participant in participants:
-            events = self.registration_controller.get_participant_events(participant.participant_id)
-            num_events = len(events)
-            
-            phone_str = str(participant.phone) if participant.phone else ""
-            
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    participant.first_name or "",
-                    participant.last_name or "",
-                    participant.email or "",
-                    phone_str,
-                    participant.identifier or "",
-                    num_events
-                ),
-                tags=(participant.participant_id,)
+            # Palabras demasiado cortas para FULLTEXT: subcadena, por clave
+            self.table.set_source(
+                functools.partial(self.participant_controller.get_page, search_term=search_term),
+                self.participant_controller.page_key
             )
     
+    def get_event_counts(self, participant_ids=None):
+        """Obtiene el número de eventos por participante (una sola consulta agrupada)"""
+        if not self.registration_controller:
+            return {}
+        return self.registration_controller.count_events_by_participant(participant_ids)
+    
     def on_search_focus_in(self):
         """Maneja el foco en el campo de búsqueda"""
         if self.search_entry.get() == "Buscar por nombre, apellidos o email":
@@ -572,7 +634,7 @@ class ParticipantView:
                 try:
                     if self.participant_controller.delete(participant_id):
                         messagebox.showinfo("Éxito", "Participante eliminado correctamente")
-                        self.load_participants()
+                        self.table.remove_row(participant_id)
                     else:
                         messagebox.showerror("Error", "No se pudo eliminar el participante")
                 except PermissionError as e:
@@ -742,7 +804,7 @@ class ParticipantView:
                     if self.participant_controller.update(participant):
                         messagebox.showinfo("Éxito", "Participante actualizado correctamente")
                         modal.destroy()
-                        self.load_participants()
+                        self.table.refresh_rows([participant.participant_id], self.participant_controller.get_by_id)
                     else:
                         messagebox.showerror("Error", "No se pudo actualizar el participante")
                 except PermissionError as e:
@@ -1001,8 +1063,8 @@ class ParticipantView:
                     if registration_id:
                         messagebox.showinfo("Éxito", f"Participante inscrito correctamente en '{selected_event.title}'")
                         selection_modal.destroy()
-                        # Recargar la vista de participantes para actualizar el número de eventos
-                        self.load_participants()
+                        # Actualizar el número de eventos del participante en la tabla
+                        self.refresh_event_counts([participant_id])
                         # Cerrar y reabrir el modal de detalles para mostrar los nuevos eventos
                         details_modal.destroy()
                         # Reabrir el modal de detalles con los datos actualizados
@@ -8,16 +8,26 @@ from tkinter import ttk, messagebox
 import sys
 import os
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 # Agregar el directorio raíz al path para imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.views.styles import COLORS
+from src.views.virtual_grid import VirtualGrid
+from src.utils.background_loader import get_background_loader
 from src.controllers.registration_controller import RegistrationController
 from src.controllers.event_controller import EventController
 from src.controllers.participant_controller import ParticipantController
 
 
+# Colores (fondo, texto) de cada estado de inscripción
+STATUS_COLORS = {
+    'confirmado': (COLORS['success'], COLORS['success_text']),
+    'cancelado': (COLORS['danger'], COLORS['danger_text']),
+    'pendiente': (COLORS['warning'], COLORS['warning_text'])
+}
+
+
 class RegistrationView:
     """Vista completa de gestión de inscripciones"""
     
@@ -28,15 +38,33 @@ class RegistrationView:
         self.participant_controller = participant_controller
         self.is_admin = is_admin
         self.username = username  # Username del usuario actual
+        # Las consultas se hacen en segundo plano para no bloquear la interfaz
+        self.loader = get_background_loader(parent)
         
         # Buscar el participante asociado al usuario
         self.user_participant = None
+        self.events = []
+        self.participants = []
         if not is_admin and username and participant_controller:
             # Buscar el participante asociado al username usando múltiples estrategias
             self.user_participant = participant_controller.find_by_username(username)
         
         self.create_widgets()
         self.load_data()
+        
+        # Cambios hechos desde otras ventanas o en bloque: un solo refresco por ráfaga
+        self.loader.watch(
+            ['registration_created', 'registration_status_changed', 'registration_deleted'],
+            self.on_registrations_changed,
+            widget=self.registration_grid.container
+        )
+        # Las listas de los filtros solo se recargan cuando cambian eventos o participantes
+        self.loader.watch(
+            ['event_created', 'event_updated', 'event_deleted',
+             'participant_created', 'participant_updated', 'participant_deleted'],
+            self.on_entities_changed,
+            widget=self.registration_grid.container
+        )
     
     def create_widgets(self):
         """Crea los widgets de la interfaz"""
@@ -172,364 +200,245 @@ class RegistrationView:
             self.filter_participant_combo.pack(side=tk.LEFT)
             self.filter_participant_combo.bind('<<ComboboxSelected>>', lambda e: self.apply_filters())
         
-        # Tabla de inscripciones
-        table_container = tk.Frame(self.parent, bg=COLORS['white'], relief=tk.FLAT)
-        table_container.pack(fill=tk.BOTH, expand=True)
-        
-        # Headers (diferentes para admin y usuario normal)
-        headers_frame = tk.Frame(table_container, bg=COLORS['table_header'])
-        headers_frame.pack(fill=tk.X)
-        
+        # Tabla de inscripciones: rejilla virtualizada (solo se crean los widgets de las filas visibles)
+        self.registration_grid = VirtualGrid(
+            self.parent,
+            self.get_grid_columns(),
+            empty_text="No hay inscripciones registradas"
+        )
+    
+    def get_grid_columns(self) -> List[Dict]:
+        """Columnas de la tabla (diferentes para admin y usuario normal)"""
         if self.is_admin:
-            headers = ["Evento", "Participante", "Email", "Teléfono", "Fecha Inscripción", "Estado", "Acciones"]
-            header_widths = [200, 150, 180, 100, 140, 100, 120]
-        else:
-            # Para usuarios normales: columnas más simples (solo ven sus propias inscripciones)
-            headers = ["Evento", "Fecha Inscripción", "Acciones"]
-            header_widths = [400, 200, 150]
-        
-        for header, width in zip(headers, header_widths):
-            label = tk.Label(
-                headers_frame,
-                text=header.upper(),
-                font=("Arial", 9, "bold"),
-                bg=COLORS['table_header'],
-                fg=COLORS['text_secondary'],
-                padx=8,
-                pady=10,
-                anchor=tk.W,
-                width=width // 8
-            )
-            label.pack(side=tk.LEFT, padx=2)
+            return [
+                {'title': "Evento", 'width': 200, 'format': lambda r: r['event_title'][:30]},
+                {'title': "Participante", 'width': 150, 'format': lambda r: r['participant_name'][:25]},
+                {'title': "Email", 'width': 180, 'format': lambda r: (r['email'] or '')[:30]},
+                {'title': "Teléfono", 'width': 100, 'format': lambda r: str(r['phone']) if r.get('phone') else "-"},
+                {'title': "Fecha Inscripción", 'width': 140, 'format': self.format_registered_at},
+                # Estado con combobox para poder modificarlo (admin)
+                {
+                    'title': "Estado",
+                    'width': 120,
+                    'kind': 'status',
+                    'key': 'status',
+                    'values': ['confirmado', 'cancelado', 'pendiente'],
+                    'colors': STATUS_COLORS,
+                    'command': lambda r, new_status: self.change_registration_status(
+                        r['event_id'], r['participant_id'], new_status
+                    )
+                },
+                {
+                    'title': "Acciones",
+                    'width': 120,
+                    'kind': 'button',
+                    'text': "🗑️",
+                    'options': {'font': ("Arial", 10), 'fg': COLORS['danger_text']},
+                    'command': lambda r: self.delete_registration(r['event_id'], r['participant_id'])
+                }
+            ]
         
-        # Scrollable frame para las filas
-        canvas_frame = tk.Frame(table_container, bg=COLORS['white'])
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        # Para usuarios normales: columnas más simples (solo ven sus propias inscripciones)
+        def is_own(r):
+            return bool(self.user_participant) and r['participant_id'] == self.user_participant.participant_id
+        
+        return [
+            {'title': "Evento", 'width': 400, 'format': lambda r: r['event_title'][:50]},
+            {'title': "Fecha Inscripción", 'width': 200, 'format': self.format_registered_at},
+            {'title': "Estado", 'width': 110, 'kind': 'badge', 'key': 'status', 'colors': STATUS_COLORS, 'visible': is_own},
+            # Botón cancelar solo si no está cancelado - cambia estado a cancelado
+            {
+                'title': "Acciones",
+                'width': 170,
+                'kind': 'button',
+                'text': "Cancelar Inscripción",
+                'options': {
+                    'font': ("Arial", 9, "bold"),
+                    'bg': "#dc2626",  # Rojo más intenso
+                    'fg': "white",
+                    'padx': 12,
+                    'activebackground': "#b91c1c"  # Rojo más oscuro al hacer hover
+                },
+                'visible': lambda r: is_own(r) and r.get('status', 'confirmado').lower() != 'cancelado',
+                'command': lambda r: self.change_registration_status(
+                    r['event_id'], r['participant_id'], 'cancelado'
+                )
+            }
+        ]
+    
+    @staticmethod
+    def format_registered_at(registration: Dict) -> str:
+        """Formatea la fecha de inscripción"""
+        registered_at = registration.get('registered_at', '')
+        if not registered_at:
+            return ""
+        if isinstance(registered_at, datetime):
+            return registered_at.strftime("%d/%m/%Y %H:%M")
+        try:
+            return datetime.strptime(str(registered_at), "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
+        except ValueError:
+            return str(registered_at)
+    
+    def load_data(self, keep_position: bool = False):
+        """
+        Carga las listas de los filtros y las inscripciones
         
-        canvas = tk.Canvas(canvas_frame, bg=COLORS['white'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = tk.Frame(canvas, bg=COLORS['white'])
+        Args:
+            keep_position: Mantener la posición del scroll (p. ej. tras modificar una fila)
+        """
+        if not self.registration_controller:
+            self.registration_grid.set_rows([], empty_text="Modo Demo - Sin base de datos")
+            return
+        self.load_filter_lists()
+        self.load_registrations(keep_position=keep_position)
+    
+    def load_filter_lists(self):
+        """Carga los eventos (y participantes, solo admin) de los combos de filtros"""
+        load_participants = self.is_admin and hasattr(self, 'filter_participant_combo')
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        def fetch():
+            events = self.event_controller.get_all() if self.event_controller else []
+            participants = None
+            if load_participants:
+                participants = self.participant_controller.get_all() if self.participant_controller else []
+            return events, participants
+        
+        self.loader.submit(
+            'registration_filters',
+            fetch,
+            on_success=lambda data: self.show_filter_lists(*data),
+            on_error=self.show_load_error,
+            widget=self.registration_grid.container
         )
+    
+    def load_registrations(self, keep_position: bool = False):
+        """
+        Carga solo las inscripciones, ya filtradas en el servidor (una sola consulta)
         
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        Args:
+            keep_position: Mantener la posición del scroll (p. ej. tras modificar una fila)
+        """
+        if not self.registration_controller:
+            return
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Los filtros se traducen a IDs con las listas ya cargadas (se leen en el hilo de Tk)
+        event_id, participant_id = self.get_filter_ids()
         
-        self.table_canvas = canvas
-        self.table_frame = self.scrollable_frame
+        def fetch():
+            rows = self.registration_controller.get_registrations(
+                event_id=event_id,
+                participant_id=participant_id
+            )
+            return [self.row_to_registration(row) for row in rows]
+        
+        if not self.registration_grid.rows:
+            self.registration_grid.set_rows([], empty_text="Cargando inscripciones...")
+        self.loader.submit(
+            'registrations',
+            fetch,
+            on_success=lambda registrations: self.show_data(registrations, keep_position=keep_position),
+            on_error=self.show_load_error,
+            widget=self.registration_grid.container
+        )
     
-    def load_data(self):
-        """Carga los datos de inscripciones"""
-        # Limpiar tabla
-        for widget in self.table_frame.winfo_children():
-            widget.destroy()
-        
+    def show_filter_lists(self, events, participants):
+        """Actualiza los combos de filtros con las listas cargadas en segundo plano (hilo de Tk)"""
+        self.events = events
+        
+        # Actualizar combo de filtros de eventos
+        event_names = ["Todos"] + [e.title for e in self.events]
+        self.filter_event_combo['values'] = event_names
+        
+        # Actualizar combo de filtros de participantes (solo admin)
+        if participants is not None:
+            self.participants = participants
+            participant_names = ["Todos"] + [f"{p.first_name} {p.last_name} ({p.email})" for p in self.participants]
+            self.filter_participant_combo['values'] = participant_names
+    
+    def show_data(self, registrations, keep_position: bool = False):
+        """Muestra las inscripciones cargadas en segundo plano (hilo de Tk)"""
+        # Solo se pintan las filas visibles
+        self.registration_grid.set_rows(
+            registrations,
+            empty_text="No hay inscripciones registradas",
+            keep_position=keep_position
+        )
+    
+    def on_registrations_changed(self, batch):
+        """Recarga las inscripciones tras un lote de cambios, si alguno afecta a los filtros actuales"""
         if not self.registration_controller:
-            no_data_label = tk.Label(
-                self.table_frame,
-                text="Modo Demo - Sin base de datos",
-                font=("Arial", 10),
-                bg=COLORS['white'],
-                fg=COLORS['text_secondary'],
-                pady=20
-            )
-            no_data_label.pack()
             return
-        
-        try:
-            # Obtener todos los eventos para el filtro
-            events = self.event_controller.get_all() if self.event_controller else []
-            event_dict = {e.event_id: e for e in events}
-            
-            # Actualizar combo de filtros de eventos
-            event_names = ["Todos"] + [e.title for e in events]
-            self.filter_event_combo['values'] = event_names
-            
-            # Actualizar combo de filtros de participantes (solo admin)
-            if self.is_admin and hasattr(self, 'filter_participant_combo'):
-                participants = self.participant_controller.get_all() if self.participant_controller else []
-                participant_names = ["Todos"] + [f"{p.first_name} {p.last_name} ({p.email})" for p in participants]
-                self.filter_participant_combo['values'] = participant_names
-            
-            # Obtener todas las inscripciones
-            all_registrations = []
-            for event in events:
-                participants = self.registration_controller.get_event_participants(event.event_id)
-                for participant in participants:
-                    all_registrations.append({
-                        'event_id': event.event_id,
-                        'event_title': event.title,
-                        'participant_id': participant['participant_id'],
-                        'participant_name': f"{participant['first_name']} {participant['last_name']}",
-                        'email': participant['email'],
-                        'phone': participant.get('phone', ''),
-                        'registered_at': participant.get('registered_at', ''),
-                        'status': participant.get('registration_status', 'confirmado')
-                    })
-            
-            # Si es usuario normal, filtrar solo sus inscripciones
-            if not self.is_admin and self.user_participant:
-                all_registrations = [
-                    r for r in all_registrations 
-                    if r['participant_id'] == self.user_participant.participant_id
-                ]
-            
-            # Aplicar filtro
-            filtered = self.filter_registrations(all_registrations)
-            
-            if not filtered:
-                no_data_label = tk.Label(
-                    self.table_frame,
-                    text="No hay inscripciones registradas",
-                    font=("Arial", 10),
-                    bg=COLORS['white'],
-                    fg=COLORS['text_secondary'],
-                    pady=20
-                )
-                no_data_label.pack()
-                return
-            
-            # Mostrar inscripciones
-            for i, reg in enumerate(filtered):
-                self.create_registration_row(reg, i)
-            
-            # Actualizar scroll
-            self.table_canvas.update_idletasks()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al cargar inscripciones:\n{str(e)}")
-            import traceback
-            traceback.print_exc()
+        event_id, participant_id = self.get_filter_ids()
+        if event_id is not None and event_id not in batch.event_ids:
+            return
+        if participant_id is not None and participant_id not in batch.participant_ids:
+            return
+        self.load_registrations(keep_position=True)
     
-    def filter_registrations(self, registrations: List[Dict]) -> List[Dict]:
-        """Filtra las inscripciones según los filtros seleccionados (evento y/o participante)"""
-        filtered = registrations
+    def on_entities_changed(self, batch):
+        """Recarga las listas de los filtros tras cambios en eventos o participantes"""
+        if not self.registration_controller:
+            return
+        self.load_filter_lists()
+        # Las filas muestran títulos y nombres: solo las altas no pueden afectarlas
+        if set(batch.counts) - {'event_created', 'participant_created'}:
+            self.load_registrations(keep_position=True)
+    
+    def show_load_error(self, error: Exception):
+        """Muestra un error de carga"""
+        self.registration_grid.set_rows([], empty_text="No se pudieron cargar las inscripciones")
+        messagebox.showerror("Error", f"Error al cargar inscripciones:\n{str(error)}")
+    
+    @staticmethod
+    def row_to_registration(row: Dict) -> Dict:
+        """Convierte una fila de get_registrations al formato usado por la tabla"""
+        return {
+            'event_id': row['event_id'],
+            'event_title': row['event_title'],
+            'participant_id': row['participant_id'],
+            'participant_name': f"{row['first_name']} {row['last_name']}",
+            'email': row['email'],
+            'phone': row.get('phone', ''),
+            'registered_at': row.get('registered_at', ''),
+            'status': row.get('registration_status', 'confirmado')
+        }
+    
+    def get_filter_ids(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Traduce los filtros seleccionados (evento y/o participante) a IDs
+        para que el filtrado se haga en la base de datos
+        """
+        event_id = None
+        participant_id = None
         
         # Filtro por evento
         event_filter = self.filter_event_var.get()
         if event_filter != "Todos":
-            events = self.event_controller.get_all() if self.event_controller else []
-            selected_event = None
-            for event in events:
+            for event in self.events:
                 if event.title == event_filter:
-                    selected_event = event
+                    event_id = event.event_id
                     break
-            
-            if selected_event:
-                filtered = [r for r in filtered if r['event_id'] == selected_event.event_id]
+        
+        # Si es usuario normal, solo sus inscripciones
+        if not self.is_admin and self.user_participant:
+            participant_id = self.user_participant.participant_id
         
         # Filtro por participante (solo admin)
         if self.is_admin and hasattr(self, 'filter_participant_var'):
             participant_filter = self.filter_participant_var.get()
             if participant_filter != "Todos":
-                # Extraer el nombre del participante del formato "Nombre Apellido (email)"
-                # Buscar la inscripción que coincida con ese participante
-                participants = self.participant_controller.get_all() if self.participant_controller else []
-                selected_participant = None
-                for p in participants:
+                # Buscar el participante con el formato "Nombre Apellido (email)"
+                for p in self.participants:
                     participant_display = f"{p.first_name} {p.last_name} ({p.email})"
                     if participant_display == participant_filter:
-                        selected_participant = p
+                        participant_id = p.participant_id
                         break
-                
-                if selected_participant:
-                    filtered = [r for r in filtered if r['participant_id'] == selected_participant.participant_id]
         
-        return filtered
+        return event_id, participant_id
     
     def apply_filters(self):
         """Aplica los filtros y recarga la tabla"""
-        self.load_data()
-    
-    def create_registration_row(self, registration: Dict, index: int):
-        """Crea una fila en la tabla de inscripciones"""
-        row_frame = tk.Frame(
-            self.table_frame,
-            bg=COLORS['white'] if index % 2 == 0 else COLORS['table_row_even']
-        )
-        row_frame.pack(fill=tk.X)
-        
-        # Formatear fecha
-        registered_at = registration.get('registered_at', '')
-        if registered_at:
-            if isinstance(registered_at, datetime):
-                date_str = registered_at.strftime("%d/%m/%Y %H:%M")
-            else:
-                try:
-                    date_str = datetime.strptime(str(registered_at), "%Y-%m-%d %H:%M:%S").strftime("%d/%m/%Y %H:%M")
-                except:
-                    date_str = str(registered_at)
-        else:
-            date_str = ""
-        
-        # Formatear teléfono
-        phone = registration.get('phone', '')
-        phone_str = str(phone) if phone else "-"
-        
-        # Datos según tipo de usuario
-        if self.is_admin:
-            # Estado con color (solo para admin)
-            status = registration.get('status', 'confirmado')
-            status_bg = COLORS['success'] if status == 'confirmado' else COLORS['warning']
-            status_text_color = COLORS['success_text'] if status == 'confirmado' else COLORS['warning_text']
-            
-            data = [
-                registration['event_title'][:30],
-                registration['participant_name'][:25],
-                registration['email'][:30],
-                phone_str,
-                date_str,
-                status
-            ]
-            
-            widths = [200, 150, 180, 100, 140, 100]
-            
-            for data_item, width in zip(data, widths):
-                if data_item == status:
-                    # Estado con combobox para poder modificarlo (admin)
-                    # Mapeo de estados a colores
-                    status_colors = {
-                        'confirmado': (COLORS['success'], COLORS['success_text']),
-                        'cancelado': (COLORS['danger'], COLORS['danger_text']),
-                        'pendiente': (COLORS['warning'], COLORS['warning_text'])
-                    }
-                    
-                    current_bg, current_fg = status_colors.get(status.lower(), (COLORS['text_secondary'], COLORS['white']))
-                    
-                    # Frame con color de fondo según el estado (más visible)
-                    status_frame = tk.Frame(row_frame, bg=current_bg, relief=tk.SOLID, borderwidth=1)
-                    status_frame.pack(side=tk.LEFT, padx=2, fill=tk.Y)
-                    
-                    status_var = tk.StringVar(value=status.capitalize())
-                    
-                    # Crear combobox dentro del frame con color
-                    status_combo = ttk.Combobox(
-                        status_frame,
-                        textvariable=status_var,
-                        values=['Confirmado', 'Cancelado', 'Pendiente'],
-                        state='readonly',
-                        font=("Arial", 8, "bold"),
-                        width=12
-                    )
-                    status_combo.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-                    
-                    # Callback para cambiar estado y actualizar color del frame
-                    def on_status_change(e, event_id=registration['event_id'], 
-                                       participant_id=registration['participant_id'],
-                                       var=status_var,
-                                       frame=status_frame):
-                        new_status = var.get().lower()
-                        if self.change_registration_status(event_id, participant_id, new_status):
-                            # Actualizar color del frame
-                            new_bg, new_fg = status_colors.get(new_status, (COLORS['text_secondary'], COLORS['white']))
-                            frame.config(bg=new_bg)
-                    
-                    status_combo.bind('<<ComboboxSelected>>', on_status_change)
-                else:
-                    label = tk.Label(
-                        row_frame,
-                        text=str(data_item),
-                        font=("Arial", 9),
-                        bg=row_frame.cget('bg'),
-                        fg=COLORS['text_primary'],
-                        padx=8,
-                        pady=8,
-                        anchor=tk.W,
-                        width=width // 8
-                    )
-                    label.pack(side=tk.LEFT, padx=2)
-            
-            # Botón eliminar (admin)
-            btn_delete = tk.Button(
-                row_frame,
-                text="🗑️",
-                font=("Arial", 10),
-                bg=row_frame.cget('bg'),
-                fg=COLORS['danger_text'],
-                relief=tk.FLAT,
-                cursor="hand2",
-                command=lambda: self.delete_registration(
-                    registration['event_id'],
-                    registration['participant_id']
-                )
-            )
-            btn_delete.pack(side=tk.LEFT, padx=4)
-        else:
-            # Para usuarios normales: solo evento y fecha
-            data = [
-                registration['event_title'][:50],
-                date_str
-            ]
-            
-            widths = [400, 200]
-            
-            for data_item, width in zip(data, widths):
-                label = tk.Label(
-                    row_frame,
-                    text=str(data_item),
-                    font=("Arial", 9),
-                    bg=row_frame.cget('bg'),
-                    fg=COLORS['text_primary'],
-                    padx=8,
-                    pady=8,
-                    anchor=tk.W,
-                    width=width // 8
-                )
-                label.pack(side=tk.LEFT, padx=2)
-            
-            # Botón cancelar y estado (usuario normal) - cambia estado a cancelado
-            if self.user_participant and registration['participant_id'] == self.user_participant.participant_id:
-                current_status = registration.get('status', 'confirmado').lower()
-                
-                # Mapeo de estados a colores
-                status_colors = {
-                    'confirmado': (COLORS['success'], COLORS['success_text']),
-                    'cancelado': (COLORS['danger'], COLORS['danger_text']),
-                    'pendiente': (COLORS['warning'], COLORS['warning_text'])
-                }
-                
-                status_bg, status_fg = status_colors.get(current_status, (COLORS['text_secondary'], COLORS['white']))
-                
-                # Mostrar estado
-                status_label = tk.Label(
-                    row_frame,
-                    text=current_status.upper(),
-                    font=("Arial", 8, "bold"),
-                    bg=status_bg,
-                    fg=status_fg,
-                    padx=8,
-                    pady=6,
-                    relief=tk.SOLID,
-                    borderwidth=1
-                )
-                status_label.pack(side=tk.LEFT, padx=(8, 4))
-                
-                # Botón cancelar solo si no está cancelado
-                if current_status != 'cancelado':
-                    btn_cancel = tk.Button(
-                        row_frame,
-                        text="Cancelar Inscripción",
-                        font=("Arial", 9, "bold"),
-                        bg="#dc2626",  # Rojo más intenso
-                        fg="white",
-                        relief=tk.FLAT,
-                        cursor="hand2",
-                        padx=12,
-                        pady=6,
-                        activebackground="#b91c1c",  # Rojo más oscuro al hacer hover
-                        command=lambda: self.change_registration_status(
-                            registration['event_id'],
-                            registration['participant_id'],
-                            'cancelado'
-                        )
-                    )
-                    btn_cancel.pack(side=tk.LEFT, padx=4)
+        self.load_registrations()
     
     def show_new_registration_modal(self):
         """Muestra el modal para crear una nueva inscripción"""
@@ -664,7 +573,7 @@ class RegistrationView:
             if registration_id:
                 messagebox.showinfo("Éxito", "Inscripción creada correctamente")
                 modal.destroy()
-                self.load_data()
+                self.load_registrations()
             else:
                 messagebox.showerror(
                     "Error",
@@ -808,7 +717,7 @@ class RegistrationView:
             if registration_id:
                 messagebox.showinfo("Éxito", f"Te has inscrito correctamente en '{selected_event.title}'")
                 modal.destroy()
-                self.load_data()
+                self.load_registrations()
             else:
                 messagebox.showerror(
                     "Error",
@@ -878,7 +787,7 @@ class RegistrationView:
                 }
                 message = f"Inscripción {status_messages.get(new_status, 'actualizada')} correctamente"
                 messagebox.showinfo("Éxito", message)
-                self.load_data()
+                self.load_registrations(keep_position=True)
                 return True
             else:
                 messagebox.showerror("Error", "No se pudo cambiar el estado de la inscripción")
@@ -911,7 +820,7 @@ class RegistrationView:
             success = self.registration_controller.unregister_participant(event_id, participant_id)
             if success:
                 messagebox.showinfo("Éxito", "Inscripción eliminada correctamente")
-                self.load_data()
+                self.load_registrations(keep_position=True)
             else:
                 messagebox.showerror("Error", "No se pudo eliminar la inscripción")
 
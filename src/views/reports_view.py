@@ -15,6 +15,7 @@ from typing import List, Dict
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.views.styles import COLORS
 from src.utils.exporters import CSVExporter, PDFExporter
+from src.utils.background_loader import get_background_loader
 from src.controllers.event_controller import EventController
 from src.controllers.participant_controller import ParticipantController
 from src.controllers.registration_controller import RegistrationController
@@ -28,6 +29,8 @@ class ReportsView:
         self.event_controller = event_controller
         self.participant_controller = participant_controller
         self.registration_controller = registration_controller
+        # Las consultas se hacen en segundo plano para no bloquear la interfaz
+        self.loader = get_background_loader(parent)
         
         self.create_widgets()
     
@@ -152,14 +155,30 @@ class ReportsView:
             )
             btn.pack(side=tk.LEFT, padx=(0, 8))
     
+    def load_and_export(self, fetch, export, what: str):
+        """
+        Obtiene los datos en segundo plano y exporta en el hilo de Tk
+        (los diálogos de guardado y los mensajes son de Tk)
+        """
+        self.loader.submit(
+            f"reports.{what}.{getattr(export, '__name__', 'export')}",
+            fetch,
+            on_success=export,
+            on_error=lambda e: messagebox.showerror("Error", f"Error al exportar {what}:\n{str(e)}"),
+            widget=self.parent
+        )
+    
     def export_events_csv(self):
         """Exporta eventos a CSV"""
         if not self.event_controller:
             messagebox.showwarning("Advertencia", "Modo Demo - No se pueden exportar datos")
             return
         
+        self.load_and_export(self.event_controller.get_all, self._export_events_csv, "eventos")
+    
+    def _export_events_csv(self, events):
+        """Exporta los datos ya cargados (hilo de Tk)"""
         try:
-            events = self.event_controller.get_all()
             if not events:
                 messagebox.showinfo("Información", "No hay eventos para exportar")
                 return
@@ -213,8 +232,11 @@ class ReportsView:
             messagebox.showwarning("Advertencia", "Modo Demo - No se pueden exportar datos")
             return
         
+        self.load_and_export(self.event_controller.get_all, self._export_events_pdf, "eventos")
+    
+    def _export_events_pdf(self, events):
+        """Exporta los datos ya cargados (hilo de Tk)"""
         try:
-            events = self.event_controller.get_all()
             if not events:
                 messagebox.showinfo("Información", "No hay eventos para exportar")
                 return
@@ -268,8 +290,11 @@ class ReportsView:
             messagebox.showwarning("Advertencia", "Modo Demo - No se pueden exportar datos")
             return
         
+        self.load_and_export(self.participant_controller.get_all, self._export_participants_csv, "participantes")
+    
+    def _export_participants_csv(self, participants):
+        """Exporta los datos ya cargados (hilo de Tk)"""
         try:
-            participants = self.participant_controller.get_all()
             if not participants:
                 messagebox.showinfo("Información", "No hay participantes para exportar")
                 return
@@ -321,8 +346,11 @@ class ReportsView:
             messagebox.showwarning("Advertencia", "Modo Demo - No se pueden exportar datos")
             return
         
+        self.load_and_export(self.participant_controller.get_all, self._export_participants_pdf, "participantes")
+    
+    def _export_participants_pdf(self, participants):
+        """Exporta los datos ya cargados (hilo de Tk)"""
         try:
-            participants = self.participant_controller.get_all()
             if not participants:
                 messagebox.showinfo("Información", "No hay participantes para exportar")
                 return
@@ -368,31 +396,42 @@ class ReportsView:
             import traceback
             traceback.print_exc()
     
+    def get_registration_rows(self, include_names: bool = False) -> List[Dict]:
+        """
+        Obtiene todas las inscripciones con una sola consulta y las convierte
+        al formato de columnas usado en las exportaciones
+        """
+        rows = []
+        for registration in self.registration_controller.get_registrations():
+            row = {
+                'ID Evento': registration['event_id'],
+                'Evento': registration['event_title'],
+                'ID Participante': registration['participant_id'],
+                'Participante': f"{registration['first_name']} {registration['last_name']}",
+            }
+            if include_names:
+                row['first_name'] = registration.get('first_name', '')
+                row['last_name'] = registration.get('last_name', '')
+            row.update({
+                'Email': registration.get('email', ''),
+                'Teléfono': registration.get('phone', '') or '',
+                'Fecha Inscripción': registration.get('registered_at', ''),
+                'Estado': registration.get('registration_status', 'confirmado')
+            })
+            rows.append(row)
+        return rows
+    
     def export_registrations_csv(self):
         """Exporta inscripciones a CSV"""
         if not self.registration_controller or not self.event_controller:
             messagebox.showwarning("Advertencia", "Modo Demo - No se pueden exportar datos")
             return
         
+        self.load_and_export(self.get_registration_rows, self._export_registrations_csv, "inscripciones")
+    
+    def _export_registrations_csv(self, all_registrations):
+        """Exporta los datos ya cargados (hilo de Tk)"""
         try:
-            # Obtener todas las inscripciones
-            all_registrations = []
-            events = self.event_controller.get_all() if self.event_controller else []
-            
-            for event in events:
-                participants = self.registration_controller.get_event_participants(event.event_id)
-                for participant in participants:
-                    all_registrations.append({
-                        'ID Evento': event.event_id,
-                        'Evento': event.title,
-                        'ID Participante': participant['participant_id'],
-                        'Participante': f"{participant['first_name']} {participant['last_name']}",
-                        'Email': participant['email'],
-                        'Teléfono': participant.get('phone', '') or '',
-                        'Fecha Inscripción': participant.get('registered_at', ''),
-                        'Estado': participant.get('registration_status', 'confirmado')
-                    })
-            
             if not all_registrations:
                 messagebox.showinfo("Información", "No hay inscripciones para exportar")
                 return
@@ -450,25 +489,11 @@ class ReportsView:
             messagebox.showwarning("Advertencia", "Modo Demo - No se pueden exportar datos")
             return
         
+        self.load_and_export(self.get_registration_rows, self._export_registrations_pdf, "inscripciones")
+    
+    def _export_registrations_pdf(self, all_registrations):
+        """Exporta los datos ya cargados (hilo de Tk)"""
         try:
-            # Obtener todas las inscripciones
-            all_registrations = []
-            events = self.event_controller.get_all() if self.event_controller else []
-            
-            for event in events:
-                participants = self.registration_controller.get_event_participants(event.event_id)
-                for participant in participants:
-                    all_registrations.append({
-                        'ID Evento': event.event_id,
-                        'Evento': event.title,
-                        'ID Participante': participant['participant_id'],
-                        'Participante': f"{participant['first_name']} {participant['last_name']}",
-                        'Email': participant['email'],
-                        'Teléfono': participant.get('phone', '') or '',
-                        'Fecha Inscripción': participant.get('registered_at', ''),
-                        'Estado': participant.get('registration_status', 'confirmado')
-                    })
-            
             if not all_registrations:
                 messagebox.showinfo("Información", "No hay inscripciones para exportar")
                 return
@@ -508,11 +533,17 @@ class ReportsView:
             messagebox.showwarning("Advertencia", "Modo Demo - No se pueden exportar datos")
             return
         
-        try:
+        def fetch():
             # Obtener todos los datos
             events = self.event_controller.get_all() if self.event_controller else []
             participants = self.participant_controller.get_all() if self.participant_controller else []
-            
+            return events, participants, self.get_registration_rows(include_names=True)
+        
+        self.load_and_export(fetch, lambda data: self._export_full_report(*data), "reporte completo")
+    
+    def _export_full_report(self, events, participants, all_registrations):
+        """Exporta el reporte completo con los datos ya cargados (hilo de Tk)"""
+        try:
             # Convertir eventos a diccionarios
             events_data = []
             for event in events:
@@ -541,24 +572,6 @@ class ReportsView:
                     'identifier': participant.identifier
                 })
             
-            # Obtener todas las inscripciones
-            all_registrations = []
-            for event in events:
-                event_participants = self.registration_controller.get_event_participants(event.event_id)
-                for participant in event_participants:
-                    all_registrations.append({
-                        'ID Evento': event.event_id,
-                        'Evento': event.title,
-                        'ID Participante': participant['participant_id'],
-                        'Participante': f"{participant['first_name']} {participant['last_name']}",
-                        'first_name': participant.get('first_name', ''),
-                        'last_name': participant.get('last_name', ''),
-                        'Email': participant.get('email', ''),
-                        'Teléfono': participant.get('phone', '') or '',
-                        'Fecha Inscripción': participant.get('registered_at', ''),
-                        'Estado': participant.get('registration_status', 'confirmado')
-                    })
-            
             # Exportar usando PDFExporter
             filepath = PDFExporter.export_full_report(events_data, participants_data, all_registrations)
             
@@ -0,0 +1,283 @@
+"""
+Rejilla virtualizada sobre un Canvas
+Solo dibuja las filas visibles y reutiliza un conjunto fijo de widgets de fila,
+de modo que el número de widgets Tk no depende del número de registros
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.views.styles import COLORS
+
+
+class _PooledRow:
+    """Widgets de una fila reutilizable; se rellenan con el registro que toque mostrar"""
+
+    def __init__(self, grid: 'VirtualGrid'):
+        self.grid = grid
+        self.index: Optional[int] = None
+        self.frame = tk.Frame(grid.canvas, height=grid.row_height, bg=COLORS['white'])
+        self.frame.pack_propagate(False)
+        self.cells: List[Dict[str, Any]] = []
+
+        for column in grid.columns:
+            cell_frame = tk.Frame(self.frame, width=column['width'], height=grid.row_height, bg=COLORS['white'])
+            cell_frame.pack_propagate(False)
+            cell_frame.pack(side=tk.LEFT, padx=2)
+            cell = {'column': column, 'frame': cell_frame}
+            kind = column.get('kind', 'text')
+
+            if kind == 'status':
+                # Editor de estado en línea (Combobox dentro de un marco coloreado)
+                holder = tk.Frame(cell_frame, relief=tk.SOLID, borderwidth=1)
+                var = tk.StringVar()
+                combo = ttk.Combobox(
+                    holder,
+                    textvariable=var,
+                    values=[v.capitalize() for v in column.get('values', [])],
+                    state='readonly',
+                    font=("Arial", 8, "bold"),
+                    width=12
+                )
+                combo.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+                combo.bind('<<ComboboxSelected>>', lambda e, c=cell: self._on_status_selected(c))
+                cell.update(holder=holder, var=var, combo=combo, widget=holder,
+                            pack={'fill': tk.X, 'expand': True, 'pady': 3})
+            elif kind == 'badge':
+                label = tk.Label(
+                    cell_frame,
+                    font=("Arial", 8, "bold"),
+                    padx=8,
+                    relief=tk.SOLID,
+                    borderwidth=1
+                )
+                cell.update(widget=label, pack={'side': tk.LEFT, 'pady': 4})
+            elif kind == 'button':
+                button = tk.Button(
+                    cell_frame,
+                    text=column.get('text', ''),
+                    cursor="hand2",
+                    relief=tk.FLAT,
+                    command=lambda c=cell: self._on_button(c),
+                    **column.get('options', {})
+                )
+                cell.update(widget=button, pack={'side': tk.LEFT, 'pady': 2})
+            else:
+                label = tk.Label(
+                    cell_frame,
+                    font=("Arial", 9),
+                    fg=COLORS['text_primary'],
+                    padx=8,
+                    anchor=tk.W
+                )
+                cell.update(widget=label, pack={'fill': tk.BOTH, 'expand': True})
+
+            cell['widget'].pack(**cell['pack'])
+            self.cells.append(cell)
+
+        self.window = grid.canvas.create_window(0, 0, window=self.frame, anchor="nw", state='hidden')
+        grid.bind_scroll(self.frame)
+        for cell in self.cells:
+            grid.bind_scroll(cell['frame'])
+            grid.bind_scroll(cell['widget'])
+            if 'combo' in cell:
+                grid.bind_scroll(cell['combo'])
+
+    def show(self, index: int, row: Any, y: int, width: int):
+        """Rellena la fila con el registro index y la coloca en la posición y"""
+        bg = COLORS['white'] if index % 2 == 0 else COLORS['table_row_even']
+        self.frame.config(bg=bg)
+        self.index = index
+
+        for cell in self.cells:
+            column = cell['column']
+            kind = column.get('kind', 'text')
+            value = self.grid.cell_value(column, row)
+            visible = column.get('visible')
+            shown = visible(row) if visible else True
+
+            cell['frame'].config(bg=bg)
+            if kind == 'status':
+                status = str(value).lower()
+                cell['var'].set(status.capitalize())
+                cell['holder'].config(bg=self.grid.status_colors(column, status)[0])
+            elif kind == 'badge':
+                status = str(value).lower()
+                status_bg, status_fg = self.grid.status_colors(column, status)
+                cell['widget'].config(text=status.upper(), bg=status_bg, fg=status_fg)
+            elif kind == 'button':
+                if not column.get('options', {}).get('bg'):
+                    cell['widget'].config(bg=bg)
+            else:
+                cell['widget'].config(text=str(value), bg=bg)
+
+            # Mostrar u ocultar el widget según el predicado de la columna
+            if shown and not cell['widget'].winfo_manager():
+                cell['widget'].pack(**cell['pack'])
+            elif not shown and cell['widget'].winfo_manager():
+                cell['widget'].pack_forget()
+
+        self.grid.canvas.coords(self.window, 0, y)
+        self.grid.canvas.itemconfigure(self.window, width=width, state='normal')
+
+    def hide(self):
+        self.index = None
+        self.grid.canvas.itemconfigure(self.window, state='hidden')
+
+    def _on_status_selected(self, cell):
+        if self.index is None:
+            return
+        command = cell['column'].get('command')
+        row = self.grid.rows[self.index]
+        if command and not command(row, cell['var'].get().lower()):
+            # Si el cambio no se aplicó, volver a mostrar el valor del registro
+            self.grid.refresh()
+
+    def _on_button(self, cell):
+        if self.index is None:
+            return
+        command = cell['column'].get('command')
+        if command:
+            command(self.grid.rows[self.index])
+
+
+class VirtualGrid:
+    """
+    Tabla de registros con cabecera, scroll vertical y filas virtualizadas
+
+    Cada columna es un diccionario con:
+        title: Texto de la cabecera
+        width: Ancho en píxeles
+        key / format: Campo del registro o función registro -> texto
+        kind: 'text' (por defecto), 'status' (Combobox editable), 'badge' o 'button'
+        values, colors: Estados posibles y colores (fondo, texto) por estado ('status'/'badge')
+        command: Para 'status' recibe (registro, nuevo_estado) y devuelve si se aplicó;
+                 para 'button' recibe el registro
+        visible: Función registro -> bool para ocultar el widget en algunas filas
+    """
+
+    def __init__(self, parent, columns: Sequence[Dict[str, Any]], row_height: int = 34,
+                 empty_text: str = "No hay datos"):
+        self.columns = list(columns)
+        self.row_height = row_height
+        self.empty_text = empty_text
+        self.rows: Sequence[Any] = []
+        self.top = 0
+        self._pool: List[_PooledRow] = []
+
+        self.container = tk.Frame(parent, bg=COLORS['white'], relief=tk.FLAT)
+        self.container.pack(fill=tk.BOTH, expand=True)
+
+        # Cabecera
+        headers_frame = tk.Frame(self.container, bg=COLORS['table_header'])
+        headers_frame.pack(fill=tk.X)
+        for column in self.columns:
+            cell = tk.Frame(headers_frame, width=column['width'], height=36, bg=COLORS['table_header'])
+            cell.pack_propagate(False)
+            cell.pack(side=tk.LEFT, padx=2)
+            tk.Label(
+                cell,
+                text=column['title'].upper(),
+                font=("Arial", 9, "bold"),
+                bg=COLORS['table_header'],
+                fg=COLORS['text_secondary'],
+                padx=8,
+                anchor=tk.W
+            ).pack(fill=tk.BOTH, expand=True)
+
+        # Cuerpo: Canvas con las filas del pool y scrollbar manual
+        body = tk.Frame(self.container, bg=COLORS['white'])
+        body.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(body, bg=COLORS['white'], highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.yview)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self._empty_item = self.canvas.create_text(
+            20, 20,
+            text="",
+            anchor="nw",
+            font=("Arial", 10),
+            fill=COLORS['text_secondary']
+        )
+
+        self.canvas.bind('<Configure>', lambda e: self.refresh())
+        self.bind_scroll(self.canvas)
+
+    def bind_scroll(self, widget):
+        """Asocia la rueda del ratón de un widget al scroll de la rejilla"""
+        widget.bind('<MouseWheel>', self._on_mousewheel)
+        widget.bind('<Button-4>', lambda e: self._on_mousewheel(e, -3))
+        widget.bind('<Button-5>', lambda e: self._on_mousewheel(e, 3))
+
+    def set_rows(self, rows: Sequence[Any], empty_text: Optional[str] = None,
+                 keep_position: bool = False):
+        """Sustituye los registros mostrados; salvo keep_position, vuelve al principio"""
+        self.rows = rows
+        if not keep_position:
+            self.top = 0
+        if empty_text is not None:
+            self.empty_text = empty_text
+        self.refresh()
+
+    def cell_value(self, column: Dict[str, Any], row: Any) -> Any:
+        formatter = column.get('format')
+        if formatter:
+            return formatter(row)
+        key = column.get('key')
+        return row.get(key, '') if key else ''
+
+    @staticmethod
+    def status_colors(column: Dict[str, Any], status: str):
+        return column.get('colors', {}).get(status, (COLORS['text_secondary'], COLORS['white']))
+
+    def visible_count(self) -> int:
+        height = max(self.canvas.winfo_height(), self.row_height)
+        return height // self.row_height + 1
+
+    def refresh(self):
+        """Vuelve a pintar las filas visibles"""
+        count = self.visible_count()
+        while len(self._pool) < count:
+            self._pool.append(_PooledRow(self))
+
+        total = len(self.rows)
+        self.top = max(0, min(self.top, total - (count - 1)))
+        width = self.canvas.winfo_width()
+
+        for i, pooled in enumerate(self._pool):
+            index = self.top + i
+            if i < count and index < total:
+                pooled.show(index, self.rows[index], i * self.row_height, width)
+            else:
+                pooled.hide()
+
+        self.canvas.itemconfigure(self._empty_item, text="" if total else self.empty_text)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + count - 1) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, *args):
+        """Comando de la scrollbar: 'moveto' fracción o 'scroll' n unidades/páginas"""
+        total = len(self.rows)
+        if not total:
+            return
+        page = max(1, self.visible_count() - 1)
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * total)
+        else:
+            step = int(args[1])
+            top = self.top + (step * page if args[2] == 'pages' else step)
+        top = max(0, min(top, total - page))
+        if top != self.top:
+            self.top = top
+            self.refresh()
+
+    def _on_mousewheel(self, event, step: Optional[int] = None):
+        if step is None:
+            step = -3 if event.delta > 0 else 3
+        self.yview('scroll', step, 'units')
+        # Evita que el Combobox cambie de valor con la rueda
+        return "break"
@@ -0,0 +1,130 @@
+"""
+Pruebas unitarias para el circuit breaker de AsyncDatabaseConnection con un pool simulado
+(pruebas canceladas y conexiones perdidas dentro del bloque)
+No necesitan base de datos ni aiomysql
+"""
+
+import asyncio
+import unittest
+from src.database.async_db_connection import AsyncDatabaseConnection, Error
+from src.utils.concurrency_manager import CircuitBreaker
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=()):
+        await self.conn.pool.query_gate.wait()
+
+    async def fetchall(self):
+        return [(1,)]
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool:
+    """Pool al estilo de aiomysql; acquire y las consultas esperan a que se abran sus puertas"""
+
+    def __init__(self):
+        self.acquire_gate = asyncio.Event()
+        self.query_gate = asyncio.Event()
+        self.acquire_gate.set()
+        self.query_gate.set()
+        self.released = []
+
+    async def acquire(self):
+        await self.acquire_gate.wait()
+        return FakeConnection(self)
+
+    def release(self, conn):
+        self.released.append(conn)
+
+
+class TestAsyncDatabaseConnection(unittest.TestCase):
+    """Clase de pruebas para el circuit breaker de AsyncDatabaseConnection"""
+
+    def setUp(self):
+        """Conexión con el circuito en half_open (una prueba admitida)"""
+        self.db = AsyncDatabaseConnection()
+        self.db.circuit = CircuitBreaker(name="test", failure_threshold=1, cooldown=60.0)
+        self.db.circuit.record_failure()
+        self.db.circuit._opened_at -= self.db.circuit.cooldown
+
+    def run_with_pool(self, body):
+        async def main():
+            self.db.pool = FakePool()
+            await body(self.db.pool)
+        asyncio.run(main())
+
+    async def use_connection(self, timeout=None):
+        async def use():
+            async with self.db.connection():
+                pass
+        await asyncio.wait_for(use(), timeout)
+
+    def test_cancelled_acquire_releases_probe(self):
+        """Si se cancela la espera de la conexión de prueba, se admite otra prueba"""
+        async def body(pool):
+            pool.acquire_gate.clear()
+            with self.assertRaises(asyncio.TimeoutError):
+                await self.use_connection(timeout=0.01)
+            self.assertEqual(self.db.circuit.state, CircuitBreaker.HALF_OPEN)
+
+            pool.acquire_gate.set()
+            await self.use_connection()
+            self.assertEqual(self.db.circuit.state, CircuitBreaker.CLOSED)
+        self.run_with_pool(body)
+
+    def test_cancelled_probe_query_releases_probe(self):
+        """Si se cancela la consulta de prueba, la conexión se cierra y se admite otra prueba"""
+        async def body(pool):
+            pool.query_gate.clear()
+            with self.assertRaises(asyncio.TimeoutError):
+                await self.use_connection(timeout=0.01)
+            self.assertTrue(pool.released[0].closed)
+            self.assertTrue(self.db.circuit.allow())
+        self.run_with_pool(body)
+
+    def test_lost_connection_in_block_counts_as_failure(self):
+        """Una conexión perdida dentro del bloque cuenta como fallo y no vuelve al pool abierta"""
+        async def body(pool):
+            await self.use_connection()
+            self.assertEqual(self.db.circuit.state, CircuitBreaker.CLOSED)
+
+            with self.assertRaises(Error):
+                async with self.db.connection():
+                    raise Error(2013, "Lost connection to MySQL server during query")
+            self.assertTrue(pool.released[-1].closed)
+            self.assertEqual(self.db.circuit.state, CircuitBreaker.OPEN)
+        self.run_with_pool(body)
+
+    def test_other_errors_in_block_are_not_failures(self):
+        """Un error de SQL dentro del bloque no afecta al circuito"""
+        async def body(pool):
+            with self.assertRaises(Error):
+                async with self.db.connection():
+                    raise Error(1062, "Duplicate entry")
+            self.assertFalse(pool.released[-1].closed)
+            self.assertEqual(self.db.circuit.state, CircuitBreaker.CLOSED)
+        self.run_with_pool(body)
+
+
+if __name__ == '__main__':
+    unittest.main()
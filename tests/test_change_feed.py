@@ -0,0 +1,200 @@
+"""
+Pruebas unitarias para ChangeFeedPoller con un cursor simulado (huecos en la secuencia,
+arranque con start_window, llegadas tardías y cambios de la propia instancia)
+No necesitan base de datos
+"""
+
+import time
+import unittest
+from unittest import mock
+from src.utils import change_feed
+from src.utils.change_feed import INSTANCE_ID, ChangeFeedPoller
+
+
+def change(change_id, change_type='event_updated', event_id=1, participant_id=None, origin='otra'):
+    return {'change_id': change_id, 'change_type': change_type, 'event_id': event_id,
+            'participant_id': participant_id, 'user_id': None, 'origin': origin}
+
+
+class FakeCursor:
+    """Cursor simulado que responde a las consultas del lector sobre las filas confirmadas"""
+
+    def __init__(self, db):
+        self.db = db
+        self.result = []
+
+    def execute(self, query, params=()):
+        rows = self.db.rows
+        if 'MAX(change_id)' in query:
+            self.result = [{'last_id': max(rows, default=0)}]
+        elif 'AND change_id <=' in query:
+            self.result = [{'change_id': i} for i in rows if params[0] < i <= params[1]]
+        elif 'IN (' in query:
+            self.result = [rows[i] for i in params if i in rows]
+        else:
+            after, limit = params
+            self.result = [rows[i] for i in sorted(rows) if i > after][:limit]
+
+    def fetchone(self):
+        return self.result[0]
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self.db)
+
+    def close(self):
+        pass
+
+
+class FakeDatabase:
+    """DatabaseConnection simulada: rows son las filas de change_log ya confirmadas"""
+
+    def __init__(self, change_ids):
+        self.rows = {change_id: change(change_id) for change_id in change_ids}
+
+    def get_connection(self):
+        return FakeConnection(self)
+
+
+class FakeNotificationSystem:
+    def __init__(self):
+        self.notified = []
+
+    def notify(self, event_type, **kwargs):
+        self.notified.append((event_type, kwargs))
+
+
+class FakeCache:
+    def __init__(self, kind, invalidated):
+        self.kind = kind
+        self.invalidated = invalidated
+
+    def invalidate(self, entity_id):
+        self.invalidated.append((self.kind, entity_id))
+
+
+class TestChangeFeedPoller(unittest.TestCase):
+    """Clase de pruebas para ChangeFeedPoller"""
+
+    def setUp(self):
+        """Registro con huecos en 4, 7 y 8; notificaciones y cachés simuladas"""
+        self.db = FakeDatabase([1, 2, 3, 5, 6, 9, 10])
+        self.notifications = FakeNotificationSystem()
+        self.invalidated = []
+        for name, fake in (('get_notification_system', lambda: self.notifications),
+                           ('get_entity_cache', lambda kind: FakeCache(kind, self.invalidated))):
+            patcher = mock.patch.object(change_feed, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def make_poller(self, **kwargs):
+        options = dict(interval=0.01, batch_size=100, gap_timeout=60.0, max_gaps=1000, start_window=200)
+        options.update(kwargs)
+        return ChangeFeedPoller(self.db, **options)
+
+    def notified_ids(self):
+        return [kwargs['event_id'] for _, kwargs in self.notifications.notified]
+
+    def test_start_watches_missing_ids_in_window(self):
+        """Al arrancar se empieza por el último ID y se vigilan los que faltan en la ventana"""
+        poller = self.make_poller()
+        self.assertFalse(poller.poll_once())
+
+        self.assertEqual(poller.last_id, 10)
+        self.assertEqual(sorted(poller._gaps), [4, 7, 8])
+        self.assertEqual(self.notifications.notified, [])
+
+    def test_start_window_limits_scan(self):
+        """Solo se buscan huecos en los start_window IDs anteriores al último"""
+        poller = self.make_poller(start_window=4)
+        poller.poll_once()
+        self.assertEqual(sorted(poller._gaps), [7, 8])
+
+        poller = self.make_poller(start_window=0)
+        poller.poll_once()
+        self.assertEqual(poller._gaps, {})
+
+    def test_max_gaps_counts_dropped(self):
+        """Los huecos que no caben en max_gaps se descartan, se cuentan y se avisa"""
+        poller = self.make_poller(max_gaps=2)
+        with self.assertLogs(change_feed.logger, level='WARNING'):
+            poller.poll_once()
+        self.assertEqual(sorted(poller._gaps), [4, 7])
+        self.assertEqual(poller.stats()['gaps_dropped'], 1)
+
+        with self.assertLogs(change_feed.logger, level='WARNING'):
+            poller._add_gaps([20, 21, 22], time.monotonic())
+        self.assertEqual(sorted(poller._gaps), [4, 7])
+        self.assertEqual(poller.stats()['gaps_dropped'], 4)
+
+    def test_track_gaps(self):
+        """_track_gaps anota los IDs saltados entre el último leído y el nuevo"""
+        poller = self.make_poller(gap_timeout=5.0)
+        poller.last_id = 10
+        poller._track_gaps(11, 100.0)
+        self.assertEqual(poller._gaps, {})
+
+        poller._track_gaps(14, 100.0)
+        self.assertEqual(poller._gaps, {11: 105.0, 12: 105.0, 13: 105.0})
+
+    def test_new_rows_and_late_rows_are_delivered(self):
+        """Los huecos que se confirman tarde se reenvían (antes que los nuevos) y dejan de vigilarse"""
+        poller = self.make_poller()
+        poller.poll_once()
+        self.db.rows[7] = change(7, event_id=7)
+        self.db.rows[12] = change(12, event_id=12)
+        self.db.rows[13] = change(13, event_id=13)
+        self.assertFalse(poller.poll_once())
+
+        self.assertEqual(self.notified_ids(), [7, 12, 13])
+        self.assertEqual(sorted(poller._gaps), [4, 8, 11])
+        stats = poller.stats()
+        self.assertEqual((stats['last_id'], stats['late'], stats['delivered']), (13, 1, 3))
+        self.assertTrue(all(kwargs['remote'] for _, kwargs in self.notifications.notified))
+
+    def test_gaps_expire(self):
+        """Un hueco que no llega antes de gap_timeout se olvida"""
+        poller = self.make_poller(gap_timeout=0.0)
+        poller.poll_once()
+        poller.poll_once()
+
+        self.assertEqual(poller._gaps, {})
+        self.assertEqual(poller.stats()['gaps_expired'], 3)
+
+    def test_full_batch_asks_for_more(self):
+        """poll_once devuelve True si el lote se llenó"""
+        poller = self.make_poller(batch_size=2)
+        poller.poll_once()
+        for change_id in (11, 12, 13):
+            self.db.rows[change_id] = change(change_id, event_id=change_id)
+
+        self.assertTrue(poller.poll_once())
+        self.assertFalse(poller.poll_once())
+        self.assertEqual(self.notified_ids(), [11, 12, 13])
+
+    def test_own_changes_are_skipped(self):
+        """Los cambios de esta instancia se leen pero no se reenvían ni invalidan cachés"""
+        poller = self.make_poller()
+        poller.poll_once()
+        self.db.rows[11] = change(11, event_id=11, origin=INSTANCE_ID)
+        self.db.rows[12] = change(12, change_type='participant_updated', event_id=None, participant_id=5)
+        poller.poll_once()
+
+        self.assertEqual(self.notifications.notified, [('participant_updated', {'remote': True, 'participant_id': 5})])
+        self.assertEqual(self.invalidated, [('participants', 5)])
+        stats = poller.stats()
+        self.assertEqual((stats['last_id'], stats['received'], stats['delivered']), (12, 2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Pruebas unitarias para CircuitBreaker (transiciones entre closed, open y half_open)
+No necesitan base de datos
+"""
+
+import unittest
+from src.database.db_connection import DatabaseConnection
+from src.utils.concurrency_manager import CircuitBreaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Clase de pruebas para CircuitBreaker"""
+
+    def setUp(self):
+        """Circuito que se abre con 3 fallos seguidos y registro de sus transiciones"""
+        self.breaker = CircuitBreaker(name="test", failure_threshold=3, cooldown=60.0)
+        self.transitions = []
+        self.breaker.add_listener(lambda previous, state: self.transitions.append((previous, state)))
+
+    def open_breaker(self):
+        for _ in range(self.breaker.failure_threshold):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_failure()
+
+    def end_cooldown(self):
+        """Da por vencido el cooldown sin esperarlo"""
+        self.breaker._opened_at -= self.breaker.cooldown
+
+    def test_opens_after_consecutive_failures(self):
+        """failure_threshold fallos seguidos abren el circuito"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.transitions, [('closed', 'open')])
+
+    def test_success_resets_failures(self):
+        """Un éxito entre fallos pone a cero la cuenta de fallos seguidos"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.stats()['consecutive_failures'], 2)
+
+    def test_open_rejects_until_cooldown(self):
+        """Abierto, allow() rechaza al instante e indica cuándo se admitirá una prueba"""
+        self.open_breaker()
+
+        self.assertFalse(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+        self.assertGreater(self.breaker.retry_after(), 59.0)
+        self.assertEqual(self.breaker.stats()['rejected'], 2)
+
+    def test_half_open_admits_a_single_probe(self):
+        """Pasado el cooldown solo se admite una llamada de prueba a la vez"""
+        self.open_breaker()
+        self.end_cooldown()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(self.breaker.retry_after(), 0.0)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.stats()['probes'], 1)
+
+    def test_probe_success_closes(self):
+        """Una prueba correcta cierra el circuito"""
+        self.open_breaker()
+        self.end_cooldown()
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.transitions, [('closed', 'open'), ('open', 'half_open'), ('half_open', 'closed')])
+
+    def test_probe_failure_reopens(self):
+        """Una prueba fallida vuelve a abrir el circuito con un cooldown nuevo"""
+        self.open_breaker()
+        self.end_cooldown()
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.assertGreater(self.breaker.retry_after(), 59.0)
+        self.assertEqual(self.breaker.stats()['opened'], 2)
+
+    def test_success_threshold(self):
+        """Con success_threshold=2 hacen falta dos pruebas correctas para cerrarlo"""
+        breaker = CircuitBreaker(name="test2", failure_threshold=1, cooldown=60.0, success_threshold=2)
+        breaker.record_failure()
+        breaker._opened_at -= breaker.cooldown
+
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_release_probe(self):
+        """release_probe libera la prueba sin contar resultado (p. ej. pool agotado)"""
+        self.open_breaker()
+        self.end_cooldown()
+        self.assertTrue(self.breaker.allow())
+        self.breaker.release_probe()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+
+    def test_unexpected_error_releases_probe(self):
+        """Un error que no es de MySQL al obtener la conexión de prueba no deja el circuito bloqueado"""
+        class FailingPool:
+            def get_connection(self):
+                raise RuntimeError("fallo inesperado")
+
+        db = object.__new__(DatabaseConnection)
+        db.pool = FailingPool()
+        db.circuit = self.breaker
+        self.open_breaker()
+        self.end_cooldown()
+
+        with self.assertRaises(RuntimeError):
+            db.get_connection()
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+
+    def test_reset_and_listener_errors(self):
+        """reset() cierra el circuito; un listener que falla no impide avisar a los demás"""
+        def failing_listener(previous, state):
+            raise RuntimeError("listener roto")
+        self.breaker.remove_listener(self.breaker._listeners[0])
+        self.breaker.add_listener(failing_listener)
+        self.breaker.add_listener(lambda previous, state: self.transitions.append((previous, state)))
+
+        self.open_breaker()
+        self.breaker.reset()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.transitions, [('closed', 'open'), ('open', 'closed')])
+
+
+if __name__ == '__main__':
+    unittest.main()
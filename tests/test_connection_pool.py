@@ -0,0 +1,314 @@
+"""
+Pruebas unitarias para ConnectionPool con conexiones simuladas
+(caducidad, comprobación de salud, espera con el pool agotado y reinicio al devolver)
+No necesitan base de datos
+"""
+
+import threading
+import time
+import unittest
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from src.database.connection_pool import ConnectionPool
+
+
+class FakeConnection:
+    """Conexión simulada que registra los pings, reinicios y rollbacks"""
+
+    def __init__(self):
+        self.alive = True
+        self.in_transaction = False
+        self.pings = 0
+        self.resets = 0
+        self.rollbacks = 0
+        self.fail_reset = False
+        self.lost = False
+
+    def is_connected(self):
+        self.pings += 1
+        return self.alive
+
+    def reset_session(self):
+        if self.fail_reset:
+            raise Error(msg="reset failed", errno=2013)
+        self.resets += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def close(self):
+        self.alive = False
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+
+    def execute(self, query, params=()):
+        if self.conn.lost:
+            raise Error(msg="Lost connection to MySQL server during query", errno=2013)
+        if query == 'bad sql':
+            raise Error(msg="syntax error", errno=1064)
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Clase de pruebas para ConnectionPool"""
+
+    def setUp(self):
+        """Fábrica de conexiones simuladas que guarda las que abre"""
+        self.opened = []
+        self.connect_error = None
+
+    def connect(self):
+        if self.connect_error:
+            raise self.connect_error
+        conn = FakeConnection()
+        self.opened.append(conn)
+        return conn
+
+    def make_pool(self, **kwargs):
+        options = dict(size=3, min_idle=2, checkout_timeout=0.5, validation_interval=60.0,
+                       max_lifetime=0, idle_timeout=0)
+        options.update(kwargs)
+        return ConnectionPool(self.connect, **options)
+
+    @staticmethod
+    def raw(pooled):
+        """Conexión simulada detrás de una conexión prestada"""
+        return pooled._entry.conn
+
+    def test_warm_up_and_growth(self):
+        """Se abren min_idle conexiones al arrancar y el resto bajo demanda hasta size"""
+        pool = self.make_pool()
+        self.assertEqual(pool.warm_up(), 2)
+        self.assertEqual(len(self.opened), 2)
+
+        borrowed = [pool.get_connection() for _ in range(3)]
+        self.assertEqual(len(self.opened), 3)
+        stats = pool.stats()
+        self.assertEqual((stats['open'], stats['in_use'], stats['available']), (3, 3, 0))
+        self.assertEqual(stats['peak_in_use'], 3)
+        for conn in borrowed:
+            conn.close()
+        self.assertEqual(pool.stats()['idle'], 3)
+
+    def test_warm_up_fails_without_server(self):
+        """Si no se puede abrir la primera conexión, warm_up lanza el error"""
+        self.connect_error = Error(msg="Can't connect", errno=2003)
+        pool = self.make_pool()
+        with self.assertRaises(Error):
+            pool.warm_up()
+        self.assertEqual(pool.stats()['open'], 0)
+
+    def test_connect_failure_frees_the_slot(self):
+        """Un fallo al abrir una conexión bajo demanda no ocupa plaza en el pool"""
+        pool = self.make_pool(size=1)
+        self.connect_error = Error(msg="Can't connect", errno=2003)
+        with self.assertRaises(Error):
+            pool.get_connection()
+
+        self.connect_error = None
+        conn = pool.get_connection()
+        self.assertEqual(pool.stats()['create_failures'], 1)
+        self.assertEqual(pool.stats()['open'], 1)
+        conn.close()
+
+    def test_last_returned_connection_is_reused(self):
+        """Se presta la conexión devuelta más recientemente (LIFO)"""
+        pool = self.make_pool()
+        pool.warm_up()
+        first = pool.get_connection()
+        second = pool.get_connection()
+        raw_second = self.raw(second)
+        first.close()
+        second.close()
+
+        again = pool.get_connection()
+        self.assertIs(self.raw(again), raw_second)
+        again.close()
+
+    def test_checkout_timeout(self):
+        """Con todas las conexiones en uso se espera checkout_timeout y después PoolError"""
+        pool = self.make_pool(size=1, min_idle=1, checkout_timeout=0.05)
+        held = pool.get_connection()
+
+        started = time.monotonic()
+        with self.assertRaises(PoolError):
+            pool.get_connection()
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        stats = pool.stats()
+        self.assertEqual((stats['exhausted'], stats['timeouts']), (1, 1))
+        held.close()
+
+    def test_waiting_checkout_gets_released_connection(self):
+        """Quien espera recibe la conexión que otro devuelve antes del plazo"""
+        pool = self.make_pool(size=1, min_idle=1, checkout_timeout=2.0)
+        held = pool.get_connection()
+        raw_held = self.raw(held)
+        timer = threading.Timer(0.05, held.close)
+        timer.start()
+
+        conn = pool.get_connection()
+        timer.join()
+        self.assertIs(self.raw(conn), raw_held)
+        self.assertEqual(pool.stats()['timeouts'], 0)
+        self.assertGreater(pool.stats()['max_wait_ms'], 0)
+        conn.close()
+
+    def test_validation_replaces_dead_connection(self):
+        """Una conexión libre que el servidor cerró se sustituye al prestarla"""
+        pool = self.make_pool(size=1, min_idle=1, validation_interval=0)
+        pool.warm_up()
+        self.opened[0].alive = False
+
+        conn = pool.get_connection()
+        self.assertIsNot(self.raw(conn), self.opened[0])
+        self.assertTrue(self.raw(conn).alive)
+        stats = pool.stats()
+        self.assertEqual((stats['validations'], stats['validation_failures']), (1, 1))
+        conn.close()
+
+    def test_recently_used_connection_is_not_pinged(self):
+        """Dentro de validation_interval la conexión se presta sin ping"""
+        pool = self.make_pool(validation_interval=60.0)
+        pool.warm_up()
+        conn = pool.get_connection()
+        conn.close()
+        conn = pool.get_connection()
+
+        self.assertEqual(self.raw(conn).pings, 0)
+        self.assertEqual(pool.stats()['validations'], 0)
+        conn.close()
+
+    def test_expired_connection_is_replaced(self):
+        """Al superar max_lifetime la conexión se cierra al devolverla o antes de prestarla"""
+        pool = self.make_pool(size=2, min_idle=1, max_lifetime=0.01)
+        pool.warm_up()
+        time.sleep(0.02)
+
+        conn = pool.get_connection()
+        self.assertFalse(self.opened[0].alive)
+        self.assertIs(self.raw(conn), self.opened[1])
+        time.sleep(0.02)
+        conn.close()
+        self.assertFalse(self.opened[1].alive)
+        stats = pool.stats()
+        self.assertEqual((stats['expired'], stats['open']), (2, 0))
+
+    def test_release_resets_session(self):
+        """Por defecto se reinicia la sesión al devolver la conexión"""
+        pool = self.make_pool()
+        conn = pool.get_connection()
+        raw_conn = self.raw(conn)
+        conn.close()
+
+        self.assertEqual(raw_conn.resets, 1)
+        self.assertEqual(pool.stats()['resets'], 1)
+
+    def test_release_without_reset_rolls_back_open_transaction(self):
+        """Sin reset_session solo se deshace la transacción que quedó abierta"""
+        pool = self.make_pool(reset_session=False)
+        conn = pool.get_connection()
+        raw_conn = self.raw(conn)
+        conn.close()
+        self.assertEqual((raw_conn.resets, raw_conn.rollbacks), (0, 0))
+
+        conn = pool.get_connection()
+        raw_conn.in_transaction = True
+        conn.close()
+        self.assertEqual((raw_conn.resets, raw_conn.rollbacks), (0, 1))
+
+    def test_require_reset(self):
+        """require_reset() fuerza el reinicio de la sesión aunque reset_session esté desactivado"""
+        pool = self.make_pool(reset_session=False)
+        conn = pool.get_connection()
+        raw_conn = self.raw(conn)
+        conn.require_reset()
+        conn.close()
+
+        self.assertEqual(raw_conn.resets, 1)
+
+    def test_failed_reset_discards_connection(self):
+        """Si el reinicio falla la conexión se cierra en lugar de volver al pool"""
+        pool = self.make_pool(reset_session=True)
+        conn = pool.get_connection()
+        raw_conn = self.raw(conn)
+        raw_conn.fail_reset = True
+        conn.close()
+
+        self.assertFalse(raw_conn.alive)
+        self.assertEqual(pool.stats()['discarded'], 1)
+        self.assertEqual(pool.stats()['open'], 0)
+
+    def test_close_is_idempotent(self):
+        """Cerrar dos veces una conexión prestada la devuelve una sola vez"""
+        pool = self.make_pool()
+        conn = pool.get_connection()
+        conn.close()
+        conn.close()
+
+        self.assertEqual(pool.stats()['idle'], 1)
+        with self.assertRaises(Error):
+            conn.cursor()
+
+    def test_lost_connection_is_discarded(self):
+        """Una consulta que pierde la conexión la descarta y hace comprobar las libres"""
+        errors = []
+        pool = self.make_pool(on_connection_error=errors.append)
+        pool.warm_up()
+        conn = pool.get_connection()
+        raw_conn = self.raw(conn)
+        raw_conn.lost = True
+
+        with self.assertRaises(Error):
+            conn.cursor().execute("SELECT 1")
+        conn.close()
+        self.assertFalse(raw_conn.alive)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(pool.stats()['connection_errors'], 1)
+
+        # La conexión libre de antes del fallo se comprueba aunque no haya pasado validation_interval
+        idle = pool.get_connection()
+        self.assertEqual(self.raw(idle).pings, 1)
+        idle.close()
+
+    def test_other_query_errors_keep_connection(self):
+        """Un error de SQL no se considera pérdida de la conexión"""
+        errors = []
+        pool = self.make_pool(on_connection_error=errors.append)
+        conn = pool.get_connection()
+        raw_conn = self.raw(conn)
+
+        with self.assertRaises(Error):
+            conn.cursor().execute('bad sql')
+        conn.close()
+        self.assertTrue(raw_conn.alive)
+        self.assertEqual(errors, [])
+        self.assertEqual(pool.stats()['idle'], 1)
+
+    def test_close_idle(self):
+        """close_idle cierra las libres inactivas por encima de min_idle"""
+        pool = self.make_pool(size=3, min_idle=1, idle_timeout=0.01)
+        borrowed = [pool.get_connection() for _ in range(3)]
+        for conn in borrowed:
+            conn.close()
+        time.sleep(0.02)
+
+        self.assertEqual(pool.close_idle(), 2)
+        stats = pool.stats()
+        self.assertEqual((stats['open'], stats['idle'], stats['idle_closed']), (1, 1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Pruebas unitarias para EntityCache (LRU, caducidad y generación de invalidaciones)
+No necesitan base de datos
+"""
+
+import time
+import unittest
+from src.utils.entity_cache import EntityCache
+
+
+def row(event_id):
+    return {'event_id': event_id, 'title': f"Evento {event_id}"}
+
+
+class TestEntityCache(unittest.TestCase):
+    """Clase de pruebas para EntityCache"""
+
+    def setUp(self):
+        """Caché pequeña con un TTL largo para que solo caduque donde se pruebe"""
+        self.cache = EntityCache(name="events", key_field='event_id', max_size=3, ttl=60.0)
+
+    def test_get_and_put(self):
+        """Una fila guardada se devuelve hasta que se invalida"""
+        self.assertIsNone(self.cache.get(1))
+        self.cache.put(1, row(1), self.cache.generation)
+
+        self.assertEqual(self.cache.get(1), row(1))
+        self.assertEqual(self.cache.get("1"), row(1))  # IDs leídos de un Treeview
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (2, 1, 1))
+
+    def test_lru_eviction(self):
+        """Al superar max_size se expulsa la fila usada hace más tiempo"""
+        generation = self.cache.generation
+        for event_id in (1, 2, 3):
+            self.cache.put(event_id, row(event_id), generation)
+        self.cache.get(1)  # 1 pasa a ser la más reciente
+        self.cache.put(4, row(4), generation)
+
+        self.assertIsNone(self.cache.get(2))
+        for event_id in (1, 3, 4):
+            self.assertIsNotNone(self.cache.get(event_id))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_ttl_expiry(self):
+        """Una fila caducada no se devuelve y sale de la caché"""
+        cache = EntityCache(name="events", key_field='event_id', max_size=3, ttl=0.01)
+        cache.put(1, row(1), cache.generation)
+        cache.put_all([row(2)], cache.generation)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get(1))
+        self.assertIsNone(cache.get_all())
+        self.assertEqual(cache.stats()['size'], 1)
+
+    def test_stale_generation_is_discarded(self):
+        """Una lectura anterior a una invalidación no se guarda"""
+        generation = self.cache.generation
+        self.cache.invalidate(1)  # Otra escritura mientras se consultaba la base de datos
+        self.cache.put(1, row(1), generation)
+        self.cache.put_all([row(2)], generation)
+
+        self.assertIsNone(self.cache.get(1))
+        self.assertIsNone(self.cache.get_all())
+        self.assertNotEqual(self.cache.generation, generation)
+
+    def test_invalidate_drops_row_and_listing(self):
+        """invalidate(id) elimina esa fila y el listado completo, pero no las demás filas"""
+        self.cache.put_all([row(1), row(2)], self.cache.generation)
+        self.assertEqual(self.cache.get_all(), [row(1), row(2)])
+
+        self.cache.invalidate(1)
+        self.assertIsNone(self.cache.get(1))
+        self.assertEqual(self.cache.get(2), row(2))
+        self.assertIsNone(self.cache.get_all())
+        self.assertEqual(self.cache.stats()['invalidations'], 1)
+
+    def test_listing_larger_than_cache(self):
+        """Un listado mayor que max_size no se guarda entero, solo sus últimas filas"""
+        rows = [row(event_id) for event_id in range(1, 6)]
+        self.cache.put_all(rows, self.cache.generation)
+
+        self.assertIsNone(self.cache.get_all())
+        self.assertIsNone(self.cache.get(2))
+        self.assertEqual(self.cache.get(5), row(5))
+        self.assertEqual(self.cache.stats()['size'], 3)
+
+    def test_clear(self):
+        """clear vacía la caché y cambia la generación"""
+        generation = self.cache.generation
+        self.cache.put(1, row(1), generation)
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get(1))
+        self.assertEqual(self.cache.stats()['size'], 0)
+        self.assertNotEqual(self.cache.generation, generation)
+
+    def test_disabled_cache(self):
+        """Con max_size=0 la caché no guarda nada"""
+        cache = EntityCache(name="events", key_field='event_id', max_size=0)
+        cache.put(1, row(1), cache.generation)
+        cache.put_all([row(1)], cache.generation)
+
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.get(1))
+        self.assertIsNone(cache.get_all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+Pruebas unitarias para EventNotificationSystem (orden, desbordamiento de colas y coalescing)
+No necesitan base de datos
+"""
+
+import threading
+import time
+import unittest
+from src.utils.concurrency_manager import EventNotificationSystem, NotificationBatch
+
+
+class BlockingSubscriber:
+    """Suscriptor que se queda bloqueado en la primera notificación hasta release()"""
+
+    def __init__(self):
+        self.received = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def __call__(self, value):
+        self.started.set()
+        self.gate.wait(5)
+        self.received.append(value)
+
+    def release(self):
+        self.gate.set()
+
+
+class TestEventNotificationSystem(unittest.TestCase):
+    """Clase de pruebas para EventNotificationSystem"""
+
+    def setUp(self):
+        self.systems = []
+
+    def tearDown(self):
+        for system in self.systems:
+            system.shutdown(timeout=1.0)
+
+    def make_system(self, **kwargs):
+        system = EventNotificationSystem(**kwargs)
+        self.systems.append(system)
+        return system
+
+    def fill_queue(self, system, subscriber, values):
+        """Ocupa el worker con la primera notificación y deja el resto en la cola"""
+        system.notify('changed', values[0])
+        self.assertTrue(subscriber.started.wait(5))
+        for value in values[1:]:
+            system.notify('changed', value)
+
+    def test_delivery_in_order(self):
+        """Un suscriptor recibe sus notificaciones en orden aunque haya varios workers"""
+        system = self.make_system(num_workers=4)
+        received = []
+        system.subscribe('changed', received.append)
+        for value in range(200):
+            system.notify('changed', value)
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(received, list(range(200)))
+        self.assertEqual(system.stats()['delivered'], 200)
+
+    def test_shared_queue_keeps_order_across_types(self):
+        """Los callbacks con el mismo subscriber reciben en orden notificaciones de tipos distintos"""
+        system = self.make_system(num_workers=4)
+        received = []
+        system.subscribe('created', lambda value: received.append(('created', value)), subscriber='view')
+        system.subscribe('deleted', lambda value: received.append(('deleted', value)), subscriber='view')
+        for value in range(50):
+            system.notify('created', value)
+            system.notify('deleted', value)
+
+        self.assertTrue(system.wait_idle(5))
+        expected = [(kind, value) for value in range(50) for kind in ('created', 'deleted')]
+        self.assertEqual(received, expected)
+
+    def test_callback_errors_are_counted(self):
+        """Un callback que falla no detiene la entrega de las siguientes"""
+        system = self.make_system(num_workers=1)
+        received = []
+
+        def callback(value):
+            if value == 1:
+                raise RuntimeError("fallo")
+            received.append(value)
+        system.subscribe('changed', callback)
+        for value in range(3):
+            system.notify('changed', value)
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(received, [0, 2])
+        self.assertEqual(system.stats()['errors'], 1)
+
+    def test_overflow_drop_oldest(self):
+        """Con drop_oldest la cola llena descarta la notificación pendiente más antigua"""
+        system = self.make_system(num_workers=1, max_pending=2)
+        subscriber = BlockingSubscriber()
+        system.subscribe('changed', subscriber)
+        self.fill_queue(system, subscriber, [0, 1, 2, 3, 4])
+        subscriber.release()
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(subscriber.received, [0, 3, 4])
+        self.assertEqual(system.stats()['dropped'], 2)
+
+    def test_overflow_drop_newest(self):
+        """Con drop_newest la cola llena descarta la notificación nueva"""
+        system = self.make_system(num_workers=1, max_pending=2)
+        subscriber = BlockingSubscriber()
+        system.subscribe('changed', subscriber, overflow='drop_newest')
+        self.fill_queue(system, subscriber, [0, 1, 2, 3, 4])
+        subscriber.release()
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(subscriber.received, [0, 1, 2])
+        self.assertEqual(system.stats()['dropped'], 2)
+
+    def test_overflow_block_waits_then_drops(self):
+        """Con block notify espera block_timeout a que haya sitio y después descarta la nueva"""
+        system = self.make_system(num_workers=1, max_pending=1, overflow='block', block_timeout=0.05)
+        subscriber = BlockingSubscriber()
+        system.subscribe('changed', subscriber)
+        self.fill_queue(system, subscriber, [0, 1, 2])
+        subscriber.release()
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(subscriber.received, [0, 1])
+        self.assertEqual(system.stats()['dropped'], 1)
+
+    def test_overflow_block_is_served_when_space_frees(self):
+        """Con block notify continúa en cuanto el worker deja sitio en la cola"""
+        system = self.make_system(num_workers=1, max_pending=1, overflow='block', block_timeout=5.0)
+        subscriber = BlockingSubscriber()
+        system.subscribe('changed', subscriber)
+        self.fill_queue(system, subscriber, [0, 1])
+        timer = threading.Timer(0.05, subscriber.release)
+        timer.start()
+        system.notify('changed', 2)
+        timer.join()
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(subscriber.received, [0, 1, 2])
+        self.assertEqual(system.stats()['dropped'], 0)
+
+    def test_unknown_overflow_policy(self):
+        """Una política de desbordamiento desconocida se rechaza"""
+        with self.assertRaises(ValueError):
+            EventNotificationSystem(overflow='discard')
+        system = self.make_system()
+        with self.assertRaises(ValueError):
+            system.subscribe('changed', print, overflow='discard')
+
+    def test_unsubscribe_discards_only_that_type(self):
+        """unsubscribe descarta las pendientes de su tipo y conserva las de otros tipos"""
+        system = self.make_system(num_workers=1)
+        subscriber = BlockingSubscriber()
+        system.subscribe('changed', subscriber, subscriber='view')
+        system.subscribe('other', subscriber, subscriber='view')
+        system.notify('changed', 0)
+        self.assertTrue(subscriber.started.wait(5))
+        system.notify('changed', 1)
+        system.notify('other', 2)
+        system.unsubscribe('changed', subscriber)
+        system.notify('changed', 3)
+        subscriber.release()
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(subscriber.received, [0, 2])
+
+    def test_coalesced_batch(self):
+        """subscribe_coalesced entrega un único lote por ventana con los tipos y los IDs"""
+        system = self.make_system(num_workers=2)
+        batches = []
+        system.subscribe_coalesced(['registration_created', 'registration_deleted'], batches.append,
+                                   window=0.05)
+        for participant_id in range(10):
+            system.notify('registration_created', event_id=1, participant_id=participant_id)
+        system.notify('registration_deleted', event_id=2, participant_id=3)
+        system.notify('unrelated', event_id=9)
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(len(batches), 1)
+        batch = batches[0]
+        self.assertIsInstance(batch, NotificationBatch)
+        self.assertEqual(len(batch), 11)
+        self.assertEqual(batch.counts, {'registration_created': 10, 'registration_deleted': 1})
+        self.assertEqual(batch.event_ids, {1, 2})
+        self.assertEqual(batch.participant_ids, set(range(10)))
+
+    def test_coalesced_flush_survives_overflow(self):
+        """Con la cola compartida llena, la entrega de un lote no se descarta y siguen llegando lotes"""
+        system = self.make_system(num_workers=1)
+        subscriber = BlockingSubscriber()
+        batches = []
+        system.subscribe('changed', subscriber, subscriber='view', max_pending=2, overflow='drop_oldest')
+        system.subscribe_coalesced(['registration_created'], batches.append, window=0.01, subscriber='view')
+        self.fill_queue(system, subscriber, [0, 1, 2])
+        system.notify('registration_created', event_id=1)
+        time.sleep(0.05)  # Vence la ventana: la entrega del lote entra en la cola llena
+        system.notify('changed', 3)
+        subscriber.release()
+        self.assertTrue(system.wait_idle(5))
+
+        system.notify('registration_created', event_id=2)
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(subscriber.received, [0, 2, 3])
+        self.assertEqual([batch.event_ids for batch in batches], [{1}, {2}])
+
+    def test_coalesced_flush_does_not_block_timer(self):
+        """Con la política block, el timer encola la entrega del lote sin esperar sitio"""
+        system = self.make_system(num_workers=1, max_pending=1, overflow='block', block_timeout=5.0)
+        subscriber = BlockingSubscriber()
+        batches = []
+        system.subscribe('changed', subscriber, subscriber='view')
+        system.subscribe_coalesced(['registration_created'], batches.append, window=0.01, subscriber='view')
+        self.fill_queue(system, subscriber, [0, 1])
+        system.notify('registration_created', event_id=1)
+        time.sleep(0.1)
+
+        self.assertEqual(system.stats()['queued'], 2)
+        subscriber.release()
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(len(batches), 1)
+
+    def test_coalesced_unsubscribe_drops_pending_batch(self):
+        """Desuscrito de todos sus tipos, el lote de la ventana abierta ya no se entrega"""
+        system = self.make_system(num_workers=1)
+        batches = []
+        system.subscribe_coalesced(['changed'], batches.append, window=0.05)
+        system.notify('changed', event_id=1)
+        system.unsubscribe('changed', batches.append)
+
+        self.assertTrue(system.wait_idle(5))
+        self.assertEqual(batches, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Pruebas unitarias para PagedTreeview (recargas por diferencias con _apply_diff) y OffsetPageSource
+Usan un Treeview simulado que registra las llamadas a Tk; no necesitan base de datos ni pantalla
+"""
+
+import unittest
+from src.views.paged_table import OffsetPageSource, PagedTreeview
+
+
+class FakeTree:
+    """Treeview simulado: guarda el orden y los valores de los items y cuenta las llamadas"""
+
+    def __init__(self):
+        self.items = []
+        self.values = {}
+        self.calls = []
+        self._next = 0
+
+    def configure(self, **kwargs):
+        pass
+
+    def yview(self, *args):
+        pass
+
+    def insert(self, parent, index, values, tags):
+        self._next += 1
+        item = f"I{self._next}"
+        if index == 'end':
+            self.items.append(item)
+        else:
+            self.items.insert(index, item)
+        self.values[item] = values
+        self.calls.append('insert')
+        return item
+
+    def delete(self, *items):
+        for item in items:
+            self.items.remove(item)
+            del self.values[item]
+        self.calls.append('delete')
+
+    def item(self, item, values, tags):
+        self.values[item] = values
+        self.calls.append('item')
+
+    def move(self, item, parent, index):
+        self.items.remove(item)
+        self.items.insert(index, item)
+        self.calls.append('move')
+
+    def get_children(self):
+        return tuple(self.items)
+
+
+class FakeScrollbar:
+    def config(self, **kwargs):
+        pass
+
+
+class Row:
+    def __init__(self, row_id, title):
+        self.id = row_id
+        self.title = title
+
+
+class TestPagedTreeviewDiff(unittest.TestCase):
+    """Clase de pruebas para las recargas por diferencias de PagedTreeview"""
+
+    def setUp(self):
+        """Tabla con row_id cargada con diez filas"""
+        self.data = [Row(i, f"t{i}") for i in range(10)]
+        self.tree = FakeTree()
+        self.table = PagedTreeview(self.tree, FakeScrollbar(), lambda row: ((row.title,), ()),
+                                   page_size=100, row_id=lambda row: row.id)
+        self.table.set_source(lambda after=None, before=None, limit=100: list(self.data), lambda row: row.id)
+        self.tree.calls.clear()
+
+    def shown(self):
+        return [self.tree.values[item][0] for item in self.tree.items]
+
+    def test_unchanged_reload_makes_no_tk_calls(self):
+        """Recargar las mismas filas no toca el Treeview"""
+        items = list(self.tree.items)
+        self.table.reload()
+
+        self.assertEqual(self.tree.calls, [])
+        self.assertEqual(self.tree.items, items)
+
+    def test_reload_applies_only_differences(self):
+        """Solo se insertan, eliminan, mueven o redibujan las filas que cambian"""
+        item_of_7 = self.table.item_for(7)
+        self.data = [Row(i, f"t{i}") for i in range(10)]
+        self.data[3].title = 'x'
+        del self.data[5]
+        self.data.insert(0, Row(99, 'new'))
+        self.data[4], self.data[6] = self.data[6], self.data[4]
+        self.table.reload()
+
+        self.assertEqual(self.shown(), [row.title for row in self.data])
+        self.assertEqual(sorted(self.tree.calls), ['delete', 'insert', 'item', 'move', 'move'])
+        self.assertEqual(self.table.item_for(7), item_of_7)
+        self.assertIsNone(self.table.item_for(5))
+        self.assertEqual(len(self.table), 10)
+
+    def test_reverse_order(self):
+        """Invertir el orden reutiliza todos los items"""
+        self.data.reverse()
+        self.table.reload()
+
+        self.assertEqual(self.shown(), [row.title for row in self.data])
+        self.assertNotIn('insert', self.tree.calls)
+        self.assertNotIn('delete', self.tree.calls)
+
+    def test_duplicate_ids_are_shown_once(self):
+        """Si una entidad llega repetida solo se muestra su primera fila"""
+        self.data = [Row(1, 'a'), Row(2, 'b'), Row(1, 'a bis')]
+        self.table.reload()
+
+        self.assertEqual(self.shown(), ['a', 'b'])
+
+    def test_empty_reload_removes_everything(self):
+        """Una recarga vacía deja la tabla vacía y avisa con on_empty"""
+        empty = []
+        self.table.set_source(lambda after=None, before=None, limit=100: [], lambda row: row.id,
+                              on_empty=lambda: empty.append(True))
+
+        self.assertEqual(self.tree.items, [])
+        self.assertEqual(len(self.table), 0)
+        self.assertEqual(empty, [True])
+
+    def test_set_rows_uses_diff(self):
+        """set_rows con row_id también reutiliza los items existentes"""
+        item_of_7 = self.table.item_for(7)
+        self.table.set_rows([Row(7, 'upd'), Row(1, 't1')])
+
+        self.assertEqual(self.shown(), ['upd', 't1'])
+        self.assertEqual(self.table.item_for(7), item_of_7)
+        self.assertNotIn('insert', self.tree.calls)
+
+    def test_refresh_rows(self):
+        """refresh_rows actualiza o elimina solo las filas de las entidades indicadas"""
+        self.table.refresh_rows([2, 7, 1234], lambda row_id: None if row_id == 2 else Row(row_id, 'upd'))
+
+        self.assertIsNone(self.table.item_for(2))
+        self.assertEqual(self.tree.values[self.table.item_for(7)], ('upd',))
+        self.assertEqual(sorted(self.tree.calls), ['delete', 'item'])
+
+
+class TestOffsetPageSource(unittest.TestCase):
+    """Clase de pruebas para OffsetPageSource (páginas por LIMIT/OFFSET)"""
+
+    def setUp(self):
+        """Resultado simulado de 25 filas que registra los (limit, offset) pedidos"""
+        self.rows = [Row(i, f"t{i}") for i in range(25)]
+        self.requests = []
+        self.source = OffsetPageSource(self.fetch_page, lambda row: row.id)
+
+    def fetch_page(self, limit, offset):
+        self.requests.append((limit, offset))
+        return self.rows[offset:offset + limit]
+
+    def test_forward_pages(self):
+        """La posición de la última fila leída da el OFFSET de la página siguiente"""
+        first = self.source.fetch(limit=10)
+        second = self.source.fetch(after=self.source.key(first[-1]), limit=10)
+        last = self.source.fetch(after=self.source.key(second[-1]), limit=10)
+
+        self.assertEqual([row.id for row in second], list(range(10, 20)))
+        self.assertEqual([row.id for row in last], list(range(20, 25)))
+        self.assertEqual(self.requests, [(10, 0), (10, 10), (10, 20)])
+
+    def test_backward_pages(self):
+        """Hacia atrás se piden las filas anteriores sin pasar de la primera"""
+        self.source.fetch(after=14, limit=10)
+        previous = self.source.fetch(before=self.source.key(self.rows[15]), limit=10)
+        first = self.source.fetch(before=self.source.key(previous[0]), limit=10)
+
+        self.assertEqual([row.id for row in previous], list(range(5, 15)))
+        self.assertEqual([row.id for row in first], list(range(5)))
+        self.assertEqual(self.source.fetch(before=0, limit=10), [])
+        self.assertEqual(self.requests, [(10, 15), (10, 5), (5, 0)])
+
+    def test_unknown_row_has_no_key(self):
+        """Una fila que no se ha leído no tiene posición"""
+        self.assertIsNone(self.source.key(Row(99, 'x')))
+
+
+if __name__ == '__main__':
+    unittest.main()
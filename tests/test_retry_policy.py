@@ -0,0 +1,134 @@
+"""
+Pruebas unitarias para RetryPolicy (clasificación por errno, plazo máximo y jitter)
+No necesitan base de datos
+"""
+
+import unittest
+from mysql.connector import Error
+from src.utils.concurrency_manager import RetryPolicy, retry_with_backoff
+
+
+class FlakyOperation:
+    """Operación que falla con los errores indicados antes de devolver 'ok'"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+class DriverError(Exception):
+    """Error al estilo de PyMySQL/aiomysql: el errno es el primer argumento"""
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Clase de pruebas para RetryPolicy"""
+
+    def make_policy(self, **kwargs):
+        """Política sin esperas reales, salvo que la prueba indique otra cosa"""
+        options = dict(name="test", max_retries=3, base_delay=0.0, max_delay=0.0, exceptions=(Error,))
+        options.update(kwargs)
+        return RetryPolicy(**options)
+
+    def test_transient_errno_is_retried(self):
+        """Un deadlock o un lock wait timeout se reintentan hasta que la operación funciona"""
+        policy = self.make_policy()
+        operation = FlakyOperation(Error(msg="deadlock", errno=1213), Error(msg="lock wait", errno=1205))
+
+        self.assertEqual(policy.call(operation), 'ok')
+        self.assertEqual(operation.calls, 3)
+        stats = policy.stats()
+        self.assertEqual(stats['retries'], 2)
+        self.assertEqual(stats['recovered'], 1)
+        self.assertEqual(stats['retries_by_errno'], {1213: 1, 1205: 1})
+
+    def test_permanent_errno_fails_fast(self):
+        """Una clave duplicada no se reintenta"""
+        policy = self.make_policy()
+        operation = FlakyOperation(Error(msg="duplicate", errno=1062))
+
+        with self.assertRaises(Error):
+            policy.call(operation)
+        self.assertEqual(operation.calls, 1)
+        self.assertEqual(policy.stats()['fail_fast'], 1)
+        self.assertEqual(policy.stats()['retries'], 0)
+
+    def test_other_exceptions_are_not_evaluated(self):
+        """Las excepciones fuera de exceptions se relanzan sin contarlas"""
+        policy = self.make_policy()
+        operation = FlakyOperation(ValueError("bug"))
+
+        with self.assertRaises(ValueError):
+            policy.call(operation)
+        self.assertEqual(operation.calls, 1)
+        self.assertEqual(policy.stats()['fail_fast'], 0)
+
+    def test_errno_from_first_argument(self):
+        """Los drivers basados en PyMySQL guardan el errno en args[0]"""
+        policy = self.make_policy(exceptions=(DriverError,))
+
+        self.assertTrue(policy.is_retryable(DriverError(2013, "Lost connection")))
+        self.assertFalse(policy.is_retryable(DriverError(1452, "Foreign key")))
+        self.assertFalse(policy.is_retryable(DriverError("sin errno")))
+
+    def test_custom_errnos_and_classifier(self):
+        """retryable_errnos sustituye a la lista por defecto y classifier a la clasificación"""
+        policy = self.make_policy(retryable_errnos=[1062])
+        self.assertTrue(policy.is_retryable(Error(errno=1062)))
+        self.assertFalse(policy.is_retryable(Error(errno=1213)))
+
+        policy = self.make_policy(classifier=lambda error: 'retry' in str(error))
+        self.assertTrue(policy.is_retryable(Error(msg="retry me", errno=1062)))
+        self.assertFalse(policy.is_retryable(Error(msg="no", errno=1213)))
+
+    def test_retries_are_exhausted(self):
+        """Tras max_retries reintentos se relanza el último error"""
+        policy = self.make_policy(max_retries=2)
+        operation = FlakyOperation(*[Error(msg="deadlock", errno=1213)] * 5)
+
+        with self.assertRaises(Error):
+            policy.call(operation)
+        self.assertEqual(operation.calls, 3)
+        self.assertEqual(policy.stats()['exhausted'], 1)
+        self.assertEqual(policy.stats()['retries'], 2)
+
+    def test_deadline_stops_retries(self):
+        """No se reintenta si la espera superaría el plazo total"""
+        policy = self.make_policy(deadline=0.05)
+        policy.backoff = lambda attempt: 1.0
+        operation = FlakyOperation(Error(msg="deadlock", errno=1213))
+
+        with self.assertRaises(Error):
+            policy.call(operation)
+        self.assertEqual(operation.calls, 1)
+        self.assertEqual(policy.stats()['deadline_exceeded'], 1)
+
+    def test_backoff_full_jitter(self):
+        """Cada espera es aleatoria entre 0 y min(max_delay, base_delay * 2^intento)"""
+        policy = self.make_policy(base_delay=0.1, max_delay=1.0)
+
+        for attempt in range(6):
+            cap = min(1.0, 0.1 * 2 ** attempt)
+            delays = [policy.backoff(attempt) for _ in range(200)]
+            self.assertTrue(all(0 <= delay <= cap for delay in delays))
+            # Con jitter las esperas no coinciden y cubren el rango
+            self.assertGreater(len(set(delays)), 100)
+            self.assertGreater(max(delays), cap / 2)
+
+    def test_decorator_without_policy_retries_everything(self):
+        """Sin política, el decorador reintenta cualquier excepción de exceptions"""
+        operation = FlakyOperation(ValueError("1"), ValueError("2"))
+        decorated = retry_with_backoff(max_retries=2, base_delay=0.0, max_delay=0.0,
+                                       exceptions=(ValueError,))(operation)
+
+        self.assertEqual(decorated(), 'ok')
+        self.assertEqual(operation.calls, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
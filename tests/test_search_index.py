@@ -0,0 +1,243 @@
+"""
+Pruebas unitarias para NGramIndex (búsqueda, recorrido con presupuesto, intersección y
+páginas por clave) y LiveSearchIndex (carga y notificaciones recibidas durante build)
+No necesitan base de datos
+"""
+
+import unittest
+from unittest import mock
+from src.utils import search_index
+from src.utils.search_index import LiveSearchIndex, NGramIndex
+
+
+class Doc:
+    def __init__(self, doc_id, text):
+        self.id = doc_id
+        self.text = text
+
+
+class FakeNotificationSystem:
+    """Sistema de notificaciones simulado que solo guarda las suscripciones"""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def subscribe(self, event_type, callback, subscriber=None):
+        self.callbacks[event_type] = callback
+
+    def unsubscribe(self, event_type, callback):
+        self.callbacks.pop(event_type, None)
+
+
+class TestNGramIndex(unittest.TestCase):
+    """Clase de pruebas para NGramIndex"""
+
+    def setUp(self):
+        """Índice con 100 documentos; los pares contienen 'congreso' y los múltiplos de 10, 'madrid'"""
+        self.index = NGramIndex()
+        for doc_id in range(100):
+            words = ['congreso' if doc_id % 2 == 0 else 'taller', f"sala{doc_id}"]
+            if doc_id % 10 == 0:
+                words.append('Madrid')
+            self.index.add(doc_id, ' '.join(words), payload=doc_id)
+
+    def evens(self, start=0, stop=100):
+        return list(range(start + start % 2, stop, 2))
+
+    def test_substring_and_prefix(self):
+        """Cada palabra debe aparecer como subcadena; las cortas, como prefijo de una palabra"""
+        self.assertEqual(self.index.search('ngres madr'), list(range(0, 100, 10)))
+        self.assertEqual(self.index.search('MADRÍD'), list(range(0, 100, 10)))
+        self.assertEqual(self.index.search('ta', limit=3), [1, 3, 5])
+        self.assertEqual(self.index.search('al'), [])
+        self.assertEqual(self.index.search('congreso taller'), [])
+
+    def test_forward_pages_by_key(self):
+        """Con after se continúa tras la última clave de la página anterior"""
+        pages = []
+        after = None
+        while True:
+            page = self.index.search('congreso', limit=15, after=after)
+            if not page:
+                break
+            pages.append(page)
+            after = page[-1]
+
+        self.assertEqual([len(page) for page in pages], [15, 15, 15, 5])
+        self.assertEqual([doc_id for page in pages for doc_id in page], self.evens())
+
+    def test_backward_pages_by_key(self):
+        """Con before se devuelven, en orden, los limit documentos anteriores a la clave"""
+        self.assertEqual(self.index.search('congreso', limit=5, before=50), self.evens(40, 50))
+        self.assertEqual(self.index.search('congreso', limit=5, before=3), [0, 2])
+        self.assertEqual(self.index.search('', limit=3, before=10), [7, 8, 9])
+
+    def test_where_filters_payloads(self):
+        """where descarta documentos sin contar para el límite"""
+        results = self.index.search('congreso', limit=4, after=10, where=lambda payload: payload % 4 == 0)
+        self.assertEqual(results, [12, 16, 20, 24])
+
+    def test_scan_gives_up_over_budget(self):
+        """_scan devuelve None si visita más documentos que el presupuesto"""
+        sets = self.index._posting_sets('madrid')
+        self.assertIsNone(self.index._scan(sets, ['madrid'], None, 5, None, None, 20))
+        self.assertEqual(self.index._scan(sets, ['madrid'], None, 2, None, None, 20), [0, 10])
+        self.assertEqual(self.index._scan(sets, ['madrid'], None, 2, None, 50, 20), [30, 40])
+
+    def test_scan_and_intersect_agree(self):
+        """El recorrido ordenado y la intersección devuelven lo mismo"""
+        sets = self.index._posting_sets('congreso')[:1]
+        where = lambda payload: payload % 3 == 0
+        for after, before in ((None, None), (20, None), (None, 61)):
+            scanned = self.index._scan(sets, ['congreso'], where, 5, after, before, None)
+            intersected = self.index._intersect(sets, ['congreso'], where, 5, after, before)
+            self.assertEqual(scanned, intersected)
+        self.assertEqual(self.index._intersect(sets, ['congreso'], where, None, 20, 40), [24, 30, 36])
+
+    def test_intersect_verifies_whole_word(self):
+        """Los n-gramas que coinciden por separado no bastan: se comprueba la subcadena completa"""
+        index = NGramIndex()
+        index.add(1, 'abcx xbcd')
+        index.add(2, 'abcd')
+        sets = index._posting_sets('abcd')
+
+        self.assertEqual(index._intersect(sets, ['abcd'], None, None, None, None), [2])
+        self.assertEqual(index.search('abcd'), [2])
+
+    def test_replaced_document(self):
+        """Al reemplazar un documento cuenta su nuevo texto y su nueva clave de orden"""
+        self.index.add(4, 'taller sala4', payload='nuevo', sort_key=1000)
+        self.index.add(6, 'congreso sala6', payload=6, sort_key=-1)
+
+        self.assertEqual(self.index.search('congreso', limit=3), [6, 0, 2])
+        self.assertNotIn(4, self.index.search('congreso'))
+        self.assertEqual(self.index.search('taller', limit=2, after=99), [4])
+        self.assertEqual(self.index.search_payloads('taller', after=99), ['nuevo'])
+        self.assertEqual(len(self.index), 100)
+
+    def test_removed_document_and_version(self):
+        """remove saca el documento de los resultados y cambia la versión del índice"""
+        version = self.index.version
+        self.index.remove(10)
+
+        self.assertEqual(self.index.search('madrid', limit=2), [0, 20])
+        self.assertNotIn(10, self.index)
+        self.assertNotEqual(self.index.version, version)
+
+
+class TestLiveSearchIndex(unittest.TestCase):
+    """Clase de pruebas para LiveSearchIndex"""
+
+    def setUp(self):
+        """Índice de documentos con un sistema de notificaciones simulado"""
+        self.notifications = FakeNotificationSystem()
+        patcher = mock.patch.object(search_index, 'get_notification_system', lambda: self.notifications)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.stored = {doc_id: Doc(doc_id, f"evento {doc_id}") for doc_id in range(1, 6)}
+        self.loader = lambda: list(self.stored.values())
+        self.live = LiveSearchIndex(
+            loader=lambda: self.loader(),
+            id_getter=lambda doc: doc.id,
+            text_getter=lambda doc: doc.text,
+            sort_key=lambda doc: doc.id,
+            upsert_events={'doc_created': 'doc', 'doc_updated': 'doc'},
+            delete_events={'doc_deleted': 'doc_id'},
+            fetcher=lambda doc_id: self.stored.get(doc_id),
+            id_arg='doc_id'
+        )
+
+    def notify(self, event_type, **kwargs):
+        self.notifications.callbacks[event_type](**kwargs)
+
+    def texts(self, query=''):
+        return [doc.text for doc in self.live.search(query)]
+
+    def test_search_before_build(self):
+        """Hasta que termina build, search devuelve None"""
+        self.assertIsNone(self.live.search('evento'))
+        self.live.build()
+        self.assertEqual(len(self.live.search('evento')), 5)
+
+    def test_notifications_during_build_are_replayed(self):
+        """Los cambios notificados mientras se lee el listado se aplican después, en orden"""
+        def loader():
+            # El listado se leyó antes de estos cambios
+            rows = [Doc(doc.id, doc.text) for doc in self.stored.values()]
+            self.notify('doc_updated', doc=Doc(2, 'evento dos editado'))
+            self.notify('doc_deleted', doc_id=3)
+            self.notify('doc_created', doc=Doc(6, 'evento seis'))
+            self.notify('doc_updated', doc=Doc(6, 'evento seis editado'))
+            self.assertEqual(len(self.live.index), 0)  # Aún no se ha aplicado nada
+            return rows
+        self.loader = loader
+        self.live.build()
+
+        self.assertEqual(self.texts(), ['evento 1', 'evento dos editado', 'evento 4', 'evento 5',
+                                        'evento seis editado'])
+
+    def test_notifications_during_replay_are_applied(self):
+        """Las notificaciones que llegan mientras se aplican las pendientes también se aplican"""
+        def fetcher(doc_id):
+            if doc_id == 1:
+                # Otra notificación llega mientras se reaplica la primera
+                self.notify('doc_deleted', doc_id=5)
+            return Doc(doc_id, f"remoto {doc_id}")
+        self.live._fetcher = fetcher
+
+        def loader():
+            rows = list(self.stored.values())
+            self.notify('doc_updated', doc_id=1)
+            return rows
+        self.loader = loader
+        self.live.build()
+
+        self.assertEqual(self.texts(), ['remoto 1', 'evento 2', 'evento 3', 'evento 4'])
+        self.assertIsNone(self.live._pending)
+
+    def test_notifications_after_build_apply_directly(self):
+        """Una vez cargado, cada notificación se aplica al momento"""
+        self.live.build()
+        self.notify('doc_updated', doc=Doc(1, 'primero'))
+        self.notify('doc_deleted', doc_id=2)
+
+        self.assertEqual(self.live.search('primero')[0].id, 1)
+        self.assertEqual(len(self.live.search('evento')), 3)
+
+    def test_page_source_by_index_key(self):
+        """page_source sin order_key pagina por la clave del índice hacia delante y hacia atrás"""
+        self.live.build()
+        fetch, key_getter = self.live.page_source('evento')
+        first = fetch(limit=2)
+        second = fetch(after=key_getter(first[-1]), limit=2)
+        previous = fetch(before=key_getter(second[0]), limit=2)
+
+        self.assertEqual([doc.id for doc in first], [1, 2])
+        self.assertEqual([doc.id for doc in second], [3, 4])
+        self.assertEqual([doc.id for doc in previous], [1, 2])
+
+    def test_page_source_with_order_key(self):
+        """Con order_key se ordenan las coincidencias una vez y se reutilizan hasta un cambio"""
+        for doc_id, text in ((1, 'evento c'), (2, 'evento a'), (3, 'evento b'), (4, 'evento a'), (5, 'otro')):
+            self.stored[doc_id] = Doc(doc_id, text)
+        self.live.build()
+        fetch, key_getter = self.live.page_source('evento', order_key=lambda doc: doc.text)
+
+        with mock.patch.object(self.live, 'search', wraps=self.live.search) as search:
+            first = fetch(limit=2)
+            second = fetch(after=key_getter(first[-1]), limit=2)
+            previous = fetch(before=key_getter(second[0]), limit=2)
+            self.assertEqual(search.call_count, 1)
+
+            self.notify('doc_updated', doc=Doc(5, 'evento 0'))
+            refreshed = fetch(limit=1)
+            self.assertEqual(search.call_count, 2)
+
+        self.assertEqual([doc.id for doc in first], [2, 4])
+        self.assertEqual([doc.id for doc in second], [3, 1])
+        self.assertEqual([doc.id for doc in previous], [2, 4])
+        self.assertEqual([doc.id for doc in refreshed], [5])
+
+
+if __name__ == '__main__':
+    unittest.main()